@@ -8,11 +8,15 @@ interface CalendarProps {
   posts: ScheduledPost[];
   onDateClick: (date: Date) => void;
   onMovePosts?: (postIds: string[], targetDate: string) => void;
+  /** Month to show; when set, the parent owns navigation via onMonthChange */
+  month?: Date;
+  onMonthChange?: (month: Date) => void;
   className?: string;
 }
 
-export function Calendar({ posts, onDateClick, onMovePosts, className = '' }: CalendarProps) {
-  const [currentDate, setCurrentDate] = useState(new Date());
+export function Calendar({ posts, onDateClick, onMovePosts, month, onMonthChange, className = '' }: CalendarProps) {
+  const [internalDate, setInternalDate] = useState(new Date());
+  const currentDate = month ?? internalDate;
   const [dragSourceDate, setDragSourceDate] = useState<string | null>(null);
   const [dragOverDate, setDragOverDate] = useState<string | null>(null);
 
@@ -23,6 +27,10 @@ export function Calendar({ posts, onDateClick, onMovePosts, className = '' }: Ca
   const prevMonth = new Date(currentDate.getFullYear(), currentDate.getMonth() - 1, 0);
   const daysInPrevMonth = prevMonth.getDate();
 
+  const setCurrentDate = (date: Date) => {
+    setInternalDate(date);
+    onMonthChange?.(date);
+  };
   const goToPreviousMonth = () => {
     setCurrentDate(new Date(currentDate.getFullYear(), currentDate.getMonth() - 1, 1));
   };
@@ -160,6 +160,8 @@ export const CaptionEditor: React.FC<CaptionEditorProps> = ({ className = '' })
           setGenerationPhase(event.phase);
         } else if (event.event === 'thinking' && event.text) {
           setThinkingText(prev => prev + event.text);
+        } else if (event.event === 'copy' && event.index !== undefined) {
+          setGenerationPhase(`Drafted ${event.index + 1} copies...`);
         } else if (event.event === 'error' && event.message) {
           setError(event.message);
         }
@@ -21,6 +21,23 @@ interface SchedulerProps {
 
 type ViewMode = 'calendar' | 'grid';
 
+/** Local "YYYY-MM-DD" string of a date. */
+function toDateKey(d: Date): string {
+  return `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, '0')}-${String(d.getDate()).padStart(2, '0')}`;
+}
+
+/**
+ * Date range to load for a month: the calendar's six-week grid, including
+ * the leading and trailing days of the neighbouring months, widened by a
+ * day on each side because posts are stored in UTC and shown in local time.
+ */
+function visibleRange(month: Date): schedulerClient.PostDateRange {
+  const first = new Date(month.getFullYear(), month.getMonth(), 1);
+  const start = new Date(first.getFullYear(), first.getMonth(), 1 - first.getDay() - 1);
+  const end = new Date(start.getFullYear(), start.getMonth(), start.getDate() + 43);
+  return { from: toDateKey(start), to: toDateKey(end) };
+}
+
 export function Scheduler({ className = '' }: SchedulerProps) {
   /**
    * Convert a UTC date string ("YYYY-MM-DD") and UTC time string ("HH:MM")
@@ -43,6 +60,10 @@ export function Scheduler({ className = '' }: SchedulerProps) {
   };
 
   const [viewMode, setViewMode] = useState<ViewMode>('grid');
+  const [visibleMonth, setVisibleMonth] = useState(() => {
+    const today = new Date();
+    return new Date(today.getFullYear(), today.getMonth(), 1);
+  });
   const [posts, setPosts] = useState<ScheduledPost[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -60,7 +81,11 @@ export function Scheduler({ className = '' }: SchedulerProps) {
   const [isAutoScheduling, setIsAutoScheduling] = useState(false);
   const [operationError, setOperationError] = useState<string | null>(null);
   const [lastAutoScheduleStrategyId, setLastAutoScheduleStrategyId] = useState<string | null>(null);
+  // Idempotency key of the last unfinished auto-schedule, reused by its retry
+  const autoScheduleKeyRef = useRef<{ strategyId: string; key: string } | null>(null);
   const dropdownRef = useRef<HTMLDivElement>(null);
+  // Ignores responses for a month the user has already navigated away from
+  const fetchSeqRef = useRef(0);
 
   // Clear all state
   const [isClearingAll, setIsClearingAll] = useState(false);
@@ -79,22 +104,29 @@ export function Scheduler({ className = '' }: SchedulerProps) {
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, [showStrategyDropdown]);
 
-  // Fetch posts from API on mount
+  // Fetch the visible month's posts on mount and whenever the month changes
   const fetchPosts = useCallback(async () => {
+    const seq = ++fetchSeqRef.current;
     try {
       setError(null);
-      const data = await schedulerClient.listPosts();
+      const data = await schedulerClient.listPosts(visibleRange(visibleMonth));
+      if (seq !== fetchSeqRef.current) return;
       setPosts(data);
     } catch (err) {
+      if (seq !== fetchSeqRef.current) return;
       console.error('[Scheduler] fetchPosts: error', err);
       const message = err instanceof schedulerClient.SchedulerAPIError
         ? err.message
         : 'Failed to load scheduled posts';
       setError(message);
     } finally {
-      setIsLoading(false);
+      if (seq === fetchSeqRef.current) setIsLoading(false);
     }
-  }, []);
+  }, [visibleMonth]);
+
+  const goToMonth = (offset: number) => {
+    setVisibleMonth(new Date(visibleMonth.getFullYear(), visibleMonth.getMonth() + offset, 1));
+  };
 
   useEffect(() => {
     fetchPosts();
@@ -270,8 +302,14 @@ export function Scheduler({ className = '' }: SchedulerProps) {
     setOperationError(null);
     setShowStrategyDropdown(false);
     setLastAutoScheduleStrategyId(strategyId);
+    const idempotencyKey = autoScheduleKeyRef.current?.strategyId === strategyId
+      ? autoScheduleKeyRef.current.key
+      : crypto.randomUUID();
+    autoScheduleKeyRef.current = { strategyId, key: idempotencyKey };
     try {
-      await schedulerClient.autoSchedule(strategyId);
+      // A retry after a timeout picks up the original run instead of scheduling twice
+      await schedulerClient.autoSchedule(strategyId, idempotencyKey);
+      autoScheduleKeyRef.current = null;
       await fetchPosts();
       setLastAutoScheduleStrategyId(null);
     } catch (err) {
@@ -337,7 +375,9 @@ export function Scheduler({ className = '' }: SchedulerProps) {
   };
 
   // Sort posts chronologically (nearest first) using local date/time
-  const sortedPosts = [...posts].sort((a, b) => {
+  // The grid lists the visible month only, not the calendar's padding days
+  const monthKey = toDateKey(visibleMonth).slice(0, 7);
+  const sortedPosts = posts.filter(p => localDateKey(p).startsWith(monthKey)).sort((a, b) => {
     const aKey = localDateKey(a);
     const bKey = localDateKey(b);
     const aTime = localTimeStr(a);
@@ -544,18 +584,41 @@ export function Scheduler({ className = '' }: SchedulerProps) {
           posts={posts}
           onDateClick={handleDateClick}
           onMovePosts={handleMovePosts}
+          month={visibleMonth}
+          onMonthChange={setVisibleMonth}
         />
       )}
 
       {/* Grid View */}
       {viewMode === 'grid' && (
         <div>
+          <div className="flex items-center gap-3 mb-6">
+            <h2 className="text-xl font-bold font-heading text-gray-900">
+              {visibleMonth.toLocaleDateString('en-US', { month: 'long', year: 'numeric' })}
+            </h2>
+            <div className="flex items-center gap-1">
+              <button
+                onClick={() => goToMonth(-1)}
+                className="p-1.5 text-gray-400 hover:text-indigo-600 hover:bg-indigo-50 rounded-full transition-colors"
+                aria-label="Previous month"
+              >
+                <Icon icon="solar:alt-arrow-left-bold" className="w-5 h-5" />
+              </button>
+              <button
+                onClick={() => goToMonth(1)}
+                className="p-1.5 text-gray-400 hover:text-indigo-600 hover:bg-indigo-50 rounded-full transition-colors"
+                aria-label="Next month"
+              >
+                <Icon icon="solar:alt-arrow-right-bold" className="w-5 h-5" />
+              </button>
+            </div>
+          </div>
           {sortedPosts.length === 0 ? (
             <div className="bg-white rounded-2xl shadow-sm border border-gray-100 p-8 text-center">
               <Icon icon="solar:calendar-bold" className="w-12 h-12 text-gray-400 mx-auto mb-4" />
-              <h3 className="text-lg font-medium text-gray-900 mb-2">No scheduled posts</h3>
+              <h3 className="text-lg font-medium text-gray-900 mb-2">No scheduled posts this month</h3>
               <p className="text-gray-500 mb-4">
-                Start by scheduling your first post to see it appear here.
+                Schedule a post or switch months to see it appear here.
               </p>
               <Button
                 onClick={() => handleScheduleNewPost()}
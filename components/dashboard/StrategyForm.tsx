@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState } from 'react';
+import React, { useRef, useState } from 'react';
 import { Icon } from '@iconify/react';
 import Input from '@/components/ui/Input';
 import Button from '@/components/ui/Button';
@@ -83,6 +83,8 @@ export const StrategyForm: React.FC<StrategyFormProps> = ({ onStrategyGenerated
   const [generatedStrategy, setGeneratedStrategy] = useState<StrategyOutput | null>(null);
   const [errorMessage, setErrorMessage] = useState<string>('');
   const [expandedSection, setExpandedSection] = useState<string>('form');
+  // Idempotency key of the last unfinished generation, reused when retrying the same input
+  const idempotencyKeyRef = useRef<string | null>(null);
 
   const validateForm = (): boolean => {
     const newErrors: Partial<StrategyFormData> = {};
@@ -111,6 +113,8 @@ export const StrategyForm: React.FC<StrategyFormProps> = ({ onStrategyGenerated
       ...prev,
       [field]: value,
     }));
+    // Changed input is a new request, not a retry
+    idempotencyKeyRef.current = null;
     // Clear error for this field when user starts typing
     if (errors[field]) {
       setErrors((prev) => ({
@@ -131,15 +135,18 @@ export const StrategyForm: React.FC<StrategyFormProps> = ({ onStrategyGenerated
 
     setIsLoading(true);
     setErrorMessage('');
+    const idempotencyKey = idempotencyKeyRef.current ?? crypto.randomUUID();
+    idempotencyKeyRef.current = idempotencyKey;
 
     try {
-      // Call the real API
+      // Call the real API; a retry after a timeout gets the original generation
       const strategyOutput = await generateStrategy({
         brandName: formData.brandName,
         industry: formData.industry,
         targetAudience: formData.targetAudience,
         goals: formData.goals,
-      });
+      }, idempotencyKey);
+      idempotencyKeyRef.current = null;
 
       // Create strategy object for context (maintaining compatibility with existing Strategy type)
       const strategy: Strategy = {
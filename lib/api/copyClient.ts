@@ -87,9 +87,11 @@ function convertChatResponse(response: any): ChatResponse {
  * Streaming event types from the copy generation SSE endpoint
  */
 export interface CopyStreamEvent {
-  event: 'thinking' | 'lifecycle' | 'result' | 'saved' | 'error' | 'done';
+  event: 'thinking' | 'lifecycle' | 'copy' | 'result' | 'saved' | 'error' | 'done';
   text?: string;
   phase?: string;
+  index?: number;
+  copy?: { text: string; platform: string; hashtags: string[] };
   copies?: Array<{ text: string; platform: string; hashtags: string[] }>;
   message?: string;
 }
@@ -98,7 +100,8 @@ export interface CopyStreamEvent {
  * Generate copies with real-time streaming of agent thinking events.
  *
  * Connects to the SSE endpoint and yields events as they arrive.
- * The final 'saved' event contains the persisted CopyRecords.
+ * Each 'copy' event carries one finished copy. The 'saved' event contains
+ * the persisted CopyRecords, including those finished before an 'error'.
  *
  * @param strategyId - ID of the strategy to generate copies from
  * @param onEvent - Callback invoked for each streamed event
@@ -203,14 +206,23 @@ export async function generateCopiesStream(
  * Generate copies from a strategy using the Copywriter Agent
  * 
  * @param strategyId - ID of the strategy to generate copies from
+ * @param idempotencyKey - Reuse the key of a failed attempt to get that attempt's
+ *   copies instead of generating them again
  * @returns Promise resolving to an array of generated copy records
  * @throws CopyAPIError if the request fails
  */
-export async function generateCopies(strategyId: string): Promise<CopyRecord[]> {
+export async function generateCopies(
+  strategyId: string,
+  idempotencyKey?: string
+): Promise<CopyRecord[]> {
   try {
+    const headers = createAuthHeaders() as Record<string, string>;
+    if (idempotencyKey) {
+      headers['Idempotency-Key'] = idempotencyKey;
+    }
     const response = await fetch(`${API_BASE_URL}/api/copy/generate`, {
       method: 'POST',
-      headers: createAuthHeaders(),
+      headers,
       body: JSON.stringify({ strategy_id: strategyId }),
     });
 
@@ -78,6 +78,8 @@ function convertScheduledPost(record: any): ScheduledPost {
     updatedAt: record.updated_at,
     ...(record.media_id ? { mediaId: record.media_id } : {}),
     ...(record.media_type ? { mediaType: record.media_type } : {}),
+    ...(record.attempt_count ? { attemptCount: record.attempt_count } : {}),
+    ...(record.next_attempt_at ? { nextAttemptAt: record.next_attempt_at } : {}),
   };
 }
 
@@ -85,14 +87,23 @@ function convertScheduledPost(record: any): ScheduledPost {
  * Auto-schedule all copies for a strategy using the AI agent
  * 
  * @param strategyId - ID of the strategy to auto-schedule copies from
+ * @param idempotencyKey - Reuse the key of a failed attempt to get that attempt's
+ *   posts instead of scheduling the copies twice
  * @returns Promise resolving to an array of scheduled post records
  * @throws SchedulerAPIError if the request fails
  */
-export async function autoSchedule(strategyId: string): Promise<ScheduledPost[]> {
+export async function autoSchedule(
+  strategyId: string,
+  idempotencyKey?: string
+): Promise<ScheduledPost[]> {
   try {
+    const headers = createAuthHeaders() as Record<string, string>;
+    if (idempotencyKey) {
+      headers['Idempotency-Key'] = idempotencyKey;
+    }
     const response = await fetch(`${API_BASE_URL}/api/scheduler/auto-schedule`, {
       method: 'POST',
-      headers: createAuthHeaders(),
+      headers,
       body: JSON.stringify({ strategy_id: strategyId }),
     });
 
@@ -202,14 +213,30 @@ export async function manualSchedule(input: ManualScheduleInput): Promise<Schedu
 }
 
 /**
- * List all scheduled posts for the authenticated user
+ * Optional calendar window for listing posts. Either a whole `month`
+ * (YYYY-MM) or an inclusive `from`/`to` range (YYYY-MM-DD).
+ */
+export interface PostDateRange {
+  month?: string;
+  from?: string;
+  to?: string;
+}
+
+/**
+ * List scheduled posts for the authenticated user
  * 
+ * @param range - Optional month or date range; omit to list every post
  * @returns Promise resolving to an array of scheduled post records
  * @throws SchedulerAPIError if the request fails
  */
-export async function listPosts(): Promise<ScheduledPost[]> {
+export async function listPosts(range: PostDateRange = {}): Promise<ScheduledPost[]> {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/scheduler/posts`, {
+    const params = new URLSearchParams();
+    if (range.month) params.set('month', range.month);
+    if (range.from) params.set('from', range.from);
+    if (range.to) params.set('to', range.to);
+    const query = params.toString();
+    const response = await fetch(`${API_BASE_URL}/api/scheduler/posts${query ? `?${query}` : ''}`, {
       method: 'GET',
       headers: createAuthHeaders(),
     });
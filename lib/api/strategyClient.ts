@@ -65,14 +65,23 @@ function handleAuthError(): void {
  * Generate a social media strategy using the Strategist Agent
  * 
  * @param input - Strategy input data (brand name, industry, target audience, goals)
+ * @param idempotencyKey - Reuse the key of a failed attempt to get that attempt's
+ *   result instead of generating a second strategy
  * @returns Promise resolving to the generated strategy output
  * @throws StrategyAPIError if the request fails
  */
-export async function generateStrategy(input: StrategyInput): Promise<StrategyOutput> {
+export async function generateStrategy(
+  input: StrategyInput,
+  idempotencyKey?: string
+): Promise<StrategyOutput> {
   try {
+    const headers = createAuthHeaders() as Record<string, string>;
+    if (idempotencyKey) {
+      headers['Idempotency-Key'] = idempotencyKey;
+    }
     const response = await fetch(`${API_BASE_URL}/api/strategy/generate`, {
       method: 'POST',
-      headers: createAuthHeaders(),
+      headers,
       body: JSON.stringify({
         brand_name: input.brandName,
         industry: input.industry,
@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the Zetca agent backend.
+
+Run from the python/ directory, e.g. python -m benchmarks.repository_concurrency
+"""
@@ -0,0 +1,126 @@
+"""
+Benchmark due-post selection: full-table scan vs the sparse DueIndex.
+
+Builds an in-memory scheduled-posts table (100k posts by default, mostly
+published history plus a tail of future and overdue scheduled posts) that
+mimics DynamoDB paging: every Scan/Query call returns at most ~1 MB of items
+and costs a fixed round-trip latency. Both `PublisherService.get_due_posts`
+paths run against it and report wall time, round trips and items read (the
+read-unit driver).
+
+Run with: JWT_SECRET=dev python -m benchmarks.due_posts
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, UTC
+from unittest.mock import patch
+
+from config import settings
+from repositories.executor import shutdown_executor
+from repositories.scheduler_repository import SchedulerRepository
+from services.publisher_service import PublisherService
+
+# Approximate item size, used to cut pages at DynamoDB's 1 MB response limit
+ITEM_BYTES = 600
+PAGE_ITEMS = (1024 * 1024) // ITEM_BYTES
+
+
+class _PagedTable:
+    """Stand-in for a boto3 Table supporting Scan and DueIndex Query."""
+
+    def __init__(self, items, latency: float):
+        self.items = items
+        self.latency = latency
+        self.calls = 0
+        self.items_read = 0
+        self.due_index = defaultdict(list)
+        for item in items:
+            if 'dueBucket' in item:
+                self.due_index[item['dueBucket']].append(item)
+        for bucket in self.due_index.values():
+            bucket.sort(key=lambda i: i['dueAt'])
+
+    def _page(self, items, start_key):
+        time.sleep(self.latency)
+        self.calls += 1
+        start = start_key['offset'] if start_key else 0
+        page = items[start:start + PAGE_ITEMS]
+        self.items_read += len(page)
+        response = {'Items': page}
+        if start + PAGE_ITEMS < len(items):
+            response['LastEvaluatedKey'] = {'offset': start + PAGE_ITEMS}
+        return response
+
+    def scan(self, ExclusiveStartKey=None, **_):
+        return self._page(self.items, ExclusiveStartKey)
+
+    def query(self, KeyConditionExpression, ExclusiveStartKey=None, FilterExpression=None, **_):
+        bucket_cond, due_cond = KeyConditionExpression.get_expression()['values']
+        bucket = bucket_cond.get_expression()['values'][1]
+        upper = due_cond.get_expression()['values'][1]
+        matched = [i for i in self.due_index.get(bucket, []) if i['dueAt'] <= upper]
+        return self._page(matched, ExclusiveStartKey)
+
+
+def _build_items(total: int, due: int, pending: int):
+    """Create `total` posts: `due` overdue, `pending` in the future, the rest published."""
+    repo = SchedulerRepository.__new__(SchedulerRepository)
+    now = datetime.now(UTC)
+    rng = random.Random(42)
+    items = []
+    for i in range(total):
+        if i < due:
+            when, status = now - timedelta(minutes=rng.randint(1, 60 * 24 * 3)), 'scheduled'
+        elif i < due + pending:
+            when, status = now + timedelta(minutes=rng.randint(1, 60 * 24 * 30)), 'scheduled'
+        else:
+            when, status = now - timedelta(days=rng.randint(1, 720)), 'published'
+        record = repo._item_to_record({
+            'postId': f'post-{i}', 'strategyId': 's', 'copyId': 'c', 'userId': f'user-{i % 500}',
+            'content': 'Benchmark post ' * 20, 'platform': 'linkedin', 'hashtags': ['#bench'],
+            'scheduledDate': when.strftime('%Y-%m-%d'), 'scheduledTime': when.strftime('%H:%M'),
+            'status': status, 'createdAt': now.isoformat(), 'updatedAt': now.isoformat(),
+        })
+        items.append(repo._record_to_item(record))
+    rng.shuffle(items)
+    return items
+
+
+async def _run(label: str, table: _PagedTable, use_index: bool) -> float:
+    repo = SchedulerRepository.__new__(SchedulerRepository)
+    repo.table = table
+    service = PublisherService.__new__(PublisherService)
+    service.scheduler_repository = repo
+
+    table.calls = table.items_read = 0
+    with patch.object(settings, 'publisher_due_index_enabled', use_index):
+        start = time.perf_counter()
+        due_posts = await service.get_due_posts()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<6} {elapsed * 1000:9.1f} ms  calls={table.calls:<4} "
+          f"items_read={table.items_read:<7} due={len(due_posts)}")
+    return elapsed
+
+
+async def main(total: int, due: int, pending: int, latency: float) -> None:
+    print(f"Building {total} posts ({due} due, {pending} future scheduled)...")
+    table = _PagedTable(_build_items(total, due, pending), latency)
+    print(f"Simulated round-trip latency: {latency * 1000:.0f} ms, page size: {PAGE_ITEMS} items")
+    scan = await _run("scan", table, use_index=False)
+    index = await _run("index", table, use_index=True)
+    print(f"Speed-up: {scan / index:.1f}x")
+    shutdown_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--due", type=int, default=200)
+    parser.add_argument("--pending", type=int, default=2_000)
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds per Scan/Query call")
+    args = parser.parse_args()
+    asyncio.run(main(args.posts, args.due, args.pending, args.latency))
@@ -0,0 +1,182 @@
+"""
+Benchmark peak memory of publishing large image posts.
+
+Publishes `--images` image posts of `--size-mb` each through
+`PublisherService._handle_image_post` against a local stand-in for the
+LinkedIn REST API, with an S3 stand-in that generates the object body on the
+fly. The "buffered" run reproduces the old behaviour (read the whole S3 body,
+then PUT the bytes); the "streaming" run uses the current chunked path. Each
+run happens in a fresh subprocess and reports its peak RSS, sampled after the
+first few images and after all of them: the streaming run should stay flat
+while the buffered run grows with image size times concurrency.
+
+Run with: JWT_SECRET=dev python -m benchmarks.image_upload_memory
+"""
+
+import argparse
+import asyncio
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from services.linkedin_client import LinkedInClient
+from services.publisher_service import PublisherService
+
+
+class _GeneratedBody:
+    """StreamingBody stand-in that produces `size` bytes without holding them."""
+
+    def __init__(self, size: int):
+        self.remaining = size
+
+    def read(self, amt: int = None) -> bytes:
+        amt = self.remaining if amt is None else min(amt, self.remaining)
+        self.remaining -= amt
+        return b"\x00" * amt
+
+    def close(self) -> None:
+        pass
+
+
+class _LoadedBody:
+    """A body already read into memory, as the old download path did."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def read(self, amt: int = None) -> bytes:
+        chunk, self.data = self.data, b""
+        return chunk
+
+    def close(self) -> None:
+        pass
+
+
+class _S3:
+    def __init__(self, size: int):
+        self.size = size
+
+    def get_object(self, Bucket, Key):
+        return {"Body": _GeneratedBody(self.size), "ContentLength": self.size}
+
+
+class _Media:
+    async def get_media_by_id(self, media_id):
+        return {"s3Key": f"media/{media_id}", "contentType": "image/png"}
+
+
+def _stand_in_app(port: int) -> FastAPI:
+    """LinkedIn stand-in that discards uploaded bytes as they arrive."""
+    app = FastAPI()
+
+    @app.post("/rest/images")
+    async def initialize_upload():
+        image_id = uuid.uuid4().hex
+        return {"value": {
+            "uploadUrl": f"http://127.0.0.1:{port}/upload/{image_id}",
+            "image": f"urn:li:image:{image_id}",
+        }}
+
+    @app.put("/upload/{image_id}")
+    async def upload(image_id: str, request: Request):
+        async for _ in request.stream():
+            pass
+        return Response(status_code=201)
+
+    @app.post("/rest/posts")
+    async def create_post():
+        return Response(status_code=201, headers={"x-restli-id": "urn:li:share:1"})
+
+    return app
+
+
+def _start_server() -> tuple[uvicorn.Server, int]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(
+        _stand_in_app(port), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, port
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _run(mode: str, images: int, size: int, concurrency: int) -> float:
+    server, port = _start_server()
+    client = LinkedInClient(base_url=f"http://127.0.0.1:{port}/rest", upload_timeout_seconds=300)
+    service = PublisherService(
+        linkedin_client=client,
+        publisher_repository=None,
+        scheduler_repository=None,
+        user_repository=None,
+        media_repository=_Media(),
+        s3_client=_S3(size),
+        worker_id="bench",
+    )
+    if mode == "buffered":
+        async def open_buffered(s3_key):
+            response = service.s3_client.get_object(Bucket=service.s3_bucket, Key=s3_key)
+            return _LoadedBody(response["Body"].read()), response["ContentLength"]
+        service._open_s3_object = open_buffered
+
+    post = type("Post", (), {"id": "p", "media_id": "m"})
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def publish():
+        async with semaphore:
+            response = await service._handle_image_post(post, "token", "urn:li:person:b", "hi")
+            assert response.status_code == 201, response
+
+    warmup = min(5, images)
+    await asyncio.gather(*(publish() for _ in range(warmup)))
+    early = _peak_rss_mb()
+    started = time.perf_counter()
+    await asyncio.gather(*(publish() for _ in range(images - warmup)))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{mode:<9} {images} x {size // 2**20} MB: peak RSS {early:7.1f} MB after {warmup}, "
+        f"{_peak_rss_mb():7.1f} MB after {images} ({elapsed:5.1f}s)"
+    )
+    await client.aclose()
+    server.should_exit = True
+    return _peak_rss_mb() - early
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=50)
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--max-growth-mb", type=float, default=16.0,
+                        help="fail if streaming peak RSS grows more than this after warm-up")
+    parser.add_argument("--mode", choices=["buffered", "streaming"])
+    args = parser.parse_args()
+
+    if args.mode:
+        growth = asyncio.run(_run(args.mode, args.images, args.size_mb * 2**20, args.concurrency))
+        if args.mode == "streaming" and growth > args.max_growth_mb:
+            sys.exit(f"streaming peak RSS grew {growth:.1f} MB (limit {args.max_growth_mb} MB)")
+        return
+    # Run each mode in its own process so peak RSS is not shared between them
+    for mode in ("buffered", "streaming"):
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.image_upload_memory", *sys.argv[1:], "--mode", mode],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark LinkedInClient with a fresh connection per call vs the shared pool.
+
+Starts a local stand-in for the LinkedIn REST API (posts, image upload
+initialization and binary upload) and publishes image posts against it, each
+of which makes three requests. The "per-call" run opens and closes a client
+for every post, as the old `async with httpx.AsyncClient()` code did for every
+request; the "pooled" run reuses one long-lived client. The stand-in speaks
+plain HTTP, so the real-world gap (TLS handshakes to api.linkedin.com) is
+larger than shown here.
+
+Run with: JWT_SECRET=dev python -m benchmarks.linkedin_client_pool
+"""
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+import uuid
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from services.linkedin_client import LinkedInClient
+
+IMAGE = b"\x89PNG" + b"\x00" * 64 * 1024
+
+
+def _stand_in_app(port: int) -> FastAPI:
+    """Minimal LinkedIn REST API stand-in."""
+    app = FastAPI()
+
+    @app.post("/rest/posts")
+    async def create_post():
+        return Response(status_code=201, headers={"x-restli-id": f"urn:li:share:{uuid.uuid4().int % 10**12}"})
+
+    @app.post("/rest/images")
+    async def initialize_upload():
+        image_id = uuid.uuid4().hex
+        return {"value": {
+            "uploadUrl": f"http://127.0.0.1:{port}/upload/{image_id}",
+            "image": f"urn:li:image:{image_id}",
+        }}
+
+    @app.put("/upload/{image_id}")
+    async def upload(image_id: str, request: Request):
+        await request.body()
+        return Response(status_code=201)
+
+    return app
+
+
+def _start_server() -> tuple[uvicorn.Server, int]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(
+        _stand_in_app(port), host="127.0.0.1", port=port, log_level="warning"
+    ))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, port
+
+
+async def _image_post(client: LinkedInClient) -> None:
+    upload = await client.initialize_image_upload("token", "urn:li:person:bench")
+    await client.upload_image_binary(upload.upload_url, IMAGE, "image/png")
+    response = await client.create_image_post(
+        "token", "urn:li:person:bench", "Benchmark", upload.image_urn
+    )
+    assert response.status_code == 201, response
+
+
+async def _run(label: str, post, posts: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded():
+        async with semaphore:
+            await post()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded() for _ in range(posts)))
+    elapsed = time.perf_counter() - start
+    rps = posts * 3 / elapsed
+    print(f"{label:<9} {posts} image posts ({posts * 3} requests) in {elapsed:6.2f}s -> {rps:8.1f} req/s")
+    return rps
+
+
+async def main(posts: int, concurrency: int) -> None:
+    server, port = _start_server()
+    base_url = f"http://127.0.0.1:{port}/rest"
+
+    async def per_call_post():
+        client = LinkedInClient(base_url=base_url)
+        try:
+            await _image_post(client)
+        finally:
+            await client.aclose()
+
+    pooled = LinkedInClient(base_url=base_url, max_connections=concurrency)
+
+    try:
+        before = await _run("per-call", per_call_post, posts, concurrency)
+        after = await _run("pooled", lambda: _image_post(pooled), posts, concurrency)
+        print(f"Speed-up: {after / before:.1f}x")
+    finally:
+        await pooled.aclose()
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.posts, args.concurrency))
@@ -0,0 +1,84 @@
+"""
+Benchmark concurrent repository throughput with and without executor offload.
+
+Simulates a DynamoDB table whose GetItem takes a fixed amount of wall time and
+issues many concurrent `get_post_by_id` calls. The "blocking" run calls boto3
+directly on the event loop (the old behaviour); the "offloaded" run goes through
+the bounded executor used by the repositories.
+
+Run with: JWT_SECRET=dev python -m benchmarks.repository_concurrency
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, UTC
+
+from repositories.executor import get_executor, shutdown_executor
+from repositories.scheduler_repository import SchedulerRepository
+
+
+class _SlowTable:
+    """Stand-in for a boto3 Table whose reads take `latency` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def get_item(self, Key):
+        time.sleep(self.latency)
+        now = datetime.now(UTC).isoformat()
+        return {
+            'Item': {
+                'postId': Key['postId'],
+                'strategyId': 'bench-strategy',
+                'copyId': 'bench-copy',
+                'userId': 'bench-user',
+                'content': 'Benchmark post',
+                'platform': 'linkedin',
+                'scheduledDate': '2030-01-01',
+                'scheduledTime': '09:00',
+                'status': 'scheduled',
+                'createdAt': now,
+                'updatedAt': now,
+            }
+        }
+
+
+def _make_repository(latency: float) -> SchedulerRepository:
+    repo = SchedulerRepository.__new__(SchedulerRepository)
+    repo.table_name = 'bench'
+    repo.region = 'us-east-1'
+    repo.table = _SlowTable(latency)
+    return repo
+
+
+async def _blocking_get(repo: SchedulerRepository, post_id: str):
+    """The pre-offload code path: boto3 called directly inside the coroutine."""
+    response = repo.table.get_item(Key={'postId': post_id})
+    return repo._item_to_record(response['Item'])
+
+
+async def _run(label: str, coro_factory, requests: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(coro_factory(f"post-{i}") for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {requests} requests in {elapsed:6.2f}s -> {requests / elapsed:8.1f} req/s")
+    return elapsed
+
+
+async def main(requests: int, latency: float) -> None:
+    repo = _make_repository(latency)
+    print(f"Simulated GetItem latency: {latency * 1000:.0f} ms, "
+          f"executor workers: {get_executor()._max_workers}")
+    blocking = await _run("blocking", lambda pid: _blocking_get(repo, pid), requests)
+    offloaded = await _run("offloaded", repo.get_post_by_id, requests)
+    print(f"Speed-up: {blocking / offloaded:.1f}x")
+    shutdown_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per GetItem")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.latency))
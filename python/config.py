@@ -21,12 +21,15 @@ class Settings(BaseSettings):
     aws_region: str = "us-east-1"
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
+    aws_max_pool_connections: int = 32  # Pooled HTTP connections per shared boto3 client
+    aws_tcp_keepalive: bool = True
     
     # DynamoDB Configuration
     dynamodb_users_table: str = "users-dev"
     dynamodb_strategies_table: str = "strategies-dev"
     dynamodb_copies_table: str = "copies-dev"
     dynamodb_scheduled_posts_table: str = "scheduled-posts-dev"
+    dynamodb_executor_max_workers: int = 16  # Threads available for blocking boto3 calls
     
     # JWT Configuration
     jwt_secret: str
@@ -43,14 +46,62 @@ class Settings(BaseSettings):
     
     # Publisher Configuration
     dynamodb_publish_log_table: str = "publish-log-dev"
-    publisher_scan_interval_seconds: int = 60
+    publisher_scan_interval_seconds: int = 300  # Reconciliation safety net; publishing is timer-driven
     linkedin_api_timeout_seconds: int = 30
+    linkedin_upload_timeout_seconds: int = 120
+    linkedin_api_base_url: str = "https://api.linkedin.com/rest"
+    linkedin_max_connections: int = 20
+    linkedin_max_keepalive_connections: int = 10
+    linkedin_keepalive_expiry_seconds: float = 30.0
+    linkedin_http2: bool = False  # Requires the optional 'h2' package
     publisher_enabled: bool = True
+    publisher_scanner_in_api: bool = True  # False when `python -m workers.publisher` runs the scanner
+    publisher_worker_port: int = 8081  # Health and metrics port of the standalone worker
+    publisher_worker_scan_interval_seconds: int = 60  # Workers miss the API's in-process change feed
+    publisher_due_index_enabled: bool = True  # False falls back to the full-table scan
+    publisher_due_lookback_days: int = 2  # Past due buckets queried each scan; the aged sweep covers older ones
+    publisher_due_aged_sweep_interval_seconds: int = 3600  # DueIndex sweep for posts older than the lookback
+    publisher_lease_seconds: int = 300  # Claim lease; must exceed the slowest single publish
+    publisher_drain_timeout_seconds: float = 25.0  # Shutdown wait for in-flight publishes
+    publisher_worker_id: str = ""  # Lease owner id; defaults to host:pid:random
+    publisher_pipeline_queue_size: int = 32  # Bound on each queue between publish stages
+    publisher_resolve_concurrency: int = 8  # Workers claiming posts and taking tokens
+    publisher_fetch_concurrency: int = 8  # Workers reading media records and opening S3 objects
+    publisher_upload_concurrency: int = 4  # Workers streaming images to LinkedIn
+    publisher_post_concurrency: int = 8  # Users posting at once; each user's posts stay in order
+    publisher_record_concurrency: int = 8  # Workers writing statuses and publish logs
+    publisher_prepare_lookahead_seconds: int = 900  # Upload images this far before due; 0 disables
+    publisher_upload_chunk_bytes: int = 256 * 1024  # S3 → LinkedIn streaming chunk size
+    publisher_upload_buffer_chunks: int = 4  # Chunks read ahead per upload
+    publisher_upload_max_bytes_in_flight: int = 64 * 1024 * 1024  # Across concurrent uploads
+    publisher_retry_max_attempts: int = 5  # Failed attempts before a post is marked failed
+    linkedin_member_posts_per_day: int = 150  # Per-member share quota
+    linkedin_member_burst: int = 10
+    linkedin_app_posts_per_day: int = 100000  # Application-wide quota
+    linkedin_app_burst: int = 100
+    linkedin_rate_limit_max_inline_wait_seconds: float = 5.0  # Longer waits defer the post
     s3_media_bucket: str = "zetca-post-media-dev"
     dynamodb_media_table: str = "post-media-dev"
     
     # Timeout Configuration
     agent_timeout_seconds: int = 60
+
+    # Copy generation: one concurrent agent call per platform, retrying failed platforms
+    copy_generation_fan_out: bool = True
+    copy_generation_platform_attempts: int = 2
+    copy_stream_persist_batch_size: int = 7  # Streamed copies stored per DynamoDB batch write
+
+    # Agent response cache: repeated strategy/copy/refine requests are served without Bedrock
+    agent_cache_enabled: bool = True
+    agent_cache_ttl_seconds: int = 86400
+    agent_cache_max_entries: int = 512
+    agent_cache_max_bytes: int = 32 * 1024 * 1024  # In-memory tier size cap
+    agent_cache_store: str = ""  # Shared second tier: "dynamodb", "disk" or "" for memory only
+    agent_cache_dir: str = ".agent-cache"  # Directory of the "disk" tier
+    dynamodb_agent_cache_table: str = "agent-cache-dev"
+
+    # Identical concurrent generation requests share one call; Idempotency-Key replays its result
+    idempotency_result_ttl_seconds: int = 3600
     
     model_config = ConfigDict(
         env_file=".env",
@@ -0,0 +1,240 @@
+"""
+Shared dependency providers for the FastAPI application.
+
+Each provider builds its object once per process, on first use, and returns
+the same instance on every call, so all routers, the publish scanner and the
+lifespan hooks share one set of repositories backed by the pooled clients in
+`repositories.aws_clients`. The providers take no arguments; routers take the
+services as `fastapi.Depends` parameters, so tests can replace them through
+`app.dependency_overrides`. `clear_providers` drops every cached instance, e.g.
+after the lifespan has closed the clients they hold.
+"""
+
+import logging
+from functools import lru_cache
+
+from config import settings
+from repositories.agent_cache_repository import AgentCacheRepository
+from repositories.copy_repository import CopyRepository
+from repositories.media_repository import MediaRepository
+from repositories.publisher_repository import PublisherRepository
+from repositories.scheduler_repository import SchedulerRepository
+from repositories.strategy_repository import StrategyRepository
+from repositories.user_repository import UserRepository
+from services.agent_cache import AgentResponseCache, DiskCacheStore
+from services.copy_service import CopyService
+from services.linkedin_client import LinkedInClient
+from services.publisher_service import PublisherService
+from services.scheduler_service import SchedulerService
+from services.single_flight import SingleFlight
+from services.rate_limiter import LinkedInRateLimiter
+from services.strategy_service import StrategyService
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_copy_repository() -> CopyRepository:
+    return CopyRepository(
+        table_name=settings.dynamodb_copies_table,
+        region=settings.aws_region,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_strategy_repository() -> StrategyRepository:
+    return StrategyRepository(
+        table_name=settings.dynamodb_strategies_table,
+        region=settings.aws_region,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_scheduler_repository() -> SchedulerRepository:
+    return SchedulerRepository(
+        table_name=settings.dynamodb_scheduled_posts_table,
+        region=settings.aws_region,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_publisher_repository() -> PublisherRepository:
+    return PublisherRepository(
+        table_name=settings.dynamodb_publish_log_table,
+        region=settings.aws_region,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_user_repository() -> UserRepository:
+    return UserRepository(
+        table_name=settings.dynamodb_users_table,
+        region=settings.aws_region,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_media_repository() -> MediaRepository:
+    return MediaRepository(
+        table_name=settings.dynamodb_media_table,
+        region=settings.aws_region,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_linkedin_client() -> LinkedInClient:
+    return LinkedInClient(
+        timeout_seconds=settings.linkedin_api_timeout_seconds,
+        upload_timeout_seconds=settings.linkedin_upload_timeout_seconds,
+        base_url=settings.linkedin_api_base_url,
+        max_connections=settings.linkedin_max_connections,
+        max_keepalive_connections=settings.linkedin_max_keepalive_connections,
+        keepalive_expiry_seconds=settings.linkedin_keepalive_expiry_seconds,
+        http2=settings.linkedin_http2,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> LinkedInRateLimiter:
+    return LinkedInRateLimiter.from_settings()
+
+
+@lru_cache(maxsize=None)
+def get_publisher_service() -> PublisherService:
+    return PublisherService(
+        linkedin_client=get_linkedin_client(),
+        publisher_repository=get_publisher_repository(),
+        scheduler_repository=get_scheduler_repository(),
+        user_repository=get_user_repository(),
+        media_repository=get_media_repository(),
+        rate_limiter=get_rate_limiter(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_agent_cache() -> AgentResponseCache:
+    store = None
+    if settings.agent_cache_store == "dynamodb":
+        store = AgentCacheRepository(
+            table_name=settings.dynamodb_agent_cache_table,
+            region=settings.aws_region,
+        )
+    elif settings.agent_cache_store == "disk":
+        store = DiskCacheStore(settings.agent_cache_dir)
+    return AgentResponseCache(
+        max_entries=settings.agent_cache_max_entries,
+        max_bytes=settings.agent_cache_max_bytes,
+        ttl_seconds=settings.agent_cache_ttl_seconds,
+        store=store,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_single_flight() -> SingleFlight:
+    return SingleFlight(result_ttl_seconds=settings.idempotency_result_ttl_seconds)
+
+
+@lru_cache(maxsize=None)
+def get_strategist_agent():
+    if settings.use_mock_agent:
+        logger.info("Using MOCK agent for strategy generation (no AWS required)")
+        from services.mock_agent import MockStrategistAgent
+        return MockStrategistAgent()
+    logger.info(f"Using REAL Strands agent with Bedrock (region: {settings.aws_region}, model: {settings.bedrock_model_id})")
+    from services.strategist_agent import StrategistAgent
+    return StrategistAgent(
+        aws_region=settings.aws_region,
+        model_id=settings.bedrock_model_id,
+        aws_access_key_id=settings.aws_access_key_id,
+        aws_secret_access_key=settings.aws_secret_access_key,
+        cache=get_agent_cache() if settings.agent_cache_enabled else None,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_copywriter_agent():
+    if settings.use_mock_agent:
+        logger.info("Using MOCK agent for copy generation (no AWS required)")
+        from services.mock_copywriter_agent import MockCopywriterAgent
+        return MockCopywriterAgent()
+    logger.info(f"Using REAL Copywriter agent with Bedrock (region: {settings.aws_region}, model: {settings.bedrock_model_id})")
+    from services.copywriter_agent import CopywriterAgent
+    return CopywriterAgent(
+        aws_region=settings.aws_region,
+        model_id=settings.bedrock_model_id,
+        aws_access_key_id=settings.aws_access_key_id,
+        aws_secret_access_key=settings.aws_secret_access_key,
+        fan_out=settings.copy_generation_fan_out,
+        platform_attempts=settings.copy_generation_platform_attempts,
+        cache=get_agent_cache() if settings.agent_cache_enabled else None,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_scheduler_agent():
+    if settings.use_mock_agent:
+        logger.info("Using MOCK agent for scheduling (no AWS required)")
+        from services.mock_scheduler_agent import MockSchedulerAgent
+        return MockSchedulerAgent()
+    logger.info(f"Using REAL Scheduler agent with Bedrock (region: {settings.aws_region}, model: {settings.bedrock_model_id})")
+    from services.scheduler_agent import SchedulerAgent
+    return SchedulerAgent(
+        aws_region=settings.aws_region,
+        model_id=settings.bedrock_model_id,
+        aws_access_key_id=settings.aws_access_key_id,
+        aws_secret_access_key=settings.aws_secret_access_key,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_strategy_service() -> StrategyService:
+    return StrategyService(
+        agent=get_strategist_agent(),
+        repository=get_strategy_repository(),
+        single_flight=get_single_flight(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_copy_service() -> CopyService:
+    return CopyService(
+        agent=get_copywriter_agent(),
+        copy_repository=get_copy_repository(),
+        strategy_repository=get_strategy_repository(),
+        single_flight=get_single_flight(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_scheduler_service() -> SchedulerService:
+    return SchedulerService(
+        agent=get_scheduler_agent(),
+        scheduler_repository=get_scheduler_repository(),
+        copy_repository=get_copy_repository(),
+        strategy_repository=get_strategy_repository(),
+        single_flight=get_single_flight(),
+    )
+
+
+def clear_providers() -> None:
+    """Forget every cached instance; the next provider call builds a new one."""
+    for provider in (
+        get_copy_repository,
+        get_strategy_repository,
+        get_scheduler_repository,
+        get_publisher_repository,
+        get_user_repository,
+        get_media_repository,
+        get_linkedin_client,
+        get_rate_limiter,
+        get_publisher_service,
+        get_agent_cache,
+        get_single_flight,
+        get_strategist_agent,
+        get_copywriter_agent,
+        get_scheduler_agent,
+        get_strategy_service,
+        get_copy_service,
+        get_scheduler_service,
+    ):
+        provider.cache_clear()
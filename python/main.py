@@ -11,20 +11,20 @@ from contextlib import asynccontextmanager
 # Suppress noisy botocore credential discovery logs
 logging.getLogger("botocore.credentials").setLevel(logging.WARNING)
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routes.strategy import router as strategy_router
 from routes.copy import router as copy_router
 from routes.scheduler import router as scheduler_router
 from routes.publisher import router as publisher_router
 from config import settings
-from services.linkedin_client import LinkedInClient
-from services.publisher_service import PublisherService
 from services.publish_scanner import PublishScanner
-from repositories.publisher_repository import PublisherRepository
-from repositories.scheduler_repository import SchedulerRepository
-from repositories.user_repository import UserRepository
-from repositories.media_repository import MediaRepository
+from dependencies import clear_providers, get_agent_cache, get_linkedin_client, get_publisher_service
+from middleware.auth import auth_middleware
+from models.agent_cache import AgentCacheStats
+from repositories.aws_clients import aws_clients
+from repositories.pagination import NEXT_CURSOR_HEADER
+from repositories.executor import shutdown_executor
 
 # Publisher background task reference
 publish_scanner: PublishScanner = None
@@ -34,20 +34,18 @@ publish_scanner: PublishScanner = None
 async def lifespan(app: FastAPI):
     """Manage startup and shutdown of background tasks."""
     global publish_scanner
-    if settings.publisher_enabled:
-        linkedin_client = LinkedInClient(timeout_seconds=settings.linkedin_api_timeout_seconds)
-        publisher_service = PublisherService(
-            linkedin_client=linkedin_client,
-            publisher_repository=PublisherRepository(),
-            scheduler_repository=SchedulerRepository(),
-            user_repository=UserRepository(),
-            media_repository=MediaRepository(),
-        )
-        publish_scanner = PublishScanner(publisher_service)
+    # With publisher_scanner_in_api off, standalone workers publish instead
+    if settings.publisher_enabled and settings.publisher_scanner_in_api:
+        publish_scanner = PublishScanner(get_publisher_service())
         await publish_scanner.start()
     yield
     if publish_scanner:
         await publish_scanner.stop()
+        publish_scanner = None
+    await get_linkedin_client().aclose()
+    shutdown_executor(wait=False)
+    aws_clients.close()
+    clear_providers()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -64,6 +62,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Register routes
@@ -79,6 +78,14 @@ async def health_check():
     return {"status": "healthy", "service": "zetca-agent"}
 
 
+@app.get("/api/agent-cache", response_model=AgentCacheStats)
+async def agent_cache_stats(user_id: str = Depends(auth_middleware.get_current_user)):
+    """Size and hit ratio of the agent response cache in this process."""
+    if not settings.agent_cache_enabled:
+        return AgentCacheStats(enabled=False)
+    return AgentCacheStats(enabled=True, **get_agent_cache().stats())
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
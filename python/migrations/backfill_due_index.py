@@ -0,0 +1,107 @@
+"""
+Backfill the sparse DueIndex attributes on the scheduled-posts table.
+
+Scans every post and sets `dueBucket`/`dueAt` on posts whose status is
+"scheduled", removing them from any other post, so the index matches what
+`SchedulerRepository` now writes. Safe to re-run: items that are already
+correct are skipped, and each write is conditional on the status and schedule
+it was computed from, so concurrent edits are never overwritten.
+
+Run with: python -m migrations.backfill_due_index [--dry-run]
+"""
+
+import argparse
+import logging
+
+from botocore.exceptions import ClientError
+
+from config import settings
+from repositories.aws_clients import aws_clients
+from repositories.scheduler_repository import due_attributes
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROJECTION = 'postId, #status, scheduledDate, scheduledTime, dueBucket, dueAt'
+
+
+def _scan(table):
+    """Yield every item in the table, one page at a time."""
+    kwargs = {
+        'ProjectionExpression': PROJECTION,
+        'ExpressionAttributeNames': {'#status': 'status'},
+    }
+    while True:
+        response = table.scan(**kwargs)
+        yield from response.get('Items', [])
+        if 'LastEvaluatedKey' not in response:
+            return
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def _apply(table, item: dict, due: dict) -> None:
+    """Write the desired due attributes, guarded against concurrent edits."""
+    values = {
+        ':status': item['status'],
+        ':date': item['scheduledDate'],
+        ':time': item['scheduledTime'],
+    }
+    if due:
+        update_expr = 'SET dueBucket = :due_bucket, dueAt = :due_at'
+        values.update({':due_bucket': due['dueBucket'], ':due_at': due['dueAt']})
+    else:
+        update_expr = 'REMOVE dueBucket, dueAt'
+    table.update_item(
+        Key={'postId': item['postId']},
+        UpdateExpression=update_expr,
+        ConditionExpression='#status = :status AND scheduledDate = :date AND scheduledTime = :time',
+        ExpressionAttributeNames={'#status': 'status'},
+        ExpressionAttributeValues=values,
+    )
+
+
+def backfill(table, dry_run: bool = False) -> dict:
+    """Reconcile dueBucket/dueAt on every item. Returns counters."""
+    counts = {'scanned': 0, 'indexed': 0, 'removed': 0, 'unchanged': 0, 'conflicts': 0}
+    for item in _scan(table):
+        counts['scanned'] += 1
+        due = due_attributes(
+            item.get('status'), item.get('scheduledDate'), item.get('scheduledTime'),
+            item.get('nextAttemptAt'),
+        )
+        current = {k: item[k] for k in ('dueBucket', 'dueAt') if k in item}
+        if current == due:
+            counts['unchanged'] += 1
+            continue
+
+        if not dry_run:
+            try:
+                _apply(table, item, due)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+                # Edited since the scan; the repository already wrote the right attributes
+                counts['conflicts'] += 1
+                continue
+        counts['indexed' if due else 'removed'] += 1
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--table', default=settings.dynamodb_scheduled_posts_table)
+    parser.add_argument('--region', default=settings.aws_region)
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    args = parser.parse_args()
+
+    table = aws_clients.table(args.table, args.region)
+    logger.info(f"Backfilling DueIndex attributes on {args.table} (dry_run={args.dry_run})")
+    counts = backfill(table, dry_run=args.dry_run)
+    logger.info(
+        "Done: scanned=%(scanned)d indexed=%(indexed)d removed=%(removed)d "
+        "unchanged=%(unchanged)d conflicts=%(conflicts)d", counts
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Backfill the precomputed scheduledAt epoch on the scheduled-posts table.
+
+Scans every post and sets `scheduledAt` (UTC epoch seconds of scheduledDate
+and scheduledTime) where it is missing or stale, so due checks and the legacy
+scan filter can compare integers. Safe to re-run: items that are already
+correct are skipped, and each write is conditional on the schedule it was
+computed from, so concurrent reschedules are never overwritten.
+
+Run with: python -m migrations.backfill_scheduled_at [--dry-run]
+"""
+
+import argparse
+import logging
+
+from botocore.exceptions import ClientError
+
+from config import settings
+from repositories.aws_clients import aws_clients
+from repositories.scheduler_repository import schedule_attributes
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROJECTION = 'postId, scheduledDate, scheduledTime, scheduledAt'
+
+
+def _scan(table):
+    """Yield every item in the table, one page at a time."""
+    kwargs = {'ProjectionExpression': PROJECTION}
+    while True:
+        response = table.scan(**kwargs)
+        yield from response.get('Items', [])
+        if 'LastEvaluatedKey' not in response:
+            return
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def _apply(table, item: dict, schedule: dict) -> None:
+    """Write the desired scheduledAt, guarded against concurrent edits."""
+    values = {':date': item['scheduledDate'], ':time': item['scheduledTime']}
+    if schedule:
+        update_expr = 'SET scheduledAt = :scheduled_at'
+        values[':scheduled_at'] = schedule['scheduledAt']
+    else:
+        update_expr = 'REMOVE scheduledAt'
+    table.update_item(
+        Key={'postId': item['postId']},
+        UpdateExpression=update_expr,
+        ConditionExpression='scheduledDate = :date AND scheduledTime = :time',
+        ExpressionAttributeValues=values,
+    )
+
+
+def backfill(table, dry_run: bool = False) -> dict:
+    """Reconcile scheduledAt on every item. Returns counters."""
+    counts = {'scanned': 0, 'updated': 0, 'invalid': 0, 'unchanged': 0, 'conflicts': 0}
+    for item in _scan(table):
+        counts['scanned'] += 1
+        schedule = schedule_attributes(item.get('scheduledDate'), item.get('scheduledTime'))
+        current = {'scheduledAt': item['scheduledAt']} if 'scheduledAt' in item else {}
+        if current == schedule:
+            counts['unchanged'] += 1
+            continue
+
+        if not dry_run:
+            try:
+                _apply(table, item, schedule)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+                # Rescheduled since the scan; the repository already wrote scheduledAt
+                counts['conflicts'] += 1
+                continue
+        if schedule:
+            counts['updated'] += 1
+        else:
+            logger.warning(f"Invalid date/time on post {item['postId']}; scheduledAt removed")
+            counts['invalid'] += 1
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--table', default=settings.dynamodb_scheduled_posts_table)
+    parser.add_argument('--region', default=settings.aws_region)
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    args = parser.parse_args()
+
+    table = aws_clients.table(args.table, args.region)
+    logger.info(f"Backfilling scheduledAt on {args.table} (dry_run={args.dry_run})")
+    counts = backfill(table, dry_run=args.dry_run)
+    logger.info(
+        "Done: scanned=%(scanned)d updated=%(updated)d invalid=%(invalid)d "
+        "unchanged=%(unchanged)d conflicts=%(conflicts)d", counts
+    )
+
+
+if __name__ == '__main__':
+    main()
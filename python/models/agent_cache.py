@@ -0,0 +1,22 @@
+"""
+Pydantic models for the agent response cache statistics endpoint.
+"""
+
+from typing import Optional
+from pydantic import BaseModel
+
+
+class AgentCacheStats(BaseModel):
+    """Size, limits and hit counts of this process's agent response cache."""
+    enabled: bool
+    entries: int = 0
+    bytes: int = 0
+    max_entries: int = 0
+    max_bytes: int = 0
+    ttl_seconds: int = 0
+    store: Optional[str] = None
+    memory_hits: int = 0
+    store_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    hit_ratio: float = 0.0
@@ -54,9 +54,45 @@ class LinkedInPostResponse(BaseModel):
     post_id: Optional[str] = None  # From x-restli-id header
     error_code: Optional[str] = None
     error_message: Optional[str] = None
+    # Seconds LinkedIn asked us to back off (Retry-After / X-RateLimit-* headers)
+    retry_after_seconds: Optional[float] = None
 
 
 class LinkedInImageUploadResponse(BaseModel):
     """Parsed response from LinkedIn image upload initialization."""
     upload_url: str
     image_urn: str
+
+
+class RateLimitBucket(BaseModel):
+    """Current level of one rate-limit token bucket."""
+    tokens: float
+    capacity: float
+    refill_per_second: float
+    blocked_for_seconds: float
+
+
+class RateLimitStatus(BaseModel):
+    """App-wide and per-member LinkedIn rate-limit bucket levels."""
+    app: RateLimitBucket
+    members: dict[str, RateLimitBucket]
+
+
+class PipelineStageStats(BaseModel):
+    """Queue depth and latency of one publish pipeline stage."""
+    name: str
+    concurrency: int
+    queue_size: int
+    depth: int
+    in_progress: int
+    processed: int
+    errors: int
+    avg_seconds: float
+    max_seconds: float
+    last_seconds: float
+
+
+class PipelineStatus(BaseModel):
+    """Per-stage statistics of the publish pipeline in this process."""
+    active_runs: int
+    stages: list[PipelineStageStats]
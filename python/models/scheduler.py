@@ -104,7 +104,7 @@ class ScheduledPostRecord(BaseModel):
     scheduled_time: str = Field(..., description="Time in HH:MM format")
     status: str = Field(
         default="draft",
-        description="Post status: draft, scheduled, or published"
+        description="Post status: draft, scheduled, publishing, published, or failed"
     )
     strategy_color: str = Field(
         default="",
@@ -120,6 +120,27 @@ class ScheduledPostRecord(BaseModel):
     )
     media_id: Optional[str] = Field(default=None, description="Optional media attachment ID")
     media_type: Optional[str] = Field(default=None, description="Media type: image or video")
+    image_urn: Optional[str] = Field(
+        default=None,
+        description="LinkedIn image URN uploaded ahead of the due time"
+    )
+    image_urn_media_id: Optional[str] = Field(
+        default=None,
+        description="Media ID the prepared image_urn was uploaded from"
+    )
+    attempt_count: int = Field(default=0, description="Failed publish attempts so far")
+    next_attempt_at: Optional[int] = Field(
+        default=None,
+        description="UTC epoch seconds of the next publish retry, while one is pending"
+    )
+    scheduled_at: Optional[int] = Field(
+        default=None,
+        description="UTC epoch seconds of scheduled_date/scheduled_time, as stored"
+    )
+    lease_expires_at: Optional[int] = Field(
+        default=None,
+        description="UTC epoch seconds when the publishing claim's lease expires, while claimed"
+    )
     updated_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
         description="Last modification timestamp"
@@ -128,7 +149,7 @@ class ScheduledPostRecord(BaseModel):
     @field_validator('status')
     @classmethod
     def validate_status(cls, v: str) -> str:
-        allowed = {'draft', 'scheduled', 'published'}
+        allowed = {'draft', 'scheduled', 'publishing', 'published', 'failed'}
         if v not in allowed:
             raise ValueError(f'status must be one of: {", ".join(allowed)}')
         return v
@@ -0,0 +1,43 @@
+"""
+DynamoDB second tier for the agent response cache.
+
+Entries are keyed by the content hash from `services.agent_cache.cache_key`
+and carry an `expiresAt` epoch that DynamoDB's TTL uses to delete them. TTL
+deletion is lazy, so expiry is also checked on read.
+"""
+
+import time
+from typing import Optional
+
+from repositories.aws_clients import aws_clients
+from repositories.executor import run_blocking
+from config import settings
+
+# DynamoDB items are limited to 400 KB; larger outputs stay memory-only
+MAX_VALUE_BYTES = 350 * 1024
+
+
+class AgentCacheRepository:
+    """Repository for cached agent outputs in DynamoDB."""
+
+    def __init__(self, table_name: str = None, region: str = None):
+        self.table_name = table_name or settings.dynamodb_agent_cache_table
+        self.region = region or settings.aws_region
+        self.table = aws_clients.table(self.table_name, self.region)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Cached output for key, or None when missing or expired."""
+        response = await run_blocking(self.table.get_item, Key={"cacheKey": key})
+        item = response.get("Item")
+        if item is None or int(item["expiresAt"]) <= time.time():
+            return None
+        return item["value"]
+
+    async def put(self, key: str, value: str, expires_at: int) -> None:
+        """Store an output until expires_at, replacing any earlier one."""
+        if len(value.encode("utf-8")) > MAX_VALUE_BYTES:
+            return
+        await run_blocking(
+            self.table.put_item,
+            Item={"cacheKey": key, "value": value, "expiresAt": expires_at},
+        )
@@ -0,0 +1,102 @@
+"""
+Process-wide registry of boto3 sessions, resources and clients.
+
+Creating a boto3 Session and DynamoDB resource is comparatively expensive
+(credential resolution, endpoint and service model loading) and every client
+keeps its own urllib3 connection pool. This module owns a single session per
+region and a single DynamoDB resource / S3 client per region, configured with
+a tuned connection pool and TCP keep-alive, so every repository and service
+in the process reuses the same pooled connections.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from config import settings
+
+
+class AWSClientRegistry:
+    """Lazily creates and caches boto3 sessions, resources and clients by region."""
+
+    def __init__(self, max_pool_connections: int, tcp_keepalive: bool = True):
+        self.max_pool_connections = max_pool_connections
+        self.tcp_keepalive = tcp_keepalive
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, boto3.Session] = {}
+        self._resources: Dict[tuple, object] = {}
+        self._clients: Dict[tuple, object] = {}
+
+    def _client_config(self) -> BotoConfig:
+        """Shared botocore config for all pooled clients."""
+        return BotoConfig(
+            max_pool_connections=self.max_pool_connections,
+            tcp_keepalive=self.tcp_keepalive,
+            retries={"mode": "standard"},
+        )
+
+    def session(self, region: Optional[str] = None) -> boto3.Session:
+        """Return the shared session for a region."""
+        region = region or settings.aws_region
+        with self._lock:
+            if region not in self._sessions:
+                # Uses env vars (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY) in containers,
+                # or falls back to ~/.aws/credentials locally
+                self._sessions[region] = boto3.Session(region_name=region)
+            return self._sessions[region]
+
+    def resource(self, service_name: str, region: Optional[str] = None):
+        """Return the shared boto3 resource for a service and region."""
+        region = region or settings.aws_region
+        key = (service_name, region)
+        session = self.session(region)
+        with self._lock:
+            if key not in self._resources:
+                self._resources[key] = session.resource(
+                    service_name, config=self._client_config()
+                )
+            return self._resources[key]
+
+    def client(self, service_name: str, region: Optional[str] = None):
+        """Return the shared low-level boto3 client for a service and region."""
+        region = region or settings.aws_region
+        key = (service_name, region)
+        session = self.session(region)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = session.client(
+                    service_name, config=self._client_config()
+                )
+            return self._clients[key]
+
+    def dynamodb(self, region: Optional[str] = None):
+        """Return the shared DynamoDB resource."""
+        return self.resource('dynamodb', region)
+
+    def table(self, table_name: str, region: Optional[str] = None):
+        """Return a Table handle backed by the shared DynamoDB resource."""
+        return self.dynamodb(region).Table(table_name)
+
+    def s3(self, region: Optional[str] = None):
+        """Return the shared S3 client."""
+        return self.client('s3', region)
+
+    def close(self) -> None:
+        """Close all pooled connections and forget cached clients."""
+        with self._lock:
+            for resource in self._resources.values():
+                resource.meta.client.close()
+            for client in self._clients.values():
+                client.close()
+            self._resources.clear()
+            self._clients.clear()
+            self._sessions.clear()
+
+
+# Global registry instance
+aws_clients = AWSClientRegistry(
+    max_pool_connections=settings.aws_max_pool_connections,
+    tcp_keepalive=settings.aws_tcp_keepalive,
+)
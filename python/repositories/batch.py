@@ -0,0 +1,79 @@
+"""
+BatchGetItem helper for reading many items by primary key.
+
+DynamoDB accepts at most 100 keys per BatchGetItem call and may return part of
+a request as `UnprocessedKeys` when it is throttled. `batch_get` splits the
+keys into chunks, fetches the chunks concurrently and re-requests unprocessed
+keys with exponential backoff, so callers get every item in a handful of round
+trips instead of one GetItem per key.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from repositories.executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# DynamoDB's per-request key limit for BatchGetItem
+MAX_BATCH_GET_KEYS = 100
+
+# How often unprocessed keys are retried before giving up
+MAX_UNPROCESSED_RETRIES = 5
+UNPROCESSED_BACKOFF_SECONDS = 0.05
+
+
+class BatchGetIncompleteError(Exception):
+    """Raised when keys stay unprocessed after all retries."""
+    pass
+
+
+async def _batch_get_chunk(table, keys: List[dict], request_options: dict) -> List[dict]:
+    """Fetch up to MAX_BATCH_GET_KEYS keys, retrying unprocessed ones."""
+    items = []
+    request = {table.name: {'Keys': keys, **request_options}}
+    for attempt in range(MAX_UNPROCESSED_RETRIES + 1):
+        response = await run_blocking(table.meta.client.batch_get_item, RequestItems=request)
+        items.extend(response.get('Responses', {}).get(table.name, []))
+        request = response.get('UnprocessedKeys') or {}
+        if not request:
+            return items
+        if attempt < MAX_UNPROCESSED_RETRIES:
+            await asyncio.sleep(UNPROCESSED_BACKOFF_SECONDS * 2 ** attempt)
+    unprocessed = len(request[table.name]['Keys'])
+    raise BatchGetIncompleteError(
+        f"{unprocessed} keys still unprocessed in {table.name} after {MAX_UNPROCESSED_RETRIES} retries"
+    )
+
+
+async def batch_get(
+    table,
+    key_name: str,
+    key_values,
+    projection: Optional[str] = None,
+    expression_names: Optional[dict] = None,
+) -> Dict[str, dict]:
+    """Fetch the items whose `key_name` is in `key_values`, keyed by that value.
+
+    Keys that do not exist are simply absent from the result. Raises
+    BatchGetIncompleteError if DynamoDB keeps returning unprocessed keys.
+    """
+    unique = list(dict.fromkeys(v for v in key_values if v))
+    if not unique:
+        return {}
+
+    request_options = {}
+    if projection:
+        request_options['ProjectionExpression'] = projection
+    if expression_names:
+        request_options['ExpressionAttributeNames'] = expression_names
+
+    chunks = [
+        [{key_name: value} for value in unique[i:i + MAX_BATCH_GET_KEYS]]
+        for i in range(0, len(unique), MAX_BATCH_GET_KEYS)
+    ]
+    results = await asyncio.gather(*(
+        _batch_get_chunk(table, chunk, request_options) for chunk in chunks
+    ))
+    return {item[key_name]: item for items in results for item in items}
@@ -5,13 +5,19 @@ This module provides data access methods for storing and retrieving copy records
 from DynamoDB with user isolation enforcement and strategy-based querying.
 """
 
-import boto3
 from boto3.dynamodb.conditions import Key
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime, UTC
 from models.copy import CopyRecord
+from repositories.aws_clients import aws_clients
+from repositories.executor import run_blocking
+from repositories.pagination import query_all, query_page
 from config import settings
 
+# Attributes of each index page's LastEvaluatedKey, checked on incoming cursors
+STRATEGY_INDEX_CURSOR_KEY = ('copyId', 'strategyId', 'createdAt')
+USER_INDEX_CURSOR_KEY = ('copyId', 'userId', 'createdAt')
+
 
 class CopyRepository:
     """Repository for copy data access in DynamoDB."""
@@ -19,26 +25,28 @@ class CopyRepository:
     def __init__(self, table_name: str = None, region: str = None):
         self.table_name = table_name or settings.dynamodb_copies_table
         self.region = region or settings.aws_region
-        # Initialize DynamoDB resource
-        session = boto3.Session(region_name=self.region)
-        dynamodb = session.resource('dynamodb')
-        self.table = dynamodb.Table(self.table_name)
+        self.table = aws_clients.table(self.table_name, self.region)
 
     async def create_copy(self, record: CopyRecord) -> CopyRecord:
         """Store a single copy record."""
-        self.table.put_item(Item=self._record_to_item(record))
+        await run_blocking(self.table.put_item, Item=self._record_to_item(record))
         return record
 
     async def create_copies(self, records: List[CopyRecord]) -> List[CopyRecord]:
         """Batch store multiple copy records."""
-        with self.table.batch_writer() as batch:
-            for record in records:
-                batch.put_item(Item=self._record_to_item(record))
+        items = [self._record_to_item(record) for record in records]
+
+        def _write():
+            with self.table.batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+
+        await run_blocking(_write)
         return records
 
     async def get_copy_by_id(self, copy_id: str, user_id: str = None) -> Optional[CopyRecord]:
         """Retrieve a copy by ID with optional user isolation."""
-        response = self.table.get_item(Key={'copyId': copy_id})
+        response = await run_blocking(self.table.get_item, Key={'copyId': copy_id})
         if 'Item' not in response:
             return None
         item = response['Item']
@@ -46,33 +54,85 @@ class CopyRepository:
             return None
         return self._item_to_record(item)
 
+    async def get_copy_for_user(
+        self, copy_id: str, user_id: str
+    ) -> tuple[Optional[CopyRecord], bool]:
+        """
+        Retrieve a copy and check ownership with a single GetItem.
+
+        Returns:
+            (record, False)  — found and owned by user
+            (None, True)     — exists but belongs to another user
+            (None, False)    — does not exist
+        """
+        response = await run_blocking(self.table.get_item, Key={'copyId': copy_id})
+        if 'Item' not in response:
+            return (None, False)
+        item = response['Item']
+        if item['userId'] != user_id:
+            return (None, True)
+        return (self._item_to_record(item), False)
+
     async def copy_exists(self, copy_id: str) -> bool:
         """Check if a copy exists regardless of owner."""
-        response = self.table.get_item(Key={'copyId': copy_id})
+        response = await run_blocking(self.table.get_item, Key={'copyId': copy_id})
         return 'Item' in response
 
     async def list_copies_by_strategy(self, strategy_id: str) -> List[CopyRecord]:
         """List all copies for a strategy, sorted by createdAt descending."""
-        response = self.table.query(
+        items = await query_all(
+            self.table,
             IndexName='StrategyIdIndex',
             KeyConditionExpression=Key('strategyId').eq(strategy_id),
             ScanIndexForward=False
         )
-        return [self._item_to_record(item) for item in response.get('Items', [])]
+        return [self._item_to_record(item) for item in items]
+
+    async def list_copies_by_strategy_page(
+        self, strategy_id: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Tuple[List[CopyRecord], Optional[str]]:
+        """List one page of a strategy's copies. Returns (records, next_cursor)."""
+        items, next_cursor = await query_page(
+            self.table,
+            limit=limit,
+            cursor=cursor,
+            key_attributes=STRATEGY_INDEX_CURSOR_KEY,
+            IndexName='StrategyIdIndex',
+            KeyConditionExpression=Key('strategyId').eq(strategy_id),
+            ScanIndexForward=False
+        )
+        return [self._item_to_record(item) for item in items], next_cursor
 
     async def list_copies_by_user(self, user_id: str) -> List[CopyRecord]:
         """List all copies for a user, sorted by createdAt descending."""
-        response = self.table.query(
+        items = await query_all(
+            self.table,
+            IndexName='UserIdIndex',
+            KeyConditionExpression=Key('userId').eq(user_id),
+            ScanIndexForward=False
+        )
+        return [self._item_to_record(item) for item in items]
+
+    async def list_copies_by_user_page(
+        self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Tuple[List[CopyRecord], Optional[str]]:
+        """List one page of a user's copies. Returns (records, next_cursor)."""
+        items, next_cursor = await query_page(
+            self.table,
+            limit=limit,
+            cursor=cursor,
+            key_attributes=USER_INDEX_CURSOR_KEY,
             IndexName='UserIdIndex',
             KeyConditionExpression=Key('userId').eq(user_id),
             ScanIndexForward=False
         )
-        return [self._item_to_record(item) for item in response.get('Items', [])]
+        return [self._item_to_record(item) for item in items], next_cursor
 
     async def update_copy(self, copy_id: str, text: str, hashtags: List[str]) -> CopyRecord:
         """Update copy text and hashtags, setting updatedAt."""
         now = datetime.now(UTC).isoformat()
-        response = self.table.update_item(
+        response = await run_blocking(
+            self.table.update_item,
             Key={'copyId': copy_id},
             UpdateExpression='SET #txt = :text, hashtags = :hashtags, updatedAt = :updated_at',
             ExpressionAttributeNames={'#txt': 'text'},
@@ -87,7 +147,8 @@ class CopyRepository:
 
     async def delete_copy(self, copy_id: str) -> bool:
         """Delete a copy record. Returns True if deleted."""
-        response = self.table.delete_item(
+        response = await run_blocking(
+            self.table.delete_item,
             Key={'copyId': copy_id},
             ReturnValues='ALL_OLD'
         )
@@ -0,0 +1,81 @@
+"""
+Bounded thread pools for blocking DynamoDB and S3 calls.
+
+boto3 is a synchronous SDK, so every `Table.get_item`/`query`/`put_item` call
+blocks the calling thread until the round trip completes. Running those calls
+directly inside `async def` repository methods stalls the uvicorn event loop
+(and the publish scanner) for the duration of the request. This module offloads
+them to a dedicated, size-limited thread pool so that many requests can wait on
+DynamoDB concurrently while the event loop keeps serving other work.
+
+S3 calls (opening media objects and reading their bodies chunk by chunk) get a
+separate, smaller pool sized to the publisher's fetch and upload concurrency.
+A slow S3 read holds its thread for the whole round trip; sharing the DynamoDB
+pool would let a few large uploads starve repository calls.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from config import settings
+
+_executor: Optional[ThreadPoolExecutor] = None
+_s3_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared DynamoDB executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.dynamodb_executor_max_workers,
+                    thread_name_prefix="dynamodb",
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking boto3 call on the bounded executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def get_s3_executor() -> ThreadPoolExecutor:
+    """Return the shared S3 executor, creating it on first use."""
+    global _s3_executor
+    if _s3_executor is None:
+        with _executor_lock:
+            if _s3_executor is None:
+                _s3_executor = ThreadPoolExecutor(
+                    max_workers=(settings.publisher_fetch_concurrency
+                                 + settings.publisher_upload_concurrency),
+                    thread_name_prefix="s3",
+                )
+    return _s3_executor
+
+
+async def run_blocking_s3(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking S3 call on the S3 executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_s3_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """Shut down the shared executors. New ones are created on next use."""
+    global _executor, _s3_executor
+    with _executor_lock:
+        for executor in (_executor, _s3_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait)
+        _executor = None
+        _s3_executor = None
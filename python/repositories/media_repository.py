@@ -5,8 +5,10 @@ This module provides read-only access to media records from the post-media Dynam
 used by the publisher service to retrieve S3 keys and content types for image posts.
 """
 
-import boto3
-from typing import Optional
+from typing import Dict, Iterable, Optional
+from repositories.aws_clients import aws_clients
+from repositories.batch import batch_get
+from repositories.executor import run_blocking
 from config import settings
 
 
@@ -16,9 +18,7 @@ class MediaRepository:
     def __init__(self, table_name: str = None, region: str = None):
         self.table_name = table_name or settings.dynamodb_media_table
         self.region = region or settings.aws_region
-        session = boto3.Session(region_name=self.region)
-        dynamodb = session.resource('dynamodb')
-        self.table = dynamodb.Table(self.table_name)
+        self.table = aws_clients.table(self.table_name, self.region)
 
     async def get_media_by_id(self, media_id: str) -> Optional[dict]:
         """
@@ -27,7 +27,15 @@ class MediaRepository:
         Returns dict with s3Key, contentType, mediaType, etc.
         Returns None if not found.
         """
-        response = self.table.get_item(Key={'mediaId': media_id})
+        response = await run_blocking(self.table.get_item, Key={'mediaId': media_id})
         if 'Item' not in response:
             return None
         return response['Item']
+
+    async def batch_get_media(self, media_ids: Iterable[str]) -> Dict[str, dict]:
+        """
+        Retrieve many media records via BatchGetItem.
+
+        Returns {mediaId: record}; IDs that do not exist are absent.
+        """
+        return await batch_get(self.table, 'mediaId', media_ids)
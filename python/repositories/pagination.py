@@ -0,0 +1,116 @@
+"""
+Cursor pagination helpers for DynamoDB queries.
+
+DynamoDB returns at most 1 MB per Query call and signals the remainder with
+`LastEvaluatedKey`. These helpers either follow that key to the end
+(`query_all`) or expose it to API clients as an opaque, URL-safe cursor string
+(`query_page`) so large result sets can be read one bounded page at a time.
+"""
+
+import base64
+import binascii
+import json
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
+
+from repositories.executor import run_blocking
+
+# Response header carrying the cursor for the next page of a list endpoint
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+# Largest page size accepted by list endpoints
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+def _json_default(value):
+    """Serialize Decimal key attributes (DynamoDB numbers) for the cursor."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def encode_cursor(last_evaluated_key: Optional[dict]) -> Optional[str]:
+    """Encode a LastEvaluatedKey as an opaque cursor. Returns None at the end."""
+    if not last_evaluated_key:
+        return None
+    raw = json.dumps(last_evaluated_key, default=_json_default, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(
+    cursor: Optional[str], key_attributes: Optional[Iterable[str]] = None
+) -> Optional[dict]:
+    """Decode a cursor back into an ExclusiveStartKey.
+
+    With `key_attributes`, the decoded key must hold exactly those attributes
+    (the table key plus the queried index's keys), each a string, so a forged
+    or foreign cursor is rejected here instead of failing inside DynamoDB.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+    if not isinstance(key, dict):
+        raise InvalidCursorError("Invalid pagination cursor")
+    if key_attributes is not None and (
+        set(key) != set(key_attributes)
+        or not all(isinstance(value, str) for value in key.values())
+    ):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return key
+
+
+async def query_page(
+    table,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    *,
+    key_attributes: Iterable[str],
+    **query_kwargs,
+) -> Tuple[List[dict], Optional[str]]:
+    """Run one Query call and return (items, next_cursor).
+
+    `key_attributes` names the attributes of the query's LastEvaluatedKey;
+    the incoming cursor is validated against them.
+    """
+    if limit is not None:
+        query_kwargs['Limit'] = limit
+    start_key = decode_cursor(cursor, key_attributes)
+    if start_key:
+        query_kwargs['ExclusiveStartKey'] = start_key
+    response = await run_blocking(table.query, **query_kwargs)
+    return response.get('Items', []), encode_cursor(response.get('LastEvaluatedKey'))
+
+
+async def query_all(table, **query_kwargs) -> List[dict]:
+    """Run a Query and follow LastEvaluatedKey until every page is read."""
+    items = []
+    response = await run_blocking(table.query, **query_kwargs)
+    items.extend(response.get('Items', []))
+    while 'LastEvaluatedKey' in response:
+        response = await run_blocking(
+            table.query, ExclusiveStartKey=response['LastEvaluatedKey'], **query_kwargs
+        )
+        items.extend(response.get('Items', []))
+    return items
+
+
+async def scan_all(table, **scan_kwargs) -> List[dict]:
+    """Run a Scan and follow LastEvaluatedKey until every page is read."""
+    items = []
+    response = await run_blocking(table.scan, **scan_kwargs)
+    items.extend(response.get('Items', []))
+    while 'LastEvaluatedKey' in response:
+        response = await run_blocking(
+            table.scan, ExclusiveStartKey=response['LastEvaluatedKey'], **scan_kwargs
+        )
+        items.extend(response.get('Items', []))
+    return items
@@ -7,13 +7,18 @@ UserIdIndex) and by post (via PostIdIndex), and includes access control helpers
 for verifying post ownership.
 """
 
-import boto3
 from boto3.dynamodb.conditions import Key
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, UTC
 from models.publisher import PublishLogRecord
+from repositories.aws_clients import aws_clients
+from repositories.executor import run_blocking
+from repositories.pagination import query_all, query_page
 from config import settings
 
+# Attributes of a UserIdIndex page's LastEvaluatedKey, checked on incoming cursors
+USER_INDEX_CURSOR_KEY = ('logId', 'userId', 'attemptedAt')
+
 
 class PublisherRepository:
     """Repository for publish log data access in DynamoDB."""
@@ -21,39 +26,73 @@ class PublisherRepository:
     def __init__(self, table_name: str = None, region: str = None):
         self.table_name = table_name or settings.dynamodb_publish_log_table
         self.region = region or settings.aws_region
-        session = boto3.Session(region_name=self.region)
-        dynamodb = session.resource('dynamodb')
-        self.table = dynamodb.Table(self.table_name)
+        self.table = aws_clients.table(self.table_name, self.region)
         # Separate reference to scheduled-posts table for ownership checks
-        self.scheduled_posts_table = dynamodb.Table(
-            settings.dynamodb_scheduled_posts_table
+        self.scheduled_posts_table = aws_clients.table(
+            settings.dynamodb_scheduled_posts_table, self.region
         )
 
     async def create_log(self, record: PublishLogRecord) -> PublishLogRecord:
         """Store a publish log record."""
-        self.table.put_item(Item=self._record_to_item(record))
+        await run_blocking(self.table.put_item, Item=self._record_to_item(record))
         return record
 
+    async def create_logs(self, records: List[PublishLogRecord]) -> List[PublishLogRecord]:
+        """Batch store multiple publish log records."""
+        items = [self._record_to_item(record) for record in records]
+
+        def _write():
+            with self.table.batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+
+        if items:
+            await run_blocking(_write)
+        return records
+
+    def log_put(self, record: PublishLogRecord) -> dict:
+        """TransactWriteItems entry storing a publish log record (see complete_publish)."""
+        return {'Put': {'TableName': self.table_name, 'Item': self._record_to_item(record)}}
+
     async def list_logs_by_user(self, user_id: str) -> List[PublishLogRecord]:
         """Query UserIdIndex for all logs belonging to a user, sorted by attemptedAt descending."""
-        response = self.table.query(
+        items = await query_all(
+            self.table,
             IndexName='UserIdIndex',
             KeyConditionExpression=Key('userId').eq(user_id),
             ScanIndexForward=False  # Sort by attemptedAt descending
         )
-        return [self._item_to_record(item) for item in response.get('Items', [])]
+        return [self._item_to_record(item) for item in items]
+
+    async def list_logs_by_user_page(
+        self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Tuple[List[PublishLogRecord], Optional[str]]:
+        """Query one page of a user's logs, newest first. Returns (records, next_cursor)."""
+        items, next_cursor = await query_page(
+            self.table,
+            limit=limit,
+            cursor=cursor,
+            key_attributes=USER_INDEX_CURSOR_KEY,
+            IndexName='UserIdIndex',
+            KeyConditionExpression=Key('userId').eq(user_id),
+            ScanIndexForward=False  # Sort by attemptedAt descending
+        )
+        return [self._item_to_record(item) for item in items], next_cursor
 
     async def list_logs_by_post(self, post_id: str) -> List[PublishLogRecord]:
         """Query PostIdIndex for all publish attempts on a specific post."""
-        response = self.table.query(
+        items = await query_all(
+            self.table,
             IndexName='PostIdIndex',
             KeyConditionExpression=Key('postId').eq(post_id),
         )
-        return [self._item_to_record(item) for item in response.get('Items', [])]
+        return [self._item_to_record(item) for item in items]
 
     async def get_post_owner(self, post_id: str) -> Optional[str]:
         """Retrieve the userId for a post from the scheduled-posts table (for access control)."""
-        response = self.scheduled_posts_table.get_item(Key={'postId': post_id})
+        response = await run_blocking(
+            self.scheduled_posts_table.get_item, Key={'postId': post_id}
+        )
         if 'Item' not in response:
             return None
         return response['Item'].get('userId')
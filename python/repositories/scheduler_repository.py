@@ -3,16 +3,160 @@ DynamoDB repository for scheduled post data access.
 
 This module provides data access methods for storing and retrieving scheduled post
 records from DynamoDB with user isolation enforcement, strategy-based querying,
-and full CRUD operations.
+and full CRUD operations. Writes are published to in-process change listeners so
+the publish scanner can track upcoming due times without polling.
 """
 
-import boto3
-from boto3.dynamodb.conditions import Key
-from typing import Optional, List
-from datetime import datetime, UTC
+import asyncio
+import logging
+import time
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from typing import Callable, Optional, List, Tuple
+from datetime import datetime, timedelta, UTC
 from models.scheduler import ScheduledPostRecord
+from repositories.aws_clients import aws_clients
+from repositories.executor import run_blocking
+from repositories.pagination import query_all, query_page, scan_all
 from config import settings
 
+logger = logging.getLogger(__name__)
+
+# Change listener: called with (post_id, due_at) after every write; due_at is
+# None when the post is no longer awaiting publication (or was deleted)
+PostChangeListener = Callable[[str, Optional[int]], None]
+
+# Sparse GSI holding only posts awaiting publication: hash dueBucket, range dueAt
+DUE_INDEX = 'DueIndex'
+
+# Attributes of each index page's LastEvaluatedKey, checked on incoming cursors
+USER_INDEX_CURSOR_KEY = ('postId', 'userId', 'scheduledDate')
+STRATEGY_INDEX_CURSOR_KEY = ('postId', 'strategyId', 'scheduledDate')
+
+# Due buckets are UTC calendar days
+DUE_BUCKET_FORMAT = '%Y-%m-%d'
+
+# Statuses that keep a post in the DueIndex: "publishing" posts stay indexed so
+# an expired claim can be found and recovered by the next scan
+AWAITING_PUBLICATION = {'scheduled', 'publishing'}
+
+# Attributes derived from a post's schedule and status, with the value
+# placeholders used when they are rewritten
+DERIVED_ATTRIBUTES = {'scheduledAt': ':scheduled_at', 'dueBucket': ':due_bucket', 'dueAt': ':due_at'}
+
+# Read-then-write rounds update_post makes before giving up on a post that
+# keeps changing between its read and its conditional write
+UPDATE_POST_ATTEMPTS = 3
+
+
+class PostBeingPublishedError(Exception):
+    """Raised when an edit hits a post that a publisher has claimed."""
+
+
+def _condition_failed(error: ClientError) -> bool:
+    """Whether a write (or the first item of a transaction) failed its condition."""
+    code = error.response['Error']['Code']
+    if code == 'ConditionalCheckFailedException':
+        return True
+    if code == 'TransactionCanceledException':
+        reasons = error.response.get('CancellationReasons') or []
+        return bool(reasons) and reasons[0].get('Code') == 'ConditionalCheckFailed'
+    return False
+
+
+def compute_due_at(scheduled_date: str, scheduled_time: str) -> Optional[int]:
+    """Return the UTC epoch seconds for a post's date/time, or None if unparseable."""
+    try:
+        dt = datetime.strptime(f"{scheduled_date} {scheduled_time}", "%Y-%m-%d %H:%M")
+    except (ValueError, TypeError):
+        return None
+    return int(dt.replace(tzinfo=UTC).timestamp())
+
+
+def due_bucket(due_at: int) -> str:
+    """Return the DueIndex partition (UTC day) for a due epoch."""
+    return datetime.fromtimestamp(due_at, UTC).strftime(DUE_BUCKET_FORMAT)
+
+
+def schedule_attributes(scheduled_date: str, scheduled_time: str) -> dict:
+    """The precomputed scheduledAt epoch of a post, or {} when unparseable.
+
+    Unlike dueAt, scheduledAt is stored on every post whatever its status and
+    never moves for retries, so due checks and scan filters can compare
+    integers instead of parsing the date and time of each row.
+    """
+    scheduled_at = compute_due_at(scheduled_date, scheduled_time)
+    return {} if scheduled_at is None else {'scheduledAt': scheduled_at}
+
+
+def effective_due_at(
+    scheduled_date: str,
+    scheduled_time: str,
+    next_attempt_at: Optional[int] = None,
+    scheduled_at: Optional[int] = None,
+) -> Optional[int]:
+    """Return when a post should next be published: its scheduled time, pushed
+    back to `next_attempt_at` while a retry is pending. A known `scheduled_at`
+    epoch is used as is instead of parsing the date and time."""
+    due_at = scheduled_at if scheduled_at is not None else compute_due_at(scheduled_date, scheduled_time)
+    if due_at is None or next_attempt_at is None:
+        return due_at
+    return max(due_at, int(next_attempt_at))
+
+
+def post_due_at(post: ScheduledPostRecord) -> Optional[int]:
+    """Effective due epoch of a post record (see effective_due_at)."""
+    return effective_due_at(
+        post.scheduled_date, post.scheduled_time, post.next_attempt_at, post.scheduled_at
+    )
+
+
+def post_ready_at(post: ScheduledPostRecord) -> Optional[int]:
+    """When a post can next be published: its effective due time, or for a
+    post claimed in "publishing" the later expiry of that claim's lease."""
+    due_at = post_due_at(post)
+    if due_at is None or post.status != 'publishing' or post.lease_expires_at is None:
+        return due_at
+    return max(due_at, post.lease_expires_at)
+
+
+def due_attributes(
+    status: str,
+    scheduled_date: str,
+    scheduled_time: str,
+    next_attempt_at: Optional[int] = None,
+    scheduled_at: Optional[int] = None,
+) -> dict:
+    """DueIndex key attributes for a post, or {} when it must not be indexed.
+
+    Only posts awaiting publication ("scheduled", or claimed and "publishing")
+    carry dueBucket/dueAt, which keeps the index sparse: drafts, published and
+    failed posts never appear in it. A pending retry moves dueAt to the retry
+    time, so backed-off posts are not selected before then.
+    """
+    if status not in AWAITING_PUBLICATION:
+        return {}
+    due_at = effective_due_at(scheduled_date, scheduled_time, next_attempt_at, scheduled_at)
+    if due_at is None:
+        return {}
+    return {'dueBucket': due_bucket(due_at), 'dueAt': due_at}
+
+
+def _with_date_range(key_condition, date_from: Optional[str], date_to: Optional[str]):
+    """Narrow an index key condition to an inclusive scheduledDate range.
+
+    scheduledDate is stored as YYYY-MM-DD, so lexical order matches date order.
+    A bare date bound also covers every time on that day.
+    """
+    scheduled_date = Key('scheduledDate')
+    if date_from and date_to:
+        return key_condition & scheduled_date.between(date_from, date_to)
+    if date_from:
+        return key_condition & scheduled_date.gte(date_from)
+    if date_to:
+        return key_condition & scheduled_date.lte(date_to)
+    return key_condition
+
 
 class SchedulerRepository:
     """Repository for scheduled post data access in DynamoDB."""
@@ -20,26 +164,57 @@ class SchedulerRepository:
     def __init__(self, table_name: str = None, region: str = None):
         self.table_name = table_name or settings.dynamodb_scheduled_posts_table
         self.region = region or settings.aws_region
-        # Initialize DynamoDB resource
-        session = boto3.Session(region_name=self.region)
-        dynamodb = session.resource('dynamodb')
-        self.table = dynamodb.Table(self.table_name)
+        self.table = aws_clients.table(self.table_name, self.region)
+
+    # Copy-on-write tuple so listeners can be added while a notification runs
+    _change_listeners: Tuple[PostChangeListener, ...] = ()
+
+    # Monotonic time of the last sweep for due posts older than the lookback
+    _aged_sweep_at: Optional[float] = None
+
+    def add_change_listener(self, listener: PostChangeListener) -> None:
+        """Subscribe to post writes made through this repository."""
+        self._change_listeners = self._change_listeners + (listener,)
+
+    def remove_change_listener(self, listener: PostChangeListener) -> None:
+        """Unsubscribe a listener added with add_change_listener."""
+        self._change_listeners = tuple(
+            existing for existing in self._change_listeners if existing is not listener
+        )
+
+    def _notify(self, post_id: str, due_at) -> None:
+        """Tell listeners about a write. Listener errors never fail the write."""
+        due_at = int(due_at) if due_at is not None else None
+        for listener in self._change_listeners:
+            try:
+                listener(post_id, due_at)
+            except Exception as e:
+                logger.error(f"Post change listener failed for {post_id}: {e}", exc_info=True)
 
     async def create_post(self, record: ScheduledPostRecord) -> ScheduledPostRecord:
         """Store a single scheduled post record."""
-        self.table.put_item(Item=self._record_to_item(record))
+        item = self._record_to_item(record)
+        await run_blocking(self.table.put_item, Item=item)
+        self._notify(record.id, item.get('dueAt'))
         return record
 
     async def create_posts(self, records: List[ScheduledPostRecord]) -> List[ScheduledPostRecord]:
         """Batch store multiple scheduled post records."""
-        with self.table.batch_writer() as batch:
-            for record in records:
-                batch.put_item(Item=self._record_to_item(record))
+        items = [self._record_to_item(record) for record in records]
+
+        def _write():
+            with self.table.batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+
+        await run_blocking(_write)
+        for item in items:
+            self._notify(item['postId'], item.get('dueAt'))
         return records
 
     async def get_post_by_id(self, post_id: str, user_id: str = None) -> Optional[ScheduledPostRecord]:
         """Retrieve a post by ID with optional user isolation."""
-        response = self.table.get_item(Key={'postId': post_id})
+        response = await run_blocking(self.table.get_item, Key={'postId': post_id})
         if 'Item' not in response:
             return None
         item = response['Item']
@@ -47,31 +222,194 @@ class SchedulerRepository:
             return None
         return self._item_to_record(item)
 
+    async def get_post_for_user(
+        self, post_id: str, user_id: str
+    ) -> tuple[Optional[ScheduledPostRecord], bool]:
+        """
+        Retrieve a post and check ownership with a single GetItem.
+
+        Returns:
+            (record, False)  — found and owned by user
+            (None, True)     — exists but belongs to another user
+            (None, False)    — does not exist
+        """
+        response = await run_blocking(self.table.get_item, Key={'postId': post_id})
+        if 'Item' not in response:
+            return (None, False)
+        item = response['Item']
+        if item['userId'] != user_id:
+            return (None, True)
+        return (self._item_to_record(item), False)
+
     async def post_exists(self, post_id: str) -> bool:
         """Check if a post exists regardless of owner."""
-        response = self.table.get_item(Key={'postId': post_id})
+        response = await run_blocking(self.table.get_item, Key={'postId': post_id})
         return 'Item' in response
 
-    async def list_posts_by_user(self, user_id: str) -> List[ScheduledPostRecord]:
-        """List all posts for a user via UserIdIndex, sorted by scheduledDate ascending."""
-        response = self.table.query(
+    async def list_posts_by_user(
+        self, user_id: str, date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> List[ScheduledPostRecord]:
+        """List a user's posts via UserIdIndex, sorted by scheduledDate ascending.
+
+        When date_from / date_to (inclusive YYYY-MM-DD) are given, the range is
+        applied on the scheduledDate sort key so only that window is read.
+        """
+        items = await query_all(
+            self.table,
+            IndexName='UserIdIndex',
+            KeyConditionExpression=_with_date_range(Key('userId').eq(user_id), date_from, date_to),
+            ScanIndexForward=True  # Sort by scheduledDate ascending
+        )
+        return [self._item_to_record(item) for item in items]
+
+    async def list_posts_by_user_page(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> Tuple[List[ScheduledPostRecord], Optional[str]]:
+        """List one page of a user's posts. Returns (records, next_cursor)."""
+        items, next_cursor = await query_page(
+            self.table,
+            limit=limit,
+            cursor=cursor,
+            key_attributes=USER_INDEX_CURSOR_KEY,
             IndexName='UserIdIndex',
-            KeyConditionExpression=Key('userId').eq(user_id),
+            KeyConditionExpression=_with_date_range(Key('userId').eq(user_id), date_from, date_to),
+            ScanIndexForward=True  # Sort by scheduledDate ascending
+        )
+        return [self._item_to_record(item) for item in items], next_cursor
+
+    async def list_posts_by_strategy(
+        self, strategy_id: str, date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> List[ScheduledPostRecord]:
+        """List a strategy's posts via StrategyIdIndex, sorted by scheduledDate ascending."""
+        items = await query_all(
+            self.table,
+            IndexName='StrategyIdIndex',
+            KeyConditionExpression=_with_date_range(
+                Key('strategyId').eq(strategy_id), date_from, date_to
+            ),
             ScanIndexForward=True  # Sort by scheduledDate ascending
         )
-        return [self._item_to_record(item) for item in response.get('Items', [])]
+        return [self._item_to_record(item) for item in items]
 
-    async def list_posts_by_strategy(self, strategy_id: str) -> List[ScheduledPostRecord]:
-        """List all posts for a strategy via StrategyIdIndex, sorted by scheduledDate ascending."""
-        response = self.table.query(
+    async def list_posts_by_strategy_page(
+        self,
+        strategy_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> Tuple[List[ScheduledPostRecord], Optional[str]]:
+        """List one page of a strategy's posts. Returns (records, next_cursor)."""
+        items, next_cursor = await query_page(
+            self.table,
+            limit=limit,
+            cursor=cursor,
+            key_attributes=STRATEGY_INDEX_CURSOR_KEY,
             IndexName='StrategyIdIndex',
-            KeyConditionExpression=Key('strategyId').eq(strategy_id),
+            KeyConditionExpression=_with_date_range(
+                Key('strategyId').eq(strategy_id), date_from, date_to
+            ),
             ScanIndexForward=True  # Sort by scheduledDate ascending
         )
-        return [self._item_to_record(item) for item in response.get('Items', [])]
+        return [self._item_to_record(item) for item in items], next_cursor
+
+    async def list_due_posts(
+        self,
+        now: Optional[datetime] = None,
+        lookback_days: Optional[int] = None,
+        platform: str = 'linkedin',
+    ) -> List[ScheduledPostRecord]:
+        """List scheduled posts due at or before `now` via the sparse DueIndex.
+
+        Queries one bucket per UTC day from `lookback_days` ago up to today,
+        each bounded by dueAt <= now, so the cost tracks the number of pending
+        posts rather than the size of the table. Posts stuck in "publishing"
+        whose claim lease expires by `now` are included so they can be
+        reclaimed. Results are ordered by dueAt.
+
+        A caller looking ahead passes a future `now`; leases that are still
+        live at the current time come back too, and post_ready_at gives the
+        time each post can actually be claimed.
+
+        The lookback is kept short (two days by default) because every bucket
+        is one query per call, even when nothing is due. Posts due before the
+        oldest bucket (e.g. after the publisher was down for longer than the
+        lookback) are not in any queried bucket. They are picked up by a scan
+        of the index, filtered to dueAt before that bucket, on the first call
+        and then at most once every `publisher_due_aged_sweep_interval_seconds`. The index only holds posts
+        awaiting publication, so the sweep stays cheap, and such posts are
+        published late rather than never.
+        """
+        now = now or datetime.now(UTC)
+        if lookback_days is None:
+            lookback_days = settings.publisher_due_lookback_days
+        now_epoch = int(now.timestamp())
+        today = now.astimezone(UTC).date()
+        oldest = today - timedelta(days=lookback_days)
+        buckets = [
+            (today - timedelta(days=offset)).strftime(DUE_BUCKET_FORMAT)
+            for offset in range(lookback_days, -1, -1)
+        ]
+        awaiting = Attr('platform').eq(platform) & (
+            Attr('status').eq('scheduled')
+            | (Attr('status').eq('publishing') & Attr('leaseExpiresAt').lte(now_epoch))
+        )
+
+        lookups = [
+            query_all(
+                self.table,
+                IndexName=DUE_INDEX,
+                KeyConditionExpression=Key('dueBucket').eq(bucket) & Key('dueAt').lte(now_epoch),
+                FilterExpression=awaiting,
+            )
+            for bucket in buckets
+        ]
+        sweep = self._aged_sweep_due()
+        if sweep:
+            oldest_epoch = int(datetime(oldest.year, oldest.month, oldest.day, tzinfo=UTC).timestamp())
+            lookups.append(scan_all(
+                self.table,
+                IndexName=DUE_INDEX,
+                FilterExpression=Attr('dueAt').lt(oldest_epoch) & awaiting,
+            ))
+
+        pages = await asyncio.gather(*lookups)
+        if sweep and pages[-1]:
+            logger.warning(
+                f"Found {len(pages[-1])} due posts older than the {lookback_days}-day lookback"
+            )
+        items = [item for page in pages for item in page]
+        items.sort(key=lambda item: item['dueAt'])
+        return [self._item_to_record(item) for item in items]
+
+    def _aged_sweep_due(self) -> bool:
+        """Whether list_due_posts should also sweep for posts older than the lookback."""
+        now = time.monotonic()
+        if (
+            self._aged_sweep_at is not None
+            and now - self._aged_sweep_at < settings.publisher_due_aged_sweep_interval_seconds
+        ):
+            return False
+        self._aged_sweep_at = now
+        return True
 
     async def update_post(self, post_id: str, updates: dict) -> ScheduledPostRecord:
-        """Update post fields and set updatedAt. Returns updated record."""
+        """Update post fields and set updatedAt. Returns updated record.
+
+        Keeps scheduledAt and the DueIndex attributes in sync in a single write.
+        When the update changes only part of what they are derived from (say,
+        the date but not the time), the rest is read first and the write is
+        conditioned on it being unchanged, retrying on a concurrent change.
+
+        The write is conditional on the post not being in "publishing", so an
+        edit cannot overwrite a post a publisher claimed after the caller read
+        it; PostBeingPublishedError is raised instead.
+        """
         now = datetime.now(UTC).isoformat()
 
         # Build update expression dynamically from provided fields
@@ -111,34 +449,384 @@ class SchedulerRepository:
         update_parts.append('#updatedAt = :updated_at')
         attr_names['#updatedAt'] = 'updatedAt'
 
-        update_expr = 'SET ' + ', '.join(update_parts)
-        if remove_parts:
-            update_expr += ' REMOVE ' + ', '.join(remove_parts)
+        # A prepared LinkedIn image only matches the media it was uploaded from
+        if 'media_id' in updates:
+            remove_parts.extend(['#imageUrn', '#imageUrnMediaId'])
+            attr_names.update({'#imageUrn': 'imageUrn', '#imageUrnMediaId': 'imageUrnMediaId'})
+
+        # Rescheduling (or re-activating a failed post) starts a fresh retry budget
+        new_status = updates.get('status')
+        if new_status == 'scheduled' or updates.get('scheduled_date') or updates.get('scheduled_time'):
+            remove_parts.extend(['#attemptCount', '#nextAttemptAt'])
+            attr_names.update({'#attemptCount': 'attemptCount', '#nextAttemptAt': 'nextAttemptAt'})
+
+        # scheduledAt and the DueIndex attributes are derived from the date,
+        # time, status and pending retry. Inputs the update leaves unchanged
+        # are read first, so the derived attributes go out in this same write,
+        # conditioned on those inputs still holding the values read.
+        new_date, new_time = updates.get('scheduled_date'), updates.get('scheduled_time')
+        resets_retry = new_status == 'scheduled' or bool(new_date or new_time)
+        rewritten = []
+        needed = set()
+        if new_date or new_time:
+            rewritten.append('scheduledAt')
+            needed.update(('scheduledDate', 'scheduledTime'))
+        if new_status is not None or new_date or new_time:
+            rewritten.extend(['dueBucket', 'dueAt'])
+            if new_status is None or new_status in AWAITING_PUBLICATION:
+                needed.update(('scheduledDate', 'scheduledTime', 'status'))
+                if not resets_retry:
+                    needed.add('nextAttemptAt')
+        given = {'scheduledDate': new_date, 'scheduledTime': new_time, 'status': new_status}
+        missing = sorted(name for name in needed if not given.get(name))
+
+        attr_names['#status'] = 'status'
+        attr_values[':publishing'] = 'publishing'
+
+        for attempt in range(UPDATE_POST_ATTEMPTS):
+            current = await self._read_attributes(post_id, missing) if missing else {}
+            if current.get('status') == 'publishing':
+                raise PostBeingPublishedError(post_id)
+            values = {**current, **{name: value for name, value in given.items() if value}}
+
+            desired = {}
+            if 'scheduledAt' in rewritten:
+                desired.update(schedule_attributes(
+                    values.get('scheduledDate'), values.get('scheduledTime')
+                ))
+            if 'dueAt' in rewritten:
+                desired.update(due_attributes(
+                    values.get('status'), values.get('scheduledDate'), values.get('scheduledTime'),
+                    None if resets_retry else values.get('nextAttemptAt'), desired.get('scheduledAt'),
+                ))
+
+            write_sets = update_parts + [f'#{name} = {DERIVED_ATTRIBUTES[name]}' for name in desired]
+            write_removes = remove_parts + [f'#{name}' for name in rewritten if name not in desired]
+            write_names = {**attr_names, **{f'#{name}': name for name in rewritten}}
+            write_values = {**attr_values, **{DERIVED_ATTRIBUTES[k]: v for k, v in desired.items()}}
+            conditions = ['#status <> :publishing']
+            for i, name in enumerate(missing):
+                placeholder = '#status' if name == 'status' else f'#read{i}'
+                write_names[placeholder] = name
+                if name in current:
+                    conditions.append(f'{placeholder} = :read{i}')
+                    write_values[f':read{i}'] = current[name]
+                else:
+                    conditions.append(f'attribute_not_exists({placeholder})')
+
+            update_expr = 'SET ' + ', '.join(write_sets)
+            if write_removes:
+                update_expr += ' REMOVE ' + ', '.join(write_removes)
 
-        response = self.table.update_item(
+            try:
+                response = await run_blocking(
+                    self.table.update_item,
+                    Key={'postId': post_id},
+                    UpdateExpression=update_expr,
+                    ConditionExpression=' AND '.join(conditions),
+                    ExpressionAttributeNames=write_names,
+                    ExpressionAttributeValues=write_values,
+                    ReturnValues='ALL_NEW'
+                )
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+                if not missing:
+                    raise PostBeingPublishedError(post_id) from e
+                # Claimed or changed since the read: re-read and try again
+                if attempt == UPDATE_POST_ATTEMPTS - 1:
+                    raise
+                continue
+            break
+
+        item = response['Attributes']
+        self._notify(post_id, item.get('dueAt'))
+        return self._item_to_record(item)
+
+    async def _read_attributes(self, post_id: str, names: List[str]) -> dict:
+        """Consistently read a few attributes of a post ({} if it does not exist)."""
+        response = await run_blocking(
+            self.table.get_item,
             Key={'postId': post_id},
-            UpdateExpression=update_expr,
-            ExpressionAttributeNames=attr_names,
-            ExpressionAttributeValues=attr_values,
-            ReturnValues='ALL_NEW'
+            ProjectionExpression=', '.join(f'#a{i}' for i in range(len(names))),
+            ExpressionAttributeNames={f'#a{i}': name for i, name in enumerate(names)},
+            ConsistentRead=True,
         )
+        return response.get('Item', {})
+
+    async def claim_post(
+        self,
+        post_id: str,
+        owner: str,
+        lease_seconds: int,
+        from_statuses: Tuple[str, ...] = ('scheduled',),
+    ) -> Optional[ScheduledPostRecord]:
+        """Atomically claim a post for publishing.
+
+        Moves the post from one of `from_statuses` (or from "publishing" when
+        the previous claim's lease has expired) to "publishing", recording the
+        lease owner, its expiry and the status it was claimed from. Returns the
+        claimed record, or None when another worker holds the post or it is no
+        longer claimable.
+        """
+        now = int(datetime.now(UTC).timestamp())
+        status_values = {f':from{i}': value for i, value in enumerate(from_statuses)}
+        try:
+            response = await run_blocking(
+                self.table.update_item,
+                Key={'postId': post_id},
+                UpdateExpression=(
+                    'SET claimedFrom = if_not_exists(claimedFrom, #status), '
+                    '#status = :publishing, leaseOwner = :owner, '
+                    'leaseExpiresAt = :expires, updatedAt = :updated_at'
+                ),
+                ConditionExpression=(
+                    f'#status IN ({", ".join(status_values)}) '
+                    'OR (#status = :publishing AND leaseExpiresAt <= :now)'
+                ),
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    **status_values,
+                    ':publishing': 'publishing',
+                    ':owner': owner,
+                    ':expires': now + lease_seconds,
+                    ':now': now,
+                    ':updated_at': datetime.now(UTC).isoformat(),
+                },
+                ReturnValues='ALL_NEW',
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
+            raise
         return self._item_to_record(response['Attributes'])
 
+    async def complete_publish(
+        self, post_id: str, owner: str, with_writes: Optional[List[dict]] = None
+    ) -> bool:
+        """Move a claimed post publishing → published if `owner` still holds the lease.
+
+        `with_writes` are further TransactWriteItems entries (such as the
+        publish log's Put) committed in the same transaction, so either all
+        of them are written together with the status change or, if the lease
+        was lost, none are.
+        """
+        update = dict(
+            Key={'postId': post_id},
+            UpdateExpression=(
+                'SET #status = :published, updatedAt = :updated_at '
+                'REMOVE leaseOwner, leaseExpiresAt, claimedFrom, nextAttemptAt, dueBucket, dueAt'
+            ),
+            ConditionExpression='#status = :publishing AND leaseOwner = :owner',
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={
+                ':published': 'published',
+                ':publishing': 'publishing',
+                ':owner': owner,
+                ':updated_at': datetime.now(UTC).isoformat(),
+            },
+        )
+        try:
+            if with_writes:
+                await run_blocking(
+                    self.table.meta.client.transact_write_items,
+                    TransactItems=[
+                        {'Update': {'TableName': self.table.name, **update}},
+                        *with_writes,
+                    ],
+                )
+            else:
+                await run_blocking(self.table.update_item, **update)
+        except ClientError as e:
+            if _condition_failed(e):
+                return False
+            raise
+        self._notify(post_id, None)
+        return True
+
+    async def release_claim(self, post_id: str, owner: str) -> bool:
+        """Return a claimed post to the status it was claimed from.
+
+        Listeners are deliberately not notified: a released post is still due,
+        so re-arming its timer would retry it immediately; the next
+        reconciliation picks it up instead.
+        """
+        try:
+            await run_blocking(
+                self.table.update_item,
+                Key={'postId': post_id},
+                UpdateExpression=(
+                    'SET #status = claimedFrom, updatedAt = :updated_at '
+                    'REMOVE leaseOwner, leaseExpiresAt, claimedFrom'
+                ),
+                ConditionExpression='#status = :publishing AND leaseOwner = :owner',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':publishing': 'publishing',
+                    ':owner': owner,
+                    ':updated_at': datetime.now(UTC).isoformat(),
+                },
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+        return True
+
+    async def set_image_urn(self, post_id: str, media_id: str, image_urn: str) -> bool:
+        """Record a LinkedIn image uploaded ahead of publication.
+
+        Conditional on the post still being scheduled with the same media, so
+        an edit made while the upload ran is never paired with a stale image.
+        Returns False if the condition no longer holds.
+        """
+        try:
+            await run_blocking(
+                self.table.update_item,
+                Key={'postId': post_id},
+                UpdateExpression='SET imageUrn = :urn, imageUrnMediaId = :media_id',
+                ConditionExpression='#status = :scheduled AND mediaId = :media_id',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':urn': image_urn,
+                    ':media_id': media_id,
+                    ':scheduled': 'scheduled',
+                },
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+        return True
+
+    async def schedule_retry(
+        self, post_id: str, owner: str, attempt_count: int, next_attempt_at: int
+    ) -> bool:
+        """Hand a failed claim back as "scheduled" with its retry time.
+
+        Records the attempt count and next attempt time and moves the post's
+        DueIndex entry to the retry time, so it is not selected again before
+        then. Listeners are notified so a timer is armed for the retry.
+        Returns False if `owner` no longer holds the lease.
+        """
+        try:
+            response = await run_blocking(
+                self.table.update_item,
+                Key={'postId': post_id},
+                UpdateExpression=(
+                    'SET #status = :scheduled, attemptCount = :attempts, '
+                    'nextAttemptAt = :next, updatedAt = :updated_at '
+                    'REMOVE leaseOwner, leaseExpiresAt, claimedFrom'
+                ),
+                ConditionExpression='#status = :publishing AND leaseOwner = :owner',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':scheduled': 'scheduled',
+                    ':publishing': 'publishing',
+                    ':owner': owner,
+                    ':attempts': attempt_count,
+                    ':next': next_attempt_at,
+                    ':updated_at': datetime.now(UTC).isoformat(),
+                },
+                ReturnValues='ALL_NEW',
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+        item = await self._sync_due_attributes(response['Attributes'])
+        self._notify(post_id, item.get('dueAt'))
+        return True
+
+    async def fail_post(self, post_id: str, owner: str, attempt_count: int) -> bool:
+        """Move a claimed post publishing → failed once its retry budget is spent.
+
+        Failed posts leave the DueIndex; rescheduling them via update_post
+        starts a new budget. Returns False if `owner` no longer holds the lease.
+        """
+        try:
+            await run_blocking(
+                self.table.update_item,
+                Key={'postId': post_id},
+                UpdateExpression=(
+                    'SET #status = :failed, attemptCount = :attempts, updatedAt = :updated_at '
+                    'REMOVE leaseOwner, leaseExpiresAt, claimedFrom, nextAttemptAt, dueBucket, dueAt'
+                ),
+                ConditionExpression='#status = :publishing AND leaseOwner = :owner',
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':failed': 'failed',
+                    ':publishing': 'publishing',
+                    ':owner': owner,
+                    ':attempts': attempt_count,
+                    ':updated_at': datetime.now(UTC).isoformat(),
+                },
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+        self._notify(post_id, None)
+        return True
+
+    async def _sync_due_attributes(self, item: dict) -> dict:
+        """Set or remove scheduledAt and dueBucket/dueAt so they match the
+        item's status and schedule."""
+        desired = schedule_attributes(item['scheduledDate'], item['scheduledTime'])
+        desired.update(due_attributes(
+            item['status'], item['scheduledDate'], item['scheduledTime'],
+            item.get('nextAttemptAt'), desired.get('scheduledAt'),
+        ))
+        current = {k: item[k] for k in DERIVED_ATTRIBUTES if k in item}
+        if current == desired:
+            return item
+
+        clauses = []
+        if desired:
+            clauses.append('SET ' + ', '.join(f'{k} = {DERIVED_ATTRIBUTES[k]}' for k in desired))
+        removed = [k for k in DERIVED_ATTRIBUTES if k not in desired]
+        if removed:
+            clauses.append('REMOVE ' + ', '.join(removed))
+        kwargs = {}
+        if desired:
+            kwargs['ExpressionAttributeValues'] = {
+                DERIVED_ATTRIBUTES[k]: value for k, value in desired.items()
+            }
+
+        response = await run_blocking(
+            self.table.update_item,
+            Key={'postId': item['postId']},
+            UpdateExpression=' '.join(clauses),
+            ReturnValues='ALL_NEW',
+            **kwargs
+        )
+        return response['Attributes']
+
     async def delete_all_by_user(self, user_id: str) -> int:
         """Delete all posts for a user. Returns the number of deleted records."""
         posts = await self.list_posts_by_user(user_id)
-        with self.table.batch_writer() as batch:
-            for post in posts:
-                batch.delete_item(Key={'postId': post.id})
+
+        def _delete():
+            with self.table.batch_writer() as batch:
+                for post in posts:
+                    batch.delete_item(Key={'postId': post.id})
+
+        await run_blocking(_delete)
+        for post in posts:
+            self._notify(post.id, None)
         return len(posts)
 
     async def delete_post(self, post_id: str) -> bool:
         """Delete a post record. Returns True if deleted."""
-        response = self.table.delete_item(
+        response = await run_blocking(
+            self.table.delete_item,
             Key={'postId': post_id},
             ReturnValues='ALL_OLD'
         )
-        return 'Attributes' in response
+        deleted = 'Attributes' in response
+        if deleted:
+            self._notify(post_id, None)
+        return deleted
 
     def _record_to_item(self, record: ScheduledPostRecord) -> dict:
         """Convert ScheduledPostRecord to DynamoDB item."""
@@ -162,6 +850,18 @@ class SchedulerRepository:
             item['mediaId'] = record.media_id
         if record.media_type is not None:
             item['mediaType'] = record.media_type
+        if record.image_urn is not None:
+            item['imageUrn'] = record.image_urn
+            item['imageUrnMediaId'] = record.image_urn_media_id
+        if record.attempt_count:
+            item['attemptCount'] = record.attempt_count
+        if record.next_attempt_at is not None:
+            item['nextAttemptAt'] = record.next_attempt_at
+        item.update(schedule_attributes(record.scheduled_date, record.scheduled_time))
+        item.update(due_attributes(
+            record.status, record.scheduled_date, record.scheduled_time, record.next_attempt_at,
+            item.get('scheduledAt'),
+        ))
         return item
 
     def _item_to_record(self, item: dict) -> ScheduledPostRecord:
@@ -181,6 +881,12 @@ class SchedulerRepository:
             strategy_label=item.get('strategyLabel', ''),
             media_id=item.get('mediaId'),
             media_type=item.get('mediaType'),
+            image_urn=item.get('imageUrn'),
+            image_urn_media_id=item.get('imageUrnMediaId'),
+            attempt_count=int(item.get('attemptCount', 0)),
+            next_attempt_at=int(item['nextAttemptAt']) if item.get('nextAttemptAt') is not None else None,
+            scheduled_at=int(item['scheduledAt']) if item.get('scheduledAt') is not None else None,
+            lease_expires_at=int(item['leaseExpiresAt']) if item.get('leaseExpiresAt') is not None else None,
             created_at=datetime.fromisoformat(item['createdAt']),
             updated_at=datetime.fromisoformat(item['updatedAt']),
         )
@@ -5,13 +5,18 @@ This module provides data access methods for storing and retrieving strategy rec
 from DynamoDB with user isolation enforcement.
 """
 
-import boto3
 from boto3.dynamodb.conditions import Key
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from models.strategy import StrategyRecord, StrategyOutput
+from repositories.aws_clients import aws_clients
+from repositories.executor import run_blocking
+from repositories.pagination import query_all, query_page
 from config import settings
 
+# Attributes of a UserIdIndex page's LastEvaluatedKey, checked on incoming cursors
+USER_INDEX_CURSOR_KEY = ('strategyId', 'userId', 'createdAt')
+
 
 class StrategyRepository:
     """Repository for strategy data access in DynamoDB.
@@ -30,12 +35,8 @@ class StrategyRepository:
         self.table_name = table_name or settings.dynamodb_strategies_table
         self.region = region or settings.aws_region
         
-        # Initialize DynamoDB resource
-        # Uses env vars (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY) in containers,
-        # or falls back to ~/.aws/credentials locally
-        session = boto3.Session(region_name=self.region)
-        dynamodb = session.resource('dynamodb')
-        self.table = dynamodb.Table(self.table_name)
+        # Table handle backed by the process-wide pooled DynamoDB resource
+        self.table = aws_clients.table(self.table_name, self.region)
     
     async def create_strategy(self, record: StrategyRecord) -> StrategyRecord:
         """Store a new strategy record in DynamoDB.
@@ -59,7 +60,7 @@ class StrategyRepository:
         }
         
         # Store in DynamoDB
-        self.table.put_item(Item=item)
+        await run_blocking(self.table.put_item, Item=item)
         
         return record
     
@@ -78,7 +79,8 @@ class StrategyRepository:
             StrategyRecord if found and belongs to user, None otherwise
         """
         # Get item from DynamoDB
-        response = self.table.get_item(
+        response = await run_blocking(
+            self.table.get_item,
             Key={'strategyId': strategy_id}
         )
         
@@ -95,6 +97,37 @@ class StrategyRepository:
         # Convert DynamoDB item to StrategyRecord
         return self._item_to_record(item)
     
+    async def get_strategy_for_user(
+        self,
+        strategy_id: str,
+        user_id: str
+    ) -> tuple[Optional[StrategyRecord], bool]:
+        """Retrieve a strategy and check ownership with a single GetItem.
+        
+        Args:
+            strategy_id: The strategy ID to retrieve
+            user_id: The authenticated user's ID
+            
+        Returns:
+            Tuple of (StrategyRecord or None, exists_for_other_user: bool)
+            - (record, False) if strategy found and belongs to user
+            - (None, True) if strategy exists but belongs to another user
+            - (None, False) if strategy does not exist
+        """
+        response = await run_blocking(
+            self.table.get_item,
+            Key={'strategyId': strategy_id}
+        )
+        
+        if 'Item' not in response:
+            return (None, False)
+        
+        item = response['Item']
+        if item['userId'] != user_id:
+            return (None, True)
+        
+        return (self._item_to_record(item), False)
+    
     async def strategy_exists(self, strategy_id: str) -> bool:
         """Check if a strategy exists regardless of owner.
         
@@ -104,7 +137,8 @@ class StrategyRepository:
         Returns:
             True if strategy exists, False otherwise
         """
-        response = self.table.get_item(
+        response = await run_blocking(
+            self.table.get_item,
             Key={'strategyId': strategy_id}
         )
         return 'Item' in response
@@ -118,15 +152,43 @@ class StrategyRepository:
         Returns:
             List of StrategyRecord objects sorted by created_at (newest first)
         """
-        # Query using UserIdIndex GSI
-        response = self.table.query(
+        # Query using UserIdIndex GSI, following LastEvaluatedKey past 1 MB pages
+        items = await query_all(
+            self.table,
             IndexName='UserIdIndex',
             KeyConditionExpression=Key('userId').eq(user_id),
             ScanIndexForward=False  # Sort by createdAt descending (newest first)
         )
         
         # Convert all items to StrategyRecord objects
-        return [self._item_to_record(item) for item in response.get('Items', [])]
+        return [self._item_to_record(item) for item in items]
+    
+    async def list_strategies_by_user_page(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[StrategyRecord], Optional[str]]:
+        """List one page of a user's strategies, newest first.
+        
+        Args:
+            user_id: The user ID to retrieve strategies for
+            limit: Maximum number of strategies to return
+            cursor: Opaque cursor from a previous page, or None for the first page
+            
+        Returns:
+            Tuple of (StrategyRecord list, next cursor or None when exhausted)
+        """
+        items, next_cursor = await query_page(
+            self.table,
+            limit=limit,
+            cursor=cursor,
+            key_attributes=USER_INDEX_CURSOR_KEY,
+            IndexName='UserIdIndex',
+            KeyConditionExpression=Key('userId').eq(user_id),
+            ScanIndexForward=False  # Sort by createdAt descending (newest first)
+        )
+        return [self._item_to_record(item) for item in items], next_cursor
     
     def _item_to_record(self, item: dict) -> StrategyRecord:
         """Convert DynamoDB item to StrategyRecord.
@@ -6,8 +6,10 @@ specifically for retrieving LinkedIn credentials needed by the publisher service
 User management (create, update, delete) remains in the Next.js service.
 """
 
-import boto3
-from typing import Optional
+from typing import Dict, Iterable, Optional
+from repositories.aws_clients import aws_clients
+from repositories.batch import batch_get
+from repositories.executor import run_blocking
 from config import settings
 
 
@@ -17,9 +19,7 @@ class UserRepository:
     def __init__(self, table_name: str = None, region: str = None):
         self.table_name = table_name or settings.dynamodb_users_table
         self.region = region or settings.aws_region
-        session = boto3.Session(region_name=self.region)
-        dynamodb = session.resource('dynamodb')
-        self.table = dynamodb.Table(self.table_name)
+        self.table = aws_clients.table(self.table_name, self.region)
 
     async def get_user_linkedin_credentials(self, user_id: str) -> Optional[dict]:
         """
@@ -28,10 +28,29 @@ class UserRepository:
         Returns dict with keys: linkedinAccessToken, linkedinSub, linkedinName
         Returns None if user not found.
         """
-        response = self.table.get_item(Key={'userId': user_id})
+        response = await run_blocking(self.table.get_item, Key={'userId': user_id})
         if 'Item' not in response:
             return None
-        item = response['Item']
+        return self._credentials(response['Item'])
+
+    async def batch_get_linkedin_credentials(self, user_ids: Iterable[str]) -> Dict[str, dict]:
+        """
+        Retrieve LinkedIn credentials for many users via BatchGetItem.
+
+        Returns {userId: credentials} in the same shape as
+        get_user_linkedin_credentials; users that do not exist are absent.
+        """
+        items = await batch_get(
+            self.table,
+            'userId',
+            user_ids,
+            projection='userId, linkedinAccessToken, linkedinSub, linkedinName',
+        )
+        return {user_id: self._credentials(item) for user_id, item in items.items()}
+
+    @staticmethod
+    def _credentials(item: dict) -> dict:
+        """Extract the LinkedIn credential fields from a user item."""
         return {
             'linkedinAccessToken': item.get('linkedinAccessToken'),
             'linkedinSub': item.get('linkedinSub'),
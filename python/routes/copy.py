@@ -6,20 +6,20 @@ chat refinement, and deletion. Supports both real Strands Agent with Amazon
 Bedrock and mock agent for development.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Response
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query, Response
 from fastapi.responses import StreamingResponse
 from models.copy import CopyGenerateInput, CopyRecord, ChatRequest, ChatResponse, RefineTextRequest
-from services.copywriter_agent import CopywriterAgent, StructuredOutputException
-from services.mock_copywriter_agent import MockCopywriterAgent
+from services.copywriter_agent import StructuredOutputException
 from services.copy_service import CopyService
-from repositories.copy_repository import CopyRepository
-from repositories.strategy_repository import StrategyRepository
+from services.agent_cache import bypass_agent_cache, bypass_requested
+from dependencies import get_copy_service
 from middleware.auth import auth_middleware
+from repositories.pagination import InvalidCursorError, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 from config import settings
 import logging
 import asyncio
 from botocore.exceptions import BotoCoreError, ClientError
-from typing import List
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,50 +28,30 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/copy", tags=["copy"])
 
-# Initialize agent based on configuration
-if settings.use_mock_agent:
-    logger.info("Using MOCK agent for copy generation (no AWS required)")
-    agent = MockCopywriterAgent()
-else:
-    logger.info(f"Using REAL Copywriter agent with Bedrock (region: {settings.aws_region}, model: {settings.bedrock_model_id})")
-    agent = CopywriterAgent(
-        aws_region=settings.aws_region,
-        model_id=settings.bedrock_model_id,
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key,
-    )
-
-# Initialize repositories and service
-copy_repository = CopyRepository(
-    table_name=settings.dynamodb_copies_table,
-    region=settings.aws_region,
-)
-strategy_repository = StrategyRepository(
-    table_name=settings.dynamodb_strategies_table,
-    region=settings.aws_region,
-)
-copy_service = CopyService(
-    agent=agent,
-    copy_repository=copy_repository,
-    strategy_repository=strategy_repository,
-)
-
-
 @router.post("/generate", response_model=List[CopyRecord], status_code=status.HTTP_200_OK)
 async def generate_copies(
     copy_input: CopyGenerateInput,
     user_id: str = Depends(auth_middleware.get_current_user),
+    copy_service: CopyService = Depends(get_copy_service),
+    cache_control: Optional[str] = Header(default=None),
+    idempotency_key: Optional[str] = Header(default=None),
 ):
     """
     Generate social media copies from an existing strategy.
 
     Uses the Copywriter Agent (mock or real) to produce platform-specific
     copies based on the strategy's content pillars, themes, and audience.
-    Generated copies are persisted to DynamoDB.
+    Generated copies are persisted to DynamoDB. An unchanged strategy is
+    answered from the agent response cache unless the request sends
+    `Cache-Control: no-cache`.
 
     Args:
         copy_input: Contains strategy_id to generate copies from
         user_id: Authenticated user ID from JWT token
+        copy_service: Copy service (injected from dependencies.get_copy_service)
+        cache_control: `no-cache` skips the agent response cache
+        idempotency_key: Client key reused when retrying the same request; a
+            retry gets the original request's copies instead of new ones
 
     Returns:
         List[CopyRecord]: Generated and stored copy records
@@ -82,10 +62,11 @@ async def generate_copies(
     try:
         logger.info(f"Generating copies for strategy: {copy_input.strategy_id} (mock={settings.use_mock_agent})")
 
-        records = await asyncio.wait_for(
-            copy_service.generate_copies(copy_input.strategy_id, user_id),
-            timeout=settings.agent_timeout_seconds,
-        )
+        with bypass_agent_cache(bypass_requested(cache_control)):
+            records = await asyncio.wait_for(
+                copy_service.generate_copies(copy_input.strategy_id, user_id, idempotency_key),
+                timeout=settings.agent_timeout_seconds,
+            )
 
         logger.info(f"Generated {len(records)} copies for strategy: {copy_input.strategy_id}")
         return records
@@ -122,19 +103,23 @@ async def generate_copies(
 async def generate_copies_stream(
     copy_input: CopyGenerateInput,
     user_id: str = Depends(auth_middleware.get_current_user),
+    copy_service: CopyService = Depends(get_copy_service),
 ):
     """
     Stream copy generation events via Server-Sent Events (SSE).
 
-    Streams real-time agent thinking, lifecycle phases, and the final
-    structured result as SSE events so the frontend can display the
-    agent's thought process as it generates copies.
+    Streams real-time agent thinking, lifecycle phases, each copy as soon
+    as it is finished, and the final structured result as SSE events so the
+    frontend can display the agent's progress as it generates copies.
+    Finished copies are stored in batches while the stream runs, so they are
+    kept even if generation fails before the end.
 
     Event types:
       - thinking: text delta from the model
       - lifecycle: phase change (e.g. "Agent loop initialized")
+      - copy: one finished copy
       - result: final structured copies array
-      - saved: persisted CopyRecords
+      - saved: persisted CopyRecords (also sent before an error)
       - error: generation failure
       - done: stream complete
     """
@@ -166,39 +151,34 @@ async def generate_copies_stream(
     ]
 
     async def event_generator():
+        writer = copy_service.copy_writer(copy_input.strategy_id, user_id)
+        failure = None
+        closed = False
         try:
-            final_copies_data = None
-
-            async for event in agent.generate_copies_stream(strategy_data):
-                event_type = event.get("event", "unknown")
-                payload = json_mod.dumps(event, default=str)
-                yield f"event: {event_type}\ndata: {payload}\n\n"
-
-                if event_type == "result":
-                    final_copies_data = event.get("copies", [])
-
-            # Persist copies to DB after streaming completes
-            if final_copies_data:
-                from models.copy import CopyRecord as CopyRecordModel
-
-                def _normalize_platform(p: str) -> str:
-                    lower = p.lower().strip()
-                    if lower in ("twitter", "twitter/x", "x (twitter)", "x/twitter", "tiktok"):
-                        return "x"
-                    return lower
-
-                records = [
-                    CopyRecordModel(
-                        strategy_id=copy_input.strategy_id,
-                        user_id=user_id,
-                        text=item["text"],
-                        platform=_normalize_platform(item["platform"]),
-                        hashtags=item.get("hashtags", []),
-                    )
-                    for item in final_copies_data
-                ]
-
-                saved_records = await copy_repository.create_copies(records)
+            try:
+                async for event in copy_service.agent.generate_copies_stream(strategy_data):
+                    event_type = event.get("event", "unknown")
+
+                    # Queue each copy before sending it, so it is stored even if
+                    # the client leaves while it is being sent; the final result
+                    # only adds copies the stream did not deliver on their own
+                    if event_type == "copy":
+                        writer.add(event["copy"])
+                    elif event_type == "result":
+                        for item in event.get("copies", []):
+                            writer.add(item)
+
+                    payload = json_mod.dumps(event, default=str)
+                    yield f"event: {event_type}\ndata: {payload}\n\n"
+
+            except Exception as e:
+                logger.error(f"Streaming copy generation failed: {str(e)}", exc_info=True)
+                failure = str(e)
+
+            # Copies finished before a failure are kept and reported too
+            saved_records = await writer.close()
+            closed = True
+            if saved_records:
                 saved_data = [
                     {
                         "id": r.id,
@@ -213,13 +193,21 @@ async def generate_copies_stream(
                     for r in saved_records
                 ]
                 yield f"event: saved\ndata: {json_mod.dumps(saved_data)}\n\n"
-
-            yield "event: done\ndata: {}\n\n"
-
-        except Exception as e:
-            logger.error(f"Streaming copy generation failed: {str(e)}", exc_info=True)
-            error_payload = json_mod.dumps({"event": "error", "message": str(e)})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            if writer.failed and failure is None:
+                failure = f"{writer.failed} copies could not be saved"
+
+            if failure is None:
+                yield "event: done\ndata: {}\n\n"
+            else:
+                error_payload = json_mod.dumps({"event": "error", "message": failure})
+                yield f"event: error\ndata: {error_payload}\n\n"
+
+        finally:
+            # Client disconnected: the response task is cancelled, or the
+            # generator is closed at a `yield` (GeneratorExit). Either way,
+            # still store the copies finished so far.
+            if not closed:
+                writer.close_in_background()
 
     return StreamingResponse(
         event_generator(),
@@ -235,33 +223,51 @@ async def generate_copies_stream(
 @router.get("/list/{strategy_id}", response_model=List[CopyRecord], status_code=status.HTTP_200_OK)
 async def list_copies(
     strategy_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     user_id: str = Depends(auth_middleware.get_current_user),
+    copy_service: CopyService = Depends(get_copy_service),
 ):
     """
-    List all copies for a given strategy.
+    List copies for a given strategy.
 
     Verifies strategy ownership before returning copies sorted by
     createdAt descending (newest first). Returns an empty list if
-    no copies exist.
+    no copies exist. When `limit` or `cursor` is given a single page is
+    returned and the next page's cursor is sent in the X-Next-Cursor header.
 
     Args:
         strategy_id: Strategy to list copies for
+        response: Outgoing response, used to set the next-page cursor header
+        limit: Maximum number of copies per page
+        cursor: Cursor from the previous page's X-Next-Cursor header
         user_id: Authenticated user ID from JWT token
+        copy_service: Copy service (injected from dependencies.get_copy_service)
 
     Returns:
         List[CopyRecord]: Copies for the strategy, newest first
 
     Raises:
-        HTTPException: 401, 403, 404, 500
+        HTTPException: 400, 401, 403, 404, 500
     """
     try:
         logger.info(f"Listing copies for strategy: {strategy_id}")
-        copies = await copy_service.get_copies_by_strategy(strategy_id, user_id)
+        if limit is None and cursor is None:
+            copies = await copy_service.get_copies_by_strategy(strategy_id, user_id)
+        else:
+            copies, next_cursor = await copy_service.get_copies_by_strategy_page(
+                strategy_id, user_id, limit, cursor
+            )
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
         logger.info(f"Found {len(copies)} copies for strategy: {strategy_id}")
         return copies
 
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list copies: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -274,6 +280,7 @@ async def list_copies(
 async def get_copy(
     copy_id: str,
     user_id: str = Depends(auth_middleware.get_current_user),
+    copy_service: CopyService = Depends(get_copy_service),
 ):
     """
     Get a specific copy by ID.
@@ -284,6 +291,7 @@ async def get_copy(
     Args:
         copy_id: Unique identifier of the copy
         user_id: Authenticated user ID from JWT token
+        copy_service: Copy service (injected from dependencies.get_copy_service)
 
     Returns:
         CopyRecord: The requested copy record
@@ -325,6 +333,7 @@ async def chat_refine(
     copy_id: str,
     chat_request: ChatRequest,
     user_id: str = Depends(auth_middleware.get_current_user),
+    copy_service: CopyService = Depends(get_copy_service),
 ):
     """
     Chat with the AI to refine a specific copy.
@@ -337,6 +346,7 @@ async def chat_refine(
         copy_id: ID of the copy to refine
         chat_request: Contains the user's refinement message
         user_id: Authenticated user ID from JWT token
+        copy_service: Copy service (injected from dependencies.get_copy_service)
 
     Returns:
         ChatResponse: Updated text, hashtags, and AI explanation
@@ -387,6 +397,8 @@ async def chat_refine(
 async def refine_text(
     request: RefineTextRequest,
     user_id: str = Depends(auth_middleware.get_current_user),
+    copy_service: CopyService = Depends(get_copy_service),
+    cache_control: Optional[str] = Header(default=None),
 ):
     """
     Refine arbitrary post text using the Copywriter Agent.
@@ -394,10 +406,14 @@ async def refine_text(
     Unlike the copy-specific chat endpoint, this does not require a copyId.
     It takes raw text, platform, and a refinement prompt, and returns
     updated text via the AI. Useful for the scheduler editor workspace.
+    A repeated request is answered from the agent response cache unless it
+    sends `Cache-Control: no-cache`.
 
     Args:
         request: Contains text, platform, message, and optional hashtags
         user_id: Authenticated user ID from JWT token
+        copy_service: Copy service (injected from dependencies.get_copy_service)
+        cache_control: `no-cache` skips the agent response cache
 
     Returns:
         ChatResponse: Updated text, hashtags, and AI explanation
@@ -405,16 +421,17 @@ async def refine_text(
     try:
         logger.info(f"Refining text for platform: {request.platform}")
 
-        chat_response = await asyncio.wait_for(
-            agent.chat_refine(
-                copy_text=request.text,
-                platform=request.platform,
-                hashtags=request.hashtags,
-                strategy_data={},
-                user_message=request.message,
-            ),
-            timeout=settings.agent_timeout_seconds,
-        )
+        with bypass_agent_cache(bypass_requested(cache_control)):
+            chat_response = await asyncio.wait_for(
+                copy_service.agent.chat_refine(
+                    copy_text=request.text,
+                    platform=request.platform,
+                    hashtags=request.hashtags,
+                    strategy_data={},
+                    user_message=request.message,
+                ),
+                timeout=settings.agent_timeout_seconds,
+            )
 
         logger.info("Successfully refined text")
         return chat_response
@@ -451,6 +468,7 @@ async def refine_text(
 async def delete_copy(
     copy_id: str,
     user_id: str = Depends(auth_middleware.get_current_user),
+    copy_service: CopyService = Depends(get_copy_service),
 ):
     """
     Delete a specific copy.
@@ -461,6 +479,7 @@ async def delete_copy(
     Args:
         copy_id: ID of the copy to delete
         user_id: Authenticated user ID from JWT token
+        copy_service: Copy service (injected from dependencies.get_copy_service)
 
     Returns:
         204 No Content on success
@@ -6,63 +6,59 @@ listing publish logs, querying logs by post, and triggering on-demand manual
 publishing to LinkedIn.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
-from models.publisher import PublishLogRecord
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
+from models.publisher import PipelineStatus, PublishLogRecord, RateLimitStatus
 from repositories.publisher_repository import PublisherRepository
 from repositories.scheduler_repository import SchedulerRepository
 from repositories.user_repository import UserRepository
-from repositories.media_repository import MediaRepository
-from services.linkedin_client import LinkedInClient
 from services.publisher_service import PublisherService
+from services.rate_limiter import LinkedInRateLimiter
+from dependencies import (
+    get_publisher_repository,
+    get_publisher_service,
+    get_rate_limiter,
+    get_scheduler_repository,
+    get_user_repository,
+)
 from middleware.auth import auth_middleware
-from config import settings
+from repositories.pagination import InvalidCursorError, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/publisher", tags=["publisher"])
 
-# Initialize repositories
-publisher_repository = PublisherRepository(
-    table_name=settings.dynamodb_publish_log_table,
-    region=settings.aws_region,
-)
-scheduler_repository = SchedulerRepository(
-    table_name=settings.dynamodb_scheduled_posts_table,
-    region=settings.aws_region,
-)
-user_repository = UserRepository(
-    table_name=settings.dynamodb_users_table,
-    region=settings.aws_region,
-)
-media_repository = MediaRepository(
-    table_name=settings.dynamodb_media_table,
-    region=settings.aws_region,
-)
-linkedin_client = LinkedInClient(timeout_seconds=settings.linkedin_api_timeout_seconds)
-
-publisher_service = PublisherService(
-    linkedin_client=linkedin_client,
-    publisher_repository=publisher_repository,
-    scheduler_repository=scheduler_repository,
-    user_repository=user_repository,
-    media_repository=media_repository,
-)
-
-
 @router.get("/logs", response_model=List[PublishLogRecord])
-async def list_logs(user_id: str = Depends(auth_middleware.get_current_user)):
+async def list_logs(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    user_id: str = Depends(auth_middleware.get_current_user),
+    publisher_repository: PublisherRepository = Depends(get_publisher_repository),
+):
     """
-    List all publish log records for the authenticated user,
+    List publish log records for the authenticated user,
     ordered by attemptedAt descending.
+    With `limit` or `cursor` a single page is returned and the next page's
+    cursor is sent in the X-Next-Cursor header.
     """
     try:
-        records = await publisher_repository.list_logs_by_user(user_id)
+        if limit is None and cursor is None:
+            records = await publisher_repository.list_logs_by_user(user_id)
+        else:
+            records, next_cursor = await publisher_repository.list_logs_by_user_page(
+                user_id, limit, cursor
+            )
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
         logger.info(f"Retrieved {len(records)} publish logs for user: {user_id}")
         return records
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list publish logs: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -75,6 +71,7 @@ async def list_logs(user_id: str = Depends(auth_middleware.get_current_user)):
 async def list_logs_by_post(
     post_id: str,
     user_id: str = Depends(auth_middleware.get_current_user),
+    publisher_repository: PublisherRepository = Depends(get_publisher_repository),
 ):
     """
     List all publish log records for a specific post.
@@ -102,16 +99,59 @@ async def list_logs_by_post(
         )
 
 
+@router.get("/rate-limits", response_model=RateLimitStatus)
+async def get_rate_limits(
+    user_id: str = Depends(auth_middleware.get_current_user),
+    rate_limiter: LinkedInRateLimiter = Depends(get_rate_limiter),
+):
+    """
+    Current LinkedIn rate-limit bucket levels: the app-wide bucket and the
+    authenticated user's member bucket.
+    """
+    try:
+        return rate_limiter.snapshot(user_id)
+    except Exception as e:
+        logger.error(f"Failed to read rate limits: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve rate limits. Please try again.",
+        )
+
+
+@router.get("/pipeline", response_model=PipelineStatus)
+async def get_pipeline_status(
+    user_id: str = Depends(auth_middleware.get_current_user),
+    publisher_service: PublisherService = Depends(get_publisher_service),
+):
+    """
+    Queue depth and per-stage latency of this process's publish pipeline
+    (resolve, fetch, upload, post, record).
+    """
+    try:
+        return publisher_service.pipeline_stats()
+    except Exception as e:
+        logger.error(f"Failed to read pipeline stats: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve pipeline stats. Please try again.",
+        )
+
+
 @router.post("/publish/{post_id}", response_model=PublishLogRecord)
 async def publish_post(
     post_id: str,
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_repository: SchedulerRepository = Depends(get_scheduler_repository),
+    user_repository: UserRepository = Depends(get_user_repository),
+    publisher_service: PublisherService = Depends(get_publisher_service),
 ):
     """
     Immediately publish a specific post to LinkedIn (on-demand manual publish).
 
     Verifies post exists, belongs to user, platform is linkedin, and not already published.
-    Then publishes via the LinkedIn API and returns the resulting log record.
+    Then takes a rate-limit token (429 with Retry-After if none is free),
+    claims it (409 if another worker is publishing it), publishes via the
+    LinkedIn API and returns the resulting log record.
     """
     try:
         # Retrieve the post (without user filter to distinguish 404 vs 403)
@@ -154,8 +194,26 @@ async def publish_post(
                 detail="LinkedIn profile information is incomplete. Please reconnect your LinkedIn account.",
             )
 
+        wait = await publisher_service.acquire_publish_token(user_id)
+        if wait > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="LinkedIn rate limit reached. Please try again later.",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+        # Claim the post so the scanner (on any replica) cannot publish it too
+        claimed = await publisher_service.claim_post(
+            post, from_statuses=("draft", "scheduled")
+        )
+        if claimed is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Post is already being published",
+            )
+
         # Publish via PublisherService
-        log_record = await publisher_service.publish_post(post, credentials)
+        log_record = await publisher_service.publish_post(claimed, credentials)
 
         if log_record.status == "failed":
             logger.warning(f"Manual publish failed for post {post_id}: {log_record.error_code}")
@@ -7,24 +7,22 @@ and full CRUD operations on scheduled posts. Supports both real Strands Agent
 with Amazon Bedrock and mock agent for development.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Response
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query, Response
 from models.scheduler import (
     AutoScheduleInput,
     ManualScheduleInput,
     ScheduledPostRecord,
     ScheduledPostUpdate,
 )
-from services.mock_scheduler_agent import MockSchedulerAgent
 from services.scheduler_service import SchedulerService
-from repositories.scheduler_repository import SchedulerRepository
-from repositories.copy_repository import CopyRepository
-from repositories.strategy_repository import StrategyRepository
+from dependencies import get_scheduler_service
 from middleware.auth import auth_middleware
+from repositories.pagination import InvalidCursorError, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 from config import settings
 import logging
 import asyncio
 from botocore.exceptions import BotoCoreError, ClientError
-from typing import List
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,49 +31,20 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/scheduler", tags=["scheduler"])
 
-# Initialize agent based on configuration
-if settings.use_mock_agent:
-    logger.info("Using MOCK agent for scheduling (no AWS required)")
-    agent = MockSchedulerAgent()
-else:
-    logger.info(f"Using REAL Scheduler agent with Bedrock (region: {settings.aws_region}, model: {settings.bedrock_model_id})")
-    from services.scheduler_agent import SchedulerAgent, StructuredOutputException
-    agent = SchedulerAgent(
-        aws_region=settings.aws_region,
-        model_id=settings.bedrock_model_id,
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key,
-    )
-
-# Import StructuredOutputException for mock mode too (from copywriter as fallback)
+# The real agent's StructuredOutputException; mock mode uses the copywriter's
+# so the real agent's dependencies are not imported
 if settings.use_mock_agent:
     from services.copywriter_agent import StructuredOutputException
-
-# Initialize repositories and service
-scheduler_repository = SchedulerRepository(
-    table_name=settings.dynamodb_scheduled_posts_table,
-    region=settings.aws_region,
-)
-copy_repository = CopyRepository(
-    table_name=settings.dynamodb_copies_table,
-    region=settings.aws_region,
-)
-strategy_repository = StrategyRepository(
-    table_name=settings.dynamodb_strategies_table,
-    region=settings.aws_region,
-)
-scheduler_service = SchedulerService(
-    agent=agent,
-    scheduler_repository=scheduler_repository,
-    copy_repository=copy_repository,
-    strategy_repository=strategy_repository,
-)
+else:
+    from services.scheduler_agent import StructuredOutputException
 
 
 @router.post("/auto-schedule", response_model=List[ScheduledPostRecord], status_code=status.HTTP_200_OK)
 async def auto_schedule(
     input: AutoScheduleInput,
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
+    idempotency_key: Optional[str] = Header(default=None),
 ):
     """
     Auto-schedule all copies for a strategy using the AI agent.
@@ -87,6 +56,9 @@ async def auto_schedule(
     Args:
         input: Contains strategy_id to auto-schedule copies from
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
+        idempotency_key: Client key reused when retrying the same request; a
+            retry gets the original request's posts instead of scheduling twice
 
     Returns:
         List[ScheduledPostRecord]: Created scheduled post records
@@ -98,7 +70,7 @@ async def auto_schedule(
         logger.info(f"Auto-scheduling copies for strategy: {input.strategy_id} (mock={settings.use_mock_agent})")
 
         records = await asyncio.wait_for(
-            scheduler_service.auto_schedule(input.strategy_id, user_id),
+            scheduler_service.auto_schedule(input.strategy_id, user_id, idempotency_key),
             timeout=settings.agent_timeout_seconds,
         )
 
@@ -137,6 +109,7 @@ async def auto_schedule(
 async def manual_schedule(
     input: ManualScheduleInput,
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
 ):
     """
     Manually schedule a single copy to a specific date and time.
@@ -147,6 +120,7 @@ async def manual_schedule(
     Args:
         input: Contains copyId, scheduledDate, scheduledTime, platform
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
 
     Returns:
         ScheduledPostRecord: The created scheduled post record
@@ -174,30 +148,71 @@ async def manual_schedule(
 
 @router.get("/posts", response_model=List[ScheduledPostRecord], status_code=status.HTTP_200_OK)
 async def list_posts(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    month: Optional[str] = Query(None),
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
 ):
     """
-    List all scheduled posts for the authenticated user.
+    List scheduled posts for the authenticated user.
 
-    Returns posts sorted by scheduledDate ascending.
+    Returns posts sorted by scheduledDate ascending. Without `limit` or
+    `cursor` every post is returned; otherwise one page is returned and the
+    cursor for the next page is sent in the X-Next-Cursor header (absent on
+    the last page).
+
+    The calendar can restrict the query to the visible window with an
+    inclusive `from`/`to` date range (YYYY-MM-DD) or a whole `month`
+    (YYYY-MM); the range is applied on the index sort key, so only posts in
+    the window are read.
 
     Args:
+        response: Outgoing response, used to set the next-page cursor header
+        limit: Maximum number of posts per page
+        cursor: Cursor from the previous page's X-Next-Cursor header
+        date_from: First scheduledDate to include (YYYY-MM-DD)
+        date_to: Last scheduledDate to include (YYYY-MM-DD)
+        month: Calendar month to list (YYYY-MM); cannot be combined with from/to
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
 
     Returns:
         List[ScheduledPostRecord]: User's scheduled posts
 
     Raises:
-        HTTPException: 401, 500
+        HTTPException: 400, 401, 500
     """
     try:
         logger.info(f"Listing scheduled posts for user: {user_id}")
-        posts = await scheduler_service.list_posts_by_user(user_id)
+        if month is not None:
+            if date_from is not None or date_to is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Use either 'month' or 'from'/'to', not both",
+                )
+            date_from, date_to = scheduler_service.month_window(month)
+
+        if limit is None and cursor is None:
+            posts = await scheduler_service.list_posts_by_user(
+                user_id, date_from=date_from, date_to=date_to
+            )
+        else:
+            posts, next_cursor = await scheduler_service.list_posts_by_user_page(
+                user_id, limit, cursor, date_from=date_from, date_to=date_to
+            )
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
         logger.info(f"Found {len(posts)} scheduled posts for user: {user_id}")
         return posts
 
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list scheduled posts: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -209,32 +224,50 @@ async def list_posts(
 @router.get("/posts/strategy/{strategy_id}", response_model=List[ScheduledPostRecord], status_code=status.HTTP_200_OK)
 async def list_posts_by_strategy(
     strategy_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
 ):
     """
     List scheduled posts filtered by strategy.
 
     Verifies strategy ownership before returning posts sorted by
-    scheduledDate ascending.
+    scheduledDate ascending. Supports the same `limit`/`cursor` paging
+    as GET /posts.
 
     Args:
         strategy_id: Strategy to filter posts by
+        response: Outgoing response, used to set the next-page cursor header
+        limit: Maximum number of posts per page
+        cursor: Cursor from the previous page's X-Next-Cursor header
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
 
     Returns:
         List[ScheduledPostRecord]: Posts for the strategy
 
     Raises:
-        HTTPException: 401, 403, 404, 500
+        HTTPException: 400, 401, 403, 404, 500
     """
     try:
         logger.info(f"Listing scheduled posts for strategy: {strategy_id}")
-        posts = await scheduler_service.list_posts_by_strategy(strategy_id, user_id)
+        if limit is None and cursor is None:
+            posts = await scheduler_service.list_posts_by_strategy(strategy_id, user_id)
+        else:
+            posts, next_cursor = await scheduler_service.list_posts_by_strategy_page(
+                strategy_id, user_id, limit, cursor
+            )
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
         logger.info(f"Found {len(posts)} scheduled posts for strategy: {strategy_id}")
         return posts
 
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list posts by strategy: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -247,6 +280,7 @@ async def list_posts_by_strategy(
 async def get_post(
     post_id: str,
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
 ):
     """
     Get a specific scheduled post by ID.
@@ -257,6 +291,7 @@ async def get_post(
     Args:
         post_id: Unique identifier of the scheduled post
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
 
     Returns:
         ScheduledPostRecord: The requested scheduled post
@@ -298,6 +333,7 @@ async def update_post(
     post_id: str,
     updates: ScheduledPostUpdate,
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
 ):
     """
     Update a scheduled post.
@@ -309,6 +345,7 @@ async def update_post(
         post_id: ID of the post to update
         updates: Fields to update (all optional)
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
 
     Returns:
         ScheduledPostRecord: The updated scheduled post
@@ -335,12 +372,14 @@ async def update_post(
 @router.delete("/posts/clear-all", status_code=status.HTTP_200_OK)
 async def delete_all_posts(
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
 ):
     """
     Delete all scheduled posts for the authenticated user.
 
     Args:
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
 
     Returns:
         JSON with count of deleted posts
@@ -368,6 +407,7 @@ async def delete_all_posts(
 async def delete_post(
     post_id: str,
     user_id: str = Depends(auth_middleware.get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service),
 ):
     """
     Delete a scheduled post.
@@ -378,6 +418,7 @@ async def delete_post(
     Args:
         post_id: ID of the post to delete
         user_id: Authenticated user ID from JWT token
+        scheduler_service: Scheduler service (injected from dependencies.get_scheduler_service)
 
     Returns:
         204 No Content on success
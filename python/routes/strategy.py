@@ -5,18 +5,19 @@ This module defines the REST API endpoints for strategy generation and retrieval
 Supports both real Strands Agent with Amazon Bedrock and mock agent for development.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query, Response
 from models.strategy import StrategyInput, StrategyOutput, StrategyRecord
-from services.strategist_agent import StrategistAgent, StructuredOutputException
-from services.mock_agent import MockStrategistAgent
+from services.strategist_agent import StructuredOutputException
 from services.strategy_service import StrategyService
-from repositories.strategy_repository import StrategyRepository
+from services.agent_cache import bypass_agent_cache, bypass_requested
+from dependencies import get_strategy_service
 from middleware.auth import auth_middleware
+from repositories.pagination import InvalidCursorError, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 from config import settings
 import logging
 import asyncio
 from botocore.exceptions import BotoCoreError, ClientError
-from typing import List
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,31 +26,13 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/strategy", tags=["strategy"])
 
-# Initialize agent based on configuration
-if settings.use_mock_agent:
-    logger.info("Using MOCK agent for strategy generation (no AWS required)")
-    agent = MockStrategistAgent()
-else:
-    logger.info(f"Using REAL Strands agent with Bedrock (region: {settings.aws_region}, model: {settings.bedrock_model_id})")
-    agent = StrategistAgent(
-        aws_region=settings.aws_region,
-        model_id=settings.bedrock_model_id,
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key
-    )
-
-# Initialize repository and service
-repository = StrategyRepository(
-    table_name=settings.dynamodb_strategies_table,
-    region=settings.aws_region
-)
-strategy_service = StrategyService(agent=agent, repository=repository)
-
-
 @router.post("/generate", response_model=StrategyRecord, status_code=status.HTTP_200_OK)
 async def generate_strategy(
     strategy_input: StrategyInput,
-    user_id: str = Depends(auth_middleware.get_current_user)
+    user_id: str = Depends(auth_middleware.get_current_user),
+    strategy_service: StrategyService = Depends(get_strategy_service),
+    cache_control: Optional[str] = Header(default=None),
+    idempotency_key: Optional[str] = Header(default=None),
 ):
     """
     Generate a new social media strategy and store it in the database.
@@ -62,11 +45,16 @@ async def generate_strategy(
     content themes, engagement tactics, and visual prompts.
     
     The generated strategy is automatically persisted to DynamoDB and associated
-    with the authenticated user.
+    with the authenticated user. A repeat of an earlier input is answered from
+    the agent response cache unless the request sends `Cache-Control: no-cache`.
     
     Args:
         strategy_input: Brand information (brand_name, industry, target_audience, goals)
         user_id: Authenticated user ID from JWT token (injected by auth middleware)
+        strategy_service: Strategy service (injected from dependencies.get_strategy_service)
+        cache_control: `no-cache` skips the agent response cache
+        idempotency_key: Client key reused when retrying the same request; a
+            retry gets the original request's strategy instead of a new one
         
     Returns:
         StrategyRecord: Complete strategy record including ID, timestamps, and generated strategy
@@ -84,10 +72,13 @@ async def generate_strategy(
         logger.info(f"Generating strategy for brand: {strategy_input.brand_name} (mock={settings.use_mock_agent})")
         
         # Call service with timeout
-        strategy_record = await asyncio.wait_for(
-            strategy_service.generate_and_store_strategy(strategy_input, user_id),
-            timeout=settings.agent_timeout_seconds
-        )
+        with bypass_agent_cache(bypass_requested(cache_control)):
+            strategy_record = await asyncio.wait_for(
+                strategy_service.generate_and_store_strategy(
+                    strategy_input, user_id, idempotency_key
+                ),
+                timeout=settings.agent_timeout_seconds
+            )
         
         logger.info(f"Successfully generated and stored strategy for: {strategy_input.brand_name} (ID: {strategy_record.id})")
         return strategy_record
@@ -107,7 +98,11 @@ async def generate_strategy(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate structured strategy output. Please try again."
         )
-        
+
+    except HTTPException:
+        # e.g. 422 for an idempotency key reused with a different input
+        raise
+
     except (BotoCoreError, ClientError) as e:
         # AWS Bedrock service errors
         logger.error(f"Bedrock service error: {str(e)}", exc_info=True)
@@ -134,31 +129,53 @@ async def generate_strategy(
 
 
 @router.get("/list", response_model=List[StrategyRecord], status_code=status.HTTP_200_OK)
-async def list_strategies(user_id: str = Depends(auth_middleware.get_current_user)):
+async def list_strategies(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    user_id: str = Depends(auth_middleware.get_current_user),
+    strategy_service: StrategyService = Depends(get_strategy_service),
+):
     """
-    List all strategies for the authenticated user.
+    List strategies for the authenticated user.
     
-    Returns all strategy records associated with the user, ordered by creation date
-    (newest first).
+    Returns strategy records associated with the user, ordered by creation date
+    (newest first). Without `limit` or `cursor` every strategy is returned;
+    otherwise one page is returned and the cursor for the next page is sent
+    in the X-Next-Cursor response header (absent on the last page).
     
     Args:
+        response: Outgoing response, used to set the next-page cursor header
+        limit: Maximum number of strategies per page
+        cursor: Cursor from the previous page's X-Next-Cursor header
         user_id: Authenticated user ID from JWT token (injected by auth middleware)
+        strategy_service: Strategy service (injected from dependencies.get_strategy_service)
     
     Returns:
         List[StrategyRecord]: List of strategy records, sorted by created_at descending
         
     Raises:
         HTTPException: 
+            - 400 for an invalid pagination cursor
             - 401 for missing or invalid authentication
             - 500 for database errors
     """
     
     try:
         logger.info(f"Retrieving strategy list for user: {user_id}")
-        strategies = await strategy_service.get_user_strategies(user_id)
+        if limit is None and cursor is None:
+            strategies = await strategy_service.get_user_strategies(user_id)
+        else:
+            strategies, next_cursor = await strategy_service.get_user_strategies_page(
+                user_id, limit, cursor
+            )
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
         logger.info(f"Found {len(strategies)} strategies for user: {user_id}")
         return strategies
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to retrieve strategies: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -170,7 +187,8 @@ async def list_strategies(user_id: str = Depends(auth_middleware.get_current_use
 @router.get("/{strategy_id}", response_model=StrategyRecord, status_code=status.HTTP_200_OK)
 async def get_strategy(
     strategy_id: str,
-    user_id: str = Depends(auth_middleware.get_current_user)
+    user_id: str = Depends(auth_middleware.get_current_user),
+    strategy_service: StrategyService = Depends(get_strategy_service),
 ):
     """
     Get a specific strategy by ID.
@@ -181,6 +199,7 @@ async def get_strategy(
     Args:
         strategy_id: Unique identifier of the strategy to retrieve
         user_id: Authenticated user ID from JWT token (injected by auth middleware)
+        strategy_service: Strategy service (injected from dependencies.get_strategy_service)
         
     Returns:
         StrategyRecord: The requested strategy record
@@ -0,0 +1,270 @@
+"""
+Content-addressed response cache for agent calls.
+
+Agent calls are deterministic enough to reuse: the same model, system prompt
+and inputs produce an equally good answer, and every repeat otherwise costs a
+Bedrock round trip of several seconds. AgentResponseCache stores each validated
+structured output under `cache_key(...)`, a SHA-256 of the canonical JSON of
+those three parts, so a repeated request is answered from memory in
+milliseconds.
+
+Entries live in an in-memory LRU bounded by entry count and total bytes, and
+optionally in a shared second tier (DynamoDB or local disk) that survives
+restarts and is shared between processes. Every entry expires after the TTL.
+A request can skip the lookup with `bypass_agent_cache()`; its fresh result
+still replaces the cached one.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from repositories.executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Set for the current request by bypass_agent_cache()
+_bypass: ContextVar[bool] = ContextVar("agent_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass_agent_cache(enabled: bool = True):
+    """Skip cache lookups for agent calls made inside this block."""
+    token = _bypass.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def _canonical(value: Any) -> Any:
+    """Normalize prompt inputs so equivalent requests produce the same key."""
+    if isinstance(value, BaseModel):
+        return _canonical(value.model_dump(mode="json"))
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value.replace("\r\n", "\n")).strip()
+    return value
+
+
+def content_hash(value: Any) -> str:
+    """SHA-256 of the canonical JSON of value."""
+    document = json.dumps(
+        _canonical(value),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def cache_key(model_id: str, system_prompt: str, operation: str, inputs: Any) -> str:
+    """SHA-256 of the model id, system prompt, operation name and normalized inputs."""
+    return content_hash({
+        "model": model_id,
+        "system": system_prompt,
+        "operation": operation,
+        "inputs": inputs,
+    })
+
+
+class DiskCacheStore:
+    """Second cache tier in local files, one JSON file per key."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    async def get(self, key: str) -> Optional[str]:
+        """Cached value for key, or None when missing or expired."""
+        def _read():
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    entry = json.load(f)
+            except FileNotFoundError:
+                return None
+            if entry["expiresAt"] <= time.time():
+                os.remove(self._path(key))
+                return None
+            return entry["value"]
+
+        return await run_blocking(_read)
+
+    async def put(self, key: str, value: str, expires_at: int) -> None:
+        """Write the entry atomically, replacing any earlier one."""
+        def _write():
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"expiresAt": expires_at, "value": value}, f)
+            os.replace(tmp, path)
+
+        await run_blocking(_write)
+
+
+class AgentResponseCache:
+    """LRU of validated agent outputs with TTLs and an optional shared tier."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: int = 86400,
+        store=None,
+    ):
+        """
+        Args:
+            max_entries: Entries kept in memory before the least recently used is evicted
+            max_bytes: Total size of the in-memory entries; also the largest single entry
+            ttl_seconds: Lifetime of an entry in either tier
+            store: Optional second tier with async `get(key)` and
+                   `put(key, value, expires_at)`, e.g. DiskCacheStore or
+                   AgentCacheRepository
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        # key -> (expires_at, serialized output)
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._bytes = 0
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    async def get_or_compute(
+        self, key: str, output_model: Type[T], compute: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Return the cached output for key, or await `compute()` and cache it.
+
+        Tier failures and entries that no longer validate against
+        `output_model` count as misses; they never fail the call.
+        """
+        if _bypass.get():
+            self.bypassed += 1
+        else:
+            cached = await self._lookup(key, output_model)
+            if cached is not None:
+                return cached
+            self.misses += 1
+
+        output = await compute()
+        if output is not None:
+            await self._store(key, output.model_dump_json())
+        return output
+
+    async def _lookup(self, key: str, output_model: Type[T]) -> Optional[T]:
+        value = self._get_memory(key)
+        if value is not None:
+            output = self._validate(key, value, output_model)
+            if output is not None:
+                self.memory_hits += 1
+                return output
+
+        if self.store is None:
+            return None
+        try:
+            value = await self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Agent cache store read failed: {e}")
+            return None
+        if value is None:
+            return None
+        output = self._validate(key, value, output_model)
+        if output is not None:
+            self.store_hits += 1
+            self._put_memory(key, value, time.time() + self.ttl_seconds)
+        return output
+
+    def _validate(self, key: str, value: str, output_model: Type[T]) -> Optional[T]:
+        try:
+            return output_model.model_validate_json(value)
+        except ValidationError:
+            logger.info(f"Dropping agent cache entry {key[:12]} that no longer validates")
+            self._discard(key)
+            return None
+
+    async def _store(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        self._put_memory(key, value, expires_at)
+        if self.store is None:
+            return
+        try:
+            await self.store.put(key, value, int(expires_at))
+        except Exception as e:
+            logger.warning(f"Agent cache store write failed: {e}")
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put_memory(self, key: str, value: str, expires_at: float) -> None:
+        size = len(value.encode("utf-8"))
+        self._discard(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (expires_at, value)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1].encode("utf-8"))
+
+    def clear(self) -> None:
+        """Drop every in-memory entry; the shared tier is left alone."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """Entry counts, sizes and the hit ratio of lookups since start."""
+        hits = self.memory_hits + self.store_hits
+        lookups = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "store": type(self.store).__name__ if self.store is not None else None,
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+
+def bypass_requested(cache_control: Optional[str]) -> bool:
+    """True when a request's Cache-Control header asks for a fresh answer."""
+    directives = {d.strip().lower() for d in (cache_control or "").split(",")}
+    return bool(directives & {"no-cache", "no-store"})
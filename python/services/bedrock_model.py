@@ -0,0 +1,60 @@
+"""
+Shared Amazon Bedrock model for the Strands agents.
+
+The Copywriter, Strategist and Scheduler agents run every call on a fresh
+`strands.Agent` so no conversation history is carried between requests or
+users. What is expensive to build (the boto3 session and Bedrock runtime
+client) lives in the `BedrockModel`, which holds no conversation state and is
+shared by every agent configured with the same region, model and credentials.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import boto3
+from botocore.config import Config as BotoConfig
+from strands.models.bedrock import BedrockModel
+
+
+@lru_cache
+def get_bedrock_model(
+    aws_region: str,
+    model_id: str,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+) -> BedrockModel:
+    """
+    Return the shared BedrockModel for a region, model and credentials.
+
+    Args:
+        aws_region: AWS region for Bedrock API calls
+        model_id: Bedrock model identifier
+        aws_access_key_id: AWS access key ID (if None, uses default credential chain)
+        aws_secret_access_key: AWS secret access key (if None, uses default credential chain)
+    """
+    # Increase read timeout for large structured output generation
+    boto_config = BotoConfig(
+        read_timeout=300,
+        connect_timeout=10,
+        retries={"max_attempts": 2}
+    )
+
+    # Create boto3 session with explicit credentials if provided
+    if aws_access_key_id and aws_secret_access_key:
+        boto_session = boto3.Session(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=aws_region
+        )
+        return BedrockModel(
+            boto_session=boto_session,
+            model_id=model_id,
+            boto_client_config=boto_config
+        )
+
+    # Fall back to default credential chain
+    return BedrockModel(
+        region_name=aws_region,
+        model_id=model_id,
+        boto_client_config=boto_config
+    )
@@ -7,17 +7,97 @@ the Copywriter Agent, Copy Repository, and Strategy Repository while ensuring pr
 error handling, user isolation, and data integrity.
 """
 
+import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 from fastapi import HTTPException, status
 
+from config import settings
 from models.copy import CopyItem, CopyOutput, CopyRecord, ChatResponse
 from repositories.copy_repository import CopyRepository
 from repositories.strategy_repository import StrategyRepository
+from services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_platform(p: str) -> str:
+    """Map the agent's platform names onto the stored ones (Twitter variants → "x")."""
+    lower = p.lower().strip()
+    if lower in ("twitter", "twitter/x", "x (twitter)", "x/twitter", "tiktok"):
+        return "x"
+    return lower
+
+
+class CopyBatchWriter:
+    """
+    Persist streamed copies in batches while generation is still running.
+
+    add() queues a copy and starts a background write whenever a batch fills,
+    so the stream is never held up by DynamoDB. close() writes what is left
+    and returns every stored record, which is why copies finished before a
+    stream fails are kept. A copy already queued (same platform and text) is
+    ignored, so the final result can be added on top of the streamed copies.
+    """
+
+    # Close tasks of streams whose client disconnected, kept until they finish
+    _background: Set[asyncio.Task] = set()
+
+    def __init__(self, copy_repository: CopyRepository, strategy_id: str, user_id: str, batch_size: int):
+        self.copy_repository = copy_repository
+        self.strategy_id = strategy_id
+        self.user_id = user_id
+        self.batch_size = max(1, batch_size)
+        self.failed = 0
+        self._pending: List[CopyRecord] = []
+        self._writes: List[Tuple[List[CopyRecord], asyncio.Task]] = []
+        self._seen: Set[Tuple[str, str]] = set()
+
+    def add(self, copy: dict) -> bool:
+        """Queue a copy for storage. Returns False if it was already queued."""
+        platform = _normalize_platform(copy["platform"])
+        key = (platform, copy["text"])
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._pending.append(CopyRecord(
+            strategy_id=self.strategy_id,
+            user_id=self.user_id,
+            text=copy["text"],
+            platform=platform,
+            hashtags=copy.get("hashtags", []),
+        ))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        return True
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        self._writes.append((batch, asyncio.create_task(self.copy_repository.create_copies(batch))))
+
+    async def close(self) -> List[CopyRecord]:
+        """Write the remaining copies and wait for every batch. Failed batches
+        are logged and counted in `failed` rather than raised."""
+        if self._pending:
+            self._flush()
+        saved = []
+        for batch, write in self._writes:
+            try:
+                # Shielded so a cancelled close() leaves the write running
+                saved.extend(await asyncio.shield(write))
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error(f"Failed to store {len(batch)} streamed copies: {e}", exc_info=True)
+        self._writes = []
+        return saved
+
+    def close_in_background(self) -> None:
+        """Finish storing the queued copies without waiting, e.g. after the client left."""
+        task = asyncio.create_task(self.close())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+
 class CopyService:
     """
     Business logic for copy generation, retrieval, and chat refinement.
@@ -28,29 +108,38 @@ class CopyService:
     corrupted database records.
     """
 
-    def __init__(self, agent, copy_repository: CopyRepository, strategy_repository: StrategyRepository):
+    def __init__(
+        self,
+        agent,
+        copy_repository: CopyRepository,
+        strategy_repository: StrategyRepository,
+        single_flight: Optional[SingleFlight] = None,
+    ):
         self.agent = agent
         self.copy_repository = copy_repository
         self.strategy_repository = strategy_repository
+        self.single_flight = single_flight or SingleFlight()
 
     async def _get_strategy_with_ownership(self, strategy_id: str, user_id: str):
         """Fetch a strategy and verify ownership. Raises 404/403 on failure."""
-        exists = await self.strategy_repository.strategy_exists(strategy_id)
-        if not exists:
+        strategy, belongs_to_other = await self.strategy_repository.get_strategy_for_user(
+            strategy_id, user_id
+        )
+        if belongs_to_other:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Strategy not found",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied: You do not have permission to access this resource",
             )
-
-        strategy = await self.strategy_repository.get_strategy_by_id(strategy_id, user_id)
         if strategy is None:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: You do not have permission to access this resource",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Strategy not found",
             )
         return strategy
 
-    async def generate_copies(self, strategy_id: str, user_id: str) -> List[CopyRecord]:
+    async def generate_copies(
+        self, strategy_id: str, user_id: str, idempotency_key: Optional[str] = None
+    ) -> List[CopyRecord]:
         """
         Generate copies from a strategy using the Copywriter Agent.
 
@@ -58,18 +147,30 @@ class CopyService:
         2. Call agent.generate_copies() with strategy data
         3. Store each CopyItem as a CopyRecord in the database
 
-        If the agent fails, no copies are stored (error integrity).
+        If the agent fails, no copies are stored (error integrity). Identical
+        concurrent calls share one generation, and a retry with the same
+        idempotency key gets the original call's records.
 
         Args:
             strategy_id: ID of the strategy to generate copies from
             user_id: Authenticated user's ID from JWT
+            idempotency_key: Client key identifying retries of one request
 
         Returns:
             List of stored CopyRecord objects
 
         Raises:
-            HTTPException: 404 if strategy not found, 403 if not owner
+            HTTPException: 404 if strategy not found, 403 if not owner,
+                422 if the idempotency key was used for another strategy
         """
+        return await self.single_flight.run(
+            user_id, "generate_copies", {"strategy_id": strategy_id},
+            lambda: self._generate_copies(strategy_id, user_id),
+            idempotency_key=idempotency_key,
+        )
+
+    async def _generate_copies(self, strategy_id: str, user_id: str) -> List[CopyRecord]:
+        """Generate and store copies once; see generate_copies."""
         strategy = await self._get_strategy_with_ownership(strategy_id, user_id)
 
         # Build strategy data dict for the agent
@@ -95,12 +196,6 @@ class CopyService:
         copy_output: CopyOutput = await self.agent.generate_copies(strategy_data)
 
         # Convert CopyItems to CopyRecords
-        def _normalize_platform(p: str) -> str:
-            lower = p.lower().strip()
-            if lower in ("twitter", "twitter/x", "x (twitter)", "x/twitter", "tiktok"):
-                return "x"
-            return lower
-
         records = [
             CopyRecord(
                 strategy_id=strategy_id,
@@ -115,6 +210,12 @@ class CopyService:
         # Persist all at once
         return await self.copy_repository.create_copies(records)
 
+    def copy_writer(self, strategy_id: str, user_id: str) -> CopyBatchWriter:
+        """Return a writer that stores a generation stream's copies as they arrive."""
+        return CopyBatchWriter(
+            self.copy_repository, strategy_id, user_id, settings.copy_stream_persist_batch_size
+        )
+
     async def get_copies_by_strategy(self, strategy_id: str, user_id: str) -> List[CopyRecord]:
         """
         Retrieve all copies for a strategy after verifying ownership.
@@ -132,6 +233,27 @@ class CopyService:
         await self._get_strategy_with_ownership(strategy_id, user_id)
         return await self.copy_repository.list_copies_by_strategy(strategy_id)
 
+    async def get_copies_by_strategy_page(
+        self,
+        strategy_id: str,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[CopyRecord], Optional[str]]:
+        """
+        Retrieve one page of copies for a strategy after verifying ownership.
+
+        Returns:
+            (copies, next_cursor) — next_cursor is None on the last page
+
+        Raises:
+            HTTPException: 404 if strategy not found, 403 if not owner
+        """
+        await self._get_strategy_with_ownership(strategy_id, user_id)
+        return await self.copy_repository.list_copies_by_strategy_page(
+            strategy_id, limit, cursor
+        )
+
     async def get_copy(self, copy_id: str, user_id: str) -> tuple[Optional[CopyRecord], bool]:
         """
         Retrieve a single copy with user isolation.
@@ -141,15 +263,7 @@ class CopyService:
             (None, True)     — exists but belongs to another user
             (None, False)    — does not exist
         """
-        exists = await self.copy_repository.copy_exists(copy_id)
-        if not exists:
-            return (None, False)
-
-        record = await self.copy_repository.get_copy_by_id(copy_id, user_id)
-        if record is None:
-            return (None, True)
-
-        return (record, False)
+        return await self.copy_repository.get_copy_for_user(copy_id, user_id)
 
     async def chat_refine_copy(
         self, copy_id: str, message: str, user_id: str
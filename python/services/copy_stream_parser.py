@@ -0,0 +1,87 @@
+"""
+Incremental parser for streamed CopyOutput structured output.
+
+The Copywriter agent's structured output arrives as the input of a tool call,
+streamed as fragments of one JSON document: '{"copies": [{"text": ...}, {...'.
+IncrementalCopyParser is fed those fragments and returns each element of the
+top-level "copies" array as a validated CopyItem as soon as its closing brace
+arrives, so copies can be shown and stored long before the document ends.
+"""
+
+import json
+import logging
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+from models.copy import CopyItem
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalCopyParser:
+    """Extract finished CopyItems from a partial CopyOutput JSON document."""
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string: List[str] = []
+        self._last_key: Optional[str] = None
+        # Nesting depth just inside the "copies" array, while it is open
+        self._copies_depth: Optional[int] = None
+        # Characters of the copy element being read, while one is open
+        self._element: Optional[List[str]] = None
+        self.parsed = 0
+        self.invalid = 0
+
+    def feed(self, chunk: str) -> List[CopyItem]:
+        """Consume the next fragment; return the copies it completed, in order."""
+        finished = []
+        for char in chunk:
+            if self._element is not None:
+                self._element.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = ''.join(self._string)
+                elif self._depth == 1:
+                    self._string.append(char)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string = []
+            elif char in '{[':
+                if char == '[' and self._depth == 1 and self._last_key == 'copies':
+                    self._copies_depth = 2
+                elif char == '{' and self._element is None and self._depth == self._copies_depth:
+                    self._element = [char]
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._element is not None and self._depth == self._copies_depth:
+                    copy = self._finish(''.join(self._element))
+                    self._element = None
+                    if copy is not None:
+                        finished.append(copy)
+                elif char == ']' and self._depth == 1:
+                    self._copies_depth = None
+        return finished
+
+    def _finish(self, element: str) -> Optional[CopyItem]:
+        """Validate one complete copy element; invalid ones are counted and skipped."""
+        try:
+            copy = CopyItem.model_validate(json.loads(element))
+        except (ValueError, ValidationError) as e:
+            self.invalid += 1
+            logger.debug(f"Skipping invalid streamed copy: {e}")
+            return None
+        self.parsed += 1
+        return copy
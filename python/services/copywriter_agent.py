@@ -6,14 +6,24 @@ Python SDK to generate platform-specific social media copies via Amazon Bedrock.
 The agent consumes strategy data and returns structured output validated by Pydantic models.
 """
 
+import asyncio
 import json
-import boto3
-from botocore.config import Config as BotoConfig
+import logging
 from strands import Agent
-from strands.models.bedrock import BedrockModel
-from models.copy import CopyOutput, ChatResponse
+from services.agent_cache import AgentResponseCache, cache_key
+from services.bedrock_model import get_bedrock_model
+from services.copy_stream_parser import IncrementalCopyParser
+from models.copy import CopyItem, CopyOutput, ChatResponse
 from typing import Optional, List, AsyncIterator
 
+logger = logging.getLogger(__name__)
+
+# Platforms every copy generation covers, whatever the strategy recommends
+DEFAULT_PLATFORMS = ["Twitter", "Instagram", "LinkedIn", "Facebook"]
+
+# Copy variations requested per platform
+VARIATIONS_PER_PLATFORM = 7
+
 
 class StructuredOutputException(Exception):
     """Raised when the agent fails to return structured output."""
@@ -34,49 +44,37 @@ class CopywriterAgent:
         aws_region: str, 
         model_id: str = "anthropic.claude-3-haiku-20240307-v1:0",
         aws_access_key_id: Optional[str] = None,
-        aws_secret_access_key: Optional[str] = None
+        aws_secret_access_key: Optional[str] = None,
+        fan_out: bool = True,
+        platform_attempts: int = 2,
+        cache: Optional[AgentResponseCache] = None
     ):
         """
-        Initialize the Copywriter Agent with Bedrock provider.
+        Initialize the Copywriter Agent on the shared Bedrock model.
         
         Args:
             aws_region: AWS region for Bedrock API calls
             model_id: Bedrock model identifier
             aws_access_key_id: AWS access key ID (if None, uses default credential chain)
             aws_secret_access_key: AWS secret access key (if None, uses default credential chain)
+            fan_out: Generate each platform's copies in its own concurrent call
+                     instead of one call for all platforms
+            platform_attempts: Calls per platform before fan-out generation gives up
+            cache: Response cache for repeated inputs (None disables caching)
         """
-        # Increase read timeout for large structured output generation
-        boto_config = BotoConfig(
-            read_timeout=300,
-            connect_timeout=10,
-            retries={"max_attempts": 2}
-        )
-        
-        # Create boto3 session with explicit credentials if provided
-        if aws_access_key_id and aws_secret_access_key:
-            boto_session = boto3.Session(
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                region_name=aws_region
-            )
-            self.model = BedrockModel(
-                boto_session=boto_session,
-                model_id=model_id,
-                boto_client_config=boto_config
-            )
-        else:
-            # Fall back to default credential chain
-            self.model = BedrockModel(
-                region_name=aws_region,
-                model_id=model_id,
-                boto_client_config=boto_config
-            )
-        
-        self.agent = Agent(
-            model=self.model,
-            system_prompt=self._get_system_prompt()
+        self.model = get_bedrock_model(
+            aws_region, model_id, aws_access_key_id, aws_secret_access_key
         )
-    
+        self.model_id = model_id
+        self.cache = cache
+        self.fan_out = fan_out
+        self.platform_attempts = max(1, platform_attempts)
+        self.system_prompt = self._get_system_prompt()
+
+    def _new_agent(self) -> Agent:
+        """Build a fresh, history-free agent for one call on the shared model."""
+        return Agent(model=self.model, system_prompt=self.system_prompt)
+
     def _get_system_prompt(self) -> str:
         """
         Get the detailed system prompt for the Copywriter Agent.
@@ -121,7 +119,10 @@ When refining copies via chat:
     async def generate_copies(self, strategy_data: dict) -> CopyOutput:
         """
         Generate platform-specific social media copies from strategy data.
-        
+
+        With `fan_out` (the default) each platform is generated by its own
+        concurrent call; otherwise one call generates every platform.
+
         Args:
             strategy_data: Strategy record data including content_pillars, content_themes,
                           engagement_tactics, platform_recommendations, posting_schedule,
@@ -133,6 +134,22 @@ When refining copies via chat:
         Raises:
             StructuredOutputException: If the agent fails to return structured output
         """
+        if self.cache is None:
+            return await self._generate_copies(strategy_data)
+        # Fan-out and single-call generation produce differently shaped output
+        key = cache_key(
+            self.model_id, self.system_prompt, "generate_copies",
+            {"strategy": strategy_data, "fan_out": self.fan_out},
+        )
+        return await self.cache.get_or_compute(
+            key, CopyOutput, lambda: self._generate_copies(strategy_data)
+        )
+
+    async def _generate_copies(self, strategy_data: dict) -> CopyOutput:
+        """Generate copies with uncached agent calls."""
+        if self.fan_out:
+            return await self._generate_copies_fan_out(strategy_data)
+
         platforms = strategy_data.get("platform_recommendations", [])
         
         # Handle both list of strings and list of dicts (PlatformRecommendation objects)
@@ -178,7 +195,7 @@ Each of the 7 variations per platform should take a different angle:
 6. Short and punchy — scroll-stopping brevity
 7. CTA-focused — drives action (clicks, saves, shares)"""
 
-        result = await self.agent.invoke_async(
+        result = await self._new_agent().invoke_async(
             user_prompt, structured_output_model=CopyOutput
         )
 
@@ -189,6 +206,110 @@ Each of the 7 variations per platform should take a different angle:
 
         return result.structured_output
 
+    async def _generate_copies_fan_out(self, strategy_data: dict) -> CopyOutput:
+        """
+        Generate copies with one concurrent structured call per platform.
+
+        Covers the same DEFAULT_PLATFORMS as the single-call prompt and the
+        stream. Each call is a fraction of the size of the all-platform call,
+        so the wall-clock time is roughly that of the slowest platform. Each
+        platform's output is validated on its own, and only the platforms
+        that failed are requested again, up to `platform_attempts` calls each.
+
+        Raises:
+            StructuredOutputException: If a platform still has no valid copies
+                after its last attempt
+        """
+        platforms = DEFAULT_PLATFORMS
+        copies_by_platform = {}
+        pending = list(platforms)
+
+        for attempt in range(1, self.platform_attempts + 1):
+            outcomes = await asyncio.gather(
+                *(self._generate_platform_copies(strategy_data, platform) for platform in pending),
+                return_exceptions=True,
+            )
+            failed = []
+            for platform, outcome in zip(pending, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.warning(
+                        f"Copy generation for {platform} failed "
+                        f"(attempt {attempt}/{self.platform_attempts}): {outcome}"
+                    )
+                    failed.append(platform)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    copies_by_platform[platform] = outcome
+            pending = failed
+            if not pending:
+                break
+
+        if pending:
+            raise StructuredOutputException(
+                f"Copywriter agent failed to return copies for: {', '.join(pending)}"
+            )
+
+        return CopyOutput(
+            copies=[copy for platform in platforms for copy in copies_by_platform[platform]]
+        )
+
+    async def _generate_platform_copies(self, strategy_data: dict, platform: str) -> List[CopyItem]:
+        """
+        Generate and validate one platform's copies.
+
+        Blank copies are dropped and every copy is labelled with the requested
+        platform, whatever name the model used for it.
+
+        Raises:
+            StructuredOutputException: If no usable copy was returned
+        """
+        result = await self._new_agent().invoke_async(
+            self._platform_prompt(strategy_data, platform), structured_output_model=CopyOutput
+        )
+        if result.structured_output is None:
+            raise StructuredOutputException(f"No structured output for {platform}")
+
+        copies = [
+            copy.model_copy(update={"platform": platform})
+            for copy in result.structured_output.copies
+            if copy.text.strip()
+        ][:VARIATIONS_PER_PLATFORM]
+        if not copies:
+            raise StructuredOutputException(f"No usable copies for {platform}")
+        return copies
+
+    @staticmethod
+    def _platform_prompt(strategy_data: dict, platform: str) -> str:
+        """User prompt asking for one platform's copy variations."""
+        def _join(value) -> str:
+            return ", ".join(value) if isinstance(value, list) else str(value)
+
+        return f"""Generate social media copies for the following brand strategy:
+
+Brand Name: {strategy_data.get("brand_name", "N/A")}
+Industry: {strategy_data.get("industry", "N/A")}
+Target Audience: {strategy_data.get("target_audience", "N/A")}
+Goals: {strategy_data.get("goals", "N/A")}
+
+Content Pillars: {_join(strategy_data.get("content_pillars", []))}
+Content Themes: {_join(strategy_data.get("content_themes", []))}
+Engagement Tactics: {_join(strategy_data.get("engagement_tactics", []))}
+Posting Schedule: {strategy_data.get("posting_schedule", "N/A")}
+
+IMPORTANT: Generate exactly {VARIATIONS_PER_PLATFORM} unique copy variations for {platform} only.
+Set the platform of every CopyItem to "{platform}".
+
+Each copy must include engaging caption text and relevant hashtags tailored to {platform}.
+Each of the {VARIATIONS_PER_PLATFORM} variations should take a different angle:
+1. Bold hook — attention-grabbing opening
+2. Storytelling — emotional narrative
+3. Question-driven — sparks conversation
+4. Educational — thought leadership
+5. Social proof — credibility and trust
+6. Short and punchy — scroll-stopping brevity
+7. CTA-focused — drives action (clicks, saves, shares)"""
+
     async def generate_copies_stream(
         self, strategy_data: dict
     ) -> AsyncIterator[dict]:
@@ -196,7 +317,9 @@ Each of the 7 variations per platform should take a different angle:
         Stream copy generation events from the agent in real time.
 
         Yields SSE-compatible dicts with event type and data as the agent
-        processes the request. The final event contains the structured output.
+        processes the request. The structured output is parsed while it
+        streams, so each copy is yielded as soon as it is complete; the final
+        event contains the whole structured output.
 
         Args:
             strategy_data: Strategy record data
@@ -205,6 +328,7 @@ Each of the 7 variations per platform should take a different angle:
             dict with 'event' key and event-specific data:
               - {"event": "thinking", "text": "..."} for text deltas
               - {"event": "lifecycle", "phase": "..."} for lifecycle events
+              - {"event": "copy", "index": n, "copy": {...}} for each finished copy
               - {"event": "result", "copies": [...]} for the final output
               - {"event": "error", "message": "..."} on failure
         """
@@ -253,9 +377,12 @@ Each of the 7 variations per platform should take a different angle:
 
         accumulated_text = ""
         result = None
+        parser = None
+        tool_use_id = None
+        emitted = set()
 
         try:
-            async for event in self.agent.stream_async(
+            async for event in self._new_agent().stream_async(
                 user_prompt, structured_output_model=CopyOutput
             ):
                 # Text delta from the model
@@ -264,6 +391,23 @@ Each of the 7 variations per platform should take a different angle:
                     accumulated_text += chunk
                     yield {"event": "thinking", "text": chunk}
 
+                # Structured output streaming in as tool input: emit each copy
+                # once its JSON object is complete
+                elif event.get("type") == "tool_use_stream":
+                    tool_use = event["current_tool_use"]
+                    if tool_use.get("name") != CopyOutput.__name__:
+                        continue
+                    if tool_use.get("toolUseId") != tool_use_id:
+                        # A retried structured output call starts a new document
+                        tool_use_id = tool_use.get("toolUseId")
+                        parser = IncrementalCopyParser()
+                    for copy in parser.feed(event["delta"]["toolUse"]["input"]):
+                        key = (copy.platform, copy.text)
+                        if key in emitted:
+                            continue
+                        emitted.add(key)
+                        yield {"event": "copy", "index": len(emitted) - 1, "copy": copy.model_dump()}
+
                 # Reasoning / thinking content (if model supports it)
                 elif event.get("reasoningText"):
                     yield {"event": "thinking", "text": event["reasoningText"]}
@@ -316,6 +460,32 @@ Each of the 7 variations per platform should take a different angle:
         Raises:
             StructuredOutputException: If the agent fails to return structured output
         """
+        if self.cache is None:
+            return await self._chat_refine(copy_text, platform, hashtags, strategy_data, user_message)
+        key = cache_key(
+            self.model_id, self.system_prompt, "chat_refine",
+            {
+                "copy_text": copy_text,
+                "platform": platform,
+                "hashtags": hashtags,
+                "strategy": strategy_data,
+                "message": user_message,
+            },
+        )
+        return await self.cache.get_or_compute(
+            key, ChatResponse,
+            lambda: self._chat_refine(copy_text, platform, hashtags, strategy_data, user_message),
+        )
+
+    async def _chat_refine(
+        self,
+        copy_text: str,
+        platform: str,
+        hashtags: List[str],
+        strategy_data: dict,
+        user_message: str
+    ) -> ChatResponse:
+        """Refine a copy with one uncached agent call."""
         hashtags_str = ", ".join(hashtags) if hashtags else "None"
 
         user_prompt = f"""I need you to refine the following social media copy based on my feedback.
@@ -336,7 +506,7 @@ My feedback: {user_message}
 Please update the copy based on my feedback while maintaining brand consistency. 
 Provide the updated text, updated hashtags, and explain what changes you made."""
 
-        result = await self.agent.invoke_async(
+        result = await self._new_agent().invoke_async(
             user_prompt, structured_output_model=ChatResponse
         )
 
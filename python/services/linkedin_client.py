@@ -3,12 +3,17 @@ LinkedIn API client for publishing posts and uploading images.
 
 Encapsulates all LinkedIn REST API interactions including post creation,
 image upload initialization, image binary upload, and error handling.
-Uses httpx.AsyncClient with configurable timeout for all requests.
+All requests share one long-lived, pooled httpx.AsyncClient so TCP/TLS
+connections are reused across calls (an image post's three requests included).
+The pool is created lazily and closed from the application lifespan.
 """
 
+import importlib.util
 import httpx
 import logging
+from typing import AsyncIterable, Mapping, Optional, Union
 from models.publisher import LinkedInPostResponse, LinkedInImageUploadResponse
+from services.rate_limiter import retry_after_from_headers
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +32,66 @@ _ERROR_CODE_MAP = {
 }
 
 
+class LinkedInRateLimitError(Exception):
+    """Raised by non-post calls (image upload initialization) on HTTP 429."""
+
+    def __init__(self, message: str, retry_after_seconds: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
 class LinkedInClient:
     """Encapsulates all LinkedIn REST API interactions."""
 
-    def __init__(self, timeout_seconds: int = 30):
+    def __init__(
+        self,
+        timeout_seconds: int = 30,
+        upload_timeout_seconds: Optional[int] = None,
+        base_url: str = LINKEDIN_API_BASE,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_seconds: float = 30.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.timeout = timeout_seconds
+        # Binary uploads can be much larger than API calls, so they get their own budget
+        self.upload_timeout = upload_timeout_seconds or timeout_seconds
+        self.base_url = base_url.rstrip("/")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self.http2 = http2 and self._http2_available()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def _http2_available() -> bool:
+        """HTTP/2 needs the optional `h2` package (pip install httpx[http2])."""
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested for LinkedIn client but 'h2' is not installed; using HTTP/1.1")
+            return False
+        return True
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared connection pool, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections. The pool is recreated if the client is used again."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _headers(self, access_token: str) -> dict:
         """Standard headers for all LinkedIn API requests."""
@@ -60,13 +120,19 @@ class LinkedInClient:
 
         return f"{content} {' '.join(formatted_tags)}"
 
-    def _map_error(self, status_code: int, response_text: str) -> LinkedInPostResponse:
+    def _map_error(
+        self,
+        status_code: int,
+        response_text: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> LinkedInPostResponse:
         """Map an HTTP error response to a LinkedInPostResponse."""
         error_code = _ERROR_CODE_MAP.get(status_code, "linkedin_server_error")
         return LinkedInPostResponse(
             status_code=status_code,
             error_code=error_code,
             error_message=response_text[:500] if response_text else f"HTTP {status_code}",
+            retry_after_seconds=retry_after_from_headers(headers) if headers else None,
         )
 
     def _build_post_body(
@@ -97,22 +163,23 @@ class LinkedInClient:
         Creates a text-only post. Returns structured response with status code
         and post ID (from x-restli-id header) on success.
         """
-        url = f"{LINKEDIN_API_BASE}/posts"
+        url = f"{self.base_url}/posts"
         body = self._build_post_body(person_urn, commentary)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url, headers=self._headers(access_token), json=body
-                )
+            response = await self.client.post(
+                url, headers=self._headers(access_token), json=body,
+                timeout=self.timeout,
+            )
 
             if response.status_code == 201:
                 post_id = response.headers.get("x-restli-id")
                 return LinkedInPostResponse(
-                    status_code=201, post_id=post_id
+                    status_code=201, post_id=post_id,
+                    retry_after_seconds=retry_after_from_headers(response.headers),
                 )
 
-            return self._map_error(response.status_code, response.text)
+            return self._map_error(response.status_code, response.text, response.headers)
 
         except httpx.TimeoutException as e:
             logger.error(f"Timeout creating text post: {e}")
@@ -136,14 +203,14 @@ class LinkedInClient:
         POST https://api.linkedin.com/rest/images?action=initializeUpload
         Returns upload URL and image URN.
         """
-        url = f"{LINKEDIN_API_BASE}/images?action=initializeUpload"
+        url = f"{self.base_url}/images?action=initializeUpload"
         body = {"initializeUploadRequest": {"owner": person_urn}}
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url, headers=self._headers(access_token), json=body
-                )
+            response = await self.client.post(
+                url, headers=self._headers(access_token), json=body,
+                timeout=self.timeout,
+            )
 
             if response.status_code in (200, 201):
                 data = response.json()
@@ -155,6 +222,10 @@ class LinkedInClient:
 
             error_msg = f"Image upload init failed with status {response.status_code}: {response.text[:500]}"
             logger.error(error_msg)
+            if response.status_code == 429:
+                raise LinkedInRateLimitError(
+                    error_msg, retry_after_from_headers(response.headers)
+                )
             raise Exception(error_msg)
 
         except (httpx.TimeoutException, httpx.HTTPError) as e:
@@ -162,21 +233,29 @@ class LinkedInClient:
             raise Exception(f"Network error initializing image upload: {e}") from e
 
     async def upload_image_binary(
-        self, upload_url: str, image_data: bytes, content_type: str
+        self,
+        upload_url: str,
+        image_data: Union[bytes, AsyncIterable[bytes]],
+        content_type: str,
+        content_length: Optional[int] = None,
     ) -> int:
         """
         PUT to the upload URL with raw image bytes.
+        `image_data` may be an async iterable of chunks, which is streamed;
+        pass `content_length` with it so the upload is not chunk-encoded.
         Returns HTTP status code.
         """
         headers = {
             "Content-Type": content_type,
         }
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.put(
-                    upload_url, headers=headers, content=image_data
-                )
+            response = await self.client.put(
+                upload_url, headers=headers, content=image_data,
+                timeout=self.upload_timeout,
+            )
 
             if response.status_code not in (200, 201):
                 error_msg = f"Image binary upload failed with status {response.status_code}: {response.text[:500]}"
@@ -197,22 +276,23 @@ class LinkedInClient:
         Creates a post with an image attachment. Same as text post but includes
         content.media.id field with the image URN.
         """
-        url = f"{LINKEDIN_API_BASE}/posts"
+        url = f"{self.base_url}/posts"
         body = self._build_post_body(person_urn, commentary, image_urn=image_urn)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    url, headers=self._headers(access_token), json=body
-                )
+            response = await self.client.post(
+                url, headers=self._headers(access_token), json=body,
+                timeout=self.timeout,
+            )
 
             if response.status_code == 201:
                 post_id = response.headers.get("x-restli-id")
                 return LinkedInPostResponse(
-                    status_code=201, post_id=post_id
+                    status_code=201, post_id=post_id,
+                    retry_after_seconds=retry_after_from_headers(response.headers),
                 )
 
-            return self._map_error(response.status_code, response.text)
+            return self._map_error(response.status_code, response.text, response.headers)
 
         except httpx.TimeoutException as e:
             logger.error(f"Timeout creating image post: {e}")
@@ -0,0 +1,74 @@
+"""
+Streaming helpers for moving media from S3 to LinkedIn without buffering it.
+
+`stream_body` turns a boto3 `StreamingBody` into an async generator of chunks.
+A background task reads ahead into a bounded queue, so S3 reads overlap with
+the LinkedIn upload while at most `buffer_chunks` chunks sit in memory per
+upload, whatever the image size. `ByteBudget` caps the total size of uploads
+in flight across the process, so several large images due at once queue up
+instead of all streaming simultaneously.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from repositories.executor import run_blocking_s3
+
+logger = logging.getLogger(__name__)
+
+
+async def stream_body(body, chunk_size: int, buffer_chunks: int) -> AsyncIterator[bytes]:
+    """Yield `body` in chunks of up to `chunk_size` bytes, reading ahead at most
+    `buffer_chunks` chunks. The body is closed when the generator finishes."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_chunks)
+
+    async def produce() -> None:
+        try:
+            while True:
+                chunk = await run_blocking_s3(body.read, chunk_size)
+                await queue.put(chunk)
+                if not chunk:
+                    return
+        except Exception as e:
+            await queue.put(e)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            chunk = await queue.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        producer.cancel()
+        body.close()
+
+
+class ByteBudget:
+    """An async semaphore counted in bytes rather than slots."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reserve(self, nbytes: int):
+        """Wait until `nbytes` fit under the budget and hold them for the block.
+
+        A single item larger than the whole budget is admitted on its own.
+        """
+        nbytes = min(nbytes, self.max_bytes)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight + nbytes <= self.max_bytes)
+            self.in_flight += nbytes
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= nbytes
+                self._condition.notify_all()
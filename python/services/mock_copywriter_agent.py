@@ -169,12 +169,15 @@ class MockCopywriterAgent:
             yield {"event": "thinking", "text": chunk}
             await asyncio.sleep(0.4)
 
-        # Generate the actual mock copies
+        # Generate the actual mock copies, streaming each one like the real agent
         output = await self.generate_copies(strategy_data)
         copies_data = [
             {"text": c.text, "platform": c.platform, "hashtags": c.hashtags}
             for c in output.copies
         ]
+        for index, copy in enumerate(copies_data):
+            yield {"event": "copy", "index": index, "copy": copy}
+            await asyncio.sleep(0.1)
         yield {"event": "result", "copies": copies_data}
 
     async def chat_refine(
@@ -0,0 +1,210 @@
+"""
+Bounded producer/consumer pipeline used by the publisher.
+
+A publish cycle moves each post through a fixed sequence of stages. Every
+stage has its own input queue (bounded, so a slow stage pushes back on the
+ones before it) and its own pool of workers, so while one post is being
+created on LinkedIn the next one's image is already streaming and the one
+after that is being claimed.
+
+A stage can be `ordered`: items sharing a lane key are then handled one at a
+time and in submission order, while different lanes still run concurrently.
+Out-of-order arrivals are parked until their predecessor has been handled,
+without holding a worker, so an ordered stage can never deadlock the
+pipeline. For this to work every item must reach every stage: handlers pass
+items they have nothing to do for straight through instead of dropping them.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StageStats:
+    """Running counters for one stage, kept across cycles."""
+
+    def __init__(self):
+        self.processed = 0
+        self.errors = 0
+        self.in_progress = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.last_seconds = 0.0
+
+    def record(self, seconds: float, failed: bool) -> None:
+        self.processed += 1
+        if failed:
+            self.errors += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.last_seconds = seconds
+
+
+class PipelineStage:
+    """
+    One step of the pipeline.
+
+    `handler` is awaited with each item and must return it (possibly updated)
+    for the next stage. With `ordered_by`, items are handled sequentially per
+    lane in the order given by the returned (lane, sequence) pair, where each
+    lane's sequence numbers start at 0.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        concurrency: int,
+        queue_size: int,
+        ordered_by: Optional[Callable[[Any], Tuple[Hashable, int]]] = None,
+    ):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, queue_size)
+        self.ordered_by = ordered_by
+        self.stats = StageStats()
+        # Queues of the cycles currently running, for depth reporting
+        self._queues: List[asyncio.Queue] = []
+        self._parked = 0
+
+    @property
+    def depth(self) -> int:
+        """Items waiting for this stage, including parked out-of-order items."""
+        return sum(q.qsize() for q in self._queues) + self._parked
+
+    def snapshot(self) -> dict:
+        stats = self.stats
+        return {
+            "name": self.name,
+            "concurrency": self.concurrency,
+            "queue_size": self.queue_size,
+            "depth": self.depth,
+            "in_progress": stats.in_progress,
+            "processed": stats.processed,
+            "errors": stats.errors,
+            "avg_seconds": stats.total_seconds / stats.processed if stats.processed else 0.0,
+            "max_seconds": stats.max_seconds,
+            "last_seconds": stats.last_seconds,
+        }
+
+
+class Pipeline:
+    """
+    Runs batches of items through a list of stages.
+
+    A handler that raises does not stop the pipeline: `on_error(item, exc)`
+    is called and the item continues to the next stage, where handlers see
+    whatever outcome `on_error` recorded on it.
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        on_error: Callable[[Any, Exception], None],
+    ):
+        self.stages = stages
+        self.on_error = on_error
+        self._active_runs = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Items currently inside the pipeline, across all running cycles."""
+        return sum(stage.depth + stage.stats.in_progress for stage in self.stages)
+
+    def snapshot(self) -> dict:
+        """Per-stage queue depth and latency."""
+        return {
+            "active_runs": self._active_runs,
+            "stages": [stage.snapshot() for stage in self.stages],
+        }
+
+    async def wait_idle(self) -> None:
+        """Wait until no cycle is running through the pipeline."""
+        await self._idle.wait()
+
+    async def run(self, items: Iterable[Any]) -> None:
+        """Push every item through all stages and return once the last one is done."""
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        workers = []
+        for index, stage in enumerate(self.stages):
+            stage._queues.append(queues[index])
+            downstream = queues[index + 1] if index + 1 < len(queues) else None
+            parked: Dict[Tuple[Hashable, int], Any] = {}
+            next_sequence: Dict[Hashable, int] = {}
+            for _ in range(stage.concurrency):
+                workers.append(asyncio.create_task(self._work(
+                    stage, queues[index], downstream, parked, next_sequence
+                )))
+
+        self._active_runs += 1
+        self._idle.clear()
+        try:
+            for item in items:
+                await queues[0].put(item)
+            # Each queue is complete once its upstream has drained into it
+            for queue in queues:
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            for stage, queue in zip(self.stages, queues):
+                stage._queues.remove(queue)
+            self._active_runs -= 1
+            if not self._active_runs:
+                self._idle.set()
+
+    async def _work(
+        self,
+        stage: PipelineStage,
+        queue: asyncio.Queue,
+        downstream: Optional[asyncio.Queue],
+        parked: Dict[Tuple[Hashable, int], Any],
+        next_sequence: Dict[Hashable, int],
+    ) -> None:
+        while True:
+            item = await queue.get()
+            if stage.ordered_by is None:
+                await self._handle(stage, item, downstream)
+                queue.task_done()
+                continue
+
+            lane, sequence = stage.ordered_by(item)
+            if sequence != next_sequence.get(lane, 0):
+                # Its predecessor's worker will pick it up; task_done comes then
+                parked[(lane, sequence)] = item
+                stage._parked += 1
+                continue
+            while item is not None:
+                await self._handle(stage, item, downstream)
+                queue.task_done()
+                sequence += 1
+                next_sequence[lane] = sequence
+                item = parked.pop((lane, sequence), None)
+                if item is not None:
+                    stage._parked -= 1
+
+    async def _handle(
+        self, stage: PipelineStage, item: Any, downstream: Optional[asyncio.Queue]
+    ) -> None:
+        stats = stage.stats
+        stats.in_progress += 1
+        started = time.perf_counter()
+        failed = False
+        try:
+            item = await stage.handler(item)
+        except Exception as e:
+            failed = True
+            logger.error(f"Pipeline stage {stage.name} failed: {e}", exc_info=True)
+            self.on_error(item, e)
+        finally:
+            stats.in_progress -= 1
+            stats.record(time.perf_counter() - started, failed)
+        if downstream is not None:
+            await downstream.put(item)
@@ -0,0 +1,39 @@
+"""
+Retry policy for failed publishes.
+
+A failed publish is retried with exponential backoff whose base and cap depend
+on the class of error: transient network and LinkedIn server errors are
+retried quickly, anything else (expired tokens, validation errors, missing
+media) is spaced out much further since it rarely fixes itself. Delays use
+"equal jitter" - half the backoff is fixed, half random - so posts that failed
+together against a degraded LinkedIn do not all come back at the same moment.
+"""
+
+import random
+from typing import Optional
+
+from config import settings
+
+# error_code -> (base delay, max delay) in seconds
+RETRY_BACKOFF = {
+    "network_error": (30, 30 * 60),
+    "linkedin_server_error": (60, 60 * 60),
+    "image_upload_error": (60, 60 * 60),
+    "image_upload_init_error": (60, 60 * 60),
+}
+DEFAULT_BACKOFF = (15 * 60, 6 * 60 * 60)
+
+# Failures that are not retried: the rate limiter defers these instead
+NOT_RETRIED = {"rate_limited"}
+
+
+def retry_delay(error_code: Optional[str], attempt: int, rng: random.Random = random) -> float:
+    """Seconds to wait before retry number `attempt` (1-based) after `error_code`."""
+    base, cap = RETRY_BACKOFF.get(error_code, DEFAULT_BACKOFF)
+    backoff = min(cap, base * 2 ** (attempt - 1))
+    return backoff / 2 + rng.uniform(0, backoff / 2)
+
+
+def retries_exhausted(attempt: int) -> bool:
+    """True once `attempt` failed attempts have used up the retry budget."""
+    return attempt >= settings.publisher_retry_max_attempts
@@ -1,54 +1,252 @@
 """
-Publish Scanner - Background task that periodically scans for and publishes due posts.
+Publish Scanner - Background task that publishes posts when they become due.
 
-This module runs as an asyncio background task within the FastAPI application,
-scanning the scheduled-posts table at a configurable interval for posts that
-are due for publishing. It maintains a processing set to prevent overlapping
-scan cycles from double-publishing the same post.
+This module runs as an asyncio background task, either within the FastAPI
+application or in the standalone worker (`python -m workers.publisher`).
+It keeps an in-memory min-heap of upcoming due times, fed by the change feed of
+`SchedulerRepository` writes, and sleeps exactly until the next post is due (or
+until a write changes the schedule). A periodic reconciliation every
+`publisher_scan_interval_seconds` re-seeds the heap from the DueIndex and
+publishes anything that was missed, e.g. posts written by another process
+(for a standalone worker, every post the API writes).
+Each reconciliation also starts a warm-up pass that uploads the images of
+posts due within `publisher_prepare_lookahead_seconds`, so at the due time
+only the post itself is created. Posts the publisher defers because no
+rate-limit token is free are re-armed for the time a token becomes
+available. It maintains a processing set to prevent overlapping cycles from
+double-publishing the same post. On shutdown it drains: no new posts are
+claimed, and posts already claimed get a deadline to finish publishing and
+recording their outcome before the loop is cancelled.
 """
 
 import asyncio
+import heapq
 import logging
-from typing import Set
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
 
+from models.scheduler import ScheduledPostRecord
 from services.publisher_service import PublisherService
+from repositories.scheduler_repository import post_ready_at
 from config import settings
 
 logger = logging.getLogger(__name__)
 
 
 class PublishScanner:
-    """Background task that periodically scans for and publishes due posts."""
+    """Background task that publishes posts at their due time."""
 
-    def __init__(self, publisher_service: PublisherService):
+    def __init__(self, publisher_service: PublisherService, interval: Optional[int] = None):
         self.publisher_service = publisher_service
-        self.interval = settings.publisher_scan_interval_seconds
+        self.scheduler_repository = publisher_service.scheduler_repository
+        self.interval = interval or settings.publisher_scan_interval_seconds
         self._running = False
         self._task: asyncio.Task = None
         self._processing_post_ids: Set[str] = set()
 
+        # Min-heap of (due_at, post_id). Entries are invalidated lazily: an
+        # entry is live only while _due_at[post_id] still equals its due_at.
+        self._heap: List[Tuple[int, str]] = []
+        self._due_at: Dict[str, int] = {}
+        # Due times beyond this epoch are left to the next reconciliation
+        self._seeded_until: float = 0.0
+        self._next_reconcile: float = 0.0
+        self._wakeup = asyncio.Event()
+        self._prepare_task: Optional[asyncio.Task] = None
+        # Wall-clock time the loop last finished an iteration
+        self.last_loop_at: Optional[float] = None
+        # Outcome of the last stop(): {"drained": n, "abandoned": m}
+        self.last_drain: Optional[Dict[str, int]] = None
+
     async def start(self):
-        """Start the background scan loop as an asyncio task."""
+        """Subscribe to post writes and start the background loop as an asyncio task."""
         self._running = True
+        self.scheduler_repository.add_change_listener(self.on_post_change)
         self._task = asyncio.create_task(self._run_loop())
-        logger.info(f"Publish Scanner started (interval: {self.interval}s)")
+        logger.info(f"Publish Scanner started (reconciliation interval: {self.interval}s)")
+
+    async def stop(self, timeout: Optional[float] = None) -> Dict[str, int]:
+        """
+        Gracefully stop the scanner, draining in-flight publishes first.
 
-    async def stop(self):
-        """Gracefully stop the scanner by cancelling the background task."""
+        No new posts are claimed once stop is called. Posts already claimed
+        get up to `timeout` seconds (default `publisher_drain_timeout_seconds`)
+        to finish publishing and writing their status and log; only then is
+        the loop cancelled. Posts still in flight at that point are abandoned
+        with their lease intact, so another worker recovers them when it
+        expires. Returns {"drained": n, "abandoned": m}.
+        """
+        if timeout is None:
+            timeout = settings.publisher_drain_timeout_seconds
         self._running = False
+        self.scheduler_repository.remove_change_listener(self.on_post_change)
+        self.publisher_service.start_drain()
+        if self._prepare_task:
+            self._prepare_task.cancel()
         if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        logger.info("Publish Scanner stopped")
+            self._wakeup.set()
+            done, _ = await asyncio.wait({self._task}, timeout=timeout)
+            if not done:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+
+        abandoned = sorted(self.publisher_service.in_flight_post_ids)
+        self.last_drain = {
+            "drained": self.publisher_service.drained,
+            "abandoned": len(abandoned),
+        }
+        if abandoned:
+            logger.warning(
+                f"Abandoned {len(abandoned)} in-flight posts after {timeout}s: {abandoned}; "
+                "they are retried once their leases expire"
+            )
+        logger.info(
+            f"Publish Scanner stopped (drained {self.last_drain['drained']}, "
+            f"abandoned {self.last_drain['abandoned']})"
+        )
+        return self.last_drain
+
+    @property
+    def healthy(self) -> bool:
+        """The loop is running and has not stalled past a reconciliation interval."""
+        if not self._running or self._task is None or self._task.done():
+            return False
+        last = self.last_loop_at
+        return last is None or time.time() - last <= 2 * self.interval
+
+    def stats(self) -> dict:
+        """Scanner state for health and metrics endpoints."""
+        return {
+            "running": self._running,
+            "healthy": self.healthy,
+            "armed_timers": len(self._due_at),
+            "processing": len(self._processing_post_ids),
+            "last_loop_at": self.last_loop_at,
+            "next_reconcile_at": self._next_reconcile or None,
+            "last_drain": self.last_drain,
+        }
+
+    def on_post_change(self, post_id: str, due_at: Optional[int]) -> None:
+        """Change-feed listener: (re)arm or disarm the timer for a post."""
+        if due_at is None:
+            self._due_at.pop(post_id, None)
+        elif due_at <= self._seeded_until:
+            self._schedule(post_id, due_at)
+        else:
+            # Far enough out that the next reconciliation will pick it up
+            self._due_at.pop(post_id, None)
+        self._wakeup.set()
+
+    def _schedule(self, post_id: str, due_at: int) -> None:
+        """Track a post's due time, superseding any earlier entry for it."""
+        if self._due_at.get(post_id) == due_at:
+            return
+        self._due_at[post_id] = due_at
+        heapq.heappush(self._heap, (due_at, post_id))
+
+    def _peek_due_at(self) -> Optional[int]:
+        """Return the earliest live due time, discarding stale heap entries."""
+        while self._heap:
+            due_at, post_id = self._heap[0]
+            if self._due_at.get(post_id) == due_at:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    def _pop_due(self, now: float) -> List[str]:
+        """Remove and return every live post whose due time has passed."""
+        post_ids = []
+        while True:
+            due_at = self._peek_due_at()
+            if due_at is None or due_at > now:
+                return post_ids
+            _, post_id = heapq.heappop(self._heap)
+            del self._due_at[post_id]
+            post_ids.append(post_id)
+
+    def _seconds_until_wakeup(self, now: float) -> float:
+        """Sleep until the next due post or the next reconciliation, whichever is first."""
+        wake_at = self._next_reconcile
+        due_at = self._peek_due_at()
+        if due_at is not None:
+            wake_at = min(wake_at, due_at)
+        return max(0.0, wake_at - now)
+
+    def _arm_deferred(self) -> None:
+        """Re-arm posts the publisher deferred for rate limiting at their retry time."""
+        for post_id, retry_at in self.publisher_service.pop_deferred().items():
+            self.on_post_change(post_id, retry_at)
+
+    def _start_prepare(self, posts: List[ScheduledPostRecord]) -> None:
+        """Upload upcoming posts' images in the background (one pass at a time)."""
+        if not posts or (self._prepare_task is not None and not self._prepare_task.done()):
+            return
+        self._prepare_task = asyncio.create_task(self.publisher_service.prepare_posts(posts))
+
+    async def _reconcile(self) -> None:
+        """Safety net: re-seed the heap from the table and publish anything overdue."""
+        if not settings.publisher_due_index_enabled:
+            # No index to seed from; fall back to a full cycle and rely on the feed
+            self._seeded_until = float("inf")
+            await self.publisher_service.run_scan_cycle(self._processing_post_ids)
+            return
+
+        now = datetime.now(timezone.utc)
+        lookahead = settings.publisher_prepare_lookahead_seconds
+        horizon = now + timedelta(seconds=max(self.interval, lookahead))
+        upcoming = await self.scheduler_repository.list_due_posts(horizon)
+        self._seeded_until = horizon.timestamp()
+
+        overdue = []
+        to_prepare = []
+        for post in upcoming:
+            # The horizon is in the future: a claim whose lease is still live
+            # now is armed for its expiry instead of being treated as overdue
+            due_at = post_ready_at(post)
+            if due_at is None:
+                continue
+            if due_at <= now.timestamp():
+                self._due_at.pop(post.id, None)
+                overdue.append(post)
+            else:
+                self._schedule(post.id, due_at)
+                if post.media_id and due_at <= now.timestamp() + lookahead:
+                    to_prepare.append(post)
+        self._start_prepare(to_prepare)
+        logger.debug(
+            f"Reconciled: {len(overdue)} overdue, {len(self._due_at)} armed timers"
+        )
+        await self.publisher_service.process_posts(overdue, self._processing_post_ids)
 
     async def _run_loop(self):
-        """Main loop: run scan cycle, catch exceptions, sleep, repeat."""
+        """Main loop: publish what is due, reconcile on schedule, sleep until the next event."""
         while self._running:
+            self._wakeup.clear()
+            now = time.time()
             try:
-                await self.publisher_service.run_scan_cycle(self._processing_post_ids)
+                if now >= self._next_reconcile:
+                    try:
+                        await self._reconcile()
+                    finally:
+                        self._next_reconcile = time.time() + self.interval
+                else:
+                    due_post_ids = self._pop_due(now)
+                    if due_post_ids:
+                        await self.publisher_service.run_posts_cycle(
+                            due_post_ids, self._processing_post_ids
+                        )
+                self._arm_deferred()
             except Exception as e:
                 logger.error(f"Scan cycle failed: {e}", exc_info=True)
-            await asyncio.sleep(self.interval)
+            self.last_loop_at = time.time()
+
+            delay = self._seconds_until_wakeup(time.time())
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
@@ -2,29 +2,134 @@
 Publisher service orchestrating the LinkedIn publishing workflow.
 
 This module coordinates scanning for due posts, retrieving user credentials,
-downloading media from S3, calling the LinkedIn API, updating post statuses,
+streaming media from S3, calling the LinkedIn API, updating post statuses,
 and logging all publish attempts. It handles text-only and image posts,
 rate limiting, credential validation, and fault isolation across posts.
 """
 
+import asyncio
 import logging
-import boto3
+import os
+import socket
+import time
+import uuid
 from collections import defaultdict
-from typing import List, Optional, Set
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from datetime import datetime, timezone
 
+from boto3.dynamodb.conditions import Attr
+
 from models.publisher import PublishLogRecord, LinkedInPostResponse
 from models.scheduler import ScheduledPostRecord
-from services.linkedin_client import LinkedInClient
+from services.linkedin_client import LinkedInClient, LinkedInRateLimitError
+from services.media_stream import ByteBudget, stream_body
+from services.publish_pipeline import Pipeline, PipelineStage
+from services.publish_retry import NOT_RETRIED, retries_exhausted, retry_delay
+from services.rate_limiter import LinkedInRateLimiter
 from repositories.publisher_repository import PublisherRepository
-from repositories.scheduler_repository import SchedulerRepository
+from repositories.scheduler_repository import (
+    AWAITING_PUBLICATION, DUE_INDEX, SchedulerRepository, post_due_at, post_ready_at,
+)
 from repositories.user_repository import UserRepository
 from repositories.media_repository import MediaRepository
+from repositories.aws_clients import aws_clients
+from repositories.executor import run_blocking, run_blocking_s3
 from config import settings
 
 logger = logging.getLogger(__name__)
 
 
+class PublishCycleCache:
+    """Credentials and media records prefetched for one publish cycle.
+
+    A key present with a None value was looked up and does not exist; a
+    missing key falls back to a single GetItem.
+    """
+
+    def __init__(
+        self,
+        credentials: Optional[Dict[str, Optional[dict]]] = None,
+        media: Optional[Dict[str, Optional[dict]]] = None,
+    ):
+        self.credentials = credentials or {}
+        self.media = media or {}
+
+
+# The cache of the cycle running in the current task. Set by process_posts and
+# prepare_posts before fanning out, so every per-user task of that cycle sees
+# it, and dropped when the cycle ends.
+_cycle_cache: ContextVar[Optional[PublishCycleCache]] = ContextVar(
+    "publish_cycle_cache", default=None
+)
+
+
+class _UserLane:
+    """State shared by one user's posts within a publish cycle."""
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self.posts: List[ScheduledPostRecord] = []
+        self.resolved = False
+        self.credentials: Optional[dict] = None
+        self.skip_reason: Optional[Tuple[str, str]] = None
+        # Set once LinkedIn answers 429: the user's later posts are deferred
+        self.rate_limited = False
+        self.deferred = 0
+
+    @property
+    def access_token(self) -> str:
+        return self.credentials['linkedinAccessToken']
+
+    @property
+    def person_urn(self) -> str:
+        return f"urn:li:person:{self.credentials['linkedinSub']}"
+
+
+class _PublishJob:
+    """One post's progress through the publish pipeline.
+
+    Stages fill in the fields below; once any outcome is set (not claimed,
+    deferred, failed or answered by LinkedIn) the remaining stages
+    pass the job through to the record stage untouched.
+    """
+
+    def __init__(self, post: ScheduledPostRecord, lane: _UserLane, sequence: int):
+        self.post = post
+        self.lane = lane
+        self.sequence = sequence
+        self.claimed = False
+        self.commentary: Optional[str] = None
+        self.media_record: Optional[dict] = None
+        self.s3_object: Optional[Tuple[object, int]] = None
+        self.image_urn: Optional[str] = None
+        self.response: Optional[LinkedInPostResponse] = None
+        self.failure: Optional[Tuple[str, str]] = None
+        self.defer_seconds: Optional[float] = None
+        self.error: Optional[Exception] = None
+
+    @property
+    def prepared(self) -> bool:
+        """The post's current image was already uploaded by the warm-up stage."""
+        post = self.post
+        return bool(post.image_urn) and post.image_urn_media_id == post.media_id
+
+    @property
+    def settled(self) -> bool:
+        return (
+            not self.claimed
+            or self.response is not None
+            or self.failure is not None
+            or self.defer_seconds is not None
+            or self.error is not None
+        )
+
+
+def _user_order(job: _PublishJob) -> Tuple[str, int]:
+    """Pipeline lane and position of a job: its user's posts in due order."""
+    return job.lane.user_id, job.sequence
+
+
 class PublisherService:
     """Orchestrates the publishing workflow for scheduled posts."""
 
@@ -36,6 +141,9 @@ class PublisherService:
         user_repository: UserRepository,
         media_repository: MediaRepository,
         s3_bucket: str = None,
+        s3_client=None,
+        worker_id: str = None,
+        rate_limiter: LinkedInRateLimiter = None,
     ):
         self.linkedin_client = linkedin_client
         self.publisher_repository = publisher_repository
@@ -43,72 +151,243 @@ class PublisherService:
         self.user_repository = user_repository
         self.media_repository = media_repository
         self.s3_bucket = s3_bucket or settings.s3_media_bucket
-        session = boto3.Session(region_name=settings.aws_region)
-        self.s3_client = session.client('s3')
+        self.s3_client = s3_client or aws_clients.s3()
+        # Lease owner recorded on claimed posts; unique per process
+        self.worker_id = (
+            worker_id
+            or settings.publisher_worker_id
+            or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        # resolve → fetch → upload → post → record, each with its own workers.
+        # Claims and LinkedIn calls stay in due order per user.
+        queue_size = settings.publisher_pipeline_queue_size
+        self.pipeline = Pipeline(
+            [
+                PipelineStage("resolve", self._resolve_stage,
+                              settings.publisher_resolve_concurrency, queue_size,
+                              ordered_by=_user_order),
+                PipelineStage("fetch", self._fetch_stage,
+                              settings.publisher_fetch_concurrency, queue_size),
+                PipelineStage("upload", self._upload_stage,
+                              settings.publisher_upload_concurrency, queue_size),
+                PipelineStage("post", self._post_stage,
+                              settings.publisher_post_concurrency, queue_size,
+                              ordered_by=_user_order),
+                PipelineStage("record", self._record_stage,
+                              settings.publisher_record_concurrency, queue_size),
+            ],
+            on_error=self._on_stage_error,
+        )
+        # Wall time of the most recent publish cycle, in seconds
+        self.last_cycle_seconds: Optional[float] = None
+        self.rate_limiter = rate_limiter or LinkedInRateLimiter.from_settings()
+        # Posts handed back because no rate-limit token was free: post_id → epoch
+        # at which a token will be available (collected by the publish scanner)
+        self._deferred: Dict[str, int] = {}
+        # Caps the combined size of image uploads streaming at once
+        self._upload_budget = ByteBudget(settings.publisher_upload_max_bytes_in_flight)
+        # Posts claimed by the pipeline whose outcome is not recorded yet
+        self.in_flight_post_ids: Set[str] = set()
+        # Set by start_drain: no more claims, in-flight posts still finish
+        self.draining = False
+        self.drained = 0
 
     async def get_due_posts(self) -> List[ScheduledPostRecord]:
         """
-        Query scheduled-posts table for posts where:
+        Return posts where:
         - status = "scheduled"
         - platform = "linkedin"
         - scheduledDate + scheduledTime <= now (UTC)
+        - no backed-off retry pending (nextAttemptAt <= now)
 
         The frontend converts the user's local time to UTC before sending,
         so scheduled_date and scheduled_time are stored in UTC. We compare
         against the current UTC time.
 
-        Uses a table scan with filter expression since we need to check
-        across all users.
+        Queries the sparse DueIndex, which only holds posts that are still
+        scheduled, so the cost does not grow with published history. Falls
+        back to a full-table scan when `publisher_due_index_enabled` is off
+        (e.g. before the index has been backfilled).
         """
         now = datetime.now(timezone.utc)
-        all_posts = await self._scan_scheduled_posts()
+        if not settings.publisher_due_index_enabled:
+            return await self._get_due_posts_by_scan(now)
+
+        due_posts = await self.scheduler_repository.list_due_posts(now)
+        logger.info(f"Found {len(due_posts)} due posts via {DUE_INDEX}")
+        return due_posts
+
+    async def _get_due_posts_by_scan(self, now: datetime) -> List[ScheduledPostRecord]:
+        """Scan the whole table for due posts (legacy path).
+
+        DynamoDB filters on the precomputed scheduledAt/nextAttemptAt epochs,
+        so only candidate posts are returned. Posts written before scheduledAt
+        existed are passed through and checked here instead.
+        """
+        now_epoch = int(now.timestamp())
+        posts = await self._scan_scheduled_posts(
+            FilterExpression=Attr('status').eq('scheduled') & Attr('platform').eq('linkedin') & (
+                Attr('scheduledAt').lte(now_epoch) | Attr('scheduledAt').not_exists()
+            ) & (
+                Attr('nextAttemptAt').not_exists() | Attr('nextAttemptAt').lte(now_epoch)
+            ),
+        )
 
         due_posts = []
-        for post in all_posts:
-            if post.status != "scheduled":
-                continue
-            if post.platform != "linkedin":
-                continue
-            try:
-                post_dt = datetime.strptime(
-                    f"{post.scheduled_date} {post.scheduled_time}",
-                    "%Y-%m-%d %H:%M",
-                ).replace(tzinfo=timezone.utc)
-                if post_dt <= now:
-                    due_posts.append(post)
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Invalid date/time for post {post.id}: {e}")
+        for post in posts:
+            due_at = post_due_at(post)
+            if due_at is None:
+                logger.warning(f"Invalid date/time for post {post.id}")
                 continue
+            if due_at <= now_epoch:
+                due_posts.append(post)
 
-        logger.info(f"Found {len(due_posts)} due posts out of {len(all_posts)} total")
+        logger.info(f"Found {len(due_posts)} due posts by scan")
         return due_posts
 
-    async def _scan_scheduled_posts(self) -> List[ScheduledPostRecord]:
-        """Scan the scheduled-posts table and return all records."""
+    async def _scan_scheduled_posts(self, **scan_kwargs) -> List[ScheduledPostRecord]:
+        """Scan the scheduled-posts table and return all matching records."""
         items = []
-        response = self.scheduler_repository.table.scan()
+        response = await run_blocking(self.scheduler_repository.table.scan, **scan_kwargs)
         items.extend(response.get('Items', []))
 
         while 'LastEvaluatedKey' in response:
-            response = self.scheduler_repository.table.scan(
-                ExclusiveStartKey=response['LastEvaluatedKey']
+            response = await run_blocking(
+                self.scheduler_repository.table.scan,
+                ExclusiveStartKey=response['LastEvaluatedKey'],
+                **scan_kwargs
             )
             items.extend(response.get('Items', []))
 
         return [self.scheduler_repository._item_to_record(item) for item in items]
 
+    async def claim_post(
+        self,
+        post: ScheduledPostRecord,
+        from_statuses: Tuple[str, ...] = ("scheduled",),
+    ) -> Optional[ScheduledPostRecord]:
+        """
+        Claim a post for this worker before publishing it.
+
+        The claim is a conditional write (scheduled → publishing) carrying a
+        lease, so only one worker across all replicas can publish a post.
+        Returns the claimed record, or None if another worker holds it.
+        """
+        return await self.scheduler_repository.claim_post(
+            post.id, self.worker_id, settings.publisher_lease_seconds, from_statuses
+        )
+
+    async def acquire_publish_token(self, user_id: str) -> float:
+        """
+        Take a LinkedIn rate-limit token for this member, waiting briefly if needed.
+
+        Waits of up to `linkedin_rate_limit_max_inline_wait_seconds` are slept
+        through. Returns 0.0 once a token is held, otherwise the number of
+        seconds until one will be free (no token is taken).
+        """
+        wait = self.rate_limiter.try_acquire(user_id)
+        while 0 < wait <= settings.linkedin_rate_limit_max_inline_wait_seconds:
+            await asyncio.sleep(wait)
+            wait = self.rate_limiter.try_acquire(user_id)
+        return wait
+
+    def _defer(
+        self, posts: List[ScheduledPostRecord], wait_seconds: float, offset: int = 0
+    ) -> None:
+        """
+        Record posts to retry once the rate limiter has a token for them.
+
+        The first post is due when the next token is; each later post one
+        member refill interval after the previous one. `offset` counts posts
+        of the same member already deferred ahead of these.
+        """
+        now = time.time()
+        refill = self.rate_limiter.member_refill_per_second
+        spacing = 1 / refill if refill > 0 else 0.0
+        wait_seconds = min(wait_seconds, 86400)
+        for i, post in enumerate(posts):
+            self._deferred[post.id] = int(now + wait_seconds + (offset + i) * spacing) + 1
+        logger.info(
+            f"Deferred {len(posts)} posts for {wait_seconds:.0f}s until a rate-limit token is free"
+        )
+
+    def pop_deferred(self) -> Dict[str, int]:
+        """Return and clear the posts deferred by rate limiting (post_id → retry epoch)."""
+        deferred, self._deferred = self._deferred, {}
+        return deferred
+
+    async def _release_claim(self, post: ScheduledPostRecord) -> None:
+        """Hand a claimed post back so a later cycle can retry it."""
+        if not await self.scheduler_repository.release_claim(post.id, self.worker_id):
+            logger.warning(f"Lease on post {post.id} was lost before it could be released")
+
+    async def _schedule_retry(self, post: ScheduledPostRecord, error_code: Optional[str]) -> None:
+        """
+        Count a failed attempt: back the post off until its next retry, or
+        mark it failed once `publisher_retry_max_attempts` is reached.
+        """
+        attempt = post.attempt_count + 1
+        if retries_exhausted(attempt):
+            handed_back = await self.scheduler_repository.fail_post(
+                post.id, self.worker_id, attempt
+            )
+            logger.warning(
+                f"Post {post.id} failed {attempt} times (last: {error_code}); giving up"
+            )
+        else:
+            delay = retry_delay(error_code, attempt)
+            handed_back = await self.scheduler_repository.schedule_retry(
+                post.id, self.worker_id, attempt, int(time.time() + delay)
+            )
+            logger.info(
+                f"Retrying post {post.id} in {delay:.0f}s (attempt {attempt}, {error_code})"
+            )
+        if not handed_back:
+            logger.warning(f"Lease on post {post.id} was lost before the retry could be recorded")
+
     async def publish_post(
-        self, post: ScheduledPostRecord, user_credentials: dict
+        self,
+        post: ScheduledPostRecord,
+        user_credentials: dict,
+        schedule_retry: bool = False,
     ) -> PublishLogRecord:
         """
         Publish a single post to LinkedIn.
 
+        The post must already be claimed by this worker (see claim_post).
+
         1. Format commentary (content + hashtags)
         2. If post has mediaId → download from S3, upload to LinkedIn, create image post
         3. Else → create text-only post
-        4. On success (201) → update post status to "published", create success log
-        5. On failure → create failure log, leave post status unchanged
+        4. On success (201) → move post publishing → published, create success log
+        5. On failure → create failure log, then either schedule a backed-off
+           retry (`schedule_retry`; the post becomes
+           "failed" once the retry budget is spent) or release the claim so
+           the post returns to its previous status
         """
+        try:
+            log_record = await self._publish_claimed_post(post, user_credentials)
+        except Exception:
+            await self._release_claim(post)
+            raise
+        await self._settle_failure(post, log_record, schedule_retry)
+        return log_record
+
+    async def _settle_failure(
+        self, post: ScheduledPostRecord, log_record: PublishLogRecord, schedule_retry: bool
+    ) -> None:
+        """Hand an unpublished post back: back it off for a retry, or release it."""
+        if log_record.status == "published":
+            return
+        if schedule_retry and log_record.error_code not in NOT_RETRIED:
+            await self._schedule_retry(post, log_record.error_code)
+        else:
+            await self._release_claim(post)
+
+    async def _publish_claimed_post(
+        self, post: ScheduledPostRecord, user_credentials: dict
+    ) -> PublishLogRecord:
+        """Call LinkedIn for a claimed post and record the outcome."""
         access_token = user_credentials['linkedinAccessToken']
         linkedin_sub = user_credentials['linkedinSub']
         person_urn = f"urn:li:person:{linkedin_sub}"
@@ -132,12 +411,19 @@ class PublisherService:
                 access_token, person_urn, commentary
             )
 
-        # Process the LinkedIn API response
+        self._note_rate_limit(post.user_id, response)
+        return await self._record_response(post, response)
+
+    def _note_rate_limit(self, user_id: str, response: LinkedInPostResponse) -> None:
+        """Feed LinkedIn's own rate-limit signals back into the token buckets."""
+        if response.error_code == "rate_limited" or response.retry_after_seconds is not None:
+            self.rate_limiter.record_rate_limited(user_id, response.retry_after_seconds)
+
+    async def _record_response(
+        self, post: ScheduledPostRecord, response: LinkedInPostResponse
+    ) -> PublishLogRecord:
+        """Record LinkedIn's answer for a claimed post: mark it published, or log the failure."""
         if response.status_code == 201:
-            # Success: update post status and create success log
-            await self.scheduler_repository.update_post(
-                post.id, {'status': 'published'}
-            )
             log_record = PublishLogRecord(
                 post_id=post.id,
                 user_id=post.user_id,
@@ -145,17 +431,70 @@ class PublisherService:
                 status="published",
                 linkedin_post_id=response.post_id,
             )
-            await self.publisher_repository.create_log(log_record)
+            # Success: publishing → published and the success log in one
+            # transaction (only while we still hold the lease)
+            completed = await self.scheduler_repository.complete_publish(
+                post.id, self.worker_id,
+                with_writes=[self.publisher_repository.log_put(log_record)],
+            )
+            if not completed:
+                logger.warning(
+                    f"Lease on post {post.id} expired while publishing; "
+                    "it may be published again by another worker"
+                )
+                # The post did go out: keep its log even though the status is not ours
+                await self.publisher_repository.create_log(log_record)
             logger.info(
                 f"Published post {post.id} to LinkedIn (post_id={response.post_id})"
             )
             return log_record
         else:
-            # Failure: create failure log, leave post status unchanged
+            # Failure: create failure log; the caller releases or retries the claim
             return await self._create_failure_log(
                 post, response.error_code, response.error_message
             )
 
+    async def prefetch(self, posts: List[ScheduledPostRecord]) -> PublishCycleCache:
+        """
+        Batch-read every credential and media record a set of posts needs.
+
+        Two BatchGetItem round trips (more only past 100 keys per table)
+        replace one GetItem per user and per image post. Images already
+        prepared for their current media need no media record. If a batch
+        read fails, the cycle falls back to per-item reads.
+        """
+        user_ids = {p.user_id for p in posts}
+        media_ids = {
+            p.media_id for p in posts
+            if p.media_id and not (p.image_urn and p.image_urn_media_id == p.media_id)
+        }
+        cache = PublishCycleCache()
+        try:
+            credentials, media = await asyncio.gather(
+                self.user_repository.batch_get_linkedin_credentials(user_ids),
+                self.media_repository.batch_get_media(media_ids),
+            )
+        except Exception as e:
+            logger.warning(f"Batch prefetch failed, falling back to per-item reads: {e}")
+            return cache
+        cache.credentials = {user_id: credentials.get(user_id) for user_id in user_ids}
+        cache.media = {media_id: media.get(media_id) for media_id in media_ids}
+        return cache
+
+    async def _get_credentials(self, user_id: str) -> Optional[dict]:
+        """LinkedIn credentials from the cycle cache, else a single read."""
+        cache = _cycle_cache.get()
+        if cache is not None and user_id in cache.credentials:
+            return cache.credentials[user_id]
+        return await self.user_repository.get_user_linkedin_credentials(user_id)
+
+    async def _get_media(self, media_id: str) -> Optional[dict]:
+        """Media record from the cycle cache, else a single read."""
+        cache = _cycle_cache.get()
+        if cache is not None and media_id in cache.media:
+            return cache.media[media_id]
+        return await self.media_repository.get_media_by_id(media_id)
+
     async def _handle_image_post(
         self,
         post: ScheduledPostRecord,
@@ -164,14 +503,29 @@ class PublisherService:
         commentary: str,
     ) -> Optional[LinkedInPostResponse]:
         """
-        Handle the image post flow: retrieve media record, download from S3,
-        upload to LinkedIn, create image post.
+        Handle the image post flow: retrieve media record, open the S3 object,
+        stream it to LinkedIn, create image post.
+
+        If the image was already uploaded by the warm-up stage (see
+        prepare_posts) for the post's current media, only the post itself is
+        created; should LinkedIn reject the prepared image, the full upload
+        runs instead.
 
         Returns LinkedInPostResponse on success/API error, or None on S3 download failure.
         Falls back to text-only if media record not found.
         """
+        if post.image_urn and post.image_urn_media_id == post.media_id:
+            response = await self.linkedin_client.create_image_post(
+                access_token, person_urn, commentary, post.image_urn
+            )
+            if response.error_code != "validation_error":
+                return response
+            logger.warning(
+                f"Prepared image {post.image_urn} rejected for post {post.id}; re-uploading"
+            )
+
         # Retrieve media record
-        media_record = await self.media_repository.get_media_by_id(post.media_id)
+        media_record = await self._get_media(post.media_id)
         if media_record is None:
             logger.warning(
                 f"Media record not found for mediaId={post.media_id} on post {post.id}. "
@@ -181,46 +535,180 @@ class PublisherService:
                 access_token, person_urn, commentary
             )
 
-        s3_key = media_record.get('s3Key')
-        content_type = media_record.get('contentType', 'image/jpeg')
+        uploaded = await self._upload_image(post, access_token, person_urn, media_record)
+        if uploaded is None or isinstance(uploaded, LinkedInPostResponse):
+            return uploaded
+
+        # Create image post
+        return await self.linkedin_client.create_image_post(
+            access_token, person_urn, commentary, uploaded
+        )
+
+    async def _upload_image(
+        self,
+        post: ScheduledPostRecord,
+        access_token: str,
+        person_urn: str,
+        media_record: dict,
+    ) -> Optional[Union[str, LinkedInPostResponse]]:
+        """
+        Stream a post's image from S3 to LinkedIn.
+
+        The image is never held in memory whole: it is streamed in chunks
+        through a bounded read-ahead buffer, and uploads wait for room under
+        `publisher_upload_max_bytes_in_flight` before starting.
+
+        Returns the LinkedIn image URN, an error LinkedInPostResponse if
+        LinkedIn refused the upload, or None on S3 download failure.
+        """
+        s3_object = await self._open_image(post, media_record)
+        if s3_object is None:
+            return None
+        return await self._stream_image(
+            post, access_token, person_urn, s3_object,
+            media_record.get('contentType', 'image/jpeg'),
+        )
 
-        # Download image from S3
-        image_data = await self._download_from_s3(s3_key)
-        if image_data is None:
+    async def _open_image(
+        self, post: ScheduledPostRecord, media_record: dict
+    ) -> Optional[Tuple[object, int]]:
+        """Open a post's image in S3 (headers only). Returns (body, content length) or None."""
+        s3_key = media_record.get('s3Key')
+        s3_object = await self._open_s3_object(s3_key)
+        if s3_object is None:
             logger.error(
                 f"S3 download failed for s3Key={s3_key} on post {post.id}. Skipping post."
             )
-            return None
+        return s3_object
+
+    async def _stream_image(
+        self,
+        post: ScheduledPostRecord,
+        access_token: str,
+        person_urn: str,
+        s3_object: Tuple[object, int],
+        content_type: str,
+    ) -> Union[str, LinkedInPostResponse]:
+        """
+        Initialize a LinkedIn image upload and stream an opened S3 object to it.
+
+        Always closes the body. Returns the image URN, or an error
+        LinkedInPostResponse if LinkedIn refused the upload.
+        """
+        body, content_length = s3_object
 
-        # Upload image to LinkedIn
         try:
-            upload_response = await self.linkedin_client.initialize_image_upload(
-                access_token, person_urn
-            )
-        except Exception as e:
-            logger.error(f"Image upload init failed for post {post.id}: {e}")
-            return LinkedInPostResponse(
-                status_code=0,
-                error_code="image_upload_init_error",
-                error_message=str(e)[:500],
-            )
+            try:
+                upload_response = await self.linkedin_client.initialize_image_upload(
+                    access_token, person_urn
+                )
+            except LinkedInRateLimitError as e:
+                logger.warning(f"Image upload init rate limited for post {post.id}: {e}")
+                return LinkedInPostResponse(
+                    status_code=429,
+                    error_code="rate_limited",
+                    error_message=str(e)[:500],
+                    retry_after_seconds=e.retry_after_seconds,
+                )
+            except Exception as e:
+                logger.error(f"Image upload init failed for post {post.id}: {e}")
+                return LinkedInPostResponse(
+                    status_code=0,
+                    error_code="image_upload_init_error",
+                    error_message=str(e)[:500],
+                )
+
+            try:
+                async with self._upload_budget.reserve(content_length):
+                    await self.linkedin_client.upload_image_binary(
+                        upload_response.upload_url,
+                        stream_body(
+                            body,
+                            settings.publisher_upload_chunk_bytes,
+                            settings.publisher_upload_buffer_chunks,
+                        ),
+                        content_type,
+                        content_length=content_length,
+                    )
+            except Exception as e:
+                logger.error(f"Image binary upload failed for post {post.id}: {e}")
+                return LinkedInPostResponse(
+                    status_code=0,
+                    error_code="image_upload_error",
+                    error_message=str(e)[:500],
+                )
+        finally:
+            # No-op once streaming has consumed and closed it
+            body.close()
+
+        return upload_response.image_urn
+
+    async def prepare_posts(self, posts: List[ScheduledPostRecord]) -> int:
+        """
+        Warm-up stage: upload images for posts that will soon be due.
+
+        For each scheduled image post whose current media has not been
+        prepared yet, the image is streamed to LinkedIn and the resulting
+        image URN is stored on the post, leaving only create_image_post for
+        the due time. Failures are logged and left to the normal publish
+        path. Returns the number of posts prepared.
+        """
+        pending = [
+            p for p in posts
+            if p.media_id and p.status == "scheduled" and p.image_urn_media_id != p.media_id
+        ]
+        if not pending:
+            return 0
+        posts_by_user: dict[str, list[ScheduledPostRecord]] = defaultdict(list)
+        for post in pending:
+            posts_by_user[post.user_id].append(post)
 
+        token = _cycle_cache.set(await self.prefetch(pending))
         try:
-            await self.linkedin_client.upload_image_binary(
-                upload_response.upload_url, image_data, content_type
-            )
-        except Exception as e:
-            logger.error(f"Image binary upload failed for post {post.id}: {e}")
-            return LinkedInPostResponse(
-                status_code=0,
-                error_code="image_upload_error",
-                error_message=str(e)[:500],
-            )
+            prepared = await self._prepare_user_posts(posts_by_user)
+        finally:
+            _cycle_cache.reset(token)
+        logger.info(f"Prepared images for {prepared} of {len(pending)} upcoming posts")
+        return prepared
 
-        # Create image post
-        return await self.linkedin_client.create_image_post(
-            access_token, person_urn, commentary, upload_response.image_urn
-        )
+    async def _prepare_user_posts(
+        self, posts_by_user: Dict[str, List[ScheduledPostRecord]]
+    ) -> int:
+        """Prepare each user's pending image posts. Returns the number prepared."""
+        prepared = 0
+        for user_id, user_posts in posts_by_user.items():
+            credentials = await self._get_credentials(user_id)
+            if not credentials or not credentials.get('linkedinAccessToken') or not credentials.get('linkedinSub'):
+                continue
+            person_urn = f"urn:li:person:{credentials['linkedinSub']}"
+            for post in user_posts:
+                try:
+                    if await self._prepare_image(post, credentials['linkedinAccessToken'], person_urn):
+                        prepared += 1
+                except Exception as e:
+                    logger.error(f"Preparing image for post {post.id} failed: {e}", exc_info=True)
+        return prepared
+
+    async def _prepare_image(
+        self, post: ScheduledPostRecord, access_token: str, person_urn: str
+    ) -> bool:
+        """Upload one post's image ahead of time and store its URN on the post."""
+        media_record = await self._get_media(post.media_id)
+        if media_record is None:
+            return False
+
+        uploaded = await self._upload_image(post, access_token, person_urn, media_record)
+        if uploaded is None:
+            return False
+        if isinstance(uploaded, LinkedInPostResponse):
+            if uploaded.error_code == "rate_limited":
+                self.rate_limiter.record_rate_limited(post.user_id, uploaded.retry_after_seconds)
+            return False
+
+        stored = await self.scheduler_repository.set_image_urn(post.id, post.media_id, uploaded)
+        if not stored:
+            logger.info(f"Post {post.id} changed while its image was uploading; not storing it")
+        return stored
 
     async def run_scan_cycle(self, processing_post_ids: Set[str]) -> None:
         """
@@ -228,15 +716,69 @@ class PublisherService:
 
         1. Query due posts
         2. Filter out posts already being processed (concurrency guard)
-        3. Group by userId
-        4. For each user:
+        3. Run the posts through the publish pipeline (see process_posts):
            a. Fetch LinkedIn credentials
-           b. If no credentials → skip all user's posts with "skipped" log
-           c. Process each post sequentially
-           d. On 429 → skip remaining posts for this user
-        5. Remove processed post IDs from the processing set
+           b. If no credentials → skip all user's posts, batch-writing "skipped" logs
+           c. Claim each post and spend a rate-limit token on it
+           d. Stream images to LinkedIn, then create the posts, each user's in order
+           e. Out of tokens or on 429 → defer the user's remaining posts
+              until a token is free
+        4. Remove processed post IDs from the processing set
         """
         due_posts = await self.get_due_posts()
+        await self.process_posts(due_posts, processing_post_ids)
+
+    async def run_posts_cycle(
+        self, post_ids: Iterable[str], processing_post_ids: Set[str]
+    ) -> None:
+        """
+        Publish specific posts whose due time has been reached.
+
+        Used by the publish scanner when its timer fires, including timers
+        armed for the expiry of another worker's claim. Each post is re-read
+        from the table by primary key, so edits, deletes and publications made
+        since the timer was armed are respected, and the index's eventual
+        consistency cannot hide a post that just became due.
+        """
+        now = int(datetime.now(timezone.utc).timestamp())
+        posts = await asyncio.gather(
+            *(self.scheduler_repository.get_post_by_id(post_id) for post_id in post_ids)
+        )
+        due_posts = []
+        for post in posts:
+            if post is None or post.status not in AWAITING_PUBLICATION or post.platform != "linkedin":
+                continue
+            # A "publishing" post is only ready once its claim's lease has expired
+            due_at = post_ready_at(post)
+            if due_at is not None and due_at <= now:
+                due_posts.append(post)
+        await self.process_posts(due_posts, processing_post_ids)
+
+    async def process_posts(
+        self, due_posts: List[ScheduledPostRecord], processing_post_ids: Set[str]
+    ) -> None:
+        """
+        Publish already-selected due posts through the publish pipeline.
+
+        Each post moves through five stages, each with its own workers and a
+        bounded queue in front of it, so one post's LinkedIn call overlaps
+        the next post's claim, S3 read and image upload:
+
+        - resolve: claim the post and take a rate-limit token; a user's
+          posts are claimed one at a time, in due order
+        - fetch: read the media record and open the image in S3
+        - upload: stream the image to LinkedIn
+        - post: create the LinkedIn post; a user's posts run one at a time,
+          in due order, so a 429 still defers that user's remaining posts
+        - record: write the post status and publish log, or hand the post
+          back for a retry
+
+        Credentials are read for every user before the pipeline starts. The
+        posts of users who cannot publish (no account, not connected) skip
+        the pipeline: they are claimed, logged as skipped in one batch write
+        and handed back. A failure for one post or user never affects the
+        others.
+        """
         if not due_posts:
             return
 
@@ -252,87 +794,273 @@ class PublisherService:
         cycle_post_ids = {p.id for p in posts_to_process}
         processing_post_ids.update(cycle_post_ids)
 
-        # Group posts by userId for sequential per-user processing
-        posts_by_user: dict[str, list[ScheduledPostRecord]] = defaultdict(list)
+        # One lane per user, holding the user's posts in due order
+        lanes: Dict[str, _UserLane] = {}
         for post in posts_to_process:
-            posts_by_user[post.user_id].append(post)
+            lanes.setdefault(post.user_id, _UserLane(post.user_id)).posts.append(post)
 
+        started = time.perf_counter()
+        token = None
         try:
-            for user_id, user_posts in posts_by_user.items():
-                await self._process_user_posts(user_id, user_posts)
+            # Prefetch the cycle's credentials and media in a few batch reads
+            token = _cycle_cache.set(await self.prefetch(posts_to_process))
+            await self._resolve_lanes(lanes.values())
+            # A job's sequence orders it within its lane
+            jobs = [
+                _PublishJob(post, lane, sequence)
+                for lane in lanes.values() if lane.resolved and not lane.skip_reason
+                for sequence, post in enumerate(lane.posts)
+            ]
+            await asyncio.gather(
+                self.pipeline.run(jobs),
+                *(self._skip_user_posts(lane) for lane in lanes.values() if lane.skip_reason),
+            )
         finally:
+            if token is not None:
+                _cycle_cache.reset(token)
             # Always clean up processing set
             processing_post_ids -= cycle_post_ids
+            self.last_cycle_seconds = time.perf_counter() - started
+            logger.info(
+                f"Publish cycle processed {len(posts_to_process)} posts for "
+                f"{len(lanes)} users in {self.last_cycle_seconds:.2f}s"
+            )
 
-    async def _process_user_posts(
-        self, user_id: str, posts: List[ScheduledPostRecord]
-    ) -> None:
-        """Process all due posts for a single user sequentially."""
-        # Fetch LinkedIn credentials
-        credentials = await self.user_repository.get_user_linkedin_credentials(user_id)
+    def start_drain(self) -> None:
+        """
+        Stop claiming posts ahead of shutdown.
 
-        if credentials is None:
-            logger.warning(f"User {user_id} not found. Skipping all posts.")
-            for post in posts:
-                await self._create_skipped_log(
-                    post, "linkedin_not_connected", "User not found"
-                )
-            return
+        Posts already claimed keep going through the pipeline until their
+        status and log are written; `drained` counts those that finish.
+        """
+        self.draining = True
+        logger.info(f"Draining {len(self.in_flight_post_ids)} in-flight posts")
 
-        access_token = credentials.get('linkedinAccessToken')
-        linkedin_sub = credentials.get('linkedinSub')
+    def pipeline_stats(self) -> dict:
+        """Per-stage queue depth and latency of the publish pipeline."""
+        return self.pipeline.snapshot()
 
-        if not access_token:
+    @staticmethod
+    def _skip_reason(user_id: str, credentials: Optional[dict]) -> Optional[Tuple[str, str]]:
+        """Why a user's posts cannot be published, or None if they can."""
+        if credentials is None:
+            logger.warning(f"User {user_id} not found. Skipping all posts.")
+            return ("linkedin_not_connected", "User not found")
+        if not credentials.get('linkedinAccessToken'):
             logger.warning(f"User {user_id} has no LinkedIn access token. Skipping.")
-            for post in posts:
-                await self._create_skipped_log(
-                    post, "linkedin_not_connected",
-                    "LinkedIn account not connected"
-                )
-            return
-
-        if not linkedin_sub:
+            return ("linkedin_not_connected", "LinkedIn account not connected")
+        if not credentials.get('linkedinSub'):
             logger.warning(f"User {user_id} has no linkedinSub. Skipping.")
-            for post in posts:
-                await self._create_skipped_log(
-                    post, "linkedin_sub_missing",
-                    "LinkedIn person URN (linkedinSub) is missing"
-                )
-            return
+            return ("linkedin_sub_missing", "LinkedIn person URN (linkedinSub) is missing")
+        return None
 
-        # Process each post sequentially
-        for post in posts:
-            try:
-                log_record = await self.publish_post(post, credentials)
-                # On 429 rate limit, skip remaining posts for this user
-                if (
-                    log_record.status == "failed"
-                    and log_record.error_code == "rate_limited"
-                ):
-                    logger.warning(
-                        f"Rate limited for user {user_id}. "
-                        f"Skipping remaining {len(posts) - posts.index(post) - 1} posts."
-                    )
-                    break
-            except Exception as e:
+    async def _resolve_lanes(self, lanes: Iterable[_UserLane]) -> None:
+        """Read each user's credentials and decide whether their posts are skipped.
+
+        A user whose credentials cannot be read is left unresolved and their
+        posts untouched for a later cycle.
+        """
+        lanes = list(lanes)
+        results = await asyncio.gather(
+            *(self._get_credentials(lane.user_id) for lane in lanes), return_exceptions=True
+        )
+        for lane, credentials in zip(lanes, results):
+            if isinstance(credentials, Exception):
                 logger.error(
-                    f"Unexpected error publishing post {post.id}: {e}",
-                    exc_info=True,
+                    f"Publishing failed for user {lane.user_id}: {credentials}",
+                    exc_info=credentials,
                 )
-                await self._create_failure_log(
-                    post, "internal_error", str(e)[:500]
+                continue
+            lane.credentials = credentials
+            lane.skip_reason = self._skip_reason(lane.user_id, credentials)
+            lane.resolved = True
+
+    async def _skip_user_posts(self, lane: _UserLane) -> None:
+        """Claim all of a user's posts, log them as skipped in one batch and hand them back."""
+        try:
+            claims = await asyncio.gather(*(self.claim_post(post) for post in lane.posts))
+            claimed = []
+            for post, claim in zip(lane.posts, claims):
+                if claim is None:
+                    logger.info(f"Post {post.id} is claimed by another worker. Skipping.")
+                else:
+                    claimed.append(claim)
+            try:
+                await self._create_skipped_logs(claimed, *lane.skip_reason)
+            finally:
+                await asyncio.gather(*(self._release_claim(post) for post in claimed))
+        except Exception as e:
+            logger.error(f"Skipping posts for user {lane.user_id} failed: {e}", exc_info=True)
+
+    def _on_stage_error(self, job: _PublishJob, error: Exception) -> None:
+        """Pipeline error hook: the record stage logs it and releases the claim."""
+        job.error = error
+
+    async def _resolve_stage(self, job: _PublishJob) -> _PublishJob:
+        """Claim the post and take a rate-limit token. Runs in order, one post at a time, per user."""
+        lane = job.lane
+        if self.draining:
+            # Left scheduled for the next worker
+            return job
+        # Don't claim anything while this member's bucket is known to be empty
+        wait = self.rate_limiter.wait_time(lane.user_id)
+        if lane.rate_limited or wait > settings.linkedin_rate_limit_max_inline_wait_seconds:
+            job.defer_seconds = wait
+            return job
+
+        # Claim the post so that no other worker publishes (or logs) it
+        claimed = await self.claim_post(job.post)
+        if claimed is None:
+            logger.info(f"Post {job.post.id} is claimed by another worker. Skipping.")
+            return job
+        if self.draining:
+            # Draining began while the claim was in flight: hand it straight back
+            await self._release_claim(claimed)
+            return job
+        job.post, job.claimed = claimed, True
+        self.in_flight_post_ids.add(claimed.id)
+
+        wait = await self.acquire_publish_token(lane.user_id)
+        if wait > 0:
+            job.defer_seconds = wait
+            return job
+        job.commentary = self.linkedin_client.format_commentary(
+            claimed.content, claimed.hashtags
+        )
+        return job
+
+    async def _fetch_stage(self, job: _PublishJob) -> _PublishJob:
+        """Read the media record of an image post and open its S3 object."""
+        post = job.post
+        if job.settled or not post.media_id or job.prepared:
+            return job
+        job.media_record = await self._get_media(post.media_id)
+        if job.media_record is None:
+            logger.warning(
+                f"Media record not found for mediaId={post.media_id} on post {post.id}. "
+                "Publishing as text-only."
+            )
+            return job
+        job.s3_object = await self._open_image(post, job.media_record)
+        if job.s3_object is None:
+            job.failure = ("s3_download_error", "Failed to download image from S3")
+        return job
+
+    async def _upload_stage(self, job: _PublishJob) -> _PublishJob:
+        """Stream an opened image to LinkedIn."""
+        if job.settled or job.s3_object is None:
+            return job
+        s3_object, job.s3_object = job.s3_object, None
+        uploaded = await self._stream_image(
+            job.post, job.lane.access_token, job.lane.person_urn, s3_object,
+            job.media_record.get('contentType', 'image/jpeg'),
+        )
+        if isinstance(uploaded, LinkedInPostResponse):
+            job.response = uploaded
+        else:
+            job.image_urn = uploaded
+        return job
+
+    async def _post_stage(self, job: _PublishJob) -> _PublishJob:
+        """Create the LinkedIn post. Runs in order, one post at a time, per user."""
+        lane = job.lane
+        if job.settled:
+            if job.response is not None:
+                self._note_rate_limit(lane.user_id, job.response)
+                lane.rate_limited |= job.response.error_code == "rate_limited"
+            return job
+        if lane.rate_limited:
+            job.defer_seconds = self.rate_limiter.wait_time(lane.user_id)
+            return job
+
+        post = job.post
+        if job.image_urn:
+            response = await self.linkedin_client.create_image_post(
+                lane.access_token, lane.person_urn, job.commentary, job.image_urn
+            )
+        elif job.prepared:
+            # Falls back to a full upload if LinkedIn rejects the prepared image
+            response = await self._handle_image_post(
+                post, lane.access_token, lane.person_urn, job.commentary
+            )
+        else:
+            response = await self.linkedin_client.create_text_post(
+                lane.access_token, lane.person_urn, job.commentary
+            )
+        job.response = response
+        self._note_rate_limit(lane.user_id, response)
+        if response is not None and response.error_code == "rate_limited":
+            # Retry this post and the user's remaining posts once it clears
+            logger.warning(
+                f"Rate limited for user {lane.user_id}. "
+                f"Deferring remaining {len(lane.posts) - job.sequence} posts."
+            )
+            lane.rate_limited = True
+        return job
+
+    async def _record_stage(self, job: _PublishJob) -> _PublishJob:
+        """Write the post's outcome: status, publish log, retry or deferral."""
+        if job.s3_object is not None:
+            # Opened but never streamed (an earlier stage raised)
+            job.s3_object[0].close()
+            job.s3_object = None
+        if not job.claimed:
+            if job.defer_seconds is not None:
+                self._defer_job(job)
+            return job
+
+        post = job.post
+        try:
+            if job.error is not None:
+                logger.error(f"Unexpected error publishing post {post.id}: {job.error}")
+                await self._release_claim(post)
+                await self._create_failure_log(post, "internal_error", str(job.error)[:500])
+            elif job.defer_seconds is not None:
+                await self._release_claim(post)
+                self._defer_job(job)
+            elif job.failure is not None:
+                log_record = await self._create_failure_log(post, *job.failure)
+                await self._settle_failure(post, log_record, schedule_retry=True)
+            elif job.response is None:
+                # _handle_image_post returns None only on S3 download failure
+                log_record = await self._create_failure_log(
+                    post, "s3_download_error", "Failed to download image from S3"
                 )
+                await self._settle_failure(post, log_record, schedule_retry=True)
+            else:
+                log_record = await self._record_response(post, job.response)
+                await self._settle_failure(post, log_record, schedule_retry=True)
+                if log_record.error_code == "rate_limited":
+                    job.defer_seconds = self.rate_limiter.wait_time(post.user_id)
+                    self._defer_job(job)
+        except Exception:
+            await self._release_claim(post)
+            self._settle_in_flight(post.id)
+            raise
+        self._settle_in_flight(post.id)
+        return job
+
+    def _settle_in_flight(self, post_id: str) -> None:
+        """A claimed post's outcome is recorded (a cancelled record stage never gets here)."""
+        self.in_flight_post_ids.discard(post_id)
+        if self.draining:
+            self.drained += 1
 
-    async def _download_from_s3(self, s3_key: str) -> Optional[bytes]:
-        """Download file from S3. Returns bytes or None on failure."""
+    def _defer_job(self, job: _PublishJob) -> None:
+        """Defer a job's post behind the user's posts already deferred this cycle."""
+        self._defer([job.post], job.defer_seconds, offset=job.lane.deferred)
+        job.lane.deferred += 1
+
+    async def _open_s3_object(self, s3_key: str) -> Optional[Tuple[object, int]]:
+        """Open an S3 object for streaming. Returns (body, content length) or None on failure."""
         try:
-            response = self.s3_client.get_object(
-                Bucket=self.s3_bucket, Key=s3_key
+            response = await run_blocking_s3(
+                self.s3_client.get_object, Bucket=self.s3_bucket, Key=s3_key
             )
-            return response['Body'].read()
         except Exception as e:
             logger.error(f"S3 download failed for key={s3_key}: {e}")
             return None
+        return response['Body'], response['ContentLength']
 
     async def _create_failure_log(
         self, post: ScheduledPostRecord, error_code: str, error_message: str
@@ -352,20 +1080,24 @@ class PublisherService:
         )
         return log_record
 
-    async def _create_skipped_log(
-        self, post: ScheduledPostRecord, error_code: str, error_message: str
-    ) -> PublishLogRecord:
-        """Create and store a skipped log record."""
-        log_record = PublishLogRecord(
-            post_id=post.id,
-            user_id=post.user_id,
-            platform="linkedin",
-            status="skipped",
-            error_code=error_code,
-            error_message=error_message,
-        )
-        await self.publisher_repository.create_log(log_record)
-        logger.info(
-            f"Skipped post {post.id}: {error_code} - {error_message}"
-        )
-        return log_record
+    async def _create_skipped_logs(
+        self, posts: List[ScheduledPostRecord], error_code: str, error_message: str
+    ) -> List[PublishLogRecord]:
+        """Create and store skipped log records for several posts in one batch write."""
+        log_records = [
+            PublishLogRecord(
+                post_id=post.id,
+                user_id=post.user_id,
+                platform="linkedin",
+                status="skipped",
+                error_code=error_code,
+                error_message=error_message,
+            )
+            for post in posts
+        ]
+        await self.publisher_repository.create_logs(log_records)
+        for post in posts:
+            logger.info(
+                f"Skipped post {post.id}: {error_code} - {error_message}"
+            )
+        return log_records
@@ -0,0 +1,232 @@
+"""
+Token-bucket rate limiting for LinkedIn API calls.
+
+LinkedIn enforces quotas per member and per application. `LinkedInRateLimiter`
+mirrors both with token buckets (one app-wide bucket plus one bucket per
+member) so the publisher spends a token before each publish and learns, without
+calling LinkedIn, exactly how long to wait when a quota is exhausted. Feedback
+from LinkedIn (`Retry-After`, `X-RateLimit-*` headers on 429s) blocks the
+affected bucket until the time LinkedIn asked for.
+
+A member bucket that has refilled to capacity and is not blocked behaves
+exactly like a new one, so such buckets are evicted periodically; the limiter
+only holds members that published or were rate limited recently.
+"""
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Used when LinkedIn answers 429 without telling us how long to back off
+DEFAULT_RETRY_AFTER_SECONDS = 60.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (now if now is not None else time.time()))
+
+
+def retry_after_from_headers(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Extract how long to back off from a LinkedIn response's headers.
+
+    Prefers Retry-After; otherwise, if the X-RateLimit-Remaining header says
+    the quota is used up, waits until X-RateLimit-Reset (epoch seconds, or
+    seconds from now for small values).
+    """
+    retry_after = parse_retry_after(headers.get("retry-after"))
+    if retry_after is not None:
+        return retry_after
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if int(remaining) > 0:
+            return None
+        reset_value = float(reset)
+    except ValueError:
+        return None
+    # Large values are absolute epoch timestamps, small ones are deltas
+    if reset_value > 1_000_000_000:
+        return max(0.0, reset_value - time.time())
+    return max(0.0, reset_value)
+
+
+class TokenBucket:
+    """A token bucket that refills continuously and can be blocked until a deadline."""
+
+    def __init__(self, capacity: float, refill_per_second: float, clock=time.monotonic):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` can be taken (0 if available now)."""
+        now = self._clock()
+        self._refill(now)
+        blocked = max(0.0, self._blocked_until - now)
+        if self._tokens >= tokens:
+            return blocked
+        if self.refill_per_second <= 0:
+            return float("inf")
+        return max(blocked, (tokens - self._tokens) / self.refill_per_second)
+
+    def take(self, tokens: float = 1.0) -> None:
+        """Consume tokens; callers check wait_time() first."""
+        self._refill(self._clock())
+        self._tokens -= tokens
+
+    def block_for(self, seconds: float) -> None:
+        """Refuse tokens for `seconds` and drain the bucket (server-side quota hit)."""
+        now = self._clock()
+        self._refill(now)
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def is_idle(self) -> bool:
+        """True when the bucket is full and not blocked, i.e. same as a new bucket."""
+        now = self._clock()
+        self._refill(now)
+        return self._tokens >= self.capacity and self._blocked_until <= now
+
+    def snapshot(self) -> dict:
+        """Current level of the bucket."""
+        now = self._clock()
+        self._refill(now)
+        return {
+            "tokens": round(self._tokens, 3),
+            "capacity": self.capacity,
+            "refill_per_second": self.refill_per_second,
+            "blocked_for_seconds": round(max(0.0, self._blocked_until - now), 3),
+        }
+
+
+class LinkedInRateLimiter:
+    """App-wide plus per-member token buckets for LinkedIn publishing."""
+
+    def __init__(
+        self,
+        member_capacity: float,
+        member_refill_per_second: float,
+        app_capacity: float,
+        app_refill_per_second: float,
+        clock=time.monotonic,
+    ):
+        self.member_capacity = member_capacity
+        self.member_refill_per_second = member_refill_per_second
+        self._clock = clock
+        self._app = TokenBucket(app_capacity, app_refill_per_second, clock)
+        self._members: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        # An empty member bucket is full again after this long
+        self._evict_interval = (
+            member_capacity / member_refill_per_second
+            if member_refill_per_second > 0 else float("inf")
+        )
+        self._evicted_at = clock()
+
+    @classmethod
+    def from_settings(cls) -> "LinkedInRateLimiter":
+        """Build a limiter from the `linkedin_*` quota settings."""
+        return cls(
+            member_capacity=settings.linkedin_member_burst,
+            member_refill_per_second=settings.linkedin_member_posts_per_day / 86400,
+            app_capacity=settings.linkedin_app_burst,
+            app_refill_per_second=settings.linkedin_app_posts_per_day / 86400,
+        )
+
+    def _evict_idle(self) -> None:
+        """Drop idle member buckets, at most once per member refill time."""
+        now = self._clock()
+        if now - self._evicted_at < self._evict_interval:
+            return
+        self._evicted_at = now
+        for member_id in [mid for mid, bucket in self._members.items() if bucket.is_idle()]:
+            del self._members[member_id]
+
+    def _member(self, member_id: str) -> TokenBucket:
+        if member_id not in self._members:
+            self._evict_idle()
+            self._members[member_id] = TokenBucket(
+                self.member_capacity, self.member_refill_per_second, self._clock
+            )
+        return self._members[member_id]
+
+    def wait_time(self, member_id: str) -> float:
+        """Seconds until a publish for this member could proceed, without consuming."""
+        with self._lock:
+            return max(self._member(member_id).wait_time(), self._app.wait_time())
+
+    def try_acquire(self, member_id: str) -> float:
+        """
+        Take one token from both the member and the app bucket.
+
+        Returns 0.0 when the call may proceed, otherwise the number of seconds
+        until both buckets can supply a token (nothing is consumed then).
+        """
+        with self._lock:
+            member = self._member(member_id)
+            wait = max(member.wait_time(), self._app.wait_time())
+            if wait > 0:
+                return wait
+            member.take()
+            self._app.take()
+            return 0.0
+
+    def record_rate_limited(self, member_id: str, retry_after_seconds: Optional[float]) -> float:
+        """
+        Apply a 429 from LinkedIn: block the member's bucket until Retry-After.
+
+        Returns the number of seconds the member is now blocked for.
+        """
+        seconds = (
+            retry_after_seconds if retry_after_seconds is not None else DEFAULT_RETRY_AFTER_SECONDS
+        )
+        with self._lock:
+            self._member(member_id).block_for(seconds)
+        logger.warning(f"LinkedIn rate limit hit for member {member_id}; backing off {seconds:.0f}s")
+        return seconds
+
+    def snapshot(self, member_id: Optional[str] = None) -> dict:
+        """
+        Bucket levels: the app bucket plus one member (or all tracked members).
+
+        Members that are not tracked have a full bucket. Looking one up does
+        not start tracking it.
+        """
+        with self._lock:
+            if member_id is not None:
+                bucket = self._members.get(member_id) or TokenBucket(
+                    self.member_capacity, self.member_refill_per_second, self._clock
+                )
+                members = {member_id: bucket.snapshot()}
+            else:
+                self._evict_idle()
+                members = {mid: bucket.snapshot() for mid, bucket in self._members.items()}
+            return {"app": self._app.snapshot(), "members": members}
@@ -7,10 +7,9 @@ The agent analyzes strategy data (posting schedule, platform recommendations,
 content themes) and copy content to distribute posts across optimal dates and times.
 """
 
-import boto3
 from datetime import datetime, UTC
 from strands import Agent
-from strands.models.bedrock import BedrockModel
+from services.bedrock_model import get_bedrock_model
 from models.scheduler import AutoScheduleOutput
 from typing import Optional, List
 
@@ -38,7 +37,7 @@ class SchedulerAgent:
         aws_secret_access_key: Optional[str] = None,
     ):
         """
-        Initialize the Scheduler Agent with Bedrock provider.
+        Initialize the Scheduler Agent on the shared Bedrock model.
 
         Args:
             aws_region: AWS region for Bedrock API calls
@@ -46,26 +45,14 @@ class SchedulerAgent:
             aws_access_key_id: AWS access key ID (if None, uses default credential chain)
             aws_secret_access_key: AWS secret access key (if None, uses default credential chain)
         """
-        if aws_access_key_id and aws_secret_access_key:
-            boto_session = boto3.Session(
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                region_name=aws_region,
-            )
-            self.model = BedrockModel(
-                boto_session=boto_session,
-                model_id=model_id,
-            )
-        else:
-            self.model = BedrockModel(
-                region_name=aws_region,
-                model_id=model_id,
-            )
-
-        self.agent = Agent(
-            model=self.model,
-            system_prompt=self._get_system_prompt(),
+        self.model = get_bedrock_model(
+            aws_region, model_id, aws_access_key_id, aws_secret_access_key
         )
+        self.system_prompt = self._get_system_prompt()
+
+    def _new_agent(self) -> Agent:
+        """Return a new agent for a single call (see services.bedrock_model)."""
+        return Agent(model=self.model, system_prompt=self.system_prompt)
 
     def _get_system_prompt(self) -> str:
         """Return the system prompt instructing the agent to act as a scheduling optimizer."""
@@ -169,7 +156,7 @@ Each must reference the exact copy_id from the list above.
 Ensure no two assignments share the same (platform, scheduled_date, scheduled_time).
 All dates must be in the future (after {datetime.now(UTC).strftime('%Y-%m-%d')})."""
 
-        result = await self.agent.invoke_async(
+        result = await self._new_agent().invoke_async(
             prompt, structured_output_model=AutoScheduleOutput
         )
 
@@ -9,7 +9,7 @@ and Strategy Repository while enforcing user isolation and data integrity.
 
 import logging
 from datetime import datetime, date, timedelta, UTC
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException, status
 
@@ -19,9 +19,14 @@ from models.scheduler import (
     ScheduledPostRecord,
     ScheduledPostUpdate,
 )
-from repositories.scheduler_repository import SchedulerRepository
+from repositories.scheduler_repository import (
+    PostBeingPublishedError,
+    SchedulerRepository,
+    compute_due_at,
+)
 from repositories.copy_repository import CopyRepository
 from repositories.strategy_repository import StrategyRepository
+from services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +52,13 @@ class SchedulerService:
         scheduler_repository: SchedulerRepository,
         copy_repository: CopyRepository,
         strategy_repository: StrategyRepository,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.agent = agent
         self.scheduler_repository = scheduler_repository
         self.copy_repository = copy_repository
         self.strategy_repository = strategy_repository
+        self.single_flight = single_flight or SingleFlight()
 
     def _get_strategy_color(self, strategy_id: str) -> str:
         """Derive a consistent color from strategyId hash."""
@@ -60,19 +67,51 @@ class SchedulerService:
     @staticmethod
     def _validate_future_date(scheduled_date: str, scheduled_time: str = "23:59") -> None:
         """Raise 400 if the given date/time is in the past (UTC)."""
-        try:
-            dt = datetime.strptime(f"{scheduled_date} {scheduled_time}", "%Y-%m-%d %H:%M")
-        except ValueError:
+        scheduled_at = compute_due_at(scheduled_date, scheduled_time)
+        if scheduled_at is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid date or time format: {scheduled_date} {scheduled_time}",
             )
-        if dt <= datetime.utcnow():
+        if scheduled_at <= int(datetime.now(UTC).timestamp()):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot schedule a post in the past. The date {scheduled_date} at {scheduled_time} has already passed. Please choose a future date and time.",
             )
 
+    @staticmethod
+    def _validate_date_range(date_from: Optional[str], date_to: Optional[str]) -> None:
+        """Raise 400 unless both bounds are YYYY-MM-DD and date_from <= date_to."""
+        for value in (date_from, date_to):
+            if value is None:
+                continue
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid date format: {value}. Expected YYYY-MM-DD",
+                )
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'from' date must be on or before 'to' date",
+            )
+
+    @staticmethod
+    def month_window(month: str) -> Tuple[str, str]:
+        """Return the inclusive (first_day, last_day) YYYY-MM-DD range for a YYYY-MM month."""
+        try:
+            first_day = datetime.strptime(month, "%Y-%m").date()
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid month format: {month}. Expected YYYY-MM",
+            )
+        next_month = (first_day.replace(day=28) + timedelta(days=4)).replace(day=1)
+        last_day = next_month - timedelta(days=1)
+        return first_day.isoformat(), last_day.isoformat()
+
     @staticmethod
     def _ensure_future_date(scheduled_date: str) -> str:
         """If the date is today or in the past, bump it to tomorrow. Used as a safety net for agent output."""
@@ -87,22 +126,23 @@ class SchedulerService:
 
     async def _get_strategy_with_ownership(self, strategy_id: str, user_id: str):
         """Fetch a strategy and verify ownership. Raises 404/403 on failure."""
-        exists = await self.strategy_repository.strategy_exists(strategy_id)
-        if not exists:
+        strategy, belongs_to_other = await self.strategy_repository.get_strategy_for_user(
+            strategy_id, user_id
+        )
+        if belongs_to_other:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Strategy not found",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied: You do not have permission to access this resource",
             )
-        strategy = await self.strategy_repository.get_strategy_by_id(strategy_id, user_id)
         if strategy is None:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: You do not have permission to access this resource",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Strategy not found",
             )
         return strategy
 
     async def auto_schedule(
-        self, strategy_id: str, user_id: str
+        self, strategy_id: str, user_id: str, idempotency_key: Optional[str] = None
     ) -> List[ScheduledPostRecord]:
         """
         Auto-schedule all copies for a strategy using the AI agent.
@@ -113,8 +153,20 @@ class SchedulerService:
         4. Create ScheduledPostRecord for each assignment with status "scheduled"
         5. Batch store all records
 
-        If the agent fails, no records are stored.
+        If the agent fails, no records are stored. Identical concurrent calls
+        share one run, and a retry with the same idempotency key gets the
+        original call's posts instead of scheduling the copies twice.
         """
+        return await self.single_flight.run(
+            user_id, "auto_schedule", {"strategy_id": strategy_id},
+            lambda: self._auto_schedule(strategy_id, user_id),
+            idempotency_key=idempotency_key,
+        )
+
+    async def _auto_schedule(
+        self, strategy_id: str, user_id: str
+    ) -> List[ScheduledPostRecord]:
+        """Schedule a strategy's copies once; see auto_schedule."""
         strategy = await self._get_strategy_with_ownership(strategy_id, user_id)
 
         # Fetch copies for this strategy
@@ -216,17 +268,18 @@ class SchedulerService:
             return await self.scheduler_repository.create_post(record)
 
         # Verify copy exists and belongs to user
-        copy_exists = await self.copy_repository.copy_exists(input.copy_id)
-        if not copy_exists:
+        copy, belongs_to_other = await self.copy_repository.get_copy_for_user(
+            input.copy_id, user_id
+        )
+        if belongs_to_other:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Copy not found",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied: You do not have permission to access this resource",
             )
-        copy = await self.copy_repository.get_copy_by_id(input.copy_id, user_id)
         if copy is None:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: You do not have permission to access this resource",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Copy not found",
             )
 
         # Fetch associated strategy for color/label
@@ -274,28 +327,53 @@ class SchedulerService:
             (None, True)     — exists but belongs to another user
             (None, False)    — does not exist
         """
-        exists = await self.scheduler_repository.post_exists(post_id)
-        if not exists:
-            return (None, False)
-
-        record = await self.scheduler_repository.get_post_by_id(post_id, user_id)
-        if record is None:
-            return (None, True)
-
-        return (record, False)
+        return await self.scheduler_repository.get_post_for_user(post_id, user_id)
 
     async def list_posts_by_user(
-        self, user_id: str
+        self, user_id: str, date_from: Optional[str] = None, date_to: Optional[str] = None
     ) -> List[ScheduledPostRecord]:
-        """List all posts for the authenticated user, sorted by scheduledDate ascending."""
-        return await self.scheduler_repository.list_posts_by_user(user_id)
+        """List the authenticated user's posts, sorted by scheduledDate ascending.
+
+        date_from / date_to (inclusive, YYYY-MM-DD) restrict the query to a
+        calendar window on the index sort key.
+        """
+        self._validate_date_range(date_from, date_to)
+        return await self.scheduler_repository.list_posts_by_user(
+            user_id, date_from=date_from, date_to=date_to
+        )
 
     async def list_posts_by_strategy(
-        self, strategy_id: str, user_id: str
+        self, strategy_id: str, user_id: str,
+        date_from: Optional[str] = None, date_to: Optional[str] = None
     ) -> List[ScheduledPostRecord]:
         """List posts for a strategy after verifying ownership."""
+        self._validate_date_range(date_from, date_to)
+        await self._get_strategy_with_ownership(strategy_id, user_id)
+        return await self.scheduler_repository.list_posts_by_strategy(
+            strategy_id, date_from=date_from, date_to=date_to
+        )
+
+    async def list_posts_by_user_page(
+        self, user_id: str, limit: Optional[int] = None, cursor: Optional[str] = None,
+        date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> Tuple[List[ScheduledPostRecord], Optional[str]]:
+        """List one page of the user's posts. Returns (posts, next_cursor)."""
+        self._validate_date_range(date_from, date_to)
+        return await self.scheduler_repository.list_posts_by_user_page(
+            user_id, limit, cursor, date_from=date_from, date_to=date_to
+        )
+
+    async def list_posts_by_strategy_page(
+        self, strategy_id: str, user_id: str,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+        date_from: Optional[str] = None, date_to: Optional[str] = None
+    ) -> Tuple[List[ScheduledPostRecord], Optional[str]]:
+        """List one page of a strategy's posts after verifying ownership."""
+        self._validate_date_range(date_from, date_to)
         await self._get_strategy_with_ownership(strategy_id, user_id)
-        return await self.scheduler_repository.list_posts_by_strategy(strategy_id)
+        return await self.scheduler_repository.list_posts_by_strategy_page(
+            strategy_id, limit, cursor, date_from=date_from, date_to=date_to
+        )
 
     async def update_post(
         self, post_id: str, updates: ScheduledPostUpdate, user_id: str
@@ -312,6 +390,8 @@ class SchedulerService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Scheduled post not found",
             )
+        if record.status == "publishing":
+            raise self._being_published()
 
         # Build updates dict — exclude_none for most fields, but preserve
         # explicit None for nullable fields (media_id, media_type) so the
@@ -328,7 +408,20 @@ class SchedulerService:
             # Nothing to update, return existing record
             return record
 
-        return await self.scheduler_repository.update_post(post_id, update_dict)
+        # The read above can be stale; the repository's conditional write is
+        # what actually keeps edits off a claimed post
+        try:
+            return await self.scheduler_repository.update_post(post_id, update_dict)
+        except PostBeingPublishedError:
+            raise self._being_published()
+
+    @staticmethod
+    def _being_published() -> HTTPException:
+        """409 for an edit to a post a publisher has claimed."""
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Post is being published and cannot be edited right now",
+        )
 
     async def delete_all_posts(self, user_id: str) -> int:
         """Delete all posts for the authenticated user. Returns count of deleted posts."""
@@ -0,0 +1,126 @@
+"""
+Single-flight coalescing and idempotency keys for generation requests.
+
+Generating a strategy, copies or a schedule takes one or more Bedrock calls
+and writes new records. Double-clicks and retries after a 504 used to start a
+second generation while the first was still running. SingleFlight runs each
+distinct (user, operation, input hash) once: identical calls that arrive
+while it is in flight await the same task. The task is shielded from its
+callers' cancellation, so when `asyncio.wait_for` times a request out the
+generation still finishes and stores its records.
+
+A call made with an idempotency key also keeps its result for
+`result_ttl_seconds`. A retry that sends the same key gets that result, or
+joins the original call if it is still running, instead of paying for a
+second generation.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from fastapi import HTTPException, status
+
+from services.agent_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one in-flight task among identical concurrent calls."""
+
+    def __init__(self, result_ttl_seconds: int = 3600, max_results: int = 1024):
+        """
+        Args:
+            result_ttl_seconds: How long a result is replayed for its idempotency key
+            max_results: Idempotency keys remembered before the oldest is dropped
+        """
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_results = max_results
+        # (user, operation, input hash) -> running task
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # (user, operation, idempotency key) -> (input hash, task, expiry once succeeded)
+        self._keyed: "OrderedDict[tuple, tuple[str, asyncio.Task, Optional[float]]]" = OrderedDict()
+        self.started = 0
+        self.joined = 0
+        self.replayed = 0
+
+    async def run(
+        self,
+        user_id: str,
+        operation: str,
+        inputs: Any,
+        compute: Callable[[], Awaitable[T]],
+        idempotency_key: Optional[str] = None,
+    ) -> T:
+        """
+        Return the result of `compute()`, sharing it with identical calls.
+
+        Raises:
+            HTTPException: 422 if the idempotency key was already used with
+                different inputs
+        """
+        input_hash = content_hash(inputs)
+        flight_key = (user_id, operation, input_hash)
+        idem_key = (user_id, operation, idempotency_key) if idempotency_key else None
+
+        task = self._replay(idem_key, input_hash) if idem_key else None
+        if task is not None:
+            self.replayed += 1
+            logger.info(f"Replaying {operation} for user {user_id} by idempotency key")
+        elif flight_key in self._inflight:
+            task = self._inflight[flight_key]
+            self.joined += 1
+            logger.info(f"Joining in-flight {operation} for user {user_id}")
+        else:
+            task = asyncio.create_task(compute())
+            self.started += 1
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda t: self._finished(flight_key, t))
+
+        if idem_key is not None and idem_key not in self._keyed:
+            self._keyed[idem_key] = (input_hash, task, None)
+            task.add_done_callback(lambda t: self._remember(idem_key, t))
+            while len(self._keyed) > self.max_results:
+                self._keyed.popitem(last=False)
+
+        # Cancelling this caller (e.g. a request timeout) must not cancel the
+        # generation the other callers and later retries are waiting for
+        return await asyncio.shield(task)
+
+    def _replay(self, idem_key: tuple, input_hash: str) -> Optional[asyncio.Task]:
+        """Task of an earlier, running or succeeded call with this idempotency key."""
+        entry = self._keyed.get(idem_key)
+        if entry is None:
+            return None
+        earlier_hash, task, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._keyed[idem_key]
+            return None
+        if earlier_hash != input_hash:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency key was already used for a different request",
+            )
+        return task
+
+    def _finished(self, flight_key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(flight_key) is task:
+            del self._inflight[flight_key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so a failure nobody awaits anymore is still logged
+            logger.warning(f"{flight_key[1]} failed for user {flight_key[0]}: {task.exception()}")
+
+    def _remember(self, idem_key: tuple, task: asyncio.Task) -> None:
+        """Keep a successful result for retries; a failed call may be retried afresh."""
+        entry = self._keyed.get(idem_key)
+        if entry is None or entry[1] is not task:
+            return
+        if task.cancelled() or task.exception() is not None:
+            del self._keyed[idem_key]
+        else:
+            self._keyed[idem_key] = (entry[0], task, time.time() + self.result_ttl_seconds)
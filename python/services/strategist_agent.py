@@ -6,10 +6,9 @@ Python SDK to generate social media strategies via Amazon Bedrock (Claude 4 Sonn
 The agent returns structured output validated by Pydantic models.
 """
 
-import boto3
-from botocore.config import Config as BotoConfig
 from strands import Agent
-from strands.models.bedrock import BedrockModel
+from services.agent_cache import AgentResponseCache, cache_key
+from services.bedrock_model import get_bedrock_model
 from models.strategy import StrategyInput, StrategyOutput
 from typing import Optional
 
@@ -33,49 +32,30 @@ class StrategistAgent:
         aws_region: str, 
         model_id: str = "anthropic.claude-3-haiku-20240307-v1:0",
         aws_access_key_id: Optional[str] = None,
-        aws_secret_access_key: Optional[str] = None
+        aws_secret_access_key: Optional[str] = None,
+        cache: Optional[AgentResponseCache] = None
     ):
         """
-        Initialize the Strategist Agent with Bedrock provider.
+        Initialize the Strategist Agent on the shared Bedrock model.
         
         Args:
             aws_region: AWS region for Bedrock API calls
             model_id: Bedrock model identifier
             aws_access_key_id: AWS access key ID (if None, uses default credential chain)
             aws_secret_access_key: AWS secret access key (if None, uses default credential chain)
+            cache: Response cache for repeated inputs (None disables caching)
         """
-        # Increase read timeout for large structured output generation
-        boto_config = BotoConfig(
-            read_timeout=300,
-            connect_timeout=10,
-            retries={"max_attempts": 2}
+        self.model = get_bedrock_model(
+            aws_region, model_id, aws_access_key_id, aws_secret_access_key
         )
-        
-        # Create boto3 session with explicit credentials if provided
-        if aws_access_key_id and aws_secret_access_key:
-            boto_session = boto3.Session(
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                region_name=aws_region
-            )
-            self.model = BedrockModel(
-                boto_session=boto_session,
-                model_id=model_id,
-                boto_client_config=boto_config
-            )
-        else:
-            # Fall back to default credential chain
-            self.model = BedrockModel(
-                region_name=aws_region,
-                model_id=model_id,
-                boto_client_config=boto_config
-            )
-        
-        self.agent = Agent(
-            model=self.model,
-            system_prompt=self._get_system_prompt()
-        )
-    
+        self.model_id = model_id
+        self.cache = cache
+        self.system_prompt = self._get_system_prompt()
+
+    def _new_agent(self) -> Agent:
+        """Build a fresh agent per call so no earlier conversation is replayed."""
+        return Agent(model=self.model, system_prompt=self.system_prompt)
+
     def _get_system_prompt(self) -> str:
         """
         Get the detailed system prompt for the Strategist Agent.
@@ -126,6 +106,15 @@ best practices."""
         Raises:
             StructuredOutputException: If the agent fails to return structured output
         """
+        if self.cache is None:
+            return await self._generate_strategy(strategy_input)
+        key = cache_key(self.model_id, self.system_prompt, "generate_strategy", strategy_input)
+        return await self.cache.get_or_compute(
+            key, StrategyOutput, lambda: self._generate_strategy(strategy_input)
+        )
+
+    async def _generate_strategy(self, strategy_input: StrategyInput) -> StrategyOutput:
+        """Generate a strategy with one uncached agent call."""
         user_prompt = f"""Generate a comprehensive social media strategy for the following brand:
 
 Brand Name: {strategy_input.brand_name}
@@ -137,5 +126,5 @@ Provide a detailed strategy that includes content pillars, posting schedule, pla
 content themes, engagement tactics, and visual prompts for image generation that align with the strategy."""
 
         # Use invoke_async with structured_output_model parameter (Strands SDK 1.x)
-        result = await self.agent.invoke_async(user_prompt, structured_output_model=StrategyOutput)
+        result = await self._new_agent().invoke_async(user_prompt, structured_output_model=StrategyOutput)
         return result.structured_output
@@ -6,10 +6,11 @@ It orchestrates the Strands Agent and DynamoDB repository while ensuring proper
 handling and data consistency.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from models.strategy import StrategyInput, StrategyOutput, StrategyRecord
 from services.strategist_agent import StrategistAgent, StructuredOutputException
 from repositories.strategy_repository import StrategyRepository
+from services.single_flight import SingleFlight
 
 
 class StrategyService:
@@ -21,31 +22,44 @@ class StrategyService:
     do not result in incomplete database records.
     """
     
-    def __init__(self, agent: StrategistAgent, repository: StrategyRepository):
+    def __init__(
+        self,
+        agent: StrategistAgent,
+        repository: StrategyRepository,
+        single_flight: Optional[SingleFlight] = None
+    ):
         """
         Initialize the strategy service with dependencies.
         
         Args:
             agent: StrategistAgent instance for generating strategies
             repository: StrategyRepository instance for database operations
+            single_flight: Coalesces identical concurrent generations (a private
+                           instance is created when omitted)
         """
         self.agent = agent
         self.repository = repository
+        self.single_flight = single_flight or SingleFlight()
     
     async def generate_and_store_strategy(
         self, 
         strategy_input: StrategyInput, 
-        user_id: str
+        user_id: str,
+        idempotency_key: Optional[str] = None
     ) -> StrategyRecord:
         """
         Generate a strategy using the Strands agent and store it in the database.
         
         This method ensures atomicity: if strategy generation fails, no database
         record is created. Only successful generations are persisted.
+
+        Identical concurrent calls for one user share a single generation, and
+        a retry with the same idempotency key gets the original record.
         
         Args:
             strategy_input: Brand information for strategy generation
             user_id: Authenticated user's ID from JWT token
+            idempotency_key: Client key identifying retries of one request
             
         Returns:
             StrategyRecord: The complete strategy record with generated content
@@ -58,6 +72,18 @@ class StrategyService:
             Errors during generation prevent database writes, ensuring no incomplete
             records are stored (Requirement 7.4).
         """
+        return await self.single_flight.run(
+            user_id, "generate_strategy", strategy_input,
+            lambda: self._generate_and_store_strategy(strategy_input, user_id),
+            idempotency_key=idempotency_key
+        )
+
+    async def _generate_and_store_strategy(
+        self,
+        strategy_input: StrategyInput,
+        user_id: str
+    ) -> StrategyRecord:
+        """Generate and persist one strategy; see generate_and_store_strategy."""
         # Step 1: Generate strategy using Strands agent
         # If this fails, no database record will be created
         strategy_output: StrategyOutput = await self.agent.generate_strategy(strategy_input)
@@ -91,6 +117,25 @@ class StrategyService:
         """
         return await self.repository.list_strategies_by_user(user_id)
     
+    async def get_user_strategies_page(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[StrategyRecord], Optional[str]]:
+        """
+        Retrieve one page of strategies for a specific user, newest first.
+        
+        Args:
+            user_id: Authenticated user's ID from JWT token
+            limit: Maximum number of strategies to return
+            cursor: Opaque cursor returned with the previous page
+            
+        Returns:
+            Tuple of (strategies, next cursor or None on the last page)
+        """
+        return await self.repository.list_strategies_by_user_page(user_id, limit, cursor)
+    
     async def get_strategy(
         self, 
         strategy_id: str, 
@@ -115,15 +160,5 @@ class StrategyService:
         Note:
             User isolation is enforced at the repository level (Requirements 4.7, 5.2, 6.6).
         """
-        # First check if strategy exists at all
-        exists = await self.repository.strategy_exists(strategy_id)
-        
-        # Try to get strategy with user isolation
-        strategy = await self.repository.get_strategy_by_id(strategy_id, user_id)
-        
-        # If exists but we got None, it belongs to another user
-        if exists and strategy is None:
-            return (None, True)
-        
-        # Either found (strategy is not None) or doesn't exist (strategy is None, exists is False)
-        return (strategy, False)
+        # Single read: existence and ownership come from the same item
+        return await self.repository.get_strategy_for_user(strategy_id, user_id)
@@ -0,0 +1,28 @@
+"""
+Shared builders for tests that exercise SchedulerRepository against a mocked table.
+"""
+
+from unittest.mock import MagicMock
+
+from repositories.scheduler_repository import SchedulerRepository
+
+CREATED_AT = '2030-01-01T00:00:00+00:00'
+
+
+def post_item(**overrides):
+    """A scheduled post as stored in DynamoDB, with `overrides` applied."""
+    item = {
+        'postId': 'p-1', 'strategyId': 's-1', 'copyId': 'c-1', 'userId': 'u-1',
+        'content': 't', 'platform': 'linkedin', 'hashtags': [],
+        'scheduledDate': '2030-01-10', 'scheduledTime': '09:30', 'status': 'scheduled',
+        'createdAt': CREATED_AT, 'updatedAt': CREATED_AT,
+    }
+    item.update(overrides)
+    return item
+
+
+def mock_repository():
+    """A SchedulerRepository whose table is a MagicMock."""
+    repo = SchedulerRepository.__new__(SchedulerRepository)
+    repo.table = MagicMock()
+    return repo
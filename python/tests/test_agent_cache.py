@@ -0,0 +1,268 @@
+"""
+Tests for the content-addressed agent response cache.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from dependencies import get_copy_service
+from main import app
+from middleware.auth import auth_middleware
+from models.copy import ChatResponse
+from models.strategy import StrategyInput, StrategyOutput
+from repositories.agent_cache_repository import AgentCacheRepository
+from services.agent_cache import (
+    AgentResponseCache,
+    DiskCacheStore,
+    bypass_agent_cache,
+    bypass_requested,
+    cache_key,
+)
+from services.strategist_agent import StrategistAgent
+
+STRATEGY_INPUT = StrategyInput(
+    brand_name="Acme", industry="SaaS", target_audience="Founders", goals="Grow signups"
+)
+
+
+def _chat(text):
+    return ChatResponse(updated_text=text, updated_hashtags=["#a"], ai_message="done")
+
+
+class _Compute:
+    """Counts calls and returns a fixed output."""
+
+    def __init__(self, output):
+        self.output = output
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.output
+
+
+def test_key_ignores_dict_order_and_whitespace_but_not_content():
+    key = cache_key("m", "system", "op", {"a": "x", "b": ["y"]})
+
+    assert key == cache_key("m", "system ", "op", {"b": ["y"], "a": " x\r\n"})
+    assert key != cache_key("m2", "system", "op", {"a": "x", "b": ["y"]})
+    assert key != cache_key("m", "other system", "op", {"a": "x", "b": ["y"]})
+    assert key != cache_key("m", "system", "op", {"a": "z", "b": ["y"]})
+    assert cache_key("m", "s", "op", STRATEGY_INPUT) == cache_key(
+        "m", "s", "op", STRATEGY_INPUT.model_dump()
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeat_is_served_from_memory():
+    cache = AgentResponseCache()
+    compute = _Compute(_chat("hello"))
+
+    first = await cache.get_or_compute("k", ChatResponse, compute)
+    second = await cache.get_or_compute("k", ChatResponse, compute)
+
+    assert first == second == _chat("hello")
+    assert compute.calls == 1
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    cache = AgentResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        await cache.get_or_compute(key, ChatResponse, _Compute(_chat(key)))
+    await cache.get_or_compute("a", ChatResponse, _Compute(None))  # touch a
+    await cache.get_or_compute("c", ChatResponse, _Compute(_chat("c")))
+
+    assert list(cache._entries) == ["a", "c"]
+    recompute = _Compute(_chat("b2"))
+    assert (await cache.get_or_compute("b", ChatResponse, recompute)).updated_text == "b2"
+    assert recompute.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_byte_cap_limits_memory_and_skips_oversized_entries():
+    size = len(_chat("x" * 100).model_dump_json())
+    cache = AgentResponseCache(max_bytes=size * 2)
+
+    await cache.get_or_compute("a", ChatResponse, _Compute(_chat("x" * 100)))
+    await cache.get_or_compute("b", ChatResponse, _Compute(_chat("y" * 100)))
+    await cache.get_or_compute("c", ChatResponse, _Compute(_chat("z" * 100)))
+    await cache.get_or_compute("big", ChatResponse, _Compute(_chat("w" * 1000)))
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] <= size * 2
+    assert "big" not in cache._entries and "a" not in cache._entries
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_recomputed():
+    cache = AgentResponseCache(ttl_seconds=60)
+    await cache.get_or_compute("k", ChatResponse, _Compute(_chat("old")))
+
+    with patch("services.agent_cache.time.time", return_value=time.time() + 61):
+        fresh = await cache.get_or_compute("k", ChatResponse, _Compute(_chat("new")))
+
+    assert fresh.updated_text == "new"
+
+
+@pytest.mark.asyncio
+async def test_bypass_skips_lookup_and_refreshes_the_entry():
+    cache = AgentResponseCache()
+    await cache.get_or_compute("k", ChatResponse, _Compute(_chat("old")))
+
+    with bypass_agent_cache():
+        fresh = await cache.get_or_compute("k", ChatResponse, _Compute(_chat("new")))
+    cached = await cache.get_or_compute("k", ChatResponse, _Compute(None))
+
+    assert fresh.updated_text == cached.updated_text == "new"
+    assert cache.stats()["bypassed"] == 1
+
+
+def test_bypass_requested_reads_cache_control():
+    assert bypass_requested("no-cache")
+    assert bypass_requested("max-age=0, No-Store")
+    assert not bypass_requested("max-age=60")
+    assert not bypass_requested(None)
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_a_new_process(tmp_path):
+    first = AgentResponseCache(store=DiskCacheStore(str(tmp_path)))
+    await first.get_or_compute("k" * 64, ChatResponse, _Compute(_chat("disk")))
+
+    second = AgentResponseCache(store=DiskCacheStore(str(tmp_path)))
+    compute = _Compute(None)
+    output = await second.get_or_compute("k" * 64, ChatResponse, compute)
+
+    assert output.updated_text == "disk"
+    assert compute.calls == 0
+    assert second.stats()["store_hits"] == 1
+    assert "k" * 64 in second._entries  # promoted to memory
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_drops_expired_entries(tmp_path):
+    store = DiskCacheStore(str(tmp_path))
+    await store.put("ab" * 32, "{}", int(time.time()) - 1)
+
+    assert await store.get("ab" * 32) is None
+    assert not (tmp_path / "ab" / f"{'ab' * 32}.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_store_failures_fall_back_to_the_agent():
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=RuntimeError("throttled"))
+    store.put = AsyncMock(side_effect=RuntimeError("throttled"))
+    cache = AgentResponseCache(store=store)
+
+    output = await cache.get_or_compute("k", ChatResponse, _Compute(_chat("ok")))
+
+    assert output.updated_text == "ok"
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_tier_reads_and_writes_items():
+    repo = AgentCacheRepository.__new__(AgentCacheRepository)
+    repo.table = MagicMock()
+    repo.table.get_item.return_value = {
+        "Item": {"cacheKey": "k", "value": "{}", "expiresAt": int(time.time()) + 60}
+    }
+
+    await repo.put("k", "{}", 123)
+    value = await repo.get("k")
+
+    repo.table.put_item.assert_called_once_with(Item={"cacheKey": "k", "value": "{}", "expiresAt": 123})
+    assert value == "{}"
+
+    repo.table.get_item.return_value = {
+        "Item": {"cacheKey": "k", "value": "{}", "expiresAt": int(time.time()) - 1}
+    }
+    assert await repo.get("k") is None
+
+
+def _strategy_output():
+    return StrategyOutput(
+        content_pillars=["Tips", "Stories", "News"],
+        posting_schedule="Daily",
+        platform_recommendations=[
+            {"platform": "LinkedIn", "rationale": "B2B", "priority": "high"},
+            {"platform": "Twitter", "rationale": "Reach", "priority": "medium"},
+        ],
+        content_themes=[f"Theme {i}" for i in range(5)],
+        engagement_tactics=[f"Tactic {i}" for i in range(4)],
+        visual_prompts=["A desk", "A team"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_strategist_repeat_does_not_call_the_model():
+    calls = []
+
+    async def invoke_async(prompt, structured_output_model):
+        calls.append(prompt)
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(structured_output=_strategy_output())
+
+    with patch("services.strategist_agent.get_bedrock_model", return_value=MagicMock()):
+        agent = StrategistAgent(aws_region="us-east-1", model_id="m", cache=AgentResponseCache())
+    agent._new_agent = lambda: SimpleNamespace(invoke_async=invoke_async)
+
+    await agent.generate_strategy(STRATEGY_INPUT)
+    started = time.perf_counter()
+    repeat = await agent.generate_strategy(STRATEGY_INPUT)
+    elapsed = time.perf_counter() - started
+
+    assert repeat == _strategy_output()
+    assert len(calls) == 1
+    assert elapsed < 0.05  # faster than a single model call
+
+
+def test_refine_text_honours_no_cache_header():
+    cache = AgentResponseCache()
+    answers = iter(["first", "second"])
+
+    async def chat_refine(**kwargs):
+        return await cache.get_or_compute("k", ChatResponse, lambda: _Compute(_chat(next(answers)))())
+
+    service = MagicMock(agent=MagicMock(chat_refine=chat_refine))
+    body = {"text": "hi", "platform": "linkedin", "message": "shorter"}
+
+    app.dependency_overrides[auth_middleware.get_current_user] = lambda: "u-1"
+    app.dependency_overrides[get_copy_service] = lambda: service
+    try:
+        client = TestClient(app)
+        cached = client.post("/api/copy/refine-text", json=body).json()
+        repeat = client.post("/api/copy/refine-text", json=body).json()
+        fresh = client.post(
+            "/api/copy/refine-text", json=body, headers={"Cache-Control": "no-cache"}
+        ).json()
+    finally:
+        app.dependency_overrides.pop(auth_middleware.get_current_user)
+        app.dependency_overrides.pop(get_copy_service)
+
+    assert cached["updated_text"] == repeat["updated_text"] == "first"
+    assert fresh["updated_text"] == "second"
+
+
+def test_stats_endpoint_reports_hit_ratio():
+    cache = AgentResponseCache()
+    cache.memory_hits, cache.misses = 3, 1
+
+    app.dependency_overrides[auth_middleware.get_current_user] = lambda: "u-1"
+    try:
+        with patch("main.get_agent_cache", return_value=cache):
+            response = TestClient(app).get("/api/agent-cache")
+    finally:
+        app.dependency_overrides.pop(auth_middleware.get_current_user)
+
+    assert response.status_code == 200
+    assert response.json()["enabled"] is True
+    assert response.json()["hit_ratio"] == 0.75
@@ -0,0 +1,101 @@
+"""
+Tests for stateless agent execution.
+
+The Bedrock agents run each call on a fresh Strands Agent over a shared
+model, so what is sent to the model must not grow with the number of calls.
+A fake Strands model answers every call with a structured output tool call
+and records the conversation it was sent.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from strands.models.model import Model
+
+from models.strategy import PlatformRecommendation, StrategyInput, StrategyOutput
+from services.bedrock_model import get_bedrock_model
+from services.strategist_agent import StrategistAgent
+
+STRATEGY = StrategyOutput(
+    content_pillars=['Education', 'Community', 'Product'],
+    posting_schedule='3x per week',
+    platform_recommendations=[
+        PlatformRecommendation(platform='LinkedIn', rationale='B2B', priority='high'),
+        PlatformRecommendation(platform='Twitter', rationale='Reach', priority='medium'),
+    ],
+    content_themes=['Tips', 'Stories', 'News', 'Launches', 'Q&A'],
+    engagement_tactics=['Polls', 'Replies', 'Live', 'Threads'],
+    visual_prompts=['A bright office', 'A product close-up'],
+)
+
+
+class _StructuredOutputModel(Model):
+    """Fake model that always calls the structured output tool."""
+
+    def __init__(self):
+        self.prompt_sizes = []
+
+    def update_config(self, **model_config):
+        pass
+
+    def get_config(self):
+        return {}
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError
+        yield
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        self.prompt_sizes.append(len(json.dumps(messages)) + len(system_prompt or ''))
+        tool_name = tool_specs[0]['name']
+        yield {'messageStart': {'role': 'assistant'}}
+        yield {'contentBlockStart': {'start': {'toolUse': {'name': tool_name, 'toolUseId': 't-1'}}}}
+        yield {'contentBlockDelta': {'delta': {'toolUse': {'input': STRATEGY.model_dump_json()}}}}
+        yield {'contentBlockStop': {}}
+        yield {'messageStop': {'stopReason': 'tool_use'}}
+
+
+def _agent(model):
+    with patch('services.strategist_agent.get_bedrock_model', return_value=model):
+        return StrategistAgent(aws_region='us-east-1', model_id='test-model')
+
+
+def _input(i):
+    return StrategyInput(
+        brand_name=f'Brand {i:04d}', industry='SaaS', target_audience='Founders', goals='Grow',
+    )
+
+
+@pytest.mark.asyncio
+async def test_prompt_size_stays_constant_across_calls():
+    model = _StructuredOutputModel()
+    agent = _agent(model)
+
+    for i in range(1000):
+        assert await agent.generate_strategy(_input(i)) == STRATEGY
+
+    assert len(model.prompt_sizes) == 1000
+    assert set(model.prompt_sizes) == {model.prompt_sizes[0]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_do_not_share_an_agent():
+    model = _StructuredOutputModel()
+    agent = _agent(model)
+
+    results = await asyncio.gather(*(agent.generate_strategy(_input(i)) for i in range(20)))
+
+    assert results == [STRATEGY] * 20
+    assert set(model.prompt_sizes) == {model.prompt_sizes[0]}
+
+
+def test_agents_share_one_bedrock_model():
+    get_bedrock_model.cache_clear()
+    try:
+        first = get_bedrock_model('us-east-1', 'test-model')
+        assert get_bedrock_model('us-east-1', 'test-model') is first
+        assert get_bedrock_model('us-west-2', 'test-model') is not first
+    finally:
+        get_bedrock_model.cache_clear()
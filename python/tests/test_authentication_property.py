@@ -14,6 +14,7 @@ from unittest.mock import MagicMock, patch, AsyncMock
 from jose import jwt
 from datetime import datetime, timedelta
 
+from dependencies import get_strategy_service
 from main import app
 from middleware.auth import AuthMiddleware, security
 from models.strategy import StrategyInput, StrategyOutput, StrategyRecord, PlatformRecommendation
@@ -100,7 +101,8 @@ class TestAuthenticationProperty:
     @pytest.fixture
     def mock_strategy_service(self):
         """Mock the strategy service to avoid actual agent calls."""
-        with patch('routes.strategy.strategy_service') as mock_service:
+        mock_service = MagicMock()
+        with patch.dict(app.dependency_overrides, {get_strategy_service: lambda: mock_service}):
             # Mock the generate_and_store_strategy method
             mock_record = StrategyRecord(
                 id="test-strategy-id",
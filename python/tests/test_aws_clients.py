@@ -0,0 +1,63 @@
+"""
+Tests for the process-wide AWS client registry and shared dependency providers.
+"""
+
+from repositories.aws_clients import AWSClientRegistry
+
+
+def test_registry_reuses_session_and_resource_per_region():
+    registry = AWSClientRegistry(max_pool_connections=7)
+
+    assert registry.session('us-east-1') is registry.session('us-east-1')
+    assert registry.dynamodb('us-east-1') is registry.dynamodb('us-east-1')
+    assert registry.dynamodb('us-east-1') is not registry.dynamodb('eu-west-1')
+    assert registry.s3('us-east-1') is registry.s3('us-east-1')
+
+
+def test_registry_applies_pool_configuration():
+    registry = AWSClientRegistry(max_pool_connections=7, tcp_keepalive=True)
+
+    config = registry.s3('us-east-1').meta.config
+    assert config.max_pool_connections == 7
+    assert config.tcp_keepalive is True
+
+    table = registry.table('some-table', 'us-east-1')
+    assert table.meta.client.meta.config.max_pool_connections == 7
+
+
+def test_tables_share_one_underlying_client():
+    registry = AWSClientRegistry(max_pool_connections=7)
+
+    first = registry.table('table-a', 'us-east-1')
+    second = registry.table('table-b', 'us-east-1')
+    assert first.meta.client is second.meta.client
+
+
+def test_close_drops_cached_clients():
+    registry = AWSClientRegistry(max_pool_connections=7)
+    client = registry.s3('us-east-1')
+
+    registry.close()
+    assert registry.s3('us-east-1') is not client
+
+
+def test_dependency_providers_return_shared_instances():
+    from dependencies import get_copy_repository, get_publisher_service, get_scheduler_repository
+
+    assert get_copy_repository() is get_copy_repository()
+    assert get_publisher_service().scheduler_repository is get_scheduler_repository()
+
+
+def test_shutdown_drops_providers_holding_closed_clients():
+    from fastapi.testclient import TestClient
+
+    from dependencies import get_copy_repository, get_linkedin_client
+    from main import app
+
+    with TestClient(app):
+        repository = get_copy_repository()
+        linkedin_client = get_linkedin_client()
+
+    # A second lifespan in the same process gets fresh instances on reopened clients
+    assert get_copy_repository() is not repository
+    assert get_linkedin_client() is not linkedin_client
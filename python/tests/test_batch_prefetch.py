@@ -0,0 +1,152 @@
+"""
+Tests for BatchGetItem reads and the per-cycle credential/media prefetch.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from models.publisher import LinkedInPostResponse
+from models.scheduler import ScheduledPostRecord
+from repositories.batch import BatchGetIncompleteError, batch_get
+from repositories.media_repository import MediaRepository
+from repositories.user_repository import UserRepository
+from services.publisher_service import PublisherService
+
+
+def _table(name='users', key='userId', unprocessed_rounds=0):
+    """Table stand-in whose BatchGetItem returns every key, after some throttled rounds."""
+    table = MagicMock()
+    table.name = name
+    rounds = {'left': unprocessed_rounds}
+
+    def batch_get_item(RequestItems):
+        keys = RequestItems[name]['Keys']
+        if rounds['left'] > 0:
+            rounds['left'] -= 1
+            half = len(keys) // 2
+            return {
+                'Responses': {name: [dict(k) for k in keys[:half]]},
+                'UnprocessedKeys': {name: {**RequestItems[name], 'Keys': keys[half:]}},
+            }
+        return {'Responses': {name: [dict(k) for k in keys if not k[key].startswith('missing')]}}
+
+    table.meta.client.batch_get_item = MagicMock(side_effect=batch_get_item)
+    return table
+
+
+@pytest.mark.asyncio
+async def test_batch_get_chunks_and_deduplicates():
+    table = _table()
+    ids = [f'u-{i}' for i in range(250)] + ['u-1', None, 'missing-1']
+
+    items = await batch_get(table, 'userId', ids)
+
+    assert len(items) == 250 and 'missing-1' not in items
+    chunk_sizes = sorted(
+        len(c.kwargs['RequestItems']['users']['Keys'])
+        for c in table.meta.client.batch_get_item.call_args_list
+    )
+    assert chunk_sizes == [51, 100, 100]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_retries_unprocessed_keys():
+    table = _table(unprocessed_rounds=2)
+
+    with patch('repositories.batch.UNPROCESSED_BACKOFF_SECONDS', 0):
+        items = await batch_get(table, 'userId', ['u-1', 'u-2', 'u-3', 'u-4'])
+
+    assert sorted(items) == ['u-1', 'u-2', 'u-3', 'u-4']
+    assert table.meta.client.batch_get_item.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_get_gives_up_after_retries():
+    table = _table(unprocessed_rounds=100)
+
+    with patch('repositories.batch.UNPROCESSED_BACKOFF_SECONDS', 0):
+        with pytest.raises(BatchGetIncompleteError):
+            await batch_get(table, 'userId', ['u-1', 'u-2'])
+
+
+@pytest.mark.asyncio
+async def test_user_repository_batch_returns_credentials():
+    repo = UserRepository.__new__(UserRepository)
+    repo.table = _table()
+
+    credentials = await repo.batch_get_linkedin_credentials(['u-1', 'missing-2'])
+
+    assert list(credentials) == ['u-1']
+    assert set(credentials['u-1']) == {'linkedinAccessToken', 'linkedinSub', 'linkedinName'}
+
+
+def _post(i, user_id, media_id=None):
+    return ScheduledPostRecord(
+        id=f'p-{i}', strategy_id='s-1', copy_id='c-1', user_id=user_id, content='t',
+        platform='linkedin', scheduled_date='2020-01-01', scheduled_time='09:00',
+        status='scheduled', media_id=media_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cycle_reads_credentials_in_one_batch():
+    users = UserRepository.__new__(UserRepository)
+    users.table = MagicMock()
+    users.batch_get_linkedin_credentials = AsyncMock(return_value={
+        f'u-{i}': {'linkedinAccessToken': 'token', 'linkedinSub': f'sub-{i}'} for i in range(20)
+    })
+    users.get_user_linkedin_credentials = AsyncMock()
+    media = MediaRepository.__new__(MediaRepository)
+    media.batch_get_media = AsyncMock(return_value={})
+    # 21 users, one of which does not exist
+    posts = [_post(i, f'u-{i % 21}') for i in range(60)]
+    by_id = {p.id: p for p in posts}
+    scheduler_repository = MagicMock()
+    scheduler_repository.claim_post = AsyncMock(side_effect=lambda post_id, *args: by_id[post_id])
+    scheduler_repository.release_claim = AsyncMock(return_value=True)
+    scheduler_repository.complete_publish = AsyncMock(return_value=True)
+    linkedin = MagicMock()
+    linkedin.create_text_post = AsyncMock(
+        return_value=LinkedInPostResponse(status_code=201, post_id='urn:li:share:1')
+    )
+    service = PublisherService(
+        linkedin_client=linkedin,
+        publisher_repository=MagicMock(create_log=AsyncMock()),
+        scheduler_repository=scheduler_repository,
+        user_repository=users,
+        media_repository=media,
+        s3_client=MagicMock(),
+        worker_id='w-1',
+    )
+
+    await service.process_posts(posts, set())
+
+    assert linkedin.create_text_post.await_count == 58  # the missing user's 2 posts are skipped
+
+    users.batch_get_linkedin_credentials.assert_awaited_once()
+    assert users.batch_get_linkedin_credentials.await_args.args[0] == {f'u-{i}' for i in range(21)}
+    # The missing user was answered by the batch too, not by a fallback GetItem
+    users.get_user_linkedin_credentials.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_failure_falls_back_to_single_reads():
+    users = MagicMock()
+    users.batch_get_linkedin_credentials = AsyncMock(side_effect=RuntimeError('throttled'))
+    users.get_user_linkedin_credentials = AsyncMock(return_value=None)
+    service = PublisherService(
+        linkedin_client=MagicMock(),
+        publisher_repository=MagicMock(),
+        scheduler_repository=MagicMock(),
+        user_repository=users,
+        media_repository=MagicMock(batch_get_media=AsyncMock(return_value={})),
+        s3_client=MagicMock(),
+        worker_id='w-1',
+    )
+
+    cache = await service.prefetch([_post(1, 'u-1', media_id='m-1')])
+
+    assert cache.credentials == {} and cache.media == {}
+    assert await service._get_credentials('u-1') is None
+    users.get_user_linkedin_credentials.assert_awaited_once_with('u-1')
@@ -16,13 +16,14 @@ os.environ.setdefault("USE_MOCK_AGENT", "true")
 import pytest
 from hypothesis import given, settings as hypothesis_settings, strategies as st, HealthCheck
 from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from jose import jwt
 from datetime import datetime, timedelta
 
 from config import settings as app_settings
 
 # Import app after env is configured so copy routes use mock agent
+from dependencies import get_copy_service
 from main import app
 from models.copy import CopyRecord, ChatResponse
 
@@ -105,7 +106,8 @@ class TestCopyAuthenticationProperty:
     @pytest.fixture
     def mock_copy_service(self):
         """Mock the copy service to avoid actual agent/DB calls."""
-        with patch("routes.copy.copy_service") as mock_service:
+        mock_service = MagicMock()
+        with patch.dict(app.dependency_overrides, {get_copy_service: lambda: mock_service}):
             mock_record = CopyRecord(
                 id="test-copy-id",
                 strategy_id="test-strategy-id",
@@ -0,0 +1,120 @@
+"""
+Tests for per-platform fan-out in CopywriterAgent.generate_copies.
+"""
+
+import asyncio
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models.copy import CopyItem, CopyOutput
+from services.copywriter_agent import CopywriterAgent, StructuredOutputException
+
+STRATEGY = {
+    "brand_name": "Acme",
+    "industry": "SaaS",
+    "content_pillars": ["Tips", "Stories"],
+    "platform_recommendations": [
+        {"platform": "Twitter"}, {"platform": "Instagram"},
+        {"platform": "LinkedIn"}, {"platform": "Facebook"},
+    ],
+}
+
+
+class _FakeModelCalls:
+    """Answers each agent call from the platform named in its prompt."""
+
+    def __init__(self, failures=None, delay=0.02):
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+
+    def agent(self):
+        return SimpleNamespace(invoke_async=self.invoke_async)
+
+    async def invoke_async(self, prompt, structured_output_model):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+
+        match = re.search(r"variations for (\w+) only", prompt)
+        platform = match.group(1) if match else "all"
+        if self.failures.get(platform):
+            self.failures[platform] -= 1
+            return SimpleNamespace(structured_output=None)
+        copies = [
+            CopyItem(text=f"{platform} {i}", platform=platform.lower(), hashtags=["#a"])
+            for i in range(7)
+        ]
+        copies.append(CopyItem(text="   ", platform=platform))
+        return SimpleNamespace(structured_output=CopyOutput(copies=copies))
+
+
+def _agent(calls, **kwargs):
+    with patch("services.copywriter_agent.get_bedrock_model", return_value=MagicMock()):
+        agent = CopywriterAgent(aws_region="us-east-1", **kwargs)
+    agent._new_agent = calls.agent
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_platforms_are_generated_concurrently_and_merged_in_order():
+    calls = _FakeModelCalls()
+
+    output = await _agent(calls).generate_copies(STRATEGY)
+
+    assert calls.peak == 4
+    assert len(output.copies) == 28
+    assert [c.platform for c in output.copies[::7]] == ["Twitter", "Instagram", "LinkedIn", "Facebook"]
+    assert all(c.text.strip() for c in output.copies)
+
+
+@pytest.mark.asyncio
+async def test_only_failed_platforms_are_retried():
+    calls = _FakeModelCalls(failures={"LinkedIn": 1})
+
+    output = await _agent(calls).generate_copies(STRATEGY)
+
+    assert len(calls.prompts) == 5
+    assert "for LinkedIn only" in calls.prompts[-1]
+    assert len(output.copies) == 28
+
+
+@pytest.mark.asyncio
+async def test_platform_failing_every_attempt_fails_generation():
+    calls = _FakeModelCalls(failures={"Instagram": 5})
+
+    with pytest.raises(StructuredOutputException, match="Instagram"):
+        await _agent(calls, platform_attempts=3).generate_copies(STRATEGY)
+
+    assert sum("for Instagram only" in p for p in calls.prompts) == 3
+
+
+@pytest.mark.asyncio
+async def test_fan_out_can_be_disabled():
+    calls = _FakeModelCalls()
+
+    output = await _agent(calls, fan_out=False).generate_copies(STRATEGY)
+
+    assert len(calls.prompts) == 1
+    assert "EACH of these 4 platforms" in calls.prompts[0]
+    assert len(output.copies) == 8
+
+
+@pytest.mark.asyncio
+async def test_fan_out_covers_the_default_platforms_whatever_the_strategy_recommends():
+    calls = _FakeModelCalls()
+    strategy = dict(STRATEGY, platform_recommendations=[
+        {"platform": "Instagram"}, {"platform": "TikTok"}, {"platform": "Instagram"},
+    ])
+
+    output = await _agent(calls).generate_copies(strategy)
+
+    assert [c.platform for c in output.copies[::7]] == ["Twitter", "Instagram", "LinkedIn", "Facebook"]
+    assert len(output.copies) == 28
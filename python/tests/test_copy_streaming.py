@@ -0,0 +1,196 @@
+"""
+Tests for incremental copy streaming: parsing copies out of the streamed
+structured output, `copy` SSE events and batched persistence.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import routes.copy as copy_routes
+from dependencies import get_copy_service
+from main import app
+from middleware.auth import auth_middleware
+from models.copy import CopyItem, CopyOutput
+from services.copy_service import CopyBatchWriter
+from services.copy_stream_parser import IncrementalCopyParser
+from services.copywriter_agent import CopywriterAgent
+
+COPIES = [
+    CopyItem(text='Say "hi" {now}', platform='LinkedIn', hashtags=['#a', '#b']),
+    CopyItem(text='Second\\nline ]', platform='Twitter', hashtags=[]),
+    CopyItem(text='Third', platform='Facebook', hashtags=['#c']),
+]
+DOCUMENT = CopyOutput(copies=COPIES).model_dump_json()
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_parser_returns_each_copy_as_soon_as_it_closes():
+    parser = IncrementalCopyParser()
+    seen = []
+    consumed = 0
+
+    for chunk in _chunks(DOCUMENT, 3):
+        consumed += len(chunk)
+        for copy in parser.feed(chunk):
+            seen.append((copy, consumed))
+
+    assert [copy for copy, _ in seen] == COPIES
+    # Each copy is returned within a chunk of its closing brace
+    first_end = DOCUMENT.index('"#b"]}') + len('"#b"]}')
+    assert first_end <= seen[0][1] < first_end + 3
+    assert parser.parsed == 3 and parser.invalid == 0
+
+
+def test_parser_skips_invalid_copies():
+    parser = IncrementalCopyParser()
+    document = '{"copies": [{"platform": "x"}, {"text": "ok", "platform": "x"}]}'
+
+    copies = [copy for chunk in _chunks(document, 5) for copy in parser.feed(chunk)]
+
+    assert [c.text for c in copies] == ['ok']
+    assert parser.invalid == 1
+
+
+def _tool_stream(tool_use_id, document, size=7):
+    streamed = ''
+    for chunk in _chunks(document, size):
+        streamed += chunk
+        yield {
+            'type': 'tool_use_stream',
+            'delta': {'toolUse': {'input': chunk}},
+            'current_tool_use': {'name': 'CopyOutput', 'toolUseId': tool_use_id, 'input': streamed},
+        }
+
+
+@pytest.mark.asyncio
+async def test_agent_stream_emits_copies_before_the_result():
+    async def stream_async(prompt, structured_output_model):
+        for event in _tool_stream('t-1', DOCUMENT):
+            yield event
+        # A retried structured output call repeats copies already sent
+        for event in _tool_stream('t-2', DOCUMENT):
+            yield event
+        yield {'result': SimpleNamespace(structured_output=CopyOutput(copies=COPIES))}
+
+    with patch('services.copywriter_agent.get_bedrock_model', return_value=MagicMock()):
+        agent = CopywriterAgent(aws_region='us-east-1')
+    agent._new_agent = lambda: SimpleNamespace(stream_async=stream_async)
+
+    events = [event async for event in agent.generate_copies_stream({})]
+
+    kinds = [e['event'] for e in events]
+    assert kinds.index('result') > max(i for i, k in enumerate(kinds) if k == 'copy')
+    copies = [e for e in events if e['event'] == 'copy']
+    assert [e['index'] for e in copies] == [0, 1, 2]
+    assert [e['copy']['text'] for e in copies] == [c.text for c in COPIES]
+
+
+@pytest.mark.asyncio
+async def test_writer_persists_in_batches_and_ignores_repeats():
+    repository = MagicMock()
+    repository.create_copies = AsyncMock(side_effect=lambda records: records)
+    writer = CopyBatchWriter(repository, 's-1', 'u-1', batch_size=2)
+
+    for i in range(5):
+        assert writer.add({'text': f'copy {i}', 'platform': 'Twitter', 'hashtags': []})
+    assert not writer.add({'text': 'copy 0', 'platform': 'twitter'})
+    assert repository.create_copies.call_count == 2  # two full batches already written
+
+    saved = await writer.close()
+
+    assert [len(c.args[0]) for c in repository.create_copies.call_args_list] == [2, 2, 1]
+    assert [r.text for r in saved] == [f'copy {i}' for i in range(5)]
+    assert {r.platform for r in saved} == {'x'}
+
+
+@pytest.mark.asyncio
+async def test_writer_counts_failed_batches():
+    repository = MagicMock()
+    repository.create_copies = AsyncMock(side_effect=RuntimeError('throttled'))
+    writer = CopyBatchWriter(repository, 's-1', 'u-1', batch_size=1)
+    writer.add({'text': 'a', 'platform': 'x'})
+
+    assert await writer.close() == []
+    assert writer.failed == 1
+
+
+def _sse(body):
+    events = []
+    for frame in body.strip().split('\n\n'):
+        kind, data = frame.split('\n', 1)
+        events.append((kind[len('event: '):], json.loads(data[len('data: '):])))
+    return events
+
+
+def test_stream_keeps_copies_finished_before_a_failure():
+    async def generate_copies_stream(strategy_data):
+        for index, copy in enumerate(COPIES[:2]):
+            yield {'event': 'copy', 'index': index, 'copy': copy.model_dump()}
+        raise RuntimeError('connection reset')
+
+    repository = MagicMock()
+    repository.create_copies = AsyncMock(side_effect=lambda records: records)
+    service = MagicMock()
+    service._get_strategy_with_ownership = AsyncMock(return_value=SimpleNamespace(
+        brand_name='Acme', industry='SaaS', target_audience='All', goals='Grow', strategy_output=None,
+    ))
+    service.copy_writer.side_effect = lambda strategy_id, user_id: CopyBatchWriter(
+        repository, strategy_id, user_id, batch_size=7
+    )
+    service.agent = MagicMock(generate_copies_stream=generate_copies_stream)
+
+    app.dependency_overrides[auth_middleware.get_current_user] = lambda: 'u-1'
+    app.dependency_overrides[get_copy_service] = lambda: service
+    try:
+        response = TestClient(app).post('/api/copy/generate-stream', json={'strategy_id': 's-1'})
+    finally:
+        app.dependency_overrides.pop(auth_middleware.get_current_user)
+        app.dependency_overrides.pop(get_copy_service)
+
+    events = _sse(response.text)
+    assert [kind for kind, _ in events] == ['copy', 'copy', 'saved', 'error']
+    saved = events[2][1]
+    assert [r['text'] for r in saved] == [c.text for c in COPIES[:2]]
+    assert {r['user_id'] for r in saved} == {'u-1'}
+    assert events[3][1]['message'] == 'connection reset'
+
+
+@pytest.mark.asyncio
+async def test_copy_being_sent_is_stored_when_the_client_disconnects():
+    async def generate_copies_stream(strategy_data):
+        for index, copy in enumerate(COPIES):
+            yield {'event': 'copy', 'index': index, 'copy': copy.model_dump()}
+
+    repository = MagicMock()
+    repository.create_copies = AsyncMock(side_effect=lambda records: records)
+    service = MagicMock()
+    service._get_strategy_with_ownership = AsyncMock(return_value=SimpleNamespace(
+        brand_name='Acme', industry='SaaS', target_audience='All', goals='Grow', strategy_output=None,
+    ))
+    service.copy_writer.side_effect = lambda strategy_id, user_id: CopyBatchWriter(
+        repository, strategy_id, user_id, batch_size=7
+    )
+    service.agent = MagicMock(generate_copies_stream=generate_copies_stream)
+
+    response = await copy_routes.generate_copies_stream(
+        copy_routes.CopyGenerateInput(strategy_id='s-1'), user_id='u-1', copy_service=service
+    )
+    stream = response.body_iterator
+    first = await stream.__anext__()
+    # The client leaves while the first copy is being sent
+    await stream.aclose()
+
+    assert first.startswith('event: copy')
+    await asyncio.sleep(0)
+    await asyncio.gather(*CopyBatchWriter._background)
+
+    records = [r for c in repository.create_copies.call_args_list for r in c.args[0]]
+    assert [r.text for r in records] == [COPIES[0].text]
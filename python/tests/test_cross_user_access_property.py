@@ -8,10 +8,11 @@ Validates Requirements 6.6
 import pytest
 from hypothesis import given, settings as hypothesis_settings, strategies as st, HealthCheck
 from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from jose import jwt
 from datetime import datetime, timedelta
 
+from dependencies import get_strategy_service
 from main import app
 from models.strategy import StrategyOutput, StrategyRecord, PlatformRecommendation
 from config import settings as app_settings
@@ -71,7 +72,8 @@ class TestCrossUserAccessProperty:
     @pytest.fixture
     def mock_strategy_service(self):
         """Mock the strategy service to simulate cross-user access scenarios."""
-        with patch('routes.strategy.strategy_service') as mock_service:
+        mock_service = MagicMock()
+        with patch.dict(app.dependency_overrides, {get_strategy_service: lambda: mock_service}):
             yield mock_service
     
     @hypothesis_settings(
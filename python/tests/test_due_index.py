@@ -0,0 +1,221 @@
+"""
+Tests for the sparse DueIndex on scheduled posts.
+
+Covers the dueBucket/dueAt attributes written by SchedulerRepository, the
+bucketed due query, and the backfill migration.
+"""
+
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from migrations.backfill_due_index import backfill
+from repositories.scheduler_repository import (
+    DUE_INDEX,
+    PostBeingPublishedError,
+    compute_due_at,
+    due_attributes,
+)
+from services.publisher_service import PublisherService
+from tests.scheduler_helpers import mock_repository, post_item
+from config import settings
+
+NOW = datetime(2030, 1, 10, 12, 0, tzinfo=UTC)
+DUE_AT = int(datetime(2030, 1, 10, 9, 30, tzinfo=UTC).timestamp())
+
+
+def test_due_attributes_only_for_scheduled_posts():
+    assert compute_due_at('2030-01-10', '09:30') == DUE_AT
+    assert due_attributes('scheduled', '2030-01-10', '09:30') == {
+        'dueBucket': '2030-01-10', 'dueAt': DUE_AT,
+    }
+    assert due_attributes('draft', '2030-01-10', '09:30') == {}
+    assert due_attributes('published', '2030-01-10', '09:30') == {}
+    assert due_attributes('scheduled', 'not-a-date', '09:30') == {}
+
+
+def test_record_to_item_is_sparse():
+    repo = mock_repository()
+    scheduled = repo._item_to_record(post_item())
+    draft = repo._item_to_record(post_item(status='draft'))
+
+    assert repo._record_to_item(scheduled)['dueBucket'] == '2030-01-10'
+    assert repo._record_to_item(scheduled)['dueAt'] == DUE_AT
+    assert 'dueBucket' not in repo._record_to_item(draft)
+    assert 'dueAt' not in repo._record_to_item(draft)
+
+
+@pytest.mark.asyncio
+async def test_publishing_removes_due_attributes_in_one_write():
+    repo = mock_repository()
+    repo.table.update_item.return_value = {'Attributes': post_item(status='published')}
+
+    await repo.update_post('p-1', {'status': 'published'})
+
+    assert repo.table.update_item.call_count == 1
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert 'REMOVE #dueBucket, #dueAt' in kwargs['UpdateExpression']
+
+
+@pytest.mark.asyncio
+async def test_reschedule_resyncs_due_attributes():
+    repo = mock_repository()
+    repo.table.get_item.return_value = {'Item': {'scheduledTime': '09:30', 'status': 'scheduled'}}
+    moved = compute_due_at('2030-02-01', '09:30')
+    repo.table.update_item.return_value = {'Attributes': post_item(
+        scheduledDate='2030-02-01', dueBucket='2030-02-01', dueAt=moved,
+    )}
+
+    await repo.update_post('p-1', {'scheduled_date': '2030-02-01'})
+
+    # The unchanged time and status are read, then one write conditioned on them
+    assert repo.table.get_item.call_args.kwargs['ConsistentRead'] is True
+    assert repo.table.update_item.call_count == 1
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert kwargs['ExpressionAttributeValues'][':due_bucket'] == '2030-02-01'
+    assert kwargs['ExpressionAttributeValues'][':due_at'] == moved
+    assert kwargs['ConditionExpression'] == (
+        '#status <> :publishing AND #read0 = :read0 AND #status = :read1'
+    )
+    assert kwargs['ExpressionAttributeNames']['#read0'] == 'scheduledTime'
+    assert kwargs['ExpressionAttributeValues'][':read0'] == '09:30'
+
+
+@pytest.mark.asyncio
+async def test_reschedule_rereads_when_the_post_changed_since_the_read():
+    repo = mock_repository()
+    repo.table.get_item.side_effect = [
+        {'Item': {'scheduledTime': '09:30', 'status': 'scheduled'}},
+        {'Item': {'scheduledTime': '11:00', 'status': 'scheduled'}},
+    ]
+    conflict = ClientError(
+        {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'}}, 'UpdateItem'
+    )
+    repo.table.update_item.side_effect = [conflict, {'Attributes': post_item(scheduledTime='11:00')}]
+
+    await repo.update_post('p-1', {'scheduled_date': '2030-02-01'})
+
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert kwargs['ExpressionAttributeValues'][':read0'] == '11:00'
+    assert kwargs['ExpressionAttributeValues'][':due_at'] == compute_due_at('2030-02-01', '11:00')
+
+
+@pytest.mark.asyncio
+async def test_reschedule_of_a_post_claimed_since_the_read_is_refused():
+    repo = mock_repository()
+    repo.table.get_item.side_effect = [
+        {'Item': {'scheduledTime': '09:30', 'status': 'scheduled'}},
+        {'Item': {'scheduledTime': '09:30', 'status': 'publishing'}},
+    ]
+    repo.table.update_item.side_effect = ClientError(
+        {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'}}, 'UpdateItem'
+    )
+
+    with pytest.raises(PostBeingPublishedError):
+        await repo.update_post('p-1', {'scheduled_date': '2030-02-01'})
+    assert repo.table.update_item.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_content_edit_does_not_touch_due_attributes():
+    repo = mock_repository()
+    repo.table.update_item.return_value = {'Attributes': post_item(content='new')}
+
+    await repo.update_post('p-1', {'content': 'new'})
+
+    assert repo.table.update_item.call_count == 1
+    assert 'dueBucket' not in str(repo.table.update_item.call_args.kwargs)
+
+
+@pytest.mark.asyncio
+async def test_list_due_posts_queries_each_bucket_up_to_now():
+    repo = mock_repository()
+    later = post_item(postId='p-2', scheduledTime='11:00',
+                  dueAt=compute_due_at('2030-01-10', '11:00'), dueBucket='2030-01-10')
+    earlier = post_item(postId='p-3', scheduledDate='2030-01-09',
+                    dueAt=compute_due_at('2030-01-09', '09:30'), dueBucket='2030-01-09')
+
+    def query(**kwargs):
+        bucket = kwargs['KeyConditionExpression'].get_expression()['values'][0]
+        bucket = bucket.get_expression()['values'][1]
+        return {'Items': {'2030-01-10': [later], '2030-01-09': [earlier]}.get(bucket, [])}
+
+    repo.table.query.side_effect = query
+
+    posts = await repo.list_due_posts(NOW, lookback_days=2)
+
+    assert [p.id for p in posts] == ['p-3', 'p-2']
+    assert repo.table.query.call_count == 3
+    assert all(c.kwargs['IndexName'] == DUE_INDEX for c in repo.table.query.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_list_due_posts_default_lookback_keeps_queries_per_scan_small():
+    repo = mock_repository()
+    repo.table.query.return_value = {'Items': []}
+    repo.table.scan.return_value = {'Items': []}
+
+    await repo.list_due_posts(NOW)
+
+    assert repo.table.query.call_count == settings.publisher_due_lookback_days + 1
+    assert repo.table.query.call_count <= 3
+
+
+@pytest.mark.asyncio
+async def test_list_due_posts_sweeps_for_posts_older_than_the_lookback():
+    repo = mock_repository()
+    repo.table.query.return_value = {'Items': []}
+    aged = post_item(postId='p-old', scheduledDate='2029-11-01',
+                 dueAt=compute_due_at('2029-11-01', '09:30'), dueBucket='2029-11-01')
+    repo.table.scan.return_value = {'Items': [aged]}
+
+    with patch.object(settings, 'publisher_due_aged_sweep_interval_seconds', 3600):
+        first = await repo.list_due_posts(NOW, lookback_days=2)
+        second = await repo.list_due_posts(NOW, lookback_days=2)
+
+    assert [p.id for p in first] == ['p-old']
+    assert second == []  # swept at most once per interval
+    assert repo.table.scan.call_count == 1
+    sweep = repo.table.scan.call_args.kwargs
+    assert sweep['IndexName'] == DUE_INDEX
+    # Only dueAt before the oldest queried bucket (2030-01-08) is swept
+    oldest_bucket = int(datetime(2030, 1, 8, tzinfo=UTC).timestamp())
+    assert oldest_bucket in sweep['FilterExpression'].get_expression()['values'][0] \
+        .get_expression()['values']
+
+
+@pytest.mark.asyncio
+async def test_get_due_posts_uses_index_instead_of_scan():
+    service = PublisherService.__new__(PublisherService)
+    service.scheduler_repository = MagicMock()
+    service.scheduler_repository.list_due_posts = AsyncMock(return_value=[])
+
+    assert await service.get_due_posts() == []
+    service.scheduler_repository.list_due_posts.assert_awaited_once()
+    service.scheduler_repository.table.scan.assert_not_called()
+
+
+def test_backfill_sets_and_removes_due_attributes():
+    table = MagicMock()
+    table.scan.return_value = {'Items': [
+        post_item(postId='needs-index'),
+        post_item(postId='stale', status='published', dueBucket='2030-01-10', dueAt=DUE_AT),
+        post_item(postId='ok', dueBucket='2030-01-10', dueAt=DUE_AT),
+    ]}
+
+    counts = backfill(table)
+
+    assert counts == {'scanned': 3, 'indexed': 1, 'removed': 1, 'unchanged': 1, 'conflicts': 0}
+    updated = {c.kwargs['Key']['postId']: c.kwargs for c in table.update_item.call_args_list}
+    assert updated['needs-index']['ExpressionAttributeValues'][':due_at'] == DUE_AT
+    assert updated['stale']['UpdateExpression'] == 'REMOVE dueBucket, dueAt'
+
+
+def test_backfill_dry_run_writes_nothing():
+    table = MagicMock()
+    table.scan.return_value = {'Items': [post_item()]}
+
+    assert backfill(table, dry_run=True)['indexed'] == 1
+    table.update_item.assert_not_called()
@@ -0,0 +1,168 @@
+"""
+Tests for the pre-publish warm-up stage that uploads images ahead of time.
+"""
+
+import io
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from models.publisher import LinkedInImageUploadResponse, LinkedInPostResponse
+from models.scheduler import ScheduledPostRecord
+from services.publish_scanner import PublishScanner
+from services.publisher_service import PublisherService
+from tests.scheduler_helpers import mock_repository
+
+
+def _post(**overrides):
+    fields = dict(
+        id='p-1', strategy_id='s-1', copy_id='c-1', user_id='u-1', content='t',
+        platform='linkedin', scheduled_date='2030-01-01', scheduled_time='09:00',
+        status='scheduled', media_id='m-1', media_type='image',
+    )
+    fields.update(overrides)
+    return ScheduledPostRecord(**fields)
+
+
+def _service():
+    linkedin = MagicMock()
+    linkedin.initialize_image_upload = AsyncMock(return_value=LinkedInImageUploadResponse(
+        upload_url='https://upload.example/1', image_urn='urn:li:image:1'
+    ))
+    linkedin.upload_image_binary = AsyncMock(return_value=201)
+    linkedin.create_image_post = AsyncMock(
+        return_value=LinkedInPostResponse(status_code=201, post_id='urn:li:share:1')
+    )
+    media_repository = MagicMock()
+    media_repository.get_media_by_id = AsyncMock(
+        return_value={'s3Key': 'media/m-1', 'contentType': 'image/png'}
+    )
+    scheduler_repository = MagicMock()
+    scheduler_repository.set_image_urn = AsyncMock(return_value=True)
+    user_repository = MagicMock()
+    user_repository.get_user_linkedin_credentials = AsyncMock(
+        return_value={'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}
+    )
+    s3_client = MagicMock()
+    s3_client.get_object.side_effect = lambda **kwargs: {
+        'Body': io.BytesIO(b'image'), 'ContentLength': 5,
+    }
+    return PublisherService(
+        linkedin_client=linkedin,
+        publisher_repository=MagicMock(create_log=AsyncMock()),
+        scheduler_repository=scheduler_repository,
+        user_repository=user_repository,
+        media_repository=media_repository,
+        s3_client=s3_client,
+        worker_id='w-1',
+    )
+
+
+@pytest.mark.asyncio
+async def test_prepare_uploads_and_stores_image_urn():
+    service = _service()
+
+    prepared = await service.prepare_posts([
+        _post(),
+        _post(id='p-2', media_id=None),  # text post: nothing to prepare
+        _post(id='p-3', image_urn='urn:li:image:0', image_urn_media_id='m-1'),  # already done
+    ])
+
+    assert prepared == 1
+    service.linkedin_client.upload_image_binary.assert_awaited_once()
+    service.scheduler_repository.set_image_urn.assert_awaited_once_with('p-1', 'm-1', 'urn:li:image:1')
+
+
+@pytest.mark.asyncio
+async def test_prepared_post_only_creates_the_post_at_due_time():
+    service = _service()
+    post = _post(image_urn='urn:li:image:9', image_urn_media_id='m-1')
+
+    response = await service._handle_image_post(post, 'token', 'urn:li:person:sub', 't')
+
+    assert response.status_code == 201
+    service.linkedin_client.create_image_post.assert_awaited_once_with(
+        'token', 'urn:li:person:sub', 't', 'urn:li:image:9'
+    )
+    service.media_repository.get_media_by_id.assert_not_awaited()
+    service.linkedin_client.initialize_image_upload.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_changed_media_is_uploaded_again():
+    service = _service()
+    post = _post(media_id='m-2', image_urn='urn:li:image:9', image_urn_media_id='m-1')
+
+    await service._handle_image_post(post, 'token', 'urn:li:person:sub', 't')
+
+    service.linkedin_client.initialize_image_upload.assert_awaited_once()
+    assert service.linkedin_client.create_image_post.await_args.args[3] == 'urn:li:image:1'
+
+
+@pytest.mark.asyncio
+async def test_rejected_prepared_image_falls_back_to_upload():
+    service = _service()
+    service.linkedin_client.create_image_post.side_effect = [
+        LinkedInPostResponse(status_code=400, error_code='validation_error'),
+        LinkedInPostResponse(status_code=201, post_id='urn:li:share:1'),
+    ]
+    post = _post(image_urn='urn:li:image:9', image_urn_media_id='m-1')
+
+    response = await service._handle_image_post(post, 'token', 'urn:li:person:sub', 't')
+
+    assert response.status_code == 201
+    service.linkedin_client.initialize_image_upload.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_set_image_urn_is_conditional_on_media():
+    repo = mock_repository()
+
+    assert await repo.set_image_urn('p-1', 'm-1', 'urn:li:image:1') is True
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert kwargs['ConditionExpression'] == '#status = :scheduled AND mediaId = :media_id'
+
+    repo.table.update_item.side_effect = ClientError(
+        {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'x'}}, 'UpdateItem'
+    )
+    assert await repo.set_image_urn('p-1', 'm-1', 'urn:li:image:1') is False
+
+
+@pytest.mark.asyncio
+async def test_changing_media_clears_prepared_image():
+    repo = mock_repository()
+    repo.table.update_item.return_value = {'Attributes': repo._record_to_item(_post(media_id='m-2'))}
+
+    await repo.update_post('p-1', {'media_id': 'm-2'})
+
+    remove = repo.table.update_item.call_args.kwargs['UpdateExpression'].split('REMOVE')[1]
+    assert '#imageUrn' in remove and '#imageUrnMediaId' in remove
+
+
+@pytest.mark.asyncio
+async def test_reconciliation_prepares_posts_inside_lookahead():
+    service = MagicMock()
+    service.scheduler_repository = MagicMock()
+    soon = datetime.now(timezone.utc) + timedelta(minutes=10)
+    later = datetime.now(timezone.utc) + timedelta(hours=3)
+    due_soon = _post(scheduled_date=soon.strftime('%Y-%m-%d'), scheduled_time=soon.strftime('%H:%M'))
+    text_soon = _post(id='p-2', media_id=None, scheduled_date=due_soon.scheduled_date,
+                      scheduled_time=due_soon.scheduled_time)
+    due_later = _post(id='p-3', scheduled_date=later.strftime('%Y-%m-%d'),
+                      scheduled_time=later.strftime('%H:%M'))
+    service.scheduler_repository.list_due_posts = AsyncMock(return_value=[due_soon, text_soon, due_later])
+    service.process_posts = AsyncMock()
+    service.prepare_posts = AsyncMock(return_value=1)
+    scanner = PublishScanner(service)
+    scanner.interval = 300
+
+    with patch('services.publish_scanner.settings.publisher_prepare_lookahead_seconds', 900):
+        await scanner._reconcile()
+        await scanner._prepare_task
+
+    service.prepare_posts.assert_awaited_once_with([due_soon])
+    horizon = service.scheduler_repository.list_due_posts.await_args.args[0]
+    assert horizon.timestamp() == pytest.approx(time.time() + 900, abs=5)
@@ -0,0 +1,79 @@
+"""
+Tests for the pooled, long-lived HTTP client inside LinkedInClient.
+"""
+
+import httpx
+import pytest
+
+from services.linkedin_client import LinkedInClient
+
+
+def _client(requests, **kwargs):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/images"):
+            return httpx.Response(200, json={"value": {
+                "uploadUrl": "https://upload.example/abc", "image": "urn:li:image:abc",
+            }})
+        if request.method == "PUT":
+            return httpx.Response(201)
+        return httpx.Response(201, headers={"x-restli-id": "urn:li:share:1"})
+
+    return LinkedInClient(transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_image_post_reuses_one_pooled_client():
+    requests = []
+    client = _client(requests, base_url="https://linkedin.test/rest")
+
+    pool = client.client
+    upload = await client.initialize_image_upload("token", "urn:li:person:x")
+    await client.upload_image_binary(upload.upload_url, b"img", "image/png")
+    response = await client.create_image_post("token", "urn:li:person:x", "hi", upload.image_urn)
+
+    assert response.post_id == "urn:li:share:1"
+    assert client.client is pool
+    assert [str(r.url) for r in requests] == [
+        "https://linkedin.test/rest/images?action=initializeUpload",
+        "https://upload.example/abc",
+        "https://linkedin.test/rest/posts",
+    ]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_uploads_use_their_own_timeout():
+    requests = []
+    client = _client(requests, timeout_seconds=5, upload_timeout_seconds=90)
+
+    await client.create_text_post("token", "urn:li:person:x", "hi")
+    await client.upload_image_binary("https://upload.example/abc", b"img", "image/png")
+
+    assert requests[0].extensions["timeout"]["read"] == 5
+    assert requests[1].extensions["timeout"]["read"] == 90
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_pool_and_allows_reuse():
+    client = _client([])
+    first = client.client
+
+    await client.aclose()
+    assert first.is_closed
+    assert client.client is not first
+    await client.aclose()
+
+
+def test_pool_limits_are_configurable():
+    client = LinkedInClient(max_connections=7, max_keepalive_connections=3, keepalive_expiry_seconds=12)
+
+    assert client.limits.max_connections == 7
+    assert client.limits.max_keepalive_connections == 3
+    assert client.limits.keepalive_expiry == 12
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr(LinkedInClient, "_http2_available", staticmethod(lambda: False))
+    assert LinkedInClient(http2=True).http2 is False
@@ -0,0 +1,91 @@
+"""
+Tests for streaming S3 bodies to LinkedIn and the bytes-in-flight budget.
+"""
+
+import asyncio
+import io
+
+import httpx
+import pytest
+
+from services.linkedin_client import LinkedInClient
+from services.media_stream import ByteBudget, stream_body
+
+
+class _Body(io.BytesIO):
+    """StreamingBody stand-in recording the largest read and whether it was closed."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.max_read = 0
+
+    def read(self, amt=None):
+        chunk = super().read(amt)
+        self.max_read = max(self.max_read, len(chunk))
+        return chunk
+
+
+@pytest.mark.asyncio
+async def test_stream_body_yields_bounded_chunks_and_closes():
+    data = bytes(range(256)) * 1000
+    body = _Body(data)
+
+    chunks = [chunk async for chunk in stream_body(body, chunk_size=4096, buffer_chunks=2)]
+
+    assert b''.join(chunks) == data
+    assert body.max_read <= 4096
+    assert body.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_body_propagates_read_errors():
+    class _Broken(_Body):
+        def read(self, amt=None):
+            raise IOError('connection reset')
+
+    with pytest.raises(IOError):
+        async for _ in stream_body(_Broken(b''), chunk_size=16, buffer_chunks=2):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_caps_concurrent_bytes():
+    budget = ByteBudget(max_bytes=100)
+    peak = 0
+
+    async def upload(size):
+        nonlocal peak
+        async with budget.reserve(size):
+            peak = max(peak, budget.in_flight)
+            await asyncio.sleep(0.01)
+
+    # The oversized upload is admitted on its own rather than deadlocking
+    await asyncio.gather(*(upload(size) for size in (60, 60, 40, 250, 30)))
+
+    assert peak <= 100
+    assert budget.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_upload_streams_with_content_length():
+    received = {}
+
+    def handler(request):
+        received['length'] = request.headers.get('content-length')
+        received['body'] = b''.join(request.stream)
+        return httpx.Response(201)
+
+    async def chunks():
+        yield b'abc'
+        yield b'def'
+
+    client = LinkedInClient(transport=httpx.MockTransport(handler))
+    try:
+        status = await client.upload_image_binary(
+            'https://upload.example/1', chunks(), 'image/png', content_length=6
+        )
+    finally:
+        await client.aclose()
+
+    assert status == 201
+    assert received == {'length': '6', 'body': b'abcdef'}
@@ -0,0 +1,88 @@
+"""
+Tests for the single-read ownership primitives on the repositories.
+
+Each `get_*_for_user` method must distinguish "not found", "forbidden" and
+"ok" from one GetItem call instead of an exists-then-get double read.
+"""
+
+from datetime import datetime, UTC
+from unittest.mock import MagicMock
+
+import pytest
+
+from repositories.copy_repository import CopyRepository
+from repositories.scheduler_repository import SchedulerRepository
+from repositories.strategy_repository import StrategyRepository
+
+NOW = datetime.now(UTC).isoformat()
+
+ITEMS = {
+    CopyRepository: {
+        'copyId': 'id-1', 'strategyId': 's-1', 'userId': 'owner', 'text': 't',
+        'platform': 'linkedin', 'hashtags': [], 'createdAt': NOW, 'updatedAt': NOW,
+    },
+    SchedulerRepository: {
+        'postId': 'id-1', 'strategyId': 's-1', 'copyId': 'c-1', 'userId': 'owner',
+        'content': 't', 'platform': 'linkedin', 'scheduledDate': '2030-01-01',
+        'scheduledTime': '09:00', 'status': 'scheduled', 'createdAt': NOW, 'updatedAt': NOW,
+    },
+    StrategyRepository: {
+        'strategyId': 'id-1', 'userId': 'owner', 'brandName': 'B', 'industry': 'I',
+        'targetAudience': 'A', 'goals': 'G', 'createdAt': NOW,
+        'strategyOutput': {
+            'content_pillars': ['a', 'b', 'c'],
+            'posting_schedule': 'daily',
+            'platform_recommendations': [
+                {'platform': 'LinkedIn', 'rationale': 'r', 'priority': 'high'},
+                {'platform': 'Twitter', 'rationale': 'r', 'priority': 'low'},
+            ],
+            'content_themes': ['1', '2', '3', '4', '5'],
+            'engagement_tactics': ['1', '2', '3', '4'],
+            'visual_prompts': ['a detailed prompt one', 'a detailed prompt two'],
+        },
+    },
+}
+
+LOOKUPS = {
+    CopyRepository: 'get_copy_for_user',
+    SchedulerRepository: 'get_post_for_user',
+    StrategyRepository: 'get_strategy_for_user',
+}
+
+
+def _repository(repo_cls, item):
+    repo = repo_cls.__new__(repo_cls)
+    repo.table = MagicMock()
+    repo.table.get_item.return_value = {'Item': item} if item else {}
+    return repo
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('repo_cls', list(LOOKUPS))
+async def test_owner_gets_record_in_one_read(repo_cls):
+    repo = _repository(repo_cls, ITEMS[repo_cls])
+    record, belongs_to_other = await getattr(repo, LOOKUPS[repo_cls])('id-1', 'owner')
+
+    assert record is not None and record.id == 'id-1'
+    assert belongs_to_other is False
+    assert repo.table.get_item.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('repo_cls', list(LOOKUPS))
+async def test_other_user_is_forbidden(repo_cls):
+    repo = _repository(repo_cls, ITEMS[repo_cls])
+    result = await getattr(repo, LOOKUPS[repo_cls])('id-1', 'intruder')
+
+    assert result == (None, True)
+    assert repo.table.get_item.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('repo_cls', list(LOOKUPS))
+async def test_missing_item_is_not_found(repo_cls):
+    repo = _repository(repo_cls, None)
+    result = await getattr(repo, LOOKUPS[repo_cls])('id-1', 'owner')
+
+    assert result == (None, False)
+    assert repo.table.get_item.call_count == 1
@@ -0,0 +1,163 @@
+"""
+Tests for cursor pagination over DynamoDB queries.
+
+Covers cursor encoding, the single-page and follow-all query helpers, and the
+X-Next-Cursor header / 400 handling on a list endpoint.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from dependencies import get_scheduler_service
+from main import app
+from middleware.auth import auth_middleware
+from repositories.pagination import (
+    InvalidCursorError,
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    query_all,
+    query_page,
+)
+from repositories.scheduler_repository import USER_INDEX_CURSOR_KEY, SchedulerRepository
+
+
+def test_cursor_round_trip():
+    key = {'postId': 'p-1', 'userId': 'u-1', 'scheduledDate': '2030-01-01'}
+    cursor = encode_cursor(key)
+
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == key
+
+
+def test_cursor_serializes_numeric_keys():
+    assert decode_cursor(encode_cursor({'n': Decimal('5'), 'f': Decimal('1.5')})) == {
+        'n': 5, 'f': 1.5,
+    }
+
+
+def test_empty_key_means_no_cursor():
+    assert encode_cursor(None) is None
+    assert encode_cursor({}) is None
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor!', 'WzEsMl0'])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize('key', [
+    {'postId': 'p-1', 'userId': 'u-1'},  # missing the index range key
+    {'postId': 'p-1', 'userId': 'u-1', 'scheduledDate': '2030-01-01', 'extra': 'x'},
+    {'postId': 'p-1', 'userId': {'S': 'u-1'}, 'scheduledDate': '2030-01-01'},
+    {'postId': 5, 'userId': 'u-1', 'scheduledDate': '2030-01-01'},
+])
+def test_cursor_with_wrong_key_attributes_is_rejected(key):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(key), USER_INDEX_CURSOR_KEY)
+
+
+@pytest.mark.asyncio
+async def test_repository_rejects_foreign_cursor_before_querying():
+    repo = SchedulerRepository.__new__(SchedulerRepository)
+    repo.table = MagicMock()
+    # A strategy-index cursor replayed against the user index
+    cursor = encode_cursor({'postId': 'p-1', 'strategyId': 's-1', 'scheduledDate': '2030-01-01'})
+
+    with pytest.raises(InvalidCursorError):
+        await repo.list_posts_by_user_page('u-1', 10, cursor)
+
+    repo.table.query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_query_page_passes_limit_and_start_key():
+    table = MagicMock()
+    table.query.return_value = {'Items': [{'postId': 'p-2'}], 'LastEvaluatedKey': {'postId': 'p-2'}}
+
+    items, next_cursor = await query_page(
+        table, limit=1, cursor=encode_cursor({'postId': 'p-1'}),
+        key_attributes=('postId',), IndexName='UserIdIndex',
+    )
+
+    assert items == [{'postId': 'p-2'}]
+    assert decode_cursor(next_cursor) == {'postId': 'p-2'}
+    kwargs = table.query.call_args.kwargs
+    assert kwargs['Limit'] == 1
+    assert kwargs['ExclusiveStartKey'] == {'postId': 'p-1'}
+    assert kwargs['IndexName'] == 'UserIdIndex'
+
+
+@pytest.mark.asyncio
+async def test_query_all_follows_last_evaluated_key():
+    table = MagicMock()
+    table.query.side_effect = [
+        {'Items': [{'id': 1}], 'LastEvaluatedKey': {'id': 1}},
+        {'Items': [{'id': 2}], 'LastEvaluatedKey': {'id': 2}},
+        {'Items': [{'id': 3}]},
+    ]
+
+    items = await query_all(table, IndexName='UserIdIndex')
+
+    assert items == [{'id': 1}, {'id': 2}, {'id': 3}]
+    assert table.query.call_count == 3
+    assert table.query.call_args.kwargs['ExclusiveStartKey'] == {'id': 2}
+
+
+@pytest.mark.asyncio
+async def test_repository_list_reads_past_first_page():
+    repo = SchedulerRepository.__new__(SchedulerRepository)
+    repo.table = MagicMock()
+    item = {
+        'postId': 'p-1', 'strategyId': 's-1', 'copyId': 'c-1', 'userId': 'u-1',
+        'content': 't', 'platform': 'linkedin', 'scheduledDate': '2030-01-01',
+        'scheduledTime': '09:00', 'status': 'scheduled',
+        'createdAt': '2030-01-01T00:00:00+00:00', 'updatedAt': '2030-01-01T00:00:00+00:00',
+    }
+    repo.table.query.side_effect = [
+        {'Items': [item], 'LastEvaluatedKey': {'postId': 'p-1'}},
+        {'Items': [dict(item, postId='p-2')]},
+    ]
+
+    posts = await repo.list_posts_by_user('u-1')
+
+    assert [p.id for p in posts] == ['p-1', 'p-2']
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[auth_middleware.get_current_user] = lambda: 'u-1'
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_list_endpoint_sets_next_cursor_header(client):
+    service = MagicMock()
+    service.list_posts_by_user_page = AsyncMock(return_value=([], 'next-token'))
+    with patch.dict(app.dependency_overrides, {get_scheduler_service: lambda: service}):
+        response = client.get('/api/scheduler/posts', params={'limit': 10})
+
+    assert response.status_code == 200
+    assert response.headers[NEXT_CURSOR_HEADER] == 'next-token'
+    service.list_posts_by_user_page.assert_awaited_once_with(
+        'u-1', 10, None, date_from=None, date_to=None
+    )
+
+
+def test_list_endpoint_rejects_bad_cursor(client):
+    service = MagicMock()
+    service.list_posts_by_user_page = AsyncMock(side_effect=InvalidCursorError('Invalid pagination cursor'))
+    with patch.dict(app.dependency_overrides, {get_scheduler_service: lambda: service}):
+        response = client.get('/api/scheduler/posts', params={'cursor': 'garbage'})
+
+    assert response.status_code == 400
+
+
+def test_list_endpoint_rejects_oversized_limit(client):
+    response = client.get('/api/scheduler/posts', params={'limit': 1000})
+    assert response.status_code == 422
@@ -0,0 +1,220 @@
+"""
+Tests for the conditional-write claim protocol used when publishing.
+
+Repository tests check the conditional updates sent to DynamoDB; service
+tests run two workers against an in-memory claim store and verify each post
+reaches LinkedIn exactly once.
+"""
+
+import asyncio
+import time
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+
+from models.publisher import LinkedInPostResponse
+from models.scheduler import ScheduledPostRecord, ScheduledPostUpdate
+from repositories.scheduler_repository import PostBeingPublishedError
+from services.publisher_service import PublisherService
+from services.scheduler_service import SchedulerService
+from tests.scheduler_helpers import mock_repository, post_item
+
+# Claims operate on posts that are already being published
+_item = partial(post_item, scheduledDate='2030-01-01', scheduledTime='09:00', status='publishing')
+
+
+def _conditional_failure():
+    return ClientError(
+        {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'}}, 'UpdateItem'
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_is_conditional_and_carries_lease():
+    repo = mock_repository()
+    repo.table.update_item.return_value = {'Attributes': _item(leaseOwner='w-1')}
+
+    record = await repo.claim_post('p-1', 'w-1', lease_seconds=60)
+
+    assert record.status == 'publishing'
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert kwargs['ConditionExpression'] == (
+        '#status IN (:from0) OR (#status = :publishing AND leaseExpiresAt <= :now)'
+    )
+    values = kwargs['ExpressionAttributeValues']
+    assert values[':owner'] == 'w-1'
+    assert values[':expires'] - values[':now'] == 60
+
+
+@pytest.mark.asyncio
+async def test_claim_lost_to_another_worker_returns_none():
+    repo = mock_repository()
+    repo.table.update_item.side_effect = _conditional_failure()
+
+    assert await repo.claim_post('p-1', 'w-2', lease_seconds=60) is None
+
+
+@pytest.mark.asyncio
+async def test_complete_requires_lease_and_clears_due_attributes():
+    repo = mock_repository()
+    events = []
+    repo.add_change_listener(lambda post_id, due_at: events.append((post_id, due_at)))
+
+    assert await repo.complete_publish('p-1', 'w-1') is True
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert kwargs['ConditionExpression'] == '#status = :publishing AND leaseOwner = :owner'
+    assert 'dueBucket' in kwargs['UpdateExpression'].split('REMOVE')[1]
+    assert events == [('p-1', None)]
+
+    repo.table.update_item.side_effect = _conditional_failure()
+    assert await repo.complete_publish('p-1', 'w-1') is False
+
+
+@pytest.mark.asyncio
+async def test_release_restores_previous_status_without_notifying():
+    repo = mock_repository()
+    events = []
+    repo.add_change_listener(lambda post_id, due_at: events.append((post_id, due_at)))
+
+    assert await repo.release_claim('p-1', 'w-1') is True
+    assert repo.table.update_item.call_args.kwargs['UpdateExpression'].startswith(
+        'SET #status = claimedFrom'
+    )
+    assert events == []
+
+
+@pytest.mark.asyncio
+async def test_edit_is_conditional_on_the_post_not_being_published():
+    repo = mock_repository()
+    repo.table.update_item.side_effect = _conditional_failure()
+
+    with pytest.raises(PostBeingPublishedError):
+        await repo.update_post('p-1', {'content': 'new'})
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert kwargs['ConditionExpression'] == '#status <> :publishing'
+    assert kwargs['ExpressionAttributeValues'][':publishing'] == 'publishing'
+
+
+@pytest.mark.asyncio
+async def test_edit_racing_a_claim_returns_409():
+    # The service reads the post before a publisher claims it
+    repository = MagicMock()
+    repository.get_post_for_user = AsyncMock(return_value=(_post('p-1'), False))
+    repository.update_post = AsyncMock(side_effect=PostBeingPublishedError('p-1'))
+    service = SchedulerService(MagicMock(), repository, MagicMock(), MagicMock())
+
+    with pytest.raises(HTTPException) as excinfo:
+        await service.update_post('p-1', ScheduledPostUpdate(content='new'), 'u-1')
+
+    assert excinfo.value.status_code == 409
+
+
+class _ClaimStore:
+    """In-memory stand-in for the claim-related SchedulerRepository methods."""
+
+    def __init__(self, posts):
+        self.posts = {p.id: p for p in posts}
+        self.leases = {}
+
+    async def claim_post(self, post_id, owner, lease_seconds, from_statuses=('scheduled',)):
+        await asyncio.sleep(0)
+        post = self.posts[post_id]
+        lease = self.leases.get(post_id)
+        expired = lease is not None and lease[1] <= time.time()
+        if post.status in from_statuses or (post.status == 'publishing' and expired):
+            post.status = 'publishing'
+            self.leases[post_id] = (owner, time.time() + lease_seconds)
+            return post.model_copy()
+        return None
+
+    async def complete_publish(self, post_id, owner, with_writes=None):
+        if self.leases.get(post_id, (None,))[0] != owner:
+            return False
+        self.posts[post_id].status = 'published'
+        del self.leases[post_id]
+        return True
+
+    async def release_claim(self, post_id, owner):
+        if self.leases.get(post_id, (None,))[0] != owner:
+            return False
+        self.posts[post_id].status = 'scheduled'
+        del self.leases[post_id]
+        return True
+
+
+def _post(post_id):
+    return ScheduledPostRecord(
+        id=post_id, strategy_id='s-1', copy_id='c-1', user_id='u-1', content='t',
+        platform='linkedin', scheduled_date='2020-01-01', scheduled_time='09:00',
+        status='scheduled',
+    )
+
+
+def _worker(store, linkedin, worker_id):
+    user_repository = MagicMock()
+    user_repository.get_user_linkedin_credentials = AsyncMock(
+        return_value={'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}
+    )
+    return PublisherService(
+        linkedin_client=linkedin,
+        publisher_repository=MagicMock(create_log=AsyncMock()),
+        scheduler_repository=store,
+        user_repository=user_repository,
+        media_repository=MagicMock(),
+        s3_client=MagicMock(),
+        worker_id=worker_id,
+    )
+
+
+def _linkedin(status_code=201):
+    linkedin = MagicMock()
+    linkedin.format_commentary.side_effect = lambda content, hashtags: content
+
+    async def create_text_post(token, urn, commentary):
+        await asyncio.sleep(0.01)
+        return LinkedInPostResponse(status_code=status_code, post_id='urn:li:share:1')
+
+    linkedin.create_text_post = AsyncMock(side_effect=create_text_post)
+    return linkedin
+
+
+@pytest.mark.asyncio
+async def test_two_workers_publish_each_post_once():
+    posts = [_post(f'p-{i}') for i in range(5)]
+    store = _ClaimStore(posts)
+    linkedin = _linkedin()
+    workers = [_worker(store, linkedin, 'w-1'), _worker(store, linkedin, 'w-2')]
+
+    # Each worker has its own processing set, as separate replicas would
+    await asyncio.gather(*(w.process_posts(list(posts), set()) for w in workers))
+
+    assert linkedin.create_text_post.await_count == len(posts)
+    assert all(p.status == 'published' for p in store.posts.values())
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_releases_claim():
+    store = _ClaimStore([_post('p-1')])
+    worker = _worker(store, _linkedin(status_code=500), 'w-1')
+
+    # Without schedule_retry (manual publish) the claim is simply handed back
+    claimed = await worker.claim_post(_post('p-1'))
+    await worker.publish_post(claimed, {'linkedinAccessToken': 'token', 'linkedinSub': 'sub'})
+
+    assert store.posts['p-1'].status == 'scheduled'
+    assert store.leases == {}
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_recovered_by_another_worker():
+    store = _ClaimStore([_post('p-1')])
+    await store.claim_post('p-1', 'crashed-worker', lease_seconds=-1)
+    linkedin = _linkedin()
+
+    await _worker(store, linkedin, 'w-2').process_posts([store.posts['p-1']], set())
+
+    assert linkedin.create_text_post.await_count == 1
+    assert store.posts['p-1'].status == 'published'
@@ -0,0 +1,125 @@
+"""
+Tests for draining in-flight publishes when the publish scanner stops.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.publisher import LinkedInPostResponse
+from models.scheduler import ScheduledPostRecord
+from services.publish_scanner import PublishScanner
+from services.publisher_service import PublisherService
+
+OK = LinkedInPostResponse(status_code=201, post_id='urn:li:share:1')
+
+
+def _post(post_id):
+    return ScheduledPostRecord(
+        id=post_id, strategy_id='s-1', copy_id='c-1', user_id='u-1', content=post_id,
+        platform='linkedin', scheduled_date='2020-01-01', scheduled_time='09:00',
+        status='scheduled',
+    )
+
+
+def _service(create_text_post, claim_post=None):
+    scheduler_repository = MagicMock()
+    scheduler_repository.claim_post = AsyncMock(
+        side_effect=claim_post or (lambda post_id, *args: _post(post_id))
+    )
+    scheduler_repository.complete_publish = AsyncMock(return_value=True)
+    scheduler_repository.release_claim = AsyncMock(return_value=True)
+    user_repository = MagicMock()
+    user_repository.get_user_linkedin_credentials = AsyncMock(
+        return_value={'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}
+    )
+    linkedin = MagicMock()
+    linkedin.format_commentary.side_effect = lambda content, hashtags: content
+    linkedin.create_text_post = AsyncMock(side_effect=create_text_post)
+    return PublisherService(
+        linkedin_client=linkedin,
+        publisher_repository=MagicMock(create_log=AsyncMock()),
+        scheduler_repository=scheduler_repository,
+        user_repository=user_repository,
+        media_repository=MagicMock(),
+        s3_client=MagicMock(),
+        worker_id='w-1',
+    )
+
+
+def _running_scanner(service, posts):
+    """A scanner whose loop is busy publishing `posts`."""
+    scanner = PublishScanner(service)
+    scanner._running = True
+    scanner._task = asyncio.create_task(service.process_posts(posts, set()))
+    return scanner
+
+
+@pytest.mark.asyncio
+async def test_draining_stops_new_claims_but_finishes_claimed_posts():
+    gate = asyncio.Event()
+    service = None
+
+    async def claim_post(post_id, *args):
+        if post_id != 'p-0':
+            await gate.wait()
+        return _post(post_id)
+
+    async def create_text_post(token, urn, commentary):
+        # Shutdown begins while p-0 is being published and p-1 is being claimed
+        service.start_drain()
+        gate.set()
+        return OK
+
+    service = _service(create_text_post, claim_post)
+
+    await service.process_posts([_post(f'p-{i}') for i in range(3)], set())
+
+    service.linkedin_client.create_text_post.assert_awaited_once()
+    service.scheduler_repository.complete_publish.assert_awaited_once()
+    # p-1's claim landed after draining began and is handed back; p-2 is never claimed
+    service.scheduler_repository.release_claim.assert_awaited_once_with('p-1', 'w-1')
+    assert service.scheduler_repository.claim_post.await_count == 2
+    assert service.drained == 1 and service.in_flight_post_ids == set()
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_publish_to_be_recorded():
+    started = asyncio.Event()
+
+    async def create_text_post(token, urn, commentary):
+        started.set()
+        await asyncio.sleep(0.05)
+        return OK
+
+    service = _service(create_text_post)
+    scanner = _running_scanner(service, [_post('p-0')])
+    await started.wait()
+
+    report = await scanner.stop(timeout=5)
+
+    assert report == {'drained': 1, 'abandoned': 0}
+    service.scheduler_repository.complete_publish.assert_awaited_once()
+    assert scanner.stats()['last_drain'] == report
+
+
+@pytest.mark.asyncio
+async def test_stop_abandons_publishes_past_the_deadline():
+    started = asyncio.Event()
+
+    async def create_text_post(token, urn, commentary):
+        started.set()
+        await asyncio.Event().wait()  # LinkedIn never answers
+
+    service = _service(create_text_post)
+    scanner = _running_scanner(service, [_post('p-0')])
+    await started.wait()
+
+    report = await scanner.stop(timeout=0.05)
+
+    assert report == {'drained': 0, 'abandoned': 1}
+    assert scanner._task.cancelled()
+    # The lease is kept: releasing it could publish the post twice
+    service.scheduler_repository.release_claim.assert_not_awaited()
+    service.scheduler_repository.complete_publish.assert_not_awaited()
@@ -0,0 +1,114 @@
+"""
+Tests for the bounded, staged publish pipeline.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from services.publish_pipeline import Pipeline, PipelineStage
+
+
+class _Item:
+    def __init__(self, lane, sequence):
+        self.lane = lane
+        self.sequence = sequence
+        self.error = None
+
+
+def _jittered(log):
+    async def handler(item):
+        await asyncio.sleep(random.random() / 200)
+        log.append((item.lane, item.sequence))
+        return item
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_ordered_stage_keeps_lane_order_while_lanes_overlap():
+    handled = []
+    active = {'now': 0, 'peak': 0}
+
+    async def ordered(item):
+        active['now'] += 1
+        active['peak'] = max(active['peak'], active['now'])
+        await asyncio.sleep(0.01)
+        active['now'] -= 1
+        handled.append((item.lane, item.sequence))
+        return item
+
+    pipeline = Pipeline(
+        [
+            # Unordered, jittery first stage reorders items before the ordered one
+            PipelineStage("shuffle", _jittered([]), concurrency=8, queue_size=2),
+            PipelineStage("ordered", ordered, concurrency=4, queue_size=2,
+                          ordered_by=lambda item: (item.lane, item.sequence)),
+        ],
+        on_error=lambda item, e: None,
+    )
+    items = [_Item(lane, i) for i in range(5) for lane in 'abcd']
+
+    await pipeline.run(items)
+
+    for lane in 'abcd':
+        assert [s for l, s in handled if l == lane] == list(range(5))
+    assert 1 < active['peak'] <= 4
+    assert pipeline.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_item_reaches_later_stages():
+    seen = []
+
+    async def explode(item):
+        if item.sequence == 1:
+            raise RuntimeError('boom')
+        return item
+
+    async def record(item):
+        seen.append((item.sequence, item.error))
+        return item
+
+    def on_error(item, error):
+        item.error = str(error)
+
+    pipeline = Pipeline(
+        [
+            PipelineStage("explode", explode, concurrency=2, queue_size=1),
+            PipelineStage("record", record, concurrency=1, queue_size=1,
+                          ordered_by=lambda item: (item.lane, item.sequence)),
+        ],
+        on_error=on_error,
+    )
+
+    await pipeline.run([_Item('a', i) for i in range(3)])
+
+    assert seen == [(0, None), (1, 'boom'), (2, None)]
+    stats = pipeline.snapshot()['stages'][0]
+    assert stats['processed'] == 3 and stats['errors'] == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_reports_depth_while_running():
+    release = asyncio.Event()
+
+    async def slow(item):
+        await release.wait()
+        return item
+
+    stage = PipelineStage("slow", slow, concurrency=1, queue_size=3)
+    pipeline = Pipeline([stage], on_error=lambda item, e: None)
+
+    run = asyncio.create_task(pipeline.run([_Item('a', i) for i in range(10)]))
+    await asyncio.sleep(0.01)
+
+    # One item in the worker, the queue full, the producer blocked on the rest
+    assert stage.stats.in_progress == 1
+    assert stage.depth == 3
+    assert pipeline.snapshot()['active_runs'] == 1
+
+    release.set()
+    await run
+    assert stage.depth == 0 and stage.stats.processed == 10
+    assert pipeline.snapshot()['active_runs'] == 0
@@ -0,0 +1,170 @@
+"""
+Tests for backed-off publish retries and the terminal "failed" status.
+"""
+
+import random
+import time
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from models.publisher import LinkedInPostResponse
+from models.scheduler import ScheduledPostRecord
+from repositories.scheduler_repository import (
+    compute_due_at,
+    due_attributes,
+    post_due_at,
+)
+from services.publish_retry import DEFAULT_BACKOFF, RETRY_BACKOFF, retry_delay
+from services.publisher_service import PublisherService
+from tests.scheduler_helpers import mock_repository, post_item
+
+_item = partial(post_item, scheduledDate='2030-01-01', scheduledTime='09:00')
+
+
+def test_backoff_grows_per_error_class_and_is_capped():
+    rng = random.Random(7)
+    base, cap = RETRY_BACKOFF['network_error']
+    delays = [retry_delay('network_error', attempt, rng) for attempt in range(1, 12)]
+
+    for attempt, delay in enumerate(delays, start=1):
+        backoff = min(cap, base * 2 ** (attempt - 1))
+        assert backoff / 2 <= delay <= backoff
+    assert max(delays) <= cap
+    # Unknown errors back off much further than transient ones
+    assert retry_delay('token_expired', 1, rng) >= DEFAULT_BACKOFF[0] / 2
+
+
+def test_jitter_spreads_simultaneous_failures():
+    rng = random.Random(1)
+    delays = {round(retry_delay('linkedin_server_error', 3, rng), 3) for _ in range(50)}
+    assert len(delays) > 40
+
+
+def test_pending_retry_moves_due_time():
+    scheduled = compute_due_at('2030-01-01', '09:00')
+
+    assert due_attributes('scheduled', '2030-01-01', '09:00', scheduled + 600)['dueAt'] == scheduled + 600
+    # A retry time before the scheduled time never makes a post due early
+    assert due_attributes('scheduled', '2030-01-01', '09:00', scheduled - 600)['dueAt'] == scheduled
+    assert due_attributes('failed', '2030-01-01', '09:00', scheduled + 600) == {}
+
+
+@pytest.mark.asyncio
+async def test_schedule_retry_reindexes_at_retry_time():
+    repo = mock_repository()
+    retry_at = compute_due_at('2030-01-01', '09:30')
+    stale = _item(attemptCount=2, nextAttemptAt=retry_at, dueBucket='2030-01-01',
+                  dueAt=compute_due_at('2030-01-01', '09:00'))
+    repo.table.update_item.side_effect = [
+        {'Attributes': stale},
+        {'Attributes': {**stale, 'dueAt': retry_at}},
+    ]
+    events = []
+    repo.add_change_listener(lambda post_id, due_at: events.append((post_id, due_at)))
+
+    assert await repo.schedule_retry('p-1', 'w-1', 2, retry_at) is True
+
+    claim_write, due_write = repo.table.update_item.call_args_list
+    assert claim_write.kwargs['ConditionExpression'] == '#status = :publishing AND leaseOwner = :owner'
+    assert due_write.kwargs['ExpressionAttributeValues'][':due_at'] == retry_at
+    assert events == [('p-1', retry_at)]
+
+
+@pytest.mark.asyncio
+async def test_fail_post_leaves_due_index():
+    repo = mock_repository()
+    events = []
+    repo.add_change_listener(lambda post_id, due_at: events.append((post_id, due_at)))
+
+    assert await repo.fail_post('p-1', 'w-1', 5) is True
+
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert kwargs['ExpressionAttributeValues'][':failed'] == 'failed'
+    assert 'dueAt' in kwargs['UpdateExpression'].split('REMOVE')[1]
+    assert events == [('p-1', None)]
+
+
+@pytest.mark.asyncio
+async def test_rescheduling_resets_retry_budget():
+    repo = mock_repository()
+    repo.table.update_item.return_value = {'Attributes': _item(scheduledDate='2030-02-01')}
+
+    await repo.update_post('p-1', {'scheduled_date': '2030-02-01', 'scheduled_time': '09:00',
+                                   'status': 'scheduled'})
+
+    kwargs = repo.table.update_item.call_args.kwargs
+    remove = kwargs['UpdateExpression'].split('REMOVE')[1]
+    assert '#attemptCount' in remove and '#nextAttemptAt' in remove
+
+
+def test_item_round_trip_keeps_retry_state():
+    repo = mock_repository()
+    record = repo._item_to_record(_item(attemptCount=3, nextAttemptAt=1_900_000_000))
+
+    assert record.attempt_count == 3
+    assert post_due_at(record) == 1_900_000_000
+    item = repo._record_to_item(record)
+    assert item['attemptCount'] == 3 and item['dueAt'] == 1_900_000_000
+
+
+def _post(attempt_count=0):
+    return ScheduledPostRecord(
+        id='p-1', strategy_id='s-1', copy_id='c-1', user_id='u-1', content='t',
+        platform='linkedin', scheduled_date='2020-01-01', scheduled_time='09:00',
+        status='scheduled', attempt_count=attempt_count,
+    )
+
+
+def _service(error_code, attempt_count):
+    scheduler_repository = MagicMock()
+    scheduler_repository.claim_post = AsyncMock(
+        return_value=_post(attempt_count).model_copy(update={'status': 'publishing'})
+    )
+    for method in ('schedule_retry', 'fail_post', 'release_claim'):
+        setattr(scheduler_repository, method, AsyncMock(return_value=True))
+    user_repository = MagicMock()
+    user_repository.get_user_linkedin_credentials = AsyncMock(
+        return_value={'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}
+    )
+    linkedin = MagicMock()
+    linkedin.format_commentary.side_effect = lambda content, hashtags: content
+    linkedin.create_text_post = AsyncMock(return_value=LinkedInPostResponse(
+        status_code=503 if error_code == 'linkedin_server_error' else 0, error_code=error_code,
+    ))
+    return PublisherService(
+        linkedin_client=linkedin,
+        publisher_repository=MagicMock(create_log=AsyncMock()),
+        scheduler_repository=scheduler_repository,
+        user_repository=user_repository,
+        media_repository=MagicMock(),
+        s3_client=MagicMock(),
+        worker_id='w-1',
+    )
+
+
+@pytest.mark.asyncio
+async def test_scanner_failure_schedules_backed_off_retry():
+    service = _service('network_error', attempt_count=1)
+
+    before = time.time()
+    await service.process_posts([_post(1)], set())
+
+    post_id, owner, attempt, next_attempt_at = service.scheduler_repository.schedule_retry.await_args.args
+    assert (post_id, owner, attempt) == ('p-1', 'w-1', 2)
+    base, _ = RETRY_BACKOFF['network_error']
+    # next_attempt_at is truncated to whole seconds
+    assert int(before) + base <= next_attempt_at <= time.time() + 2 * base + 1
+    service.scheduler_repository.release_claim.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_marks_post_failed():
+    service = _service('linkedin_server_error', attempt_count=2)
+
+    with patch('services.publish_retry.settings.publisher_retry_max_attempts', 3):
+        await service.process_posts([_post(2)], set())
+
+    service.scheduler_repository.fail_post.assert_awaited_once_with('p-1', 'w-1', 3)
+    service.scheduler_repository.schedule_retry.assert_not_awaited()
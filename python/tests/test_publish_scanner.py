@@ -0,0 +1,132 @@
+"""
+Tests for the event-driven publish scanner and the scheduled-post change feed.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models.scheduler import ScheduledPostRecord
+from services.publish_scanner import PublishScanner
+from tests.scheduler_helpers import mock_repository
+
+
+def _record(status='scheduled', date='2030-01-10', time_='09:30'):
+    return ScheduledPostRecord(
+        id='p-1', strategy_id='s-1', copy_id='c-1', user_id='u-1', content='t',
+        platform='linkedin', scheduled_date=date, scheduled_time=time_, status=status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_feed_listeners():
+    repo = mock_repository()
+    events = []
+    repo.add_change_listener(lambda post_id, due_at: events.append((post_id, due_at)))
+    repo.table.delete_item.return_value = {'Attributes': {'postId': 'p-1'}}
+
+    await repo.create_post(_record())
+    await repo.create_post(_record(status='draft'))
+    await repo.delete_post('p-1')
+
+    assert events[0][0] == 'p-1' and isinstance(events[0][1], int)
+    assert events[1:] == [('p-1', None), ('p-1', None)]
+
+
+@pytest.mark.asyncio
+async def test_failing_listener_does_not_fail_write():
+    repo = mock_repository()
+
+    def broken(post_id, due_at):
+        raise RuntimeError('boom')
+
+    repo.add_change_listener(broken)
+    assert await repo.create_post(_record()) is not None
+
+    repo.remove_change_listener(broken)
+    assert repo._change_listeners == ()
+
+
+def _scanner(interval=3600):
+    service = MagicMock()
+    service.scheduler_repository = MagicMock()
+    service.scheduler_repository.list_due_posts = AsyncMock(return_value=[])
+    service.process_posts = AsyncMock()
+    service.run_posts_cycle = AsyncMock()
+    scanner = PublishScanner(service)
+    scanner.interval = interval
+    return scanner, service
+
+
+def test_heap_tracks_latest_due_time_per_post():
+    scanner, _ = _scanner()
+    scanner._seeded_until = 1_000
+
+    scanner.on_post_change('a', 100)
+    scanner.on_post_change('b', 50)
+    scanner.on_post_change('a', 300)   # rescheduled: old entry becomes stale
+    scanner.on_post_change('c', 60)
+    scanner.on_post_change('c', None)  # unscheduled
+    scanner.on_post_change('d', 5_000)  # beyond the seeded horizon
+
+    assert scanner._pop_due(200) == ['b']
+    assert scanner._pop_due(400) == ['a']
+    assert scanner._pop_due(10_000) == []
+
+
+@pytest.mark.asyncio
+async def test_scanner_fires_at_due_time_without_polling():
+    scanner, service = _scanner()
+    fired = asyncio.Event()
+    service.run_posts_cycle.side_effect = lambda ids, processing: fired.set()
+
+    await scanner.start()
+    try:
+        await asyncio.sleep(0.05)  # initial reconciliation
+        scanner.on_post_change('p-1', int(time.time()) + 1)
+        await asyncio.wait_for(fired.wait(), timeout=3)
+    finally:
+        await scanner.stop()
+
+    service.run_posts_cycle.assert_awaited_once()
+    assert service.run_posts_cycle.await_args.args[0] == ['p-1']
+    # Only the startup reconciliation touched the table
+    assert service.scheduler_repository.list_due_posts.await_count == 1
+    service.scheduler_repository.remove_change_listener.assert_called_once_with(
+        scanner.on_post_change
+    )
+
+
+@pytest.mark.asyncio
+async def test_reconciliation_publishes_overdue_and_arms_upcoming():
+    scanner, service = _scanner()
+    overdue = _record(date='2020-01-01')
+    upcoming = _record(date='2999-01-01')
+    upcoming.id = 'p-2'
+    service.scheduler_repository.list_due_posts.return_value = [overdue, upcoming]
+
+    await scanner._reconcile()
+
+    service.process_posts.assert_awaited_once()
+    assert service.process_posts.await_args.args[0] == [overdue]
+    assert list(scanner._due_at) == ['p-2']
+
+
+@pytest.mark.asyncio
+async def test_reconciliation_arms_live_claims_at_lease_expiry():
+    scanner, service = _scanner()
+    expires_at = int(time.time()) + 120
+    claimed = _record(status='publishing', date='2020-01-01')
+    claimed.lease_expires_at = expires_at
+    abandoned = _record(status='publishing', date='2020-01-01')
+    abandoned.id = 'p-2'
+    abandoned.lease_expires_at = int(time.time()) - 1
+    service.scheduler_repository.list_due_posts.return_value = [claimed, abandoned]
+
+    await scanner._reconcile()
+
+    # The lease is still live, so the post is not retaken before it expires
+    assert service.process_posts.await_args.args[0] == [abandoned]
+    assert scanner._due_at == {'p-1': expires_at}
@@ -0,0 +1,127 @@
+"""
+Tests for the transactional publish write and the batched skip logs.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from models.publisher import LinkedInPostResponse, PublishLogRecord
+from models.scheduler import ScheduledPostRecord
+from repositories.publisher_repository import PublisherRepository
+from repositories.scheduler_repository import SchedulerRepository
+from services.publisher_service import PublisherService
+
+
+def _post(post_id, user_id='u-1'):
+    return ScheduledPostRecord(
+        id=post_id, strategy_id='s-1', copy_id='c-1', user_id=user_id, content='t',
+        platform='linkedin', scheduled_date='2020-01-01', scheduled_time='09:00',
+        status='scheduled',
+    )
+
+
+def _repositories():
+    scheduler = SchedulerRepository.__new__(SchedulerRepository)
+    scheduler.table = MagicMock()
+    scheduler.table.name = 'scheduled-posts'
+    publisher = PublisherRepository.__new__(PublisherRepository)
+    publisher.table_name = 'publish-log'
+    publisher.table = MagicMock()
+    return scheduler, publisher
+
+
+@pytest.mark.asyncio
+async def test_status_and_log_commit_in_one_transaction():
+    scheduler, publisher = _repositories()
+    events = []
+    scheduler.add_change_listener(lambda post_id, due_at: events.append((post_id, due_at)))
+    log = PublishLogRecord(post_id='p-1', user_id='u-1', status='published', linkedin_post_id='x')
+
+    assert await scheduler.complete_publish('p-1', 'w-1', with_writes=[publisher.log_put(log)])
+
+    scheduler.table.update_item.assert_not_called()
+    update, put = scheduler.table.meta.client.transact_write_items.call_args.kwargs['TransactItems']
+    assert update['Update']['TableName'] == 'scheduled-posts'
+    assert update['Update']['ConditionExpression'] == '#status = :publishing AND leaseOwner = :owner'
+    assert put == {'Put': {'TableName': 'publish-log', 'Item': publisher._record_to_item(log)}}
+    assert events == [('p-1', None)]
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_cancels_the_whole_transaction():
+    scheduler, _ = _repositories()
+    scheduler.table.meta.client.transact_write_items.side_effect = ClientError(
+        {
+            'Error': {'Code': 'TransactionCanceledException', 'Message': 'cancelled'},
+            'CancellationReasons': [{'Code': 'ConditionalCheckFailed'}, {'Code': 'None'}],
+        },
+        'TransactWriteItems',
+    )
+
+    assert await scheduler.complete_publish('p-1', 'w-1', with_writes=[{'Put': {}}]) is False
+
+
+def _service(credentials):
+    scheduler_repository = MagicMock()
+    scheduler_repository.claim_post = AsyncMock(side_effect=lambda post_id, *args: _post(post_id))
+    scheduler_repository.complete_publish = AsyncMock(return_value=True)
+    scheduler_repository.release_claim = AsyncMock(return_value=True)
+    publisher_repository = MagicMock(create_log=AsyncMock(), create_logs=AsyncMock())
+    publisher_repository.log_put.side_effect = lambda record: {'Put': record}
+    user_repository = MagicMock()
+    user_repository.get_user_linkedin_credentials = AsyncMock(side_effect=credentials.get)
+    linkedin = MagicMock()
+    linkedin.format_commentary.side_effect = lambda content, hashtags: content
+    linkedin.create_text_post = AsyncMock(
+        return_value=LinkedInPostResponse(status_code=201, post_id='urn:li:share:1')
+    )
+    return PublisherService(
+        linkedin_client=linkedin,
+        publisher_repository=publisher_repository,
+        scheduler_repository=scheduler_repository,
+        user_repository=user_repository,
+        media_repository=MagicMock(),
+        s3_client=MagicMock(),
+        worker_id='w-1',
+    )
+
+
+@pytest.mark.asyncio
+async def test_success_log_is_written_with_the_status_change():
+    service = _service({'u-1': {'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}})
+
+    await service.process_posts([_post('p-1')], set())
+
+    kwargs = service.scheduler_repository.complete_publish.await_args.kwargs
+    (write,) = kwargs['with_writes']
+    assert write['Put'].status == 'published' and write['Put'].post_id == 'p-1'
+    service.publisher_repository.create_log.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_success_log_is_kept_when_the_lease_was_lost():
+    service = _service({'u-1': {'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}})
+    service.scheduler_repository.complete_publish.return_value = False
+
+    await service.process_posts([_post('p-1')], set())
+
+    (record,) = service.publisher_repository.create_log.await_args.args
+    assert record.status == 'published'
+
+
+@pytest.mark.asyncio
+async def test_skipped_user_is_logged_in_one_batch():
+    service = _service({'u-2': {'linkedinAccessToken': None, 'linkedinSub': 'sub'}})
+    posts = [_post(f'p-{i}', user_id='u-2') for i in range(3)]
+
+    await service.process_posts(posts, set())
+
+    (records,) = service.publisher_repository.create_logs.await_args.args
+    assert [r.post_id for r in records] == ['p-0', 'p-1', 'p-2']
+    assert {r.status for r in records} == {'skipped'}
+    assert {r.error_code for r in records} == {'linkedin_not_connected'}
+    service.publisher_repository.create_log.assert_not_awaited()
+    assert service.scheduler_repository.release_claim.await_count == 3
+    service.linkedin_client.create_text_post.assert_not_awaited()
@@ -0,0 +1,183 @@
+"""
+Tests for the publish pipeline behind PublisherService.process_posts.
+"""
+
+import asyncio
+import io
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from config import settings
+from models.publisher import LinkedInImageUploadResponse, LinkedInPostResponse
+from models.scheduler import ScheduledPostRecord
+from services.publisher_service import PublisherService
+
+DELAY = 0.1
+
+
+def _post(post_id, user_id, media_id=None):
+    return ScheduledPostRecord(
+        id=post_id, strategy_id='s-1', copy_id='c-1', user_id=user_id, content=post_id,
+        platform='linkedin', scheduled_date='2020-01-01', scheduled_time='09:00',
+        status='scheduled', media_id=media_id,
+    )
+
+
+def _service(max_users, responses=None, upload_delay=0.0):
+    """Build a service whose LinkedIn calls take DELAY and are recorded in order."""
+    calls = []
+
+    async def create_text_post(token, urn, commentary):
+        calls.append(commentary)
+        await asyncio.sleep(DELAY)
+        return (responses or {}).get(commentary, LinkedInPostResponse(status_code=201, post_id='x'))
+
+    async def create_image_post(token, urn, commentary, image_urn):
+        return await create_text_post(token, urn, commentary)
+
+    async def upload_image_binary(url, body, content_type, content_length=None):
+        async for _ in body:
+            pass
+        await asyncio.sleep(upload_delay)
+        return 201
+
+    linkedin = MagicMock()
+    linkedin.format_commentary.side_effect = lambda content, hashtags: content
+    linkedin.create_text_post = AsyncMock(side_effect=create_text_post)
+    linkedin.create_image_post = AsyncMock(side_effect=create_image_post)
+    linkedin.initialize_image_upload = AsyncMock(return_value=LinkedInImageUploadResponse(
+        upload_url='https://upload.example/1', image_urn='urn:li:image:1'
+    ))
+    linkedin.upload_image_binary = AsyncMock(side_effect=upload_image_binary)
+
+    scheduler_repository = MagicMock()
+    scheduler_repository.claim_post = AsyncMock(
+        side_effect=lambda post_id, *args: _post(
+            post_id, post_id.split(':')[0], media_id='m-1' if post_id.endswith('img') else None
+        )
+    )
+    scheduler_repository.complete_publish = AsyncMock(return_value=True)
+    scheduler_repository.release_claim = AsyncMock(return_value=True)
+    user_repository = MagicMock()
+    user_repository.get_user_linkedin_credentials = AsyncMock(
+        return_value={'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}
+    )
+
+    media_repository = MagicMock()
+    media_repository.get_media_by_id = AsyncMock(
+        return_value={'s3Key': 'media/m-1', 'contentType': 'image/png'}
+    )
+    s3_client = MagicMock()
+    s3_client.get_object.side_effect = lambda **kwargs: {
+        'Body': io.BytesIO(b'image'), 'ContentLength': 5,
+    }
+
+    with patch.object(settings, 'publisher_post_concurrency', max_users):
+        service = PublisherService(
+            linkedin_client=linkedin,
+            publisher_repository=MagicMock(create_log=AsyncMock()),
+            scheduler_repository=scheduler_repository,
+            user_repository=user_repository,
+            media_repository=media_repository,
+            s3_client=s3_client,
+            worker_id='w-1',
+        )
+    return service, calls
+
+
+def _posts(users, per_user):
+    return [_post(f'{u}:{i}', u) for u in users for i in range(per_user)]
+
+
+@pytest.mark.asyncio
+async def test_cycle_time_tracks_slowest_user_not_sum():
+    service, _ = _service(max_users=8)
+    posts = _posts(['a', 'b', 'c', 'd'], per_user=2)
+
+    started = time.perf_counter()
+    await service.process_posts(posts, set())
+    elapsed = time.perf_counter() - started
+
+    # 4 users x 2 sequential posts: ~2 * DELAY concurrently vs 8 * DELAY serially
+    assert elapsed < 4 * DELAY
+    assert service.last_cycle_seconds == pytest.approx(elapsed, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_post_stage_concurrency_bounds_users():
+    service, _ = _service(max_users=1)
+
+    started = time.perf_counter()
+    await service.process_posts(_posts(['a', 'b', 'c'], per_user=1), set())
+
+    assert time.perf_counter() - started >= 3 * DELAY
+
+
+@pytest.mark.asyncio
+async def test_each_users_posts_stay_in_order():
+    service, calls = _service(max_users=8)
+
+    await service.process_posts(_posts(['a', 'b'], per_user=3), set())
+
+    assert [c for c in calls if c.startswith('a:')] == ['a:0', 'a:1', 'a:2']
+    assert [c for c in calls if c.startswith('b:')] == ['b:0', 'b:1', 'b:2']
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_stops_only_that_user():
+    rate_limited = LinkedInPostResponse(status_code=429, error_code='rate_limited')
+    service, calls = _service(max_users=8, responses={'a:0': rate_limited})
+
+    await service.process_posts(_posts(['a', 'b'], per_user=3), set())
+
+    assert [c for c in calls if c.startswith('a:')] == ['a:0']
+    assert [c for c in calls if c.startswith('b:')] == ['b:0', 'b:1', 'b:2']
+
+
+@pytest.mark.asyncio
+async def test_one_user_failing_does_not_abort_others():
+    service, calls = _service(max_users=8)
+
+    async def get_credentials(user_id):
+        if user_id == 'a':
+            raise RuntimeError('boom')
+        return {'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}
+
+    service.user_repository.get_user_linkedin_credentials.side_effect = get_credentials
+    processing = set()
+
+    await service.process_posts(_posts(['a', 'b'], per_user=1), processing)
+
+    assert calls == ['b:0']
+    assert processing == set()
+
+
+@pytest.mark.asyncio
+async def test_uploads_overlap_earlier_posts():
+    service, calls = _service(max_users=8, upload_delay=DELAY)
+    posts = [_post(f'a:{i}:img', 'a', media_id='m-1') for i in range(3)]
+
+    started = time.perf_counter()
+    await service.process_posts(posts, set())
+    elapsed = time.perf_counter() - started
+
+    # Serially: 3 uploads + 3 posts = 6 * DELAY. Later uploads run while
+    # earlier posts are being created, leaving ~1 upload + 3 posts.
+    assert elapsed < 5 * DELAY
+    assert calls == ['a:0:img', 'a:1:img', 'a:2:img']
+
+
+@pytest.mark.asyncio
+async def test_pipeline_reports_stage_depth_and_latency():
+    service, _ = _service(max_users=8)
+
+    await service.process_posts(_posts(['a', 'b'], per_user=2), set())
+
+    stats = service.pipeline_stats()
+    assert [s['name'] for s in stats['stages']] == ['resolve', 'fetch', 'upload', 'post', 'record']
+    post_stage = stats['stages'][3]
+    assert post_stage['processed'] == 4 and post_stage['depth'] == 0
+    assert post_stage['avg_seconds'] >= DELAY * 0.9
+    assert stats['active_runs'] == 0
@@ -0,0 +1,100 @@
+"""
+Tests for the standalone publisher worker and the API's scanner switch.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+import main
+from config import settings
+from workers import publisher as worker
+
+
+def _service():
+    service = MagicMock()
+    service.worker_id = 'w-1'
+    service.last_cycle_seconds = 0.5
+    service.scheduler_repository.list_due_posts = AsyncMock(return_value=[])
+    service.process_posts = AsyncMock()
+    service.pipeline_stats.return_value = {'active_runs': 0, 'stages': []}
+    service.rate_limiter.snapshot.return_value = {'app': {'tokens': 5.0}, 'members': {}}
+    return service
+
+
+def _patched_worker(service):
+    return (
+        patch.object(worker, 'get_publisher_service', return_value=service),
+        patch.object(worker, 'get_linkedin_client', return_value=MagicMock(aclose=AsyncMock())),
+        patch.object(worker, 'shutdown_executor'),
+        patch.object(worker.aws_clients, 'close'),
+    )
+
+
+def test_worker_serves_health_and_metrics_and_stops_scanner():
+    service = _service()
+    patches = _patched_worker(service)
+    for p in patches:
+        p.start()
+    try:
+        app = worker.create_app()
+        with TestClient(app) as client:
+            scanner = app.state.scanner
+            assert scanner.interval == settings.publisher_worker_scan_interval_seconds
+
+            health = client.get('/health')
+            assert health.status_code == 200
+            assert health.json()['worker_id'] == 'w-1'
+
+            metrics = client.get('/metrics').json()
+            assert metrics['pipeline'] == {'active_runs': 0, 'stages': []}
+            assert metrics['rate_limit'] == {'tokens': 5.0}
+            assert metrics['scanner']['running'] is True
+
+        # Lifespan shutdown stopped the scanner and closed the clients
+        assert scanner.healthy is False
+        worker.shutdown_executor.assert_called_once()
+    finally:
+        for p in patches:
+            p.stop()
+
+
+def test_health_reports_stopped_scanner():
+    service = _service()
+    patches = _patched_worker(service)
+    for p in patches:
+        p.start()
+    try:
+        app = worker.create_app()
+        with TestClient(app) as client:
+            app.state.scanner._task.cancel()
+            response = client.get('/health')
+        assert response.status_code == 503
+        assert response.json()['status'] == 'unhealthy'
+    finally:
+        for p in patches:
+            p.stop()
+
+
+def test_command_line_overrides_stage_concurrency():
+    args = worker.parse_args(['--post-concurrency', '32', '--worker-id', 'pub-1'])
+
+    with patch.object(settings, 'publisher_post_concurrency', 8), \
+            patch.object(settings, 'publisher_upload_concurrency', 4), \
+            patch.object(settings, 'publisher_worker_id', ''):
+        worker.apply_overrides(args)
+        assert settings.publisher_post_concurrency == 32
+        assert settings.publisher_upload_concurrency == 4
+        assert settings.publisher_worker_id == 'pub-1'
+
+
+def test_api_can_leave_publishing_to_workers():
+    with patch.object(settings, 'publisher_scanner_in_api', False), \
+            patch.object(main, 'PublishScanner') as scanner_class, \
+            patch.object(main, 'get_linkedin_client', return_value=MagicMock(aclose=AsyncMock())), \
+            patch.object(main, 'shutdown_executor'), \
+            patch.object(main.aws_clients, 'close'):
+        with TestClient(main.app) as client:
+            assert client.get('/health').status_code == 200
+
+    scanner_class.assert_not_called()
@@ -0,0 +1,188 @@
+"""
+Tests for the LinkedIn token-bucket rate limiter and its use by the publisher.
+"""
+
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from models.publisher import LinkedInPostResponse
+from models.scheduler import ScheduledPostRecord
+from services.linkedin_client import LinkedInClient
+from services.publisher_service import PublisherService
+from services.rate_limiter import (
+    DEFAULT_RETRY_AFTER_SECONDS,
+    LinkedInRateLimiter,
+    parse_retry_after,
+    retry_after_from_headers,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(clock, member_capacity=2, member_rate=1.0, app_capacity=100, app_rate=100.0):
+    return LinkedInRateLimiter(member_capacity, member_rate, app_capacity, app_rate, clock=clock)
+
+
+def test_member_bucket_refills_at_configured_rate():
+    clock = _Clock()
+    limiter = _limiter(clock, member_rate=0.5)
+
+    assert limiter.try_acquire('u-1') == 0
+    assert limiter.try_acquire('u-1') == 0
+    assert limiter.try_acquire('u-1') == pytest.approx(2.0)
+    # Other members have their own bucket
+    assert limiter.try_acquire('u-2') == 0
+
+    clock.now += 2
+    assert limiter.try_acquire('u-1') == 0
+
+
+def test_app_bucket_limits_all_members():
+    clock = _Clock()
+    limiter = _limiter(clock, app_capacity=1, app_rate=0.1)
+
+    assert limiter.try_acquire('u-1') == 0
+    assert limiter.try_acquire('u-2') == pytest.approx(10.0)
+    # A refused acquire consumes nothing from the member bucket
+    assert limiter.snapshot('u-2')['members']['u-2']['tokens'] == 2
+
+
+def test_rate_limited_blocks_member_until_retry_after():
+    clock = _Clock()
+    limiter = _limiter(clock)
+
+    assert limiter.record_rate_limited('u-1', 30) == 30
+    assert limiter.wait_time('u-1') == pytest.approx(30)
+    assert limiter.record_rate_limited('u-2', None) == DEFAULT_RETRY_AFTER_SECONDS
+
+    clock.now += 30
+    assert limiter.try_acquire('u-1') == 0
+    assert limiter.snapshot()['members']['u-1']['blocked_for_seconds'] == 0
+
+
+def test_idle_member_buckets_are_evicted_after_refilling():
+    clock = _Clock()
+    limiter = _limiter(clock, member_capacity=2, member_rate=1.0)
+
+    for i in range(100):
+        limiter.try_acquire(f'u-{i}')
+    limiter.record_rate_limited('u-blocked', 60)
+    assert len(limiter.snapshot()['members']) == 101
+
+    # Two seconds refill every bucket; only the blocked member is still distinct
+    clock.now += 2
+    limiter.try_acquire('u-new')
+    assert set(limiter.snapshot()['members']) == {'u-blocked', 'u-new'}
+    # A member that was evicted starts over with a full bucket
+    assert limiter.snapshot('u-0')['members']['u-0']['tokens'] == 2
+    assert set(limiter.snapshot()['members']) == {'u-blocked', 'u-new'}
+
+
+def test_retry_after_parsing():
+    now = time.time()
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after(formatdate(now + 60, usegmt=True), now=now) == pytest.approx(60, abs=1)
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+    assert retry_after_from_headers({'x-ratelimit-remaining': '0', 'x-ratelimit-reset': '45'}) == 45
+    assert retry_after_from_headers({'x-ratelimit-remaining': '3', 'x-ratelimit-reset': '45'}) is None
+    assert retry_after_from_headers(
+        {'x-ratelimit-remaining': '0', 'x-ratelimit-reset': str(int(now) + 90)}
+    ) == pytest.approx(90, abs=2)
+
+
+@pytest.mark.asyncio
+async def test_client_surfaces_retry_after_on_429():
+    def handler(request):
+        return httpx.Response(429, headers={'Retry-After': '17'}, text='Too many requests')
+
+    client = LinkedInClient(base_url='https://linkedin.test/rest', transport=httpx.MockTransport(handler))
+    try:
+        response = await client.create_text_post('token', 'urn:li:person:1', 'hi')
+    finally:
+        await client.aclose()
+
+    assert response.error_code == 'rate_limited'
+    assert response.retry_after_seconds == 17
+
+
+def _post(post_id):
+    return ScheduledPostRecord(
+        id=post_id, strategy_id='s-1', copy_id='c-1', user_id='u-1', content='t',
+        platform='linkedin', scheduled_date='2020-01-01', scheduled_time='09:00',
+        status='scheduled',
+    )
+
+
+def _service(limiter, responses):
+    scheduler_repository = MagicMock()
+    scheduler_repository.claim_post = AsyncMock(
+        side_effect=lambda post_id, *args: _post(post_id).model_copy(update={'status': 'publishing'})
+    )
+    scheduler_repository.complete_publish = AsyncMock(return_value=True)
+    scheduler_repository.release_claim = AsyncMock(return_value=True)
+    user_repository = MagicMock()
+    user_repository.get_user_linkedin_credentials = AsyncMock(
+        return_value={'linkedinAccessToken': 'token', 'linkedinSub': 'sub'}
+    )
+    linkedin = MagicMock()
+    linkedin.format_commentary.side_effect = lambda content, hashtags: content
+    linkedin.create_text_post = AsyncMock(side_effect=responses)
+    return PublisherService(
+        linkedin_client=linkedin,
+        publisher_repository=MagicMock(create_log=AsyncMock()),
+        scheduler_repository=scheduler_repository,
+        user_repository=user_repository,
+        media_repository=MagicMock(),
+        s3_client=MagicMock(),
+        worker_id='w-1',
+        rate_limiter=limiter,
+    )
+
+
+@pytest.mark.asyncio
+async def test_posts_beyond_bucket_are_deferred_to_token_time():
+    limiter = _limiter(_Clock(), member_capacity=2, member_rate=1 / 600)
+    ok = LinkedInPostResponse(status_code=201, post_id='urn:li:share:1')
+    service = _service(limiter, [ok, ok])
+
+    before = time.time()
+    await service.process_posts([_post(f'p-{i}') for i in range(4)], set())
+
+    assert service.linkedin_client.create_text_post.await_count == 2
+    # Posts found without a token are deferred before they are claimed
+    service.scheduler_repository.release_claim.assert_not_awaited()
+    deferred = service.pop_deferred()
+    assert sorted(deferred) == ['p-2', 'p-3']
+    assert deferred['p-2'] - before == pytest.approx(600, abs=2)
+    assert deferred['p-3'] - deferred['p-2'] == pytest.approx(600, abs=1)
+    assert service.pop_deferred() == {}
+
+
+@pytest.mark.asyncio
+async def test_429_defers_remaining_posts_until_retry_after():
+    limiter = _limiter(_Clock(), member_capacity=10)
+    limited = LinkedInPostResponse(
+        status_code=429, error_code='rate_limited', retry_after_seconds=120
+    )
+    service = _service(limiter, [limited])
+
+    before = time.time()
+    await service.process_posts([_post('p-1'), _post('p-2')], set())
+
+    assert service.linkedin_client.create_text_post.await_count == 1
+    deferred = service.pop_deferred()
+    assert sorted(deferred) == ['p-1', 'p-2']
+    assert deferred['p-1'] - before == pytest.approx(120, abs=2)
+    assert limiter.wait_time('u-1') == pytest.approx(120)
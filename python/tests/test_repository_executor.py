@@ -0,0 +1,129 @@
+"""
+Tests for the bounded DynamoDB executor used by the repositories.
+
+Verifies that blocking boto3 calls made through repository methods no longer
+stall the event loop, and that the executor honours its configured pool size.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, UTC
+from unittest.mock import MagicMock
+
+import pytest
+
+from repositories import executor
+from repositories.copy_repository import CopyRepository
+
+
+def _copy_item(copy_id: str) -> dict:
+    now = datetime.now(UTC).isoformat()
+    return {
+        'copyId': copy_id,
+        'strategyId': 'strategy-1',
+        'userId': 'user-1',
+        'text': 'hello',
+        'platform': 'linkedin',
+        'hashtags': [],
+        'createdAt': now,
+        'updatedAt': now,
+    }
+
+
+def _slow_repository(latency: float) -> CopyRepository:
+    repo = CopyRepository.__new__(CopyRepository)
+    repo.table = MagicMock()
+
+    def slow_get_item(Key):
+        time.sleep(latency)
+        return {'Item': _copy_item(Key['copyId'])}
+
+    repo.table.get_item.side_effect = slow_get_item
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_does_not_stall_event_loop():
+    """A slow GetItem must not prevent other coroutines from running."""
+    repo = _slow_repository(latency=0.3)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    record = await repo.get_copy_by_id('copy-1')
+    ticker_task.cancel()
+
+    assert record.id == 'copy-1'
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_run_in_parallel():
+    """Concurrent repository reads overlap instead of running back to back."""
+    repo = _slow_repository(latency=0.1)
+    start = time.perf_counter()
+    records = await asyncio.gather(*(repo.get_copy_by_id(f'copy-{i}') for i in range(8)))
+    elapsed = time.perf_counter() - start
+
+    assert [r.id for r in records] == [f'copy-{i}' for i in range(8)]
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_executor_respects_configured_pool_size(monkeypatch):
+    """No more than dynamodb_executor_max_workers calls run at the same time."""
+    executor.shutdown_executor()
+    monkeypatch.setattr(executor.settings, 'dynamodb_executor_max_workers', 2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def tracked():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    try:
+        await asyncio.gather(*(executor.run_blocking(tracked) for _ in range(6)))
+    finally:
+        executor.shutdown_executor()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_s3_reads_do_not_occupy_the_dynamodb_pool(monkeypatch):
+    """Slow S3 calls run on their own pool, so DynamoDB calls are not queued behind them."""
+    executor.shutdown_executor()
+    monkeypatch.setattr(executor.settings, 'dynamodb_executor_max_workers', 1)
+    release = threading.Event()
+    s3_threads = []
+
+    def slow_s3_read():
+        s3_threads.append(threading.current_thread().name)
+        release.wait(2)
+
+    try:
+        s3_reads = [asyncio.create_task(executor.run_blocking_s3(slow_s3_read)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        dynamodb_thread = await asyncio.wait_for(
+            executor.run_blocking(lambda: threading.current_thread().name), timeout=1
+        )
+        release.set()
+        await asyncio.gather(*s3_reads)
+    finally:
+        release.set()
+        executor.shutdown_executor()
+
+    assert dynamodb_thread.startswith('dynamodb')
+    assert all(name.startswith('s3') for name in s3_threads)
@@ -0,0 +1,134 @@
+"""
+Tests for the precomputed scheduledAt epoch on scheduled posts.
+
+Covers writing and reading scheduledAt, keeping it in sync on reschedule,
+integer due checks, the filtered legacy scan, and the backfill migration.
+"""
+
+from datetime import datetime, UTC
+from unittest.mock import MagicMock, patch
+
+import pytest
+from boto3.dynamodb.conditions import ConditionExpressionBuilder
+from fastapi import HTTPException
+
+from migrations.backfill_scheduled_at import backfill
+from repositories.scheduler_repository import compute_due_at, post_due_at
+from services.publisher_service import PublisherService
+from services.scheduler_service import SchedulerService
+from tests.scheduler_helpers import mock_repository, post_item
+
+NOW = datetime(2030, 1, 10, 12, 0, tzinfo=UTC)
+SCHEDULED_AT = int(datetime(2030, 1, 10, 9, 30, tzinfo=UTC).timestamp())
+
+
+def test_every_post_stores_scheduled_at():
+    repo = mock_repository()
+
+    for status in ('draft', 'scheduled', 'published'):
+        item = repo._record_to_item(repo._item_to_record(post_item(status=status)))
+        assert item['scheduledAt'] == SCHEDULED_AT
+
+
+def test_due_check_uses_stored_epoch_without_parsing():
+    repo = mock_repository()
+    post = repo._item_to_record(post_item(scheduledAt=SCHEDULED_AT))
+
+    with patch('repositories.scheduler_repository.compute_due_at') as parse:
+        assert post_due_at(post) == SCHEDULED_AT
+        assert post_due_at(post.model_copy(update={'next_attempt_at': SCHEDULED_AT + 60})) == SCHEDULED_AT + 60
+    parse.assert_not_called()
+
+    # Posts written before scheduledAt existed are still parsed
+    assert post_due_at(repo._item_to_record(post_item())) == SCHEDULED_AT
+
+
+@pytest.mark.asyncio
+async def test_reschedule_sets_scheduled_at_in_the_same_write():
+    repo = mock_repository()
+    moved = compute_due_at('2030-02-01', '10:00')
+    repo.table.update_item.return_value = {'Attributes': post_item(
+        scheduledDate='2030-02-01', scheduledTime='10:00', status='draft', scheduledAt=moved,
+    )}
+
+    post = await repo.update_post(
+        'p-1', {'scheduled_date': '2030-02-01', 'scheduled_time': '10:00', 'status': 'draft'}
+    )
+
+    assert repo.table.update_item.call_count == 1
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert '#scheduledAt = :scheduled_at' in kwargs['UpdateExpression']
+    assert kwargs['ExpressionAttributeValues'][':scheduled_at'] == moved
+    assert post.scheduled_at == moved
+
+
+@pytest.mark.asyncio
+async def test_changing_only_the_time_resyncs_scheduled_at():
+    repo = mock_repository()
+    moved = compute_due_at('2030-01-10', '18:00')
+    repo.table.get_item.return_value = {'Item': {'scheduledDate': '2030-01-10'}}
+    repo.table.update_item.return_value = {'Attributes': post_item(
+        scheduledTime='18:00', status='draft', scheduledAt=moved,
+    )}
+
+    post = await repo.update_post('p-1', {'scheduled_time': '18:00', 'status': 'draft'})
+
+    assert repo.table.update_item.call_count == 1
+    kwargs = repo.table.update_item.call_args.kwargs
+    assert '#scheduledAt = :scheduled_at' in kwargs['UpdateExpression']
+    assert kwargs['UpdateExpression'].endswith('#dueBucket, #dueAt')
+    assert kwargs['ExpressionAttributeValues'][':scheduled_at'] == moved
+    assert kwargs['ConditionExpression'] == '#status <> :publishing AND #read0 = :read0'
+    assert post.scheduled_at == moved
+
+
+@pytest.mark.asyncio
+async def test_scan_fallback_filters_on_epochs_server_side():
+    service = PublisherService.__new__(PublisherService)
+    service.scheduler_repository = mock_repository()
+    legacy_future = post_item(postId='legacy', scheduledDate='2030-01-11')
+    service.scheduler_repository.table.scan.return_value = {'Items': [
+        post_item(postId='due', scheduledAt=SCHEDULED_AT), legacy_future,
+    ]}
+
+    posts = await service._get_due_posts_by_scan(NOW)
+
+    assert [p.id for p in posts] == ['due']
+    condition = service.scheduler_repository.table.scan.call_args.kwargs['FilterExpression']
+    built = ConditionExpressionBuilder().build_expression(condition)
+    assert 'scheduledAt' in built.attribute_name_placeholders.values()
+    assert 'nextAttemptAt' in built.attribute_name_placeholders.values()
+
+
+def test_validate_future_date_compares_epochs():
+    SchedulerService._validate_future_date('2999-01-01', '09:00')
+    with pytest.raises(HTTPException) as past:
+        SchedulerService._validate_future_date('2000-01-01', '09:00')
+    with pytest.raises(HTTPException) as invalid:
+        SchedulerService._validate_future_date('2030-13-01', '09:00')
+    assert 'past' in past.value.detail
+    assert 'Invalid' in invalid.value.detail
+
+
+def test_backfill_sets_missing_and_stale_scheduled_at():
+    table = MagicMock()
+    table.scan.return_value = {'Items': [
+        post_item(postId='missing'),
+        post_item(postId='stale', scheduledAt=SCHEDULED_AT - 3600),
+        post_item(postId='ok', scheduledAt=SCHEDULED_AT),
+    ]}
+
+    counts = backfill(table)
+
+    assert counts == {'scanned': 3, 'updated': 2, 'invalid': 0, 'unchanged': 1, 'conflicts': 0}
+    for call in table.update_item.call_args_list:
+        assert call.kwargs['ExpressionAttributeValues'][':scheduled_at'] == SCHEDULED_AT
+        assert call.kwargs['ConditionExpression'] == 'scheduledDate = :date AND scheduledTime = :time'
+
+
+def test_backfill_dry_run_writes_nothing():
+    table = MagicMock()
+    table.scan.return_value = {'Items': [post_item()]}
+
+    assert backfill(table, dry_run=True)['updated'] == 1
+    table.update_item.assert_not_called()
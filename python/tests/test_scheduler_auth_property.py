@@ -16,13 +16,14 @@ os.environ.setdefault("USE_MOCK_AGENT", "true")
 import pytest
 from hypothesis import given, settings as hypothesis_settings, strategies as st, HealthCheck
 from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from jose import jwt
 from datetime import datetime, timedelta
 
 from config import settings as app_settings
 
 # Import app after env is configured so scheduler routes use mock agent
+from dependencies import get_scheduler_service
 from main import app
 from models.scheduler import ScheduledPostRecord
 
@@ -133,7 +134,8 @@ class TestSchedulerAuthenticationProperty:
     @pytest.fixture
     def mock_scheduler_service(self):
         """Mock the scheduler service to avoid actual agent/DB calls."""
-        with patch("routes.scheduler.scheduler_service") as mock_service:
+        mock_service = MagicMock()
+        with patch.dict(app.dependency_overrides, {get_scheduler_service: lambda: mock_service}):
             mock_record = _make_mock_record()
             mock_service.auto_schedule = AsyncMock(return_value=[mock_record])
             mock_service.manual_schedule = AsyncMock(return_value=mock_record)
@@ -24,6 +24,7 @@ from unittest.mock import patch, AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 from jose import jwt
 
+from dependencies import get_scheduler_service
 from main import app
 from models.scheduler import ScheduledPostRecord
 from models.strategy import StrategyRecord, StrategyOutput, PlatformRecommendation
@@ -102,15 +103,39 @@ class InMemorySchedulerRepository:
             return None
         return record
 
+    async def get_post_for_user(self, post_id: str, user_id: str):
+        record = self._store.get(post_id)
+        if record is None:
+            return (None, False)
+        if record.user_id != user_id:
+            return (None, True)
+        return (record, False)
+
     async def post_exists(self, post_id: str) -> bool:
         return post_id in self._store
 
-    async def list_posts_by_user(self, user_id: str) -> list[ScheduledPostRecord]:
-        posts = [r for r in self._store.values() if r.user_id == user_id]
+    @staticmethod
+    def _in_range(post, date_from, date_to) -> bool:
+        return (date_from is None or post.scheduled_date >= date_from) and (
+            date_to is None or post.scheduled_date <= date_to
+        )
+
+    async def list_posts_by_user(
+        self, user_id: str, date_from=None, date_to=None
+    ) -> list[ScheduledPostRecord]:
+        posts = [
+            r for r in self._store.values()
+            if r.user_id == user_id and self._in_range(r, date_from, date_to)
+        ]
         return sorted(posts, key=lambda p: p.scheduled_date)
 
-    async def list_posts_by_strategy(self, strategy_id: str) -> list[ScheduledPostRecord]:
-        posts = [r for r in self._store.values() if r.strategy_id == strategy_id]
+    async def list_posts_by_strategy(
+        self, strategy_id: str, date_from=None, date_to=None
+    ) -> list[ScheduledPostRecord]:
+        posts = [
+            r for r in self._store.values()
+            if r.strategy_id == strategy_id and self._in_range(r, date_from, date_to)
+        ]
         return sorted(posts, key=lambda p: p.scheduled_date)
 
     async def update_post(self, post_id: str, updates: dict) -> ScheduledPostRecord:
@@ -162,8 +187,16 @@ def mock_strategy_repo():
     async def strategy_exists(sid):
         return sid == STRATEGY_ID
 
+    async def get_strategy_for_user(sid, uid):
+        if sid != STRATEGY_ID:
+            return (None, False)
+        if uid != USER_A:
+            return (None, True)
+        return (strategy_a, False)
+
     repo.get_strategy_by_id = AsyncMock(side_effect=get_strategy)
     repo.strategy_exists = AsyncMock(side_effect=strategy_exists)
+    repo.get_strategy_for_user = AsyncMock(side_effect=get_strategy_for_user)
     return repo
 
 
@@ -183,8 +216,15 @@ def mock_copy_repo():
     async def copy_exists(cid):
         return any(c.id == cid for c in copies)
 
+    async def get_copy_for_user(cid, uid):
+        for c in copies:
+            if c.id == cid:
+                return (c, False) if c.user_id == uid else (None, True)
+        return (None, False)
+
     repo.get_copy_by_id = AsyncMock(side_effect=get_copy)
     repo.copy_exists = AsyncMock(side_effect=copy_exists)
+    repo.get_copy_for_user = AsyncMock(side_effect=get_copy_for_user)
     repo.list_copies_by_strategy = AsyncMock(return_value=copies)
     return repo
 
@@ -206,7 +246,7 @@ def patched_client(in_memory_repo, mock_strategy_repo, mock_copy_repo):
         strategy_repository=mock_strategy_repo,
     )
 
-    with patch("routes.scheduler.scheduler_service", service):
+    with patch.dict(app.dependency_overrides, {get_scheduler_service: lambda: service}):
         yield TestClient(app)
 
 
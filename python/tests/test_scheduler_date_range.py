@@ -0,0 +1,129 @@
+"""
+Tests for calendar date-range queries on the scheduledDate sort key.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from boto3.dynamodb.conditions import Key
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from dependencies import get_scheduler_service
+from main import app
+from middleware.auth import auth_middleware
+from repositories.scheduler_repository import SchedulerRepository
+from services.scheduler_service import SchedulerService
+
+
+@pytest.mark.parametrize('month, expected', [
+    ('2028-02', ('2028-02-01', '2028-02-29')),
+    ('2027-02', ('2027-02-01', '2027-02-28')),
+    ('2026-12', ('2026-12-01', '2026-12-31')),
+    ('2026-04', ('2026-04-01', '2026-04-30')),
+])
+def test_month_window(month, expected):
+    assert SchedulerService.month_window(month) == expected
+
+
+@pytest.mark.parametrize('month', ['2026-13', '2026/01', 'january'])
+def test_month_window_rejects_bad_month(month):
+    with pytest.raises(HTTPException) as exc:
+        SchedulerService.month_window(month)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize('date_from, date_to', [
+    ('2026-02-30', None),
+    (None, '26-01-01'),
+    ('2026-03-01', '2026-02-01'),
+])
+def test_invalid_ranges_are_rejected(date_from, date_to):
+    with pytest.raises(HTTPException) as exc:
+        SchedulerService._validate_date_range(date_from, date_to)
+    assert exc.value.status_code == 400
+
+
+def _repository():
+    repo = SchedulerRepository.__new__(SchedulerRepository)
+    repo.table = MagicMock()
+    repo.table.query.return_value = {'Items': []}
+    return repo
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('date_from, date_to, expected', [
+    ('2026-01-01', '2026-01-31',
+     Key('userId').eq('u-1') & Key('scheduledDate').between('2026-01-01', '2026-01-31')),
+    ('2026-01-01', None, Key('userId').eq('u-1') & Key('scheduledDate').gte('2026-01-01')),
+    (None, '2026-01-31', Key('userId').eq('u-1') & Key('scheduledDate').lte('2026-01-31')),
+    (None, None, Key('userId').eq('u-1')),
+])
+async def test_range_is_applied_to_sort_key(date_from, date_to, expected):
+    repo = _repository()
+
+    await repo.list_posts_by_user('u-1', date_from=date_from, date_to=date_to)
+
+    kwargs = repo.table.query.call_args.kwargs
+    assert kwargs['IndexName'] == 'UserIdIndex'
+    assert kwargs['KeyConditionExpression'] == expected
+
+
+@pytest.mark.asyncio
+async def test_strategy_listing_supports_range():
+    repo = _repository()
+
+    await repo.list_posts_by_strategy('s-1', date_from='2026-01-01', date_to='2026-01-31')
+
+    assert repo.table.query.call_args.kwargs['KeyConditionExpression'] == (
+        Key('strategyId').eq('s-1') & Key('scheduledDate').between('2026-01-01', '2026-01-31')
+    )
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[auth_middleware.get_current_user] = lambda: 'u-1'
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _service():
+    service = MagicMock()
+    service.month_window = SchedulerService.month_window
+    service.list_posts_by_user = AsyncMock(return_value=[])
+    return service
+
+
+def test_month_query_uses_window(client):
+    service = _service()
+    with patch.dict(app.dependency_overrides, {get_scheduler_service: lambda: service}):
+        response = client.get('/api/scheduler/posts', params={'month': '2026-02'})
+
+    assert response.status_code == 200
+    service.list_posts_by_user.assert_awaited_once_with(
+        'u-1', date_from='2026-02-01', date_to='2026-02-28'
+    )
+
+
+def test_from_to_query_is_passed_through(client):
+    service = _service()
+    with patch.dict(app.dependency_overrides, {get_scheduler_service: lambda: service}):
+        response = client.get(
+            '/api/scheduler/posts', params={'from': '2026-02-10', 'to': '2026-02-16'}
+        )
+
+    assert response.status_code == 200
+    service.list_posts_by_user.assert_awaited_once_with(
+        'u-1', date_from='2026-02-10', date_to='2026-02-16'
+    )
+
+
+def test_month_and_range_cannot_be_combined(client):
+    service = _service()
+    with patch.dict(app.dependency_overrides, {get_scheduler_service: lambda: service}):
+        response = client.get(
+            '/api/scheduler/posts', params={'month': '2026-02', 'from': '2026-02-10'}
+        )
+
+    assert response.status_code == 400
+    service.list_posts_by_user.assert_not_awaited()
@@ -71,6 +71,14 @@ def create_mock_scheduler_repository():
             return None
         return record
 
+    async def mock_get_post_for_user(post_id: str, user_id: str):
+        record = repo._storage.get(post_id)
+        if record is None:
+            return (None, False)
+        if record.user_id != user_id:
+            return (None, True)
+        return (record, False)
+
     async def mock_post_exists(post_id: str) -> bool:
         return post_id in repo._storage
 
@@ -84,6 +92,7 @@ def create_mock_scheduler_repository():
     repo.create_posts = mock_create_posts
     repo.get_post_by_id = mock_get_post_by_id
     repo.post_exists = mock_post_exists
+    repo.get_post_for_user = mock_get_post_for_user
     repo.list_posts_by_user = mock_list_posts_by_user
     return repo
 
@@ -91,6 +100,14 @@ def create_mock_scheduler_repository():
 def create_mock_copy_repository(copies_by_id: dict, user_id: str):
     repo = CopyRepository.__new__(CopyRepository)
 
+    async def mock_get_copy_for_user(copy_id: str, uid: str):
+        copy = copies_by_id.get(copy_id)
+        if copy is None:
+            return (None, False)
+        if copy.user_id != uid:
+            return (None, True)
+        return (copy, False)
+
     async def mock_copy_exists(copy_id: str) -> bool:
         return copy_id in copies_by_id
 
@@ -106,6 +123,7 @@ def create_mock_copy_repository(copies_by_id: dict, user_id: str):
         return [c for c in copies_by_id.values() if c.strategy_id == strategy_id]
 
     repo.copy_exists = mock_copy_exists
+    repo.get_copy_for_user = mock_get_copy_for_user
     repo.get_copy_by_id = mock_get_copy_by_id
     repo.list_copies_by_strategy = mock_list_copies_by_strategy
     return repo
@@ -114,6 +132,14 @@ def create_mock_copy_repository(copies_by_id: dict, user_id: str):
 def create_mock_strategy_repository(strategies_by_id: dict, user_id: str):
     repo = StrategyRepository.__new__(StrategyRepository)
 
+    async def mock_get_strategy_for_user(strategy_id: str, uid: str):
+        strategy = strategies_by_id.get(strategy_id)
+        if strategy is None:
+            return (None, False)
+        if strategy.user_id != uid:
+            return (None, True)
+        return (strategy, False)
+
     async def mock_strategy_exists(strategy_id: str) -> bool:
         return strategy_id in strategies_by_id
 
@@ -126,6 +152,7 @@ def create_mock_strategy_repository(strategies_by_id: dict, user_id: str):
         return strategy
 
     repo.strategy_exists = mock_strategy_exists
+    repo.get_strategy_for_user = mock_get_strategy_for_user
     repo.get_strategy_by_id = mock_get_strategy_by_id
     return repo
 
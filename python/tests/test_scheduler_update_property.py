@@ -118,6 +118,14 @@ def create_mock_scheduler_repository():
             return None
         return record
 
+    async def mock_get_post_for_user(post_id: str, user_id: str):
+        record = repo._storage.get(post_id)
+        if record is None:
+            return (None, False)
+        if record.user_id != user_id:
+            return (None, True)
+        return (record, False)
+
     async def mock_post_exists(post_id: str) -> bool:
         return post_id in repo._storage
 
@@ -147,6 +155,7 @@ def create_mock_scheduler_repository():
     repo.create_post = mock_create_post
     repo.get_post_by_id = mock_get_post_by_id
     repo.post_exists = mock_post_exists
+    repo.get_post_for_user = mock_get_post_for_user
     repo.update_post = mock_update_post
 
     return repo
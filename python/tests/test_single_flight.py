@@ -0,0 +1,169 @@
+"""
+Tests for single-flight coalescing and idempotency keys on generation calls.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from models.copy import CopyItem, CopyOutput
+from services.copy_service import CopyService
+from services.single_flight import SingleFlight
+
+
+class _Generation:
+    """Slow generation that counts how often it actually runs."""
+
+    def __init__(self, delay=0.05, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("bedrock down")
+        return [f"record-{self.calls}"]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_run():
+    flight = SingleFlight()
+    generation = _Generation()
+
+    results = await asyncio.gather(*(
+        flight.run("u-1", "generate_copies", {"strategy_id": "s-1"}, generation)
+        for _ in range(5)
+    ))
+
+    assert generation.calls == 1
+    assert results == [["record-1"]] * 5
+    assert (flight.started, flight.joined) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_different_users_and_inputs_are_not_coalesced():
+    flight = SingleFlight()
+    generation = _Generation()
+
+    await asyncio.gather(
+        flight.run("u-1", "generate_copies", {"strategy_id": "s-1"}, generation),
+        flight.run("u-2", "generate_copies", {"strategy_id": "s-1"}, generation),
+        flight.run("u-1", "generate_copies", {"strategy_id": "s-2"}, generation),
+        flight.run("u-1", "auto_schedule", {"strategy_id": "s-1"}, generation),
+    )
+
+    assert generation.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_completed_calls_without_a_key_run_again():
+    flight = SingleFlight()
+    generation = _Generation(delay=0)
+
+    await flight.run("u-1", "op", {"a": 1}, generation)
+    await flight.run("u-1", "op", {"a": 1}, generation)
+
+    assert generation.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_timed_out_caller_does_not_cancel_the_generation():
+    flight = SingleFlight()
+    generation = _Generation(delay=0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1"), timeout=0.02
+        )
+    # The retry joins the still-running call
+    result = await flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1")
+
+    assert result == ["record-1"]
+    assert generation.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_with_idempotency_key_replays_the_finished_result():
+    flight = SingleFlight()
+    generation = _Generation(delay=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1"), timeout=0.01
+        )
+    await asyncio.sleep(0.1)  # the original call finishes after the timeout
+    result = await flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1")
+
+    assert result == ["record-1"]
+    assert generation.calls == 1
+    assert flight.replayed == 1
+
+
+@pytest.mark.asyncio
+async def test_replayed_results_expire():
+    flight = SingleFlight(result_ttl_seconds=0)
+    generation = _Generation(delay=0)
+
+    await flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1")
+    await flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1")
+
+    assert generation.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_are_shared_but_not_replayed():
+    flight = SingleFlight()
+    generation = _Generation(fail=True)
+
+    results = await asyncio.gather(
+        flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1"),
+        flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert generation.calls == 1
+
+    generation.fail = False
+    assert await flight.run("u-1", "op", {"a": 1}, generation, idempotency_key="k-1") == ["record-2"]
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_reused_for_other_input_is_rejected():
+    flight = SingleFlight()
+    await flight.run("u-1", "op", {"a": 1}, _Generation(delay=0), idempotency_key="k-1")
+
+    with pytest.raises(HTTPException) as exc:
+        await flight.run("u-1", "op", {"a": 2}, _Generation(delay=0), idempotency_key="k-1")
+
+    assert exc.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_double_click_generates_copies_once():
+    agent = MagicMock()
+
+    async def generate_copies(strategy_data):
+        await asyncio.sleep(0.05)
+        return CopyOutput(copies=[CopyItem(text="Hi", platform="Twitter", hashtags=[])])
+
+    agent.generate_copies = AsyncMock(side_effect=generate_copies)
+    copy_repository = MagicMock()
+    copy_repository.create_copies = AsyncMock(side_effect=lambda records: records)
+    strategy_repository = MagicMock()
+    strategy_repository.get_strategy_for_user = AsyncMock(return_value=(SimpleNamespace(
+        brand_name="Acme", industry="SaaS", target_audience="All", goals="Grow", strategy_output=None,
+    ), False))
+    service = CopyService(agent, copy_repository, strategy_repository)
+
+    first, second = await asyncio.gather(
+        service.generate_copies("s-1", "u-1"), service.generate_copies("s-1", "u-1")
+    )
+
+    assert first is second
+    assert agent.generate_copies.await_count == 1
+    assert copy_repository.create_copies.await_count == 1
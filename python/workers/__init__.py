@@ -0,0 +1,5 @@
+"""
+Background worker processes for the Zetca agent backend.
+
+Run from the python/ directory, e.g. python -m workers.publisher
+"""
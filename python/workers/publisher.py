@@ -0,0 +1,128 @@
+"""
+Standalone publisher worker.
+
+Runs the PublishScanner in its own process so that publishing and API
+requests no longer share an event loop, and API replicas and publisher
+workers can be scaled independently. Run the API with
+PUBLISHER_SCANNER_IN_API=false and start one or more workers:
+
+    python -m workers.publisher [--port 8081] [--post-concurrency 16] ...
+
+Workers coordinate through the post claims, so any number can run at once.
+The scanner's change feed only sees writes made in its own process, so a
+worker learns about posts written by the API on its next reconciliation,
+every `publisher_worker_scan_interval_seconds`.
+
+The worker serves /health (503 once the scanner loop has stopped or stalled)
+and /metrics (scanner, publish pipeline and rate-limit state) on its port,
+and shuts down gracefully on SIGTERM/SIGINT: the scanner stops claiming
+posts and drains those in flight (for up to `publisher_drain_timeout_seconds`)
+before the LinkedIn client, executor and AWS clients are closed.
+"""
+
+import argparse
+import logging
+from contextlib import asynccontextmanager
+
+import uvicorn
+from fastapi import FastAPI, Response, status
+
+from config import settings
+from dependencies import clear_providers, get_linkedin_client, get_publisher_service
+from repositories.aws_clients import aws_clients
+from repositories.executor import shutdown_executor
+from services.publish_scanner import PublishScanner
+
+logger = logging.getLogger(__name__)
+
+# Publish pipeline stages whose concurrency can be set per worker
+STAGES = ("resolve", "fetch", "upload", "post", "record")
+
+
+def create_app() -> FastAPI:
+    """Build the worker's health/metrics app; its lifespan runs the scanner."""
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        scanner = PublishScanner(
+            get_publisher_service(), interval=settings.publisher_worker_scan_interval_seconds
+        )
+        app.state.scanner = scanner
+        await scanner.start()
+        logger.info(f"Publisher worker {scanner.publisher_service.worker_id} started")
+        yield
+        await scanner.stop()
+        await get_linkedin_client().aclose()
+        shutdown_executor(wait=False)
+        aws_clients.close()
+        clear_providers()
+
+    app = FastAPI(title="Zetca Publisher Worker", lifespan=lifespan)
+
+    @app.get("/health")
+    async def health_check(response: Response):
+        """Liveness: the scanner loop is running and not stalled."""
+        scanner = app.state.scanner
+        healthy = scanner.healthy
+        if not healthy:
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {
+            "status": "healthy" if healthy else "unhealthy",
+            "service": "zetca-publisher",
+            "worker_id": scanner.publisher_service.worker_id,
+        }
+
+    @app.get("/metrics")
+    async def metrics():
+        """Scanner, pipeline and app-wide rate-limit state of this worker."""
+        scanner = app.state.scanner
+        service = scanner.publisher_service
+        return {
+            "worker_id": service.worker_id,
+            "scanner": scanner.stats(),
+            "last_cycle_seconds": service.last_cycle_seconds,
+            "pipeline": service.pipeline_stats(),
+            "rate_limit": service.rate_limiter.snapshot()["app"],
+        }
+
+    return app
+
+
+def apply_overrides(args: argparse.Namespace) -> None:
+    """Apply command-line overrides to the settings before the service is built."""
+    for stage in STAGES:
+        value = getattr(args, f"{stage}_concurrency")
+        if value:
+            setattr(settings, f"publisher_{stage}_concurrency", value)
+    if args.worker_id:
+        settings.publisher_worker_id = args.worker_id
+    if args.scan_interval:
+        settings.publisher_worker_scan_interval_seconds = args.scan_interval
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=settings.publisher_worker_port,
+                        help="health and metrics port")
+    parser.add_argument("--worker-id", help="lease owner id (default: host:pid:random)")
+    parser.add_argument("--scan-interval", type=int,
+                        help="reconciliation interval in seconds")
+    for stage in STAGES:
+        parser.add_argument(f"--{stage}-concurrency", type=int,
+                            help=f"workers in the {stage} stage")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args(argv)
+    if not settings.publisher_enabled:
+        raise SystemExit("Publishing is disabled (PUBLISHER_ENABLED=false)")
+    apply_overrides(args)
+    # uvicorn turns SIGTERM/SIGINT into a lifespan shutdown, which stops the scanner
+    uvicorn.run(create_app(), host=args.host, port=args.port, log_level="info")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+resource "aws_dynamodb_table" "agent_cache" {
+  name           = "agent-cache-${var.environment}"
+  billing_mode   = "PAY_PER_REQUEST"
+  hash_key       = "cacheKey"
+
+  attribute {
+    name = "cacheKey"
+    type = "S"
+  }
+
+  # Expired cached agent responses are deleted by DynamoDB
+  ttl {
+    attribute_name = "expiresAt"
+    enabled        = true
+  }
+
+  server_side_encryption {
+    enabled = true
+  }
+
+  tags = {
+    Name        = "Agent Response Cache Table"
+    Environment = var.environment
+    ManagedBy   = "Terraform"
+    Application = "AgentCache"
+  }
+}
@@ -66,3 +66,13 @@ output "dynamodb_publish_log_table_arn" {
   value       = aws_dynamodb_table.publish_log.arn
   description = "ARN of the DynamoDB publish log table"
 }
+
+output "dynamodb_agent_cache_table_name" {
+  value       = aws_dynamodb_table.agent_cache.name
+  description = "Name of the DynamoDB agent response cache table"
+}
+
+output "dynamodb_agent_cache_table_arn" {
+  value       = aws_dynamodb_table.agent_cache.arn
+  description = "ARN of the DynamoDB agent response cache table"
+}
@@ -28,6 +28,16 @@ resource "aws_dynamodb_table" "scheduled_posts" {
     type = "S"
   }
 
+  attribute {
+    name = "dueBucket"
+    type = "S"
+  }
+
+  attribute {
+    name = "dueAt"
+    type = "N"
+  }
+
   global_secondary_index {
     name            = "UserIdIndex"
     hash_key        = "userId"
@@ -48,6 +58,14 @@ resource "aws_dynamodb_table" "scheduled_posts" {
     projection_type = "ALL"
   }
 
+  # Sparse: dueBucket/dueAt are only written while status = "scheduled"
+  global_secondary_index {
+    name            = "DueIndex"
+    hash_key        = "dueBucket"
+    range_key       = "dueAt"
+    projection_type = "ALL"
+  }
+
   point_in_time_recovery {
     enabled = true
   }
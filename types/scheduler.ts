@@ -16,7 +16,7 @@ export interface ScheduledPost {
   hashtags: string[];
   scheduledDate: string;
   scheduledTime: string;
-  status: 'draft' | 'scheduled' | 'published';
+  status: 'draft' | 'scheduled' | 'publishing' | 'published' | 'failed';
   strategyColor: string;
   strategyLabel: string;
   createdAt: string;
@@ -24,6 +24,8 @@ export interface ScheduledPost {
   mediaId?: string;
   mediaUrl?: string;
   mediaType?: 'image' | 'video';
+  attemptCount?: number;
+  nextAttemptAt?: number; // UTC epoch seconds of the pending publish retry
 }
 
 /**